@@ -0,0 +1,92 @@
+"""Per-batch execution context — isolates pipeline state between batches.
+
+The agent loop used to keep "who is talking / what are we replying to"
+on shared instance attributes (caller ID, inbound message, captured
+message-tool output, debug trace, registry sender and scene). That is
+only correct while a single batch is in flight. Each channel queue runs
+in its own asyncio task, so two channels processing at once would
+overwrite each other's state mid-LLM-call.
+
+A BatchContext is created per batch in _process_batch() and passed
+explicitly down the pipeline:
+
+    _process_batch → _process_message → _run_agent_loop
+                   → ContextBuilder.build_messages
+                   → ModuleRegistry.get_all_dynamic_context
+
+Callbacks that cannot take it as an argument (the message tool's send
+callback) read it via current_batch(). The binding lives in a ContextVar,
+so it is scoped to the asyncio task that set it and never leaks across
+channels.
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from nanobot.agent.debug_trace import DebugTrace
+    from nanobot.agent.reply_stream import ReplyStreamer
+    from nanobot.bus.events import InboundMessage
+
+
+@dataclass
+class BatchContext:
+    """Mutable state for one batch moving through the pipeline."""
+
+    channel_key: str = ""
+    trace_id: str = ""
+    inbound_msg: "InboundMessage | None" = None
+    caller_id: str = ""  # "channel:sender_id" — used for tool permission checks
+    sender_id: str = ""
+    sender_channel: str = ""
+    sender_metadata: dict[str, Any] = field(default_factory=dict)
+    scene_participant_ids: list[str] | None = None  # Set after ingest_batch()
+    daemon_result: Any = None  # Daemon verdict injected into the reply context (last message analysed)
+    last_message_content: str | None = None  # Content actually sent via message tool
+    trace: "DebugTrace | None" = None
+    streamer: "ReplyStreamer | None" = None  # Set while a streamed reply is in progress
+    # Fast lane: daemon checks for addressed messages, running while context is
+    # built. Resolves to [(message, DaemonResult | None)]; awaited before the LLM call.
+    pending_checks: "asyncio.Task[list[tuple[InboundMessage, Any]]] | None" = None
+    late_context: str | None = None  # Daemon notes from the fast-lane checks
+    blocked_senders: set[str] = field(default_factory=set)  # Auto-muted by those checks — no reply to them
+
+    @property
+    def platform_id(self) -> str:
+        """Current sender's platform ID (e.g., 'discord:123456')."""
+        if self.sender_id:
+            return f"{self.sender_channel}:{self.sender_id}"
+        return ""
+
+    def bind_message(self, msg: "InboundMessage") -> None:
+        """Point the context at the message about to be processed.
+
+        Called once per _process_message(). In the multi-thread path the
+        same batch context is re-bound for each focused thread message.
+        """
+        self.inbound_msg = msg
+        self.caller_id = f"{msg.channel}:{msg.sender_id}"
+        self.sender_id = msg.sender_id
+        self.sender_channel = msg.channel
+        self.sender_metadata = msg.metadata or {}
+        self.last_message_content = None
+
+
+_current_batch: ContextVar[BatchContext | None] = ContextVar(
+    "ene_current_batch", default=None
+)
+
+
+def current_batch() -> BatchContext | None:
+    """Return the batch context bound to the running task, if any."""
+    return _current_batch.get()
+
+
+def bind_batch(ctx: BatchContext | None) -> None:
+    """Bind a batch context to the running task (and tasks it spawns)."""
+    _current_batch.set(ctx)
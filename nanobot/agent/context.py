@@ -4,14 +4,21 @@ import base64
 import mimetypes
 import platform
 from pathlib import Path
-from typing import Any, TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
 
+from nanobot.agent.context_profile import ContextProfile, NullContextProfile
 from nanobot.agent.memory import MemoryStore
 from nanobot.agent.prompts.loader import PromptLoader
 from nanobot.agent.skills import SkillsLoader
 
 if TYPE_CHECKING:
+    from nanobot.agent.batch_context import BatchContext
     from nanobot.ene import ModuleRegistry
+    from nanobot.ene.observatory.module_metrics import ModuleMetrics
+
+# Ene: stable-prefix layout — per-call context heads the current user message
+CURRENT_CONTEXT_HEADER = "# Current Context"
+CURRENT_MESSAGE_HEADER = "# Current Message"
 
 
 class ContextBuilder:
@@ -24,13 +31,29 @@ class ContextBuilder:
 
     BOOTSTRAP_FILES = ["AGENTS.md", "SOUL.md", "USER.md", "TOOLS.md", "IDENTITY.md"]
 
-    def __init__(self, workspace: Path, module_registry: "ModuleRegistry | None" = None):
+    def __init__(
+        self,
+        workspace: Path,
+        module_registry: "ModuleRegistry | None" = None,
+        stable_prefix: bool = False,
+    ):
         self.workspace = workspace
         self.memory = MemoryStore(workspace)
         self.skills = SkillsLoader(workspace)
         self._module_registry = module_registry
         self._prompts = PromptLoader()
         self._muted_users: dict[str, float] = {}  # Ene: mute state for context injection
+        # Ene: cache-friendly layout — keep the system prompt byte-identical
+        # between calls and move volatile context into a trailing message
+        self.stable_prefix = stable_prefix
+        # Ene: memoized prompt components — name -> (key, value); see _cached()
+        self._prompt_cache: dict[str, tuple[Any, str]] = {}
+        # Ene: per-component build profiling, recorded when the observatory is wired
+        self._metrics: "ModuleMetrics | None" = None
+
+    def set_metrics(self, metrics: "ModuleMetrics | None") -> None:
+        """Record a per-component profile of every prompt build to metrics."""
+        self._metrics = metrics
 
     def set_mute_state(self, muted_users: dict[str, float]) -> None:
         """Update mute state so Ene can see who she's muted."""
@@ -57,83 +80,131 @@ class ContextBuilder:
             lines.append(f"- {display} ({remaining} min left)")
         return "\n".join(lines)
     
-    def build_system_prompt(self, skill_names: list[str] | None = None) -> str:
+    def build_system_prompt(
+        self,
+        skill_names: list[str] | None = None,
+        batch: "BatchContext | None" = None,
+        profile: ContextProfile | None = None,
+    ) -> str:
         """
         Build the system prompt from bootstrap files, memory, and skills.
         
         Args:
             skill_names: Optional list of skills to include.
+            batch: Per-batch execution context (decides Dad vs public identity).
+            profile: Optional build profile to attribute each part to.
         
         Returns:
             Complete system prompt.
         """
+        profile = profile or NullContextProfile()
         parts = []
         
         # Core identity
-        parts.append(self._get_identity())
+        parts.append(profile.measure("identity", lambda: self._get_identity(batch)))
         
         # Bootstrap files
-        bootstrap = self._load_bootstrap_files()
+        bootstrap = profile.measure("bootstrap", self._load_bootstrap_files)
         if bootstrap:
             parts.append(bootstrap)
         
-        # Ene module context blocks (core memory, diary, etc.)
+        # Ene module context blocks (core memory, diary, etc.) — memoized per
+        # module by the registry (EneModule.context_version)
         if self._module_registry:
-            module_context = self._module_registry.get_all_context_blocks()
+            module_context = self._module_registry.get_all_context_blocks(profile=profile)
             if module_context:
                 parts.append(f"# Memory\n\n{module_context}")
         else:
             # Fallback: legacy memory context (no modules registered)
-            memory = self.memory.get_memory_context()
+            memory = profile.measure("memory", self.memory.get_memory_context)
             if memory:
                 parts.append(f"# Memory\n\n{memory}")
         
+        # Skills — rebuilt only when the skill index changes
+        parts.append(profile.measure(
+            "skills", lambda: self._cached("skills", self.skills.version, self._build_skills_section),
+        ))
+        
+        # Reuse the assembled prompt while every part is unchanged, so the
+        # prefix stays the same string object call after call
+        return self._cached("system_prompt", tuple(parts), lambda: "\n\n---\n\n".join(p for p in parts if p))
+
+    def _build_skills_section(self) -> str:
+        """Always-loaded skills in full plus a summary of the rest."""
+        sections = []
         # Skills - progressive loading
         # 1. Always-loaded skills: include full content
         always_skills = self.skills.get_always_skills()
         if always_skills:
             always_content = self.skills.load_skills_for_context(always_skills)
             if always_content:
-                parts.append(f"# Active Skills\n\n{always_content}")
+                sections.append(f"# Active Skills\n\n{always_content}")
         
         # 2. Available skills: only show summary (agent uses read_file to load)
         skills_summary = self.skills.build_skills_summary()
         if skills_summary:
-            parts.append(f"""# Skills
+            sections.append(f"""# Skills
 
 The following skills extend your capabilities. To use a skill, read its SKILL.md file using the read_file tool.
 Skills with available="false" need dependencies installed first - you can try installing them with apt/brew.
 
 {skills_summary}""")
         
-        return "\n\n---\n\n".join(parts)
+        return "\n\n---\n\n".join(sections)
+
+    def _cached(self, name: str, key: Any, build: Callable[[], str]) -> str:
+        """A prompt component, rebuilt only when its key changes."""
+        hit = self._prompt_cache.get(name)
+        if hit is not None and hit[0] == key:
+            return hit[1]
+        value = build()
+        self._prompt_cache[name] = (key, value)
+        return value
     
-    def _is_dad_caller(self) -> bool:
-        """Check if the current caller is Dad via the module registry."""
-        if not self._module_registry:
+    def _is_dad_caller(self, batch: "BatchContext | None" = None) -> bool:
+        """Check if the current caller is Dad (batch context, else module registry)."""
+        if batch is not None:
+            platform_id = batch.platform_id
+        elif self._module_registry:
+            platform_id = self._module_registry.get_current_platform_id()
+        else:
             return False
-        platform_id = self._module_registry.get_current_platform_id()
         if not platform_id:
             return False
         # Import here to avoid circular imports
         from nanobot.ene.social.person import DAD_IDS
         return platform_id in DAD_IDS
 
-    def _get_identity(self) -> str:
+    def _get_identity(self, batch: "BatchContext | None" = None) -> str:
         """Get the core identity section.
 
         Dad sees the full technical identity (workspace paths, all tools,
         system details). Everyone else sees a stripped version — Ene knows
         who she is but doesn't leak implementation details.
+
+        In stable-prefix mode the clock and mute list are left out here and
+        sent with the current message instead (see _assemble_messages).
         """
-        from datetime import datetime
+        now, tz = self._current_time()
+        if self.stable_prefix:
+            now = "see Current Context, in the latest message"
+
+        if self._is_dad_caller(batch):
+            return self._cached("identity_dad", (now, tz), lambda: self._get_identity_full(now, tz))
+        mute_context = "" if self.stable_prefix else self._get_mute_context()
+        return self._cached(
+            "identity_public", (now, tz, mute_context),
+            lambda: self._get_identity_public(now, tz, mute_context),
+        )
+
+    @staticmethod
+    def _current_time() -> tuple[str, str]:
+        """Current local time and timezone name, as shown to the model."""
         import time as _time
+        from datetime import datetime
         now = datetime.now().strftime("%Y-%m-%d %H:%M (%A)")
         tz = _time.strftime("%Z") or "UTC"
-
-        if self._is_dad_caller():
-            return self._get_identity_full(now, tz)
-        return self._get_identity_public(now, tz)
+        return now, tz
 
     def _get_identity_full(self, now: str, tz: str) -> str:
         """Full identity block for Dad — all technical details."""
@@ -149,7 +220,7 @@ Skills with available="false" need dependencies installed first - you can try in
             workspace_path=workspace_path,
         )
 
-    def _get_identity_public(self, now: str, tz: str) -> str:
+    def _get_identity_public(self, now: str, tz: str, mute_context: str = "") -> str:
         """Stripped identity block for non-Dad callers.
 
         No workspace paths, no file names, no technical architecture.
@@ -160,11 +231,21 @@ Skills with available="false" need dependencies installed first - you can try in
             "identity_public",
             now=now,
             tz=tz,
-            mute_context=self._get_mute_context(),
+            mute_context=mute_context,
         )
     
     def _load_bootstrap_files(self) -> str:
-        """Load all bootstrap files from workspace."""
+        """Load all bootstrap files from workspace (re-read only when one changes)."""
+        stamps = []
+        for filename in self.BOOTSTRAP_FILES:
+            try:
+                stat = (self.workspace / filename).stat()
+                stamps.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                stamps.append(None)
+        return self._cached("bootstrap", tuple(stamps), self._read_bootstrap_files)
+
+    def _read_bootstrap_files(self) -> str:
         parts = []
         
         for filename in self.BOOTSTRAP_FILES:
@@ -184,6 +265,8 @@ Skills with available="false" need dependencies installed first - you can try in
         channel: str | None = None,
         chat_id: str | None = None,
         reanchor: str | None = None,
+        batch: "BatchContext | None" = None,
+        history_tokens: int | None = None,
     ) -> list[dict[str, Any]]:
         """
         Build the complete message list for an LLM call.
@@ -197,23 +280,102 @@ Skills with available="false" need dependencies installed first - you can try in
             chat_id: Current chat/user ID.
             reanchor: Optional identity re-anchoring text to inject near
                 the end of history (high-attention zone) to fight persona drift.
+            batch: Per-batch execution context (sender, scene participants).
+            history_tokens: Token count of history, if the caller has it
+                (Session.history_tokens()); otherwise history is recounted
+                when profiling.
 
         Returns:
             List of messages including system prompt.
         """
-        messages = []
-
-        # System prompt
-        system_prompt = self.build_system_prompt(skill_names)
+        profile = ContextProfile() if self._metrics else NullContextProfile()
+        system_prompt = self.build_system_prompt(skill_names, batch=batch, profile=profile)
 
         # Ene: inject dynamic per-message context (retrieved memories, entities)
+        dynamic_context = ""
+        if self._module_registry and current_message:
+            dynamic_context = self._module_registry.get_all_dynamic_context(
+                current_message, batch=batch, profile=profile
+            )
+
+        return self._assemble_messages(
+            system_prompt, dynamic_context, history, current_message,
+            media=media, channel=channel, chat_id=chat_id, reanchor=reanchor,
+            batch=batch, profile=profile, history_tokens=history_tokens,
+        )
+
+    async def build_messages_async(
+        self,
+        history: list[dict[str, Any]],
+        current_message: str,
+        skill_names: list[str] | None = None,
+        media: list[str] | None = None,
+        channel: str | None = None,
+        chat_id: str | None = None,
+        reanchor: str | None = None,
+        batch: "BatchContext | None" = None,
+        history_tokens: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """build_messages(), gathering per-message module context concurrently.
+
+        Modules are queried through ModuleRegistry.gather_dynamic_context():
+        blocking ones in worker threads, each under a timeout, so a slow
+        vector search doesn't stall the event loop or the reply.
+        """
+        profile = ContextProfile() if self._metrics else NullContextProfile()
+        # System prompt first: the static blocks it packs set the budget
+        # left for per-message context
+        system_prompt = self.build_system_prompt(skill_names, batch=batch, profile=profile)
+
+        dynamic_context = ""
         if self._module_registry and current_message:
-            dynamic_context = self._module_registry.get_all_dynamic_context(current_message)
-            if dynamic_context:
-                system_prompt += f"\n\n{dynamic_context}"
+            dynamic_context = await self._module_registry.gather_dynamic_context(
+                current_message, batch=batch, profile=profile
+            )
+
+        return self._assemble_messages(
+            system_prompt, dynamic_context, history, current_message,
+            media=media, channel=channel, chat_id=chat_id, reanchor=reanchor,
+            batch=batch, profile=profile, history_tokens=history_tokens,
+        )
+
+    def _assemble_messages(
+        self,
+        system_prompt: str,
+        dynamic_context: str,
+        history: list[dict[str, Any]],
+        current_message: str,
+        media: list[str] | None,
+        channel: str | None,
+        chat_id: str | None,
+        reanchor: str | None,
+        batch: "BatchContext | None",
+        profile: ContextProfile,
+        history_tokens: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Lay out system prompt, volatile context, history and the user message."""
+        messages = []
+
+        # Ene: per-call context — the clock, mute list, retrieved memories,
+        # entities and scene cards change with every message
+        volatile: list[str] = []
+        if self.stable_prefix:
+            now, tz = self._current_time()
+            volatile.append(f"Current time: {now} ({tz})")
+            if not self._is_dad_caller(batch):
+                mute_context = profile.measure("mute", self._get_mute_context)
+                if mute_context:
+                    volatile.append(mute_context)
+
+        if dynamic_context:
+            volatile.append(dynamic_context)
 
         if channel and chat_id:
-            system_prompt += f"\n\n## Current Session\nChannel: {channel}\nChat ID: {chat_id}"
+            volatile.append(f"## Current Session\nChannel: {channel}\nChat ID: {chat_id}")
+
+        if not self.stable_prefix:
+            # Legacy layout: everything in the system prompt
+            system_prompt = "\n\n".join([system_prompt, *volatile])
         messages.append({"role": "system", "content": system_prompt})
 
         # History
@@ -223,14 +385,66 @@ Skills with available="false" need dependencies installed first - you can try in
         # Research: DeepSeek v3.2 drifts after 8-12 turns. Periodic injection
         # of a brief personality reminder keeps Ene from going generic.
         if reanchor:
-            messages.append({"role": "system", "content": reanchor})
+            if self.stable_prefix:
+                volatile.append(reanchor)
+            else:
+                messages.append({"role": "system", "content": reanchor})
 
         # Current message (with optional image attachments)
         user_content = self._build_user_content(current_message, media)
+
+        # Ene: stable-prefix layout — volatile context rides in the current
+        # user message, not a system message: providers such as Anthropic
+        # hoist every system message into the system field, which would
+        # change the cached prefix on every call
+        if self.stable_prefix and volatile:
+            user_content = self.prepend_context(user_content, "\n\n".join(volatile))
         messages.append({"role": "user", "content": user_content})
 
+        if self._metrics:
+            if history_tokens is not None:
+                profile.add("history", None, tokens=history_tokens)
+            else:
+                profile.add_messages("history", history)
+            if reanchor:
+                profile.add("reanchor", reanchor)
+            profile.add("message", current_message)
+            self._metrics.record(
+                "prompt_built",
+                batch.channel_key if batch else f"{channel}:{chat_id}",
+                duration_ms=profile.elapsed_ms,
+                **profile.as_event(),
+            )
+
         return messages
 
+    def add_late_context(self, messages: list[dict[str, Any]], context: str) -> None:
+        """Add per-call context that arrived after build_messages() (daemon notes).
+
+        Joins the current message's "# Current Context" section in
+        stable-prefix mode, or the system prompt in the legacy layout.
+        """
+        if self.stable_prefix:
+            messages[-1] = {**messages[-1], "content": self.prepend_context(messages[-1]["content"], context)}
+        else:
+            messages[0] = {**messages[0], "content": f"{messages[0]['content']}\n\n{context}"}
+
+    @staticmethod
+    def prepend_context(content: str | list[dict[str, Any]], context: str) -> str | list[dict[str, Any]]:
+        """Put a "# Current Context" section ahead of user message content.
+
+        If content already starts with one, context is appended to it.
+        """
+        if isinstance(content, list):
+            if content and content[0].get("text", "").startswith(CURRENT_CONTEXT_HEADER):
+                return [{"type": "text", "text": f"{content[0]['text']}\n\n{context}"}, *content[1:]]
+            return [{"type": "text", "text": f"{CURRENT_CONTEXT_HEADER}\n\n{context}"}, *content]
+        marker = f"\n\n{CURRENT_MESSAGE_HEADER}\n\n"
+        if content.startswith(CURRENT_CONTEXT_HEADER) and marker in content:
+            section, message = content.split(marker, 1)
+            return f"{section}\n\n{context}{marker}{message}"
+        return f"{CURRENT_CONTEXT_HEADER}\n\n{context}{marker}{content}"
+
     def _build_user_content(self, text: str, media: list[str] | None) -> str | list[dict[str, Any]]:
         """Build user message content with optional base64-encoded images."""
         if not media:
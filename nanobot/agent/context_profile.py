@@ -0,0 +1,84 @@
+"""Per-component timing and token attribution for prompt builds.
+
+ContextBuilder runs each part of a prompt (identity, bootstrap files,
+every module's context block, skills, history, ...) through a
+ContextProfile, which records how long the part took to build and how
+many tokens it adds. The finished profile is recorded as one
+"prompt_built" event on the "context" ModuleMetrics, so the observatory
+can show which components dominate prompt size and build time:
+
+    {"components": {"identity": {"ms": 0.21, "tokens": 640}, ...},
+     "total_tokens": 9120, "total_ms": 4.8}
+
+NullContextProfile is used when no metrics are wired — it runs the
+builds and skips the bookkeeping (and the token counting).
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, TypeVar
+
+from nanobot.session.tokens import count_tokens_cached, message_tokens
+
+T = TypeVar("T")
+
+
+class ContextProfile:
+    """Latency and token count per prompt component for one build."""
+
+    def __init__(self) -> None:
+        self.components: dict[str, dict[str, float]] = {}
+        self._started = time.perf_counter()
+
+    def measure(self, component: str, build: Callable[[], T]) -> T:
+        """Run build() and attribute its time to component.
+
+        String results are counted as the component's tokens; for anything
+        else, attribute tokens separately with add().
+        """
+        start = time.perf_counter()
+        result = build()
+        self.add(component, result if isinstance(result, str) else "", time.perf_counter() - start)
+        return result
+
+    def add(self, component: str, text: str | None, seconds: float = 0.0, tokens: int | None = None) -> None:
+        """Attribute text (or an explicit token count) and time to component."""
+        if tokens is None:
+            tokens = count_tokens_cached(text) if text else 0
+        entry = self.components.setdefault(component, {"ms": 0.0, "tokens": 0})
+        entry["ms"] = round(entry["ms"] + seconds * 1000, 3)
+        entry["tokens"] += tokens
+
+    def add_messages(self, component: str, messages: list[dict[str, Any]]) -> None:
+        """Attribute already-built messages (history) by their token counts."""
+        self.add(component, None, tokens=sum(message_tokens(m) for m in messages))
+
+    @property
+    def total_tokens(self) -> int:
+        return int(sum(c["tokens"] for c in self.components.values()))
+
+    @property
+    def elapsed_ms(self) -> int:
+        return int((time.perf_counter() - self._started) * 1000)
+
+    def as_event(self) -> dict[str, Any]:
+        """Event payload for ModuleMetrics.record()."""
+        return {
+            "components": self.components,
+            "total_tokens": self.total_tokens,
+            "total_ms": round(sum(c["ms"] for c in self.components.values()), 3),
+        }
+
+
+class NullContextProfile(ContextProfile):
+    """No-op profile: builds run, nothing is measured."""
+
+    def measure(self, component: str, build: Callable[[], T]) -> T:
+        return build()
+
+    def add(self, component: str, text: str | None, seconds: float = 0.0, tokens: int | None = None) -> None:
+        pass
+
+    def add_messages(self, component: str, messages: list[dict[str, Any]]) -> None:
+        pass
@@ -0,0 +1,129 @@
+"""Adaptive debounce — size the batching window to how busy a channel is.
+
+The agent loop buffers messages per channel and flushes the buffer once
+the channel has been quiet for a window. A fixed 3.5s window is a bad fit
+at both ends: a lone DM sits in the buffer for 3.5s waiting for messages
+that never come, while a raid floods through in many small, expensive
+batches.
+
+AdaptiveDebouncer keeps a ChannelState per channel, updated on message
+*arrival* (the conversation tracker's own state only sees messages after
+they've been flushed), and derives the window from its estimate_rate() and
+conversation_state():
+
+    dm      direct message, not mid-burst           → shortest window
+    quiet   channel not actively flowing            → short window
+    active  normal conversation                     → base window
+    burst   rate at/above burst_rate                → long window, bigger batches
+
+Decisions are reported to the live tracer whenever a channel's tier
+changes, so the dashboard shows why a batch waited as long as it did.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from nanobot.ene.conversation.signals import ChannelState
+
+if TYPE_CHECKING:
+    from nanobot.agent.live_trace import LiveTracer
+
+
+@dataclass(frozen=True)
+class DebounceDecision:
+    """Window and count trigger chosen for one channel at one moment."""
+
+    window: float  # Seconds of quiet before the buffer is flushed
+    batch_limit: int  # Force-flush once the buffer reaches this size
+    tier: str  # "dm", "quiet", "active" or "burst"
+    rate: float  # Estimated arrival rate (messages per minute)
+
+
+class AdaptiveDebouncer:
+    """Chooses per-channel debounce windows from message arrival rate."""
+
+    def __init__(
+        self,
+        base_window: float = 3.5,
+        quiet_window: float = 1.5,
+        dm_window: float = 1.0,
+        burst_window: float = 6.0,
+        base_batch_limit: int = 15,
+        burst_batch_limit: int = 25,
+        quiet_rate: float = 2.0,
+        burst_rate: float = 20.0,
+        tracer: LiveTracer | None = None,
+    ) -> None:
+        """
+        Args:
+            base_window: Window for a normally active channel (seconds).
+            quiet_window: Window for a channel that isn't actively flowing.
+            dm_window: Window for a direct message that isn't mid-burst.
+            burst_window: Window for a channel at or above burst_rate.
+            base_batch_limit: Count trigger outside bursts.
+            burst_batch_limit: Count trigger during bursts.
+            quiet_rate: Below this rate (msgs/min) a channel counts as quiet.
+            burst_rate: At or above this rate (msgs/min) a channel is bursting.
+            tracer: Live tracer for window decisions (optional).
+        """
+        self.base_window = base_window
+        self.quiet_window = quiet_window
+        self.dm_window = dm_window
+        self.burst_window = burst_window
+        self.base_batch_limit = base_batch_limit
+        self.burst_batch_limit = burst_batch_limit
+        self.quiet_rate = quiet_rate
+        self.burst_rate = burst_rate
+        self._tracer = tracer
+        self._states: dict[str, ChannelState] = {}
+        self._last_tier: dict[str, str] = {}
+
+    def record_arrival(self, channel_key: str, sender_id: str, now: float | None = None) -> None:
+        """Note a message arriving in a channel (call before decide())."""
+        state = self._states.get(channel_key)
+        if state is None:
+            state = self._states[channel_key] = ChannelState(channel_key)
+        state.update(sender_id, now or time.time())
+
+    def decide(
+        self,
+        channel_key: str,
+        is_direct: bool = False,
+        now: float | None = None,
+    ) -> DebounceDecision:
+        """Pick the debounce window and count trigger for a channel right now."""
+        now = now or time.time()
+        state = self._states.get(channel_key)
+        rate = state.estimate_rate(now) if state else 0.0
+
+        if is_direct:
+            # Someone typing several lines in a row still gets them batched
+            if rate >= self.burst_rate:
+                decision = DebounceDecision(self.base_window, self.base_batch_limit, "active", rate)
+            else:
+                decision = DebounceDecision(self.dm_window, self.base_batch_limit, "dm", rate)
+        elif rate >= self.burst_rate:
+            decision = DebounceDecision(self.burst_window, self.burst_batch_limit, "burst", rate)
+        elif rate < self.quiet_rate or (state and state.conversation_state(now) != "active"):
+            decision = DebounceDecision(self.quiet_window, self.base_batch_limit, "quiet", rate)
+        else:
+            decision = DebounceDecision(self.base_window, self.base_batch_limit, "active", rate)
+
+        if self._tracer and self._last_tier.get(channel_key) != decision.tier:
+            self._tracer.emit(
+                "debounce_window", channel_key,
+                window=decision.window,
+                batch_limit=decision.batch_limit,
+                tier=decision.tier,
+                rate=round(rate, 2),
+            )
+        self._last_tier[channel_key] = decision.tier
+        return decision
+
+    def reset(self) -> None:
+        """Drop all arrival history."""
+        self._states.clear()
+        self._last_tier.clear()
@@ -13,7 +13,7 @@ from typing import Any
 from loguru import logger
 
 from nanobot.bus.events import InboundMessage, OutboundMessage
-from nanobot.bus.queue import MessageBus
+from nanobot.bus.queue import MessageBus, is_direct_message
 from nanobot.providers.base import LLMProvider
 from nanobot.agent.context import ContextBuilder
 from nanobot.agent.tools.registry import ToolRegistry
@@ -26,9 +26,15 @@ from nanobot.agent.tools.cron import CronTool
 from nanobot.agent.memory import MemoryStore
 from nanobot.agent.subagent import SubagentManager
 from nanobot.agent.debug_trace import DebugTrace
+from nanobot.agent.batch_context import BatchContext, bind_batch, current_batch
+from nanobot.agent.reply_stream import ReplyStreamer
 from nanobot.agent.live_trace import LiveTracer
+from nanobot.agent.debounce import AdaptiveDebouncer
+from nanobot.agent.rotation import PreparedRotation
 from nanobot.session.manager import Session, SessionManager
-from nanobot.ene import EneContext, ModuleRegistry
+from nanobot.session.summary import RunningSummary
+from nanobot.session.tokens import message_tokens
+from nanobot.ene import EneContext, ModuleRegistry, SenderContext
 
 
 # === Ene: Security, cleaning, and merging — extracted modules (WHITELIST S1, S3) ===
@@ -85,6 +91,10 @@ class AgentLoop:
         mcp_servers: dict | None = None,
         consolidation_model: str | None = None,
         diary_context_days: int = 3,
+        max_concurrent_batches: int = 4,
+        stream_responses: bool = False,
+        stable_prompt_prefix: bool = False,
+        background_tasks: bool = True,  # Ene: idle watcher + daily maintenance (one owner per gateway)
         config: Any = None,  # Ene: full Config object for module initialization
     ):
         from nanobot.config.schema import ExecToolConfig
@@ -110,9 +120,18 @@ class AgentLoop:
 
         # Ene: Module registry must be created before ContextBuilder (which uses it)
         self.module_registry = ModuleRegistry()
+        if config:
+            # Ene: cap module context (memory, scene cards, ...) by priority
+            self.module_registry.context_token_budget = config.agents.defaults.module_context_tokens
+            self.module_registry.dynamic_context_timeout = config.agents.defaults.module_context_timeout
 
-        self.context = ContextBuilder(workspace, module_registry=self.module_registry)
+        self.context = ContextBuilder(
+            workspace, module_registry=self.module_registry, stable_prefix=stable_prompt_prefix,
+        )
         self.sessions = session_manager or SessionManager(workspace)
+        # Ene: count history tokens with the tokenizer of the model we talk to
+        if self.sessions.token_model is None:
+            self.sessions.token_model = self.model
         self.tools = ToolRegistry()
         self.subagents = SubagentManager(
             provider=provider,
@@ -127,28 +146,53 @@ class AgentLoop:
         )
 
         self._running = False
-        self._current_caller_id = ""  # Ene: tracks who triggered current processing
         self._mcp_servers = mcp_servers or {}
         self._mcp_stack: AsyncExitStack | None = None
         self._mcp_connected = False
         self._last_message_time = 0.0  # Ene: for idle tracking
         self._idle_watcher_task: asyncio.Task | None = None
-        self._session_summaries: dict[str, str] = {}  # Ene: running summaries per session key
-        self._summary_msg_counters: dict[str, int] = {}  # Ene: messages since last summary regen (throttle)
+        # Ene: running summaries live in session metadata (nanobot.session.summary);
+        # updates run in the background once this many tokens await folding in
+        self._summary_fold_tokens = 600
+        self._summary_tasks: dict[str, asyncio.Task] = {}  # session key -> summary update in flight
+        self._recent_history_tokens = 3_000  # Ene: history kept verbatim, by token budget (was 12 messages)
+        # Ene: session rotation — the summary is prepared in the background past
+        # the prepare watermark and swapped in once the rotate threshold is hit
+        self._history_token_budget = 60_000
+        self._rotation_prepare_at = 0.65
+        self._rotation_at = 0.8
+        self._rotation_tasks: dict[str, asyncio.Task] = {}  # session key -> summary being prepared
+        self._rotation_ready: dict[str, PreparedRotation] = {}  # session key -> prepared summary
         self._reanchor_interval = 6  # Ene: re-inject identity every N assistant messages (lowered from 10 for anti-injection)
         self._log_dir = workspace / "memory" / "logs"  # Ene: debug trace log directory
-        self._trace: DebugTrace | None = None  # Ene: current debug trace (per message)
         self._live = LiveTracer()  # Ene: real-time event tracer for live dashboard
 
         # Ene: message debounce + queue — batch messages, process sequentially
         self._debounce_window = 3.5  # seconds quiet before flushing batch to queue (was 2.0)
         self._debounce_batch_limit = 15  # force-flush when batch reaches this size (was 10)
+        # Ene: window adapts per channel — shorter for DMs and quiet channels,
+        # longer (with bigger batches) during bursts. The values above are the
+        # baseline for a normally active channel.
+        self._debouncer = AdaptiveDebouncer(
+            base_window=self._debounce_window,
+            base_batch_limit=self._debounce_batch_limit,
+            tracer=self._live,
+        )
         self._debounce_buffers: dict[str, list[InboundMessage]] = {}  # channel_key -> intake buffer
         self._debounce_timers: dict[str, asyncio.Task] = {}  # channel_key -> timer task
         self._debounce_max_buffer = 40  # hard cap on intake buffer, drops oldest (was 20)
+        self._fast_lane = True  # addressed messages skip the debounce wait and the daemon wait
         self._channel_queues: dict[str, list[list[InboundMessage]]] = {}  # channel_key -> [batches]
         self._queue_processors: dict[str, asyncio.Task] = {}  # channel_key -> processor task
         self._queue_merge_cap = 30  # max messages in a merged batch (keeps newest, drops oldest)
+        self._daemon_concurrency = 4  # max daemon classifications in flight per batch
+        # Ene: global cap on batches in flight across all channels. Per-batch
+        # state lives in BatchContext, so channels can safely run in parallel.
+        self._batch_semaphore = asyncio.Semaphore(max(1, max_concurrent_batches))
+        # Ene: stream replies as progressive message edits on channels that
+        # support it. Replaces the canned latency notice for streamed calls.
+        self.stream_responses = stream_responses
+        self._background_tasks = background_tasks
 
         # Ene: per-user rate limiting — prevents spam attacks
         self._user_message_timestamps: dict[str, list[float]] = {}  # user_id -> [timestamps]
@@ -167,8 +211,6 @@ class AgentLoop:
         self._jailbreak_threshold = 3  # suspicious msgs in window to trigger mute
 
         self._observatory_module = None  # Set in _register_ene_modules if available
-        self._current_inbound_msg = None  # Ene: current message being processed (for message tool cleaning)
-        self._last_message_content: str | None = None  # Ene: actual content sent via message tool (for session storage)
         self._module_metrics: dict = {}  # Ene: ModuleMetrics instances keyed by module name
         self._batch_counter = 0  # Ene: monotonic batch counter for trace_id generation
         self._prompts = PromptLoader()  # Ene: centralized prompt loader for version tracking
@@ -205,10 +247,11 @@ class AgentLoop:
         # Message tool — wrapped callback applies _ene_clean_response() before sending
         # Without this, message tool bypasses all length limits, reflection stripping, etc.
         async def _cleaned_message_send(outbound: OutboundMessage) -> None:
-            if self._current_inbound_msg:
+            batch = current_batch()  # Ene: the batch whose agent loop invoked the tool
+            if batch and batch.inbound_msg:
                 # Resolve #msgN tag to real Discord message ID for reply threading
                 if outbound.reply_to and outbound.reply_to.startswith("#msg"):
-                    msg_id_map = self._current_inbound_msg.metadata.get("msg_id_map", {})
+                    msg_id_map = batch.inbound_msg.metadata.get("msg_id_map", {})
                     real_id = msg_id_map.get(outbound.reply_to)
                     if real_id:
                         outbound.reply_to = real_id
@@ -216,14 +259,17 @@ class AgentLoop:
                         # Tag not found — fall back to no reply threading
                         outbound.reply_to = None
 
-                cleaned = self._ene_clean_response(outbound.content, self._current_inbound_msg)
+                cleaned = self._ene_clean_response(outbound.content, batch.inbound_msg)
                 if cleaned:
                     outbound.content = cleaned
-                    self._last_message_content = cleaned  # Capture for session storage
+                    batch.last_message_content = cleaned  # Capture for session storage
                     # Inject Ene's response into thread for full conversation tracking
                     _conv = self.module_registry.get_module("conversation_tracker")
                     if _conv and hasattr(_conv, "tracker") and _conv.tracker:
-                        _conv.tracker.add_ene_response(self._current_inbound_msg, cleaned)
+                        _conv.tracker.add_ene_response(batch.inbound_msg, cleaned)
+                    if batch.streamer:
+                        # Replace the streamed preview instead of posting a second message
+                        outbound = await batch.streamer.finalize(outbound)
                     await self.bus.publish_outbound(outbound)
                 else:
                     logger.debug("Message tool output cleaned to empty, not sending")
@@ -382,6 +428,10 @@ class AgentLoop:
                 memory_metrics = ModuleMetrics("memory", store, self._live)
                 sleep_agent_mod.set_metrics(memory_metrics)
 
+                # Prompt assembly (per-component latency and tokens)
+                context_metrics = ModuleMetrics("context", store, self._live)
+                self.context.set_metrics(context_metrics)
+
                 # Store references for trace_id propagation
                 self._module_metrics = {
                     "signals": signals_metrics,
@@ -389,8 +439,9 @@ class AgentLoop:
                     "daemon": daemon_metrics,
                     "cleaning": cleaning_metrics,
                     "memory": memory_metrics,
+                    "context": context_metrics,
                 }
-                logger.debug("Wired ModuleMetrics → signals, tracker, daemon, cleaning, memory")
+                logger.debug("Wired ModuleMetrics → signals, tracker, daemon, cleaning, memory, context")
 
         # Register module tools with the ToolRegistry
         for tool in self.module_registry.get_all_tools():
@@ -467,16 +518,24 @@ class AgentLoop:
             if isinstance(cron_tool, CronTool):
                 cron_tool.set_context(channel, chat_id)
 
-    async def _run_agent_loop(self, initial_messages: list[dict]) -> tuple[str | None, list[str]]:
+    async def _run_agent_loop(
+        self,
+        initial_messages: list[dict],
+        batch: BatchContext | None = None,
+    ) -> tuple[str | None, list[str]]:
         """
         Run the agent iteration loop.
 
         Args:
             initial_messages: Starting messages for the LLM conversation.
+            batch: Per-batch execution context (caller for tool permissions, trace).
 
         Returns:
             Tuple of (final_content, list_of_tools_used).
         """
+        caller_id = batch.caller_id if batch else ""
+        trace = batch.trace if batch else None
+        streamer = batch.streamer if batch else None
         messages = initial_messages
         iteration = 0
         final_content = None
@@ -492,11 +551,11 @@ class AgentLoop:
             # Ene: non-Dad callers don't see restricted tools at all
             # Saves tokens and prevents "Access denied" weirdness
             tool_defs = self.tools.get_definitions_for_caller(
-                self._current_caller_id, DAD_IDS, RESTRICTED_TOOLS
+                caller_id, DAD_IDS, RESTRICTED_TOOLS
             )
 
-            if self._trace:
-                self._trace.log_llm_call(iteration, self.model)
+            if trace:
+                trace.log_llm_call(iteration, self.model)
 
             # Ene: live trace — LLM call
             self._live.emit(
@@ -508,17 +567,27 @@ class AgentLoop:
             )
 
             _obs_start = _time.perf_counter()
-            response = await self.provider.chat(
-                messages=messages,
-                tools=tool_defs,
-                model=self.model,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-            )
+            if streamer:
+                response = await self.provider.chat_stream(
+                    messages=messages,
+                    tools=tool_defs,
+                    model=self.model,
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                    on_delta=streamer.on_delta,
+                )
+            else:
+                response = await self.provider.chat(
+                    messages=messages,
+                    tools=tool_defs,
+                    model=self.model,
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                )
             if self._observatory:
                 self._observatory.record(
                     response, call_type="response", model=self.model,
-                    caller_id=self._current_caller_id or "system",
+                    caller_id=caller_id or "system",
                     latency_start=_obs_start,
                 )
 
@@ -529,6 +598,7 @@ class AgentLoop:
                 "llm_response", "",
                 iteration=iteration,
                 latency_ms=_llm_latency,
+                ttft_ms=response.ttft_ms,
                 tool_calls=_tool_call_names,
                 content_preview=response.content[:120] if response.content else None,
             )
@@ -546,8 +616,8 @@ class AgentLoop:
                 tool_calls=_tool_calls_detail,
             )
 
-            if self._trace:
-                self._trace.log_llm_response(response)
+            if trace:
+                trace.log_llm_response(response)
 
             if response.has_tool_calls:
                 tool_call_dicts = [
@@ -566,48 +636,40 @@ class AgentLoop:
                     reasoning_content=response.reasoning_content,
                 )
 
-                for tool_call in response.tool_calls:
-                    tools_used.append(tool_call.name)
-                    args_str = json.dumps(tool_call.arguments, ensure_ascii=False)
-                    logger.info(f"Tool call: {tool_call.name}({args_str[:200]})")
+                # Ene: consecutive read-only calls run together; anything with
+                # side effects (message, writes, memory edits) runs alone, in order.
+                for group in self._group_tool_calls(response.tool_calls):
+                    for tool_call in group:
+                        tools_used.append(tool_call.name)
+                        args_str = json.dumps(tool_call.arguments, ensure_ascii=False)
+                        logger.info(f"Tool call: {tool_call.name}({args_str[:200]})")
+
+                    results = await asyncio.gather(*(
+                        self._execute_tool_call(
+                            tool_call, caller_id, message_sent, iteration, tools_used,
+                        )
+                        for tool_call in group
+                    ))
 
-                    # Ene: pre-execution guard — block duplicate message tool calls.
-                    # The post-execution guard (lines below) catches duplicates too late —
-                    # both messages are already sent to Discord by that point.
-                    if tool_call.name == "message" and message_sent:
-                        logger.warning("Agent loop: blocked duplicate message tool (pre-execution guard)")
+                    for tool_call, result in zip(group, results):
+                        # Ene: live trace — tool execution
                         self._live.emit(
-                            "loop_break", "",
-                            reason="duplicate_message_blocked",
-                            iterations=iteration,
-                            tools_used=tools_used,
+                            "tool_exec", "",
+                            tool_name=tool_call.name,
+                            args_preview=json.dumps(tool_call.arguments, ensure_ascii=False)[:150],
+                            result_preview=str(result)[:150] if result else None,
                         )
-                        result = "Error: message already sent this batch, cannot send another."
-                    # Ene: restrict dangerous tools to Dad only
-                    elif tool_call.name in RESTRICTED_TOOLS and self._current_caller_id not in DAD_IDS:
-                        result = "Access denied."
-                        logger.warning(f"Blocked restricted tool '{tool_call.name}' for caller {self._current_caller_id}")
-                    else:
-                        result = await self.tools.execute(tool_call.name, tool_call.arguments)
-
-                    # Ene: live trace — tool execution
-                    self._live.emit(
-                        "tool_exec", "",
-                        tool_name=tool_call.name,
-                        args_preview=args_str[:150],
-                        result_preview=str(result)[:150] if result else None,
-                    )
 
-                    if self._trace:
-                        self._trace.log_tool_result(tool_call.name, str(result))
+                        if trace:
+                            trace.log_tool_result(tool_call.name, str(result))
 
-                    messages = self.context.add_tool_result(
-                        messages, tool_call.id, tool_call.name, result
-                    )
+                        messages = self.context.add_tool_result(
+                            messages, tool_call.id, tool_call.name, result
+                        )
 
-                    # Ene: track message sends
-                    if tool_call.name == "message":
-                        message_sent = True
+                        # Ene: track message sends
+                        if tool_call.name == "message":
+                            message_sent = True
 
                 # Ene: general loop detection — same tool called repeatedly
                 current_tools = [tc.name for tc in response.tool_calls]
@@ -682,6 +744,52 @@ class AgentLoop:
 
         return final_content, tools_used
 
+    def _group_tool_calls(self, tool_calls: list[Any]) -> list[list[Any]]:
+        """Split one turn's tool calls into groups that can run concurrently.
+
+        Runs of consecutive read-only calls share a group. Every other call
+        (message, file writes, memory edits, unknown tools) gets a group of
+        its own, so side effects keep the order the model emitted them in.
+        """
+        groups: list[list[Any]] = []
+        for tool_call in tool_calls:
+            if (
+                groups
+                and self.tools.is_read_only(tool_call.name)
+                and all(self.tools.is_read_only(tc.name) for tc in groups[-1])
+            ):
+                groups[-1].append(tool_call)
+            else:
+                groups.append([tool_call])
+        return groups
+
+    async def _execute_tool_call(
+        self,
+        tool_call: Any,
+        caller_id: str,
+        message_sent: bool,
+        iteration: int,
+        tools_used: list[str],
+    ) -> str:
+        """Run one tool call through the duplicate-send and permission guards."""
+        # Ene: pre-execution guard — block duplicate message tool calls.
+        # The post-execution guard in _run_agent_loop catches duplicates too late —
+        # both messages are already sent to Discord by that point.
+        if tool_call.name == "message" and message_sent:
+            logger.warning("Agent loop: blocked duplicate message tool (pre-execution guard)")
+            self._live.emit(
+                "loop_break", "",
+                reason="duplicate_message_blocked",
+                iterations=iteration,
+                tools_used=tools_used,
+            )
+            return "Error: message already sent this batch, cannot send another."
+        # Ene: restrict dangerous tools to Dad only
+        if tool_call.name in RESTRICTED_TOOLS and caller_id not in DAD_IDS:
+            logger.warning(f"Blocked restricted tool '{tool_call.name}' for caller {caller_id}")
+            return "Access denied."
+        return await self.tools.execute(tool_call.name, tool_call.arguments)
+
     def _format_author(self, m: InboundMessage) -> str:
         """Delegate to message_merging.format_author (WHITELIST S3)."""
         return format_author(
@@ -708,6 +816,232 @@ class AgentLoop:
         """Delegate to message_merging.merge_messages (WHITELIST S3)."""
         return merge_messages(messages, self._format_author)
 
+    async def _classify_with_daemon(
+        self,
+        messages: list[InboundMessage],
+        channel_key: str,
+        daemon_mod: Any,
+        channel_state: Any = None,
+        conv_mod: Any = None,
+    ) -> list[Any]:
+        """Run daemon classification for every message in a batch concurrently.
+
+        Returns one DaemonResult per message, in input order. None means the
+        daemon is unavailable or failed for that message and the caller
+        should use the hardcoded fallback classifier.
+        """
+        if not messages or not (daemon_mod and hasattr(daemon_mod, "process_message")):
+            return [None] * len(messages)
+
+        # Recent channel context is identical for every message here — the
+        # tracker only ingests this batch after classification. Fetch once.
+        recent_context: list[str] = []
+        if conv_mod and hasattr(conv_mod, "tracker") and conv_mod.tracker:
+            try:
+                recent_context = conv_mod.tracker.get_recent_context(channel_key, limit=8)
+            except Exception as e:
+                logger.debug(f"Daemon: recent context unavailable: {e}")
+
+        try:
+            from nanobot.ene.daemon.processor import DAEMON_PROMPT as _DAEMON_SYSTEM
+        except ImportError:
+            _DAEMON_SYSTEM = "(daemon system prompt unavailable)"
+
+        # Batched mode: one multi-message prompt per chunk instead of N calls.
+        # Any failure here drops through to the concurrent per-message path.
+        if len(messages) > 1 and getattr(daemon_mod, "batch_enabled", False):
+            from nanobot.ene.daemon.models import DaemonRequest
+
+            for m in messages:
+                self._live.emit_prompt(
+                    "prompt_daemon", channel_key,
+                    sender=m.metadata.get("author_name", m.sender_id),
+                    system=_DAEMON_SYSTEM,
+                    user=f"[batched x{len(messages)}]\n{m.content}",
+                )
+            requests = [
+                DaemonRequest(
+                    content=m.content,
+                    sender_name=m.metadata.get("author_name", m.sender_id),
+                    sender_id=f"{m.channel}:{m.sender_id}",
+                    is_dad=f"{m.channel}:{m.sender_id}" in DAD_IDS,
+                    metadata=m.metadata,
+                )
+                for m in messages
+            ]
+            try:
+                results = await daemon_mod.process_batch(
+                    requests, channel_state=channel_state, recent_context=recent_context,
+                )
+                if len(results) == len(messages):
+                    return list(results)
+                logger.warning(
+                    f"Daemon: batch returned {len(results)} results for {len(messages)} messages"
+                )
+            except Exception as e:
+                logger.debug(f"Daemon batch failed, classifying per message: {e}")
+
+        semaphore = asyncio.Semaphore(max(1, self._daemon_concurrency))
+
+        async def _classify_one(m: InboundMessage) -> Any:
+            caller_id = f"{m.channel}:{m.sender_id}"
+            is_dad = caller_id in DAD_IDS
+            _sender_label = m.metadata.get("author_name", m.sender_id)
+
+            # Ene: prompt log — record exactly what the daemon sees
+            _daemon_user_msg = f"Sender: {_sender_label} (ID: {caller_id})"
+            if is_dad:
+                _daemon_user_msg += " [THIS IS DAD - respond unless clearly talking to someone else]"
+            if m.metadata.get("is_reply_to_ene"):
+                _daemon_user_msg += " [REPLYING TO ENE]"
+            if m.metadata.get("_is_stale"):
+                _daemon_user_msg += f" [MESSAGE IS STALE - sent {m.metadata.get('_stale_minutes', '?')} min ago]"
+            if recent_context:
+                _daemon_user_msg += "\n\nRecent chat:\n" + "\n".join(recent_context)
+            _daemon_user_msg += f"\n\nNew message to classify:\n{m.content}"
+            self._live.emit_prompt(
+                "prompt_daemon", channel_key,
+                sender=_sender_label,
+                system=_DAEMON_SYSTEM,
+                user=_daemon_user_msg,
+            )
+            logger.debug(f"Daemon prompt for {_sender_label}: {_daemon_user_msg[:300]}")
+
+            try:
+                async with semaphore:
+                    return await daemon_mod.process_message(
+                        content=m.content,
+                        sender_name=_sender_label,
+                        sender_id=caller_id,
+                        is_dad=is_dad,
+                        metadata=m.metadata,
+                        channel_state=channel_state,
+                        recent_context=recent_context,
+                    )
+            except Exception as e:
+                logger.debug(f"Daemon failed for message, falling back: {e}")
+                return None
+
+        return list(await asyncio.gather(*(_classify_one(m) for m in messages)))
+
+    def _record_daemon_result(self, m: InboundMessage, daemon_result: Any, channel_key: str) -> bool:
+        """Attach a daemon result to its message, trace it, and apply auto-mute.
+
+        Returns True if the sender was auto-muted (high-severity security
+        flags; Dad is never muted) and the message should be dropped.
+        """
+        caller_id = f"{m.channel}:{m.sender_id}"
+        _sender_label = m.metadata.get("author_name", m.sender_id)
+        # Store daemon result on message metadata for context injection
+        m.metadata["_daemon_result"] = daemon_result
+        _flags_text = ", ".join(
+            f"{f.type} ({f.severity})" for f in daemon_result.security_flags
+        ) or None
+
+        # Ene: prompt log — record the daemon's raw response
+        self._live.emit_prompt(
+            "prompt_daemon_response", channel_key,
+            sender=_sender_label,
+            model=daemon_result.model_used,
+            fallback=daemon_result.fallback_used,
+            classification=daemon_result.classification.value,
+            reason=daemon_result.classification_reason,
+            confidence=daemon_result.confidence,
+            topic=daemon_result.topic_summary,
+            tone=daemon_result.emotional_tone,
+            security_flags=_flags_text,
+        )
+        logger.debug(
+            f"Daemon: {_sender_label} → {daemon_result.classification.value} "
+            f"({'fallback' if daemon_result.fallback_used else daemon_result.model_used}) "
+            f"[{daemon_result.classification_reason or 'no reason'}]"
+        )
+
+        # Ene: live trace — daemon classification result
+        self._live.emit(
+            "daemon_result", channel_key,
+            sender=_sender_label,
+            classification=daemon_result.classification.value,
+            reason=daemon_result.classification_reason,
+            model=daemon_result.model_used,
+            latency_ms=daemon_result.latency_ms,
+            fallback=daemon_result.fallback_used,
+            security_flags=_flags_text,
+        )
+
+        # Auto-mute on high-severity security flags (never mute Dad)
+        if daemon_result.should_auto_mute and caller_id not in DAD_IDS:
+            logger.warning(f"Daemon: auto-muting {_sender_label} (high severity security flag)")
+            self._muted_users[caller_id] = _time.time() + 1800  # 30 minutes
+            self._live.emit(
+                "mute_event", channel_key,
+                sender=_sender_label,
+                duration_min=30,
+                reason="auto (security flags)",
+            )
+            return True
+        return False
+
+    def _is_addressed(self, m: InboundMessage) -> bool:
+        """Whether a message is clearly addressed to Ene (name mention or reply to her)."""
+        return bool(ENE_PATTERN.search(m.content)) or bool(m.metadata.get("is_reply_to_ene"))
+
+    async def _fast_lane_checks(
+        self,
+        messages: list[InboundMessage],
+        channel_key: str,
+        daemon_mod: Any,
+        channel_state: Any,
+        conv_mod: Any,
+    ) -> list[tuple[InboundMessage, Any]]:
+        """Daemon-check fast-lane messages (run as a task alongside context building)."""
+        results = await self._classify_with_daemon(
+            messages, channel_key, daemon_mod, channel_state, conv_mod,
+        )
+        return list(zip(messages, results))
+
+    async def _resolve_pending_checks(self, batch: BatchContext) -> None:
+        """Apply the fast lane's daemon results: auto-mute, trace, late context.
+
+        Adds auto-muted senders to batch.blocked_senders (replies to them
+        are dropped) and sets batch.late_context to the daemon's notes
+        (security alerts, tone).
+        """
+        task = batch.pending_checks
+        if task is None:
+            return
+        batch.pending_checks = None
+        try:
+            pairs = await task
+        except Exception as e:
+            logger.debug(f"Fast lane: daemon checks failed: {e}")
+            return
+
+        last = flagged = None
+        for m, daemon_result in pairs:
+            if daemon_result is None:
+                continue
+            last = (m, daemon_result)
+            if daemon_result.has_security_flags:
+                flagged = last
+            if self._record_daemon_result(m, daemon_result, batch.channel_key):
+                batch.blocked_senders.add(f"{m.channel}:{m.sender_id}")
+
+        # Notes come from the last analysed message, unless an earlier one
+        # raised a security alert — that one must reach the reply
+        noted = flagged or last
+        if noted is None:
+            return
+        batch.daemon_result = noted[1]
+        daemon_mod = self.module_registry.get_module("daemon")
+        if daemon_mod:
+            try:
+                batch.late_context = daemon_mod.get_context_block_for_message(
+                    noted[0].content, SenderContext(daemon_result=noted[1]),
+                )
+            except Exception as e:
+                logger.debug(f"Fast lane: daemon context unavailable: {e}")
+
     async def _process_batch(self, channel_key: str, messages: list[InboundMessage]) -> None:
         """Process a batch of messages — classify, merge, and send to LLM.
 
@@ -723,6 +1057,12 @@ class AgentLoop:
         for metrics in self._module_metrics.values():
             metrics.set_trace_id(trace_id)
 
+        # Ene: per-batch execution context — replaces shared instance state so
+        # batches on different channels can run concurrently. Bound to this
+        # task for callbacks (message tool) that can't take it as an argument.
+        batch = BatchContext(channel_key=channel_key, trace_id=trace_id)
+        bind_batch(batch)
+
         # Ene: stale message detection — tag messages that sat in queue too long
         from datetime import datetime, timedelta
         _now = datetime.now()
@@ -733,48 +1073,14 @@ class AgentLoop:
                 m.metadata["_is_stale"] = True
                 m.metadata["_stale_minutes"] = int(msg_age.total_seconds() / 60)
 
-        # Ene: auto-session rotation at 80% budget — prevents degradation
-        HISTORY_TOKEN_BUDGET = 60_000
+        # Ene: auto-session rotation at 80% budget — prevents degradation.
+        # The summary is prepared from 65% on, so rotating costs no LLM call here.
         session = self.sessions.get_or_create(channel_key)
         estimated_tokens = session.estimate_tokens()
-        if estimated_tokens > HISTORY_TOKEN_BUDGET * 0.8:
-            logger.warning(
-                f"Session {channel_key} at {estimated_tokens} tokens "
-                f"(~{estimated_tokens * 100 // HISTORY_TOKEN_BUDGET}% budget), auto-rotating"
-            )
-            # Generate summary BEFORE clearing
-            _rotation_summary = self._session_summaries.get(channel_key, "")
-            if not _rotation_summary and len(session.messages) > 5:
-                try:
-                    _rotation_summary = await self._generate_running_summary(session, channel_key) or ""
-                except Exception:
-                    _rotation_summary = ""
-
-            messages_to_archive = list(session.messages)
-            session.messages.clear()
-
-            # Inject summary as seed context for new session
-            if _rotation_summary:
-                session.messages.append({
-                    "role": "system",
-                    "content": f"[Previous session summary: {_rotation_summary}]",
-                })
-
-            self.sessions.save(session)
-            self.sessions.invalidate(session.key)
-            self._session_summaries.pop(channel_key, None)
-            self._summary_msg_counters.pop(channel_key, None)
-
-            # Background consolidation of archived messages
-            async def _consolidate_old(_msgs=messages_to_archive, _key=channel_key):
-                temp_session = Session(key=_key)
-                temp_session.messages = _msgs
-                await self._consolidate_memory(temp_session, archive_all=True)
-            asyncio.create_task(_consolidate_old())
-            logger.info(
-                f"Auto-rotated session {channel_key} ({estimated_tokens} tokens), "
-                f"summary {'injected' if _rotation_summary else 'empty'}"
-            )
+        if estimated_tokens > self._history_token_budget * self._rotation_at:
+            await self._rotate_session(session, channel_key, estimated_tokens)
+        elif estimated_tokens > self._history_token_budget * self._rotation_prepare_at:
+            self._prepare_rotation(session, channel_key)
 
         # Ene: per-message classification — daemon-enhanced filtering
         respond_msgs: list[InboundMessage] = []
@@ -787,172 +1093,118 @@ class AgentLoop:
         if conv_mod and hasattr(conv_mod, "tracker") and conv_mod.tracker:
             _channel_state = conv_mod.tracker.get_channel_state(channel_key)
 
-        for m in messages:
+        # Ene: classify the whole batch up front. Daemon calls run concurrently
+        # (bounded) — sequential calls on slow free models used to dominate batch
+        # latency. Rules below are still applied one message at a time, in order.
+        # Fast path: muted → DROP (no daemon call, save rate limit)
+        _candidates = [
+            m for m in messages if not self._is_muted(f"{m.channel}:{m.sender_id}")
+        ]
+
+        # Ene: fast lane — messages addressed to Ene are RESPOND whatever the
+        # daemon says, so don't wait for it. Their daemon checks (security
+        # flags, context notes) run as a task alongside context building and
+        # are applied in _process_message just before the LLM call. The other
+        # messages still wait for the daemon — it can spot an implicit
+        # reference to Ene — so only a batch of addressed messages skips the wait.
+        _fast = [m for m in _candidates if self._is_addressed(m)] if self._fast_lane else []
+        _fast_ids = {id(m) for m in _fast}
+        if _fast and daemon_mod and hasattr(daemon_mod, "process_message"):
+            batch.pending_checks = asyncio.create_task(self._fast_lane_checks(
+                _fast, channel_key, daemon_mod, _channel_state, conv_mod,
+            ))
+        _slow = [m for m in _candidates if id(m) not in _fast_ids]
+        _slow_results = await self._classify_with_daemon(_slow, channel_key, daemon_mod, _channel_state, conv_mod)
+        _daemon_results = dict(zip((id(m) for m in _slow), _slow_results))
+        # The reply's context carries the analysis of the last message in
+        # batch order (the fast lane's checks replace it when they land)
+        batch.daemon_result = next((r for r in reversed(_slow_results) if r is not None), None)
+
+        for m in _candidates:
             caller_id = f"{m.channel}:{m.sender_id}"
             is_dad = caller_id in DAD_IDS
 
-            # Fast path: muted → DROP (no daemon call, save rate limit)
+            # Re-check: an earlier message in this batch may have auto-muted the sender
             if self._is_muted(caller_id):
                 continue
 
-            # Run daemon for ALL messages (including Dad) if available
-            if daemon_mod and hasattr(daemon_mod, "process_message"):
-                try:
-                    _sender_label = m.metadata.get("author_name", m.sender_id)
-
-                    # Get recent channel context for daemon (last 8 messages)
-                    _recent_context: list[str] = []
-                    if conv_mod and hasattr(conv_mod, "tracker") and conv_mod.tracker:
-                        _recent_context = conv_mod.tracker.get_recent_context(channel_key, limit=8)
-
-                    # Ene: prompt log — record exactly what the daemon sees
-                    _daemon_user_msg = f"Sender: {_sender_label} (ID: {caller_id})"
-                    if is_dad:
-                        _daemon_user_msg += " [THIS IS DAD - respond unless clearly talking to someone else]"
-                    if m.metadata.get("is_reply_to_ene"):
-                        _daemon_user_msg += " [REPLYING TO ENE]"
-                    if m.metadata.get("_is_stale"):
-                        _daemon_user_msg += f" [MESSAGE IS STALE - sent {m.metadata.get('_stale_minutes', '?')} min ago]"
-                    if _recent_context:
-                        _daemon_user_msg += "\n\nRecent chat:\n" + "\n".join(_recent_context)
-                    _daemon_user_msg += f"\n\nNew message to classify:\n{m.content}"
-                    try:
-                        from nanobot.ene.daemon.processor import DAEMON_PROMPT as _DAEMON_SYSTEM
-                    except ImportError:
-                        _DAEMON_SYSTEM = "(daemon system prompt unavailable)"
-                    self._live.emit_prompt(
-                        "prompt_daemon", channel_key,
-                        sender=_sender_label,
-                        system=_DAEMON_SYSTEM,
-                        user=_daemon_user_msg,
-                    )
-                    logger.debug(f"Daemon prompt for {_sender_label}: {_daemon_user_msg[:300]}")
+            if id(m) in _fast_ids:
+                self._live.emit(
+                    "classification", channel_key,
+                    sender=m.metadata.get("author_name", m.sender_id),
+                    result="respond",
+                    source="fast_lane",
+                )
+                respond_msgs.append(m)
+                continue
 
-                    daemon_result = await daemon_mod.process_message(
-                        content=m.content,
-                        sender_name=_sender_label,
-                        sender_id=caller_id,
-                        is_dad=is_dad,
-                        metadata=m.metadata,
-                        channel_state=_channel_state,
-                        recent_context=_recent_context,
-                    )
-                    # Store daemon result on message metadata for context injection
-                    m.metadata["_daemon_result"] = daemon_result
-
-                    # Ene: prompt log — record the daemon's raw response
-                    self._live.emit_prompt(
-                        "prompt_daemon_response", channel_key,
-                        sender=_sender_label,
-                        model=daemon_result.model_used,
-                        fallback=daemon_result.fallback_used,
-                        classification=daemon_result.classification.value,
-                        reason=daemon_result.classification_reason,
-                        confidence=daemon_result.confidence,
-                        topic=daemon_result.topic_summary,
-                        tone=daemon_result.emotional_tone,
-                        security_flags=", ".join(daemon_result.security_flags) if daemon_result.security_flags else None,
-                    )
+            daemon_result = _daemon_results.get(id(m))
+            if daemon_result is not None:
+                if self._record_daemon_result(m, daemon_result, channel_key):
+                    continue  # Auto-muted on high-severity security flags
+
+                # Hard override: if message mentions Ene by name or is a reply
+                # to Ene, force RESPOND regardless of daemon output. Free models
+                # sometimes misclassify obvious mentions as CONTEXT.
+                if self._is_addressed(m) and daemon_result.classification.value != "respond":
                     logger.debug(
-                        f"Daemon: {_sender_label} → {daemon_result.classification.value} "
-                        f"({'fallback' if daemon_result.fallback_used else daemon_result.model_used}) "
-                        f"[{daemon_result.classification_reason or 'no reason'}]"
+                        f"Daemon override: {daemon_result.classification.value} → respond "
+                        f"(Ene signal in message from {m.metadata.get('author_name', m.sender_id)})"
                     )
-
-                    # Ene: live trace — daemon classification result
                     self._live.emit(
-                        "daemon_result", channel_key,
-                        sender=_sender_label,
-                        classification=daemon_result.classification.value,
-                        reason=daemon_result.classification_reason,
-                        model=daemon_result.model_used,
-                        latency_ms=daemon_result.latency_ms,
-                        fallback=daemon_result.fallback_used,
-                        security_flags=", ".join(daemon_result.security_flags) if daemon_result.security_flags else None,
+                        "classification", channel_key,
+                        sender=m.metadata.get("author_name", m.sender_id),
+                        result="respond",
+                        source="daemon",
+                        override=f"ene_signal ({daemon_result.classification.value}→respond)",
                     )
-
-                    # Auto-mute on high-severity security flags (never mute Dad)
-                    if daemon_result.should_auto_mute and not is_dad:
-                        import time as _mute_time
-                        sender_name = m.metadata.get("author_name", m.sender_id)
-                        logger.warning(f"Daemon: auto-muting {sender_name} (high severity security flag)")
-                        self._muted_users[caller_id] = _mute_time.time() + 1800  # 30 minutes
-                        self._live.emit(
-                            "mute_event", channel_key,
-                            sender=sender_name,
-                            duration_min=30,
-                            reason="auto (security flags)",
-                        )
-                        continue
-
-                    # Hard override: if message mentions Ene by name or is a reply
-                    # to Ene, force RESPOND regardless of daemon output. Free models
-                    # sometimes misclassify obvious mentions as CONTEXT.
-                    has_ene_signal = (
-                        bool(ENE_PATTERN.search(m.content))
-                        or m.metadata.get("is_reply_to_ene")
-                    )
-                    if has_ene_signal and daemon_result.classification.value != "respond":
+                    respond_msgs.append(m)
+                elif daemon_result.classification.value == "respond":
+                    # Phase 4: Staleness downgrade — stale messages from non-Dad
+                    # with low daemon confidence get demoted to CONTEXT. Direct
+                    # @mentions/replies already went through the hard override above.
+                    if (
+                        m.metadata.get("_is_stale")
+                        and not is_dad
+                        and daemon_result.confidence < 0.85
+                    ):
                         logger.debug(
-                            f"Daemon override: {daemon_result.classification.value} → respond "
-                            f"(Ene signal in message from {m.metadata.get('author_name', m.sender_id)})"
-                        )
-                        self._live.emit(
-                            "classification", channel_key,
-                            sender=m.metadata.get("author_name", m.sender_id),
-                            result="respond",
-                            source="daemon",
-                            override=f"ene_signal ({daemon_result.classification.value}→respond)",
+                            f"Staleness downgrade: {m.metadata.get('author_name', m.sender_id)} "
+                            f"RESPOND → CONTEXT (stale + confidence {daemon_result.confidence:.2f})"
                         )
-                        respond_msgs.append(m)
-                    elif daemon_result.classification.value == "respond":
-                        # Phase 4: Staleness downgrade — stale messages from non-Dad
-                        # with low daemon confidence get demoted to CONTEXT. Direct
-                        # @mentions/replies already went through the hard override above.
-                        if (
-                            m.metadata.get("_is_stale")
-                            and not is_dad
-                            and daemon_result.confidence < 0.85
-                        ):
-                            logger.debug(
-                                f"Staleness downgrade: {m.metadata.get('author_name', m.sender_id)} "
-                                f"RESPOND → CONTEXT (stale + confidence {daemon_result.confidence:.2f})"
-                            )
-                            self._live.emit(
-                                "classification", channel_key,
-                                sender=m.metadata.get("author_name", m.sender_id),
-                                result="context",
-                                source="daemon",
-                                override=f"stale_downgrade (confidence={daemon_result.confidence:.2f})",
-                            )
-                            context_msgs.append(m)
-                        else:
-                            self._live.emit(
-                                "classification", channel_key,
-                                sender=m.metadata.get("author_name", m.sender_id),
-                                result="respond",
-                                source="daemon",
-                            )
-                            respond_msgs.append(m)
-                    elif daemon_result.classification.value == "drop" and not is_dad:
                         self._live.emit(
                             "classification", channel_key,
                             sender=m.metadata.get("author_name", m.sender_id),
-                            result="drop",
+                            result="context",
                             source="daemon",
+                            override=f"stale_downgrade (confidence={daemon_result.confidence:.2f})",
                         )
-                        continue  # Silently dropped (safety: never drop Dad)
+                        context_msgs.append(m)
                     else:
                         self._live.emit(
                             "classification", channel_key,
                             sender=m.metadata.get("author_name", m.sender_id),
-                            result="context",
+                            result="respond",
                             source="daemon",
                         )
-                        context_msgs.append(m)
-                    continue
-                except Exception as e:
-                    logger.debug(f"Daemon failed for message, falling back: {e}")
+                        respond_msgs.append(m)
+                elif daemon_result.classification.value == "drop" and not is_dad:
+                    self._live.emit(
+                        "classification", channel_key,
+                        sender=m.metadata.get("author_name", m.sender_id),
+                        result="drop",
+                        source="daemon",
+                    )
+                    continue  # Silently dropped (safety: never drop Dad)
+                else:
+                    self._live.emit(
+                        "classification", channel_key,
+                        sender=m.metadata.get("author_name", m.sender_id),
+                        result="context",
+                        source="daemon",
+                    )
+                    context_msgs.append(m)
+                continue
 
             # Fallback: hardcoded classification (daemon unavailable or failed)
             tier = self._classify_message(m, _channel_state)
@@ -1003,6 +1255,8 @@ class AgentLoop:
                 # Storing here caused duplication: messages appeared in both session
                 # history and thread context when the next respond batch was built.
                 logger.debug(f"Debounce: {len(context_msgs)} context-only messages in {channel_key}, lurked")
+            if batch.pending_checks is not None:
+                await self._resolve_pending_checks(batch)
             return
 
         # Thread-aware merge via conversation tracker (falls back to flat merge)
@@ -1018,7 +1272,7 @@ class AgentLoop:
                 participant_ids = _conv_mod.tracker.get_batch_participant_ids(
                     respond_msgs, context_msgs, channel_key,
                 )
-                self.module_registry.set_scene_participants(participant_ids)
+                batch.scene_participant_ids = participant_ids
             except Exception as e:
                 logger.error(f"Conversation tracker failed, falling back to flat merge: {e}")
                 merged = self._merge_messages_tiered(respond_msgs, context_msgs)
@@ -1119,7 +1373,7 @@ class AgentLoop:
                             metadata=thread_metadata,
                         )
 
-                        response = await self._process_message(focused_msg)
+                        response = await self._process_message(focused_msg, batch=batch)
                         if response:
                             self._live.emit(
                                 "response_sent", channel_key,
@@ -1150,7 +1404,7 @@ class AgentLoop:
 
             else:
                 # ── Single-thread path: existing behavior ──
-                response = await self._process_message(merged)
+                response = await self._process_message(merged, batch=batch)
                 if response:
                     self._live.emit(
                         "response_sent", channel_key,
@@ -1174,10 +1428,13 @@ class AgentLoop:
                     content=f"something broke: {str(e)[:200]}"
                 ))
         finally:
+            # Ene: fast-lane checks must land even if no reply was attempted —
+            # auto-mutes from security flags still apply
+            if batch.pending_checks is not None:
+                await self._resolve_pending_checks(batch)
             # Ene: live trace — clear processing state
             self._live.update_state(processing=None, active_batch=None)
-            # Clear scene participants after batch is done
-            self.module_registry.clear_scene_participants()
+            bind_batch(None)
 
     def _is_rate_limited(self, msg: "InboundMessage") -> bool:
         """Delegate to security.is_rate_limited (WHITELIST S3)."""
@@ -1220,13 +1477,13 @@ class AgentLoop:
             module_registry=self.module_registry,
         )
 
-    async def _debounce_timer(self, channel_key: str) -> None:
+    async def _debounce_timer(self, channel_key: str, window: float | None = None) -> None:
         """Wait for the debounce window, then flush batch to queue."""
-        await asyncio.sleep(self._debounce_window)
+        await asyncio.sleep(self._debounce_window if window is None else window)
         self._debounce_timers.pop(channel_key, None)
         self._enqueue_batch(channel_key)
 
-    def _enqueue_batch(self, channel_key: str) -> None:
+    def _enqueue_batch(self, channel_key: str, trigger: str = "timer") -> None:
         """Move current intake buffer into the processing queue."""
         batch = self._debounce_buffers.pop(channel_key, [])
         if not batch:
@@ -1237,12 +1494,10 @@ class AgentLoop:
         logger.debug(f"Queue: enqueued {len(batch)} messages for {channel_key} (queue depth: {len(self._channel_queues[channel_key])})")
 
         # Ene: live trace — batch flushed from buffer to queue
-        # Determine trigger: count-based if buffer was at limit, else timer
-        _trigger = "count" if len(batch) >= self._debounce_batch_limit else "timer"
         self._live.emit(
             "debounce_flush", channel_key,
             batch_size=len(batch),
-            trigger=_trigger,
+            trigger=trigger,
         )
 
         # Ene: live trace — update state snapshot
@@ -1302,7 +1557,8 @@ class AgentLoop:
 
             batch = queue.pop(0)
             try:
-                await self._process_batch(channel_key, batch)
+                async with self._batch_semaphore:
+                    await self._process_batch(channel_key, batch)
             except Exception as e:
                 logger.error(f"Queue: error processing batch in {channel_key}: {e}", exc_info=True)
         # Clean up empty queue
@@ -1338,9 +1594,11 @@ class AgentLoop:
         dropped_batches = sum(len(q) for q in self._channel_queues.values())
         self._debounce_buffers.clear()
         self._channel_queues.clear()
+        self._debouncer.reset()
 
-        # Invalidate session cache (forces reload from disk on next message)
-        self.sessions._cache.clear()
+        # Invalidate session cache (forces reload from disk on next message).
+        # Ene: pending saves are written first so the reload doesn't lose them
+        self.sessions.clear_cache()
 
         logger.warning(
             f"Hard reset: dropped {dropped_msgs} buffered msgs, "
@@ -1438,103 +1696,120 @@ class AgentLoop:
         except Exception as e:
             logger.debug(f"Latency warning send failed: {e}")
 
+    async def initialize(self) -> None:
+        """Connect MCP servers and initialize Ene modules (memory, personality, etc.).
+
+        run() does this itself. Call it directly for an agent that only
+        serves process_direct() — the sharded gateway's front agent, which
+        handles cron and heartbeat while workers handle the chats.
+        """
+        await self._connect_mcp()
+        await self._initialize_ene_modules()
+
     async def run(self) -> None:
         """Run the agent loop, processing messages from the bus."""
         self._running = True
-        await self._connect_mcp()
-
-        # Initialize Ene modules (memory, personality, etc.)
-        await self._initialize_ene_modules()
+        await self.initialize()
 
         # Start background tasks for idle watching and daily triggers
-        self._idle_watcher_task = asyncio.create_task(self._idle_watcher())
-        self._daily_trigger_task = asyncio.create_task(self._daily_trigger())
+        # (skipped in secondary gateway shards — daily maintenance runs once)
+        if self._background_tasks:
+            self._idle_watcher_task = asyncio.create_task(self._idle_watcher())
+            self._daily_trigger_task = asyncio.create_task(self._daily_trigger())
 
         logger.info("Agent loop started")
 
-        while self._running:
-            try:
-                msg = await asyncio.wait_for(
-                    self.bus.consume_inbound(),
-                    timeout=1.0
-                )
-                # Ene: live trace — message arrived
-                _sender_name = msg.metadata.get("author_name", msg.sender_id) if msg.metadata else msg.sender_id
-                _meta_flags = []
-                if msg.metadata:
-                    if msg.metadata.get("is_reply_to_ene"):
-                        _meta_flags.append("reply_to_ene")
-                    if msg.metadata.get("guild_id"):
-                        _meta_flags.append("guild")
-                    else:
-                        _meta_flags.append("DM")
+        # Ene: event-driven — wakes per message, ends as soon as stop() closes the bus
+        async for msg in self.bus.inbound_messages():
+            if not self._running:
+                break
+            # Ene: live trace — message arrived
+            _sender_name = msg.metadata.get("author_name", msg.sender_id) if msg.metadata else msg.sender_id
+            _meta_flags = []
+            if msg.metadata:
+                if msg.metadata.get("is_reply_to_ene"):
+                    _meta_flags.append("reply_to_ene")
+                if msg.metadata.get("guild_id"):
+                    _meta_flags.append("guild")
+                else:
+                    _meta_flags.append("DM")
+            self._live.emit(
+                "msg_arrived", msg.session_key,
+                sender=_sender_name,
+                content_preview=msg.content[:100],
+                metadata_flags=", ".join(_meta_flags) if _meta_flags else None,
+            )
+
+            # Ene: brain toggle — observe but don't process when brain is off
+            if not self._brain_enabled:
                 self._live.emit(
-                    "msg_arrived", msg.session_key,
+                    "brain_paused", msg.session_key,
                     sender=_sender_name,
-                    content_preview=msg.content[:100],
-                    metadata_flags=", ".join(_meta_flags) if _meta_flags else None,
+                    content_preview=msg.content[:80] if msg.content else "",
                 )
+                continue
 
-                # Ene: brain toggle — observe but don't process when brain is off
-                if not self._brain_enabled:
-                    self._live.emit(
-                        "brain_paused", msg.session_key,
-                        sender=_sender_name,
-                        content_preview=msg.content[:80] if msg.content else "",
-                    )
-                    continue
+            # Ene: system messages bypass debounce
+            if msg.channel == "system":
+                try:
+                    response = await self._process_message(msg)
+                    if response:
+                        await self.bus.publish_outbound(response)
+                except Exception as e:
+                    logger.error(f"Error processing system message: {e}", exc_info=True)
+                continue
 
-                # Ene: system messages bypass debounce
-                if msg.channel == "system":
-                    try:
-                        response = await self._process_message(msg)
-                        if response:
-                            await self.bus.publish_outbound(response)
-                    except Exception as e:
-                        logger.error(f"Error processing system message: {e}", exc_info=True)
-                    continue
+            # Ene: per-user rate limiting — drop spam before it enters the buffer
+            if self._is_rate_limited(msg):
+                continue
 
-                # Ene: per-user rate limiting — drop spam before it enters the buffer
-                if self._is_rate_limited(msg):
-                    continue
+            # Ene: debounce + queue — buffer messages, flush on time or count
+            channel_key = msg.session_key  # "channel:chat_id"
 
-                # Ene: debounce + queue — buffer messages, flush on time or count
-                channel_key = msg.session_key  # "channel:chat_id"
+            if channel_key not in self._debounce_buffers:
+                self._debounce_buffers[channel_key] = []
+            self._debounce_buffers[channel_key].append(msg)
 
-                if channel_key not in self._debounce_buffers:
-                    self._debounce_buffers[channel_key] = []
-                self._debounce_buffers[channel_key].append(msg)
+            # Ene: live trace — message added to debounce buffer
+            self._live.emit(
+                "debounce_add", channel_key,
+                sender=msg.metadata.get("author_name", msg.sender_id) if msg.metadata else msg.sender_id,
+                buffer_size=len(self._debounce_buffers[channel_key]),
+            )
 
-                # Ene: live trace — message added to debounce buffer
-                self._live.emit(
-                    "debounce_add", channel_key,
-                    sender=msg.metadata.get("author_name", msg.sender_id) if msg.metadata else msg.sender_id,
-                    buffer_size=len(self._debounce_buffers[channel_key]),
+            # Hard cap — drop oldest if flooding
+            if len(self._debounce_buffers[channel_key]) > self._debounce_max_buffer:
+                dropped = len(self._debounce_buffers[channel_key]) - self._debounce_max_buffer
+                self._debounce_buffers[channel_key] = self._debounce_buffers[channel_key][-self._debounce_max_buffer:]
+                logger.warning(f"Debounce: dropped {dropped} oldest in {channel_key} (buffer cap)")
+
+            # Ene: adaptive window — sized from this channel's arrival rate
+            self._debouncer.record_arrival(channel_key, f"{msg.channel}:{msg.sender_id}")
+            _window = self._debouncer.decide(channel_key, is_direct=is_direct_message(msg))
+
+            # Fast lane: a message addressed to Ene flushes immediately (taking
+            # whatever is buffered along as context). Count-based trigger:
+            # force-flush when batch limit reached.
+            _flush_now = None
+            if self._fast_lane and self._is_addressed(msg) and not self._is_muted(
+                f"{msg.channel}:{msg.sender_id}"
+            ):
+                _flush_now = "fast_lane"
+            elif len(self._debounce_buffers[channel_key]) >= _window.batch_limit:
+                _flush_now = "count"
+            if _flush_now:
+                existing = self._debounce_timers.pop(channel_key, None)
+                if existing and not existing.done():
+                    existing.cancel()
+                self._enqueue_batch(channel_key, trigger=_flush_now)
+            else:
+                # Time-based trigger: reset sliding window timer
+                existing = self._debounce_timers.get(channel_key)
+                if existing and not existing.done():
+                    existing.cancel()
+                self._debounce_timers[channel_key] = asyncio.create_task(
+                    self._debounce_timer(channel_key, _window.window)
                 )
-
-                # Hard cap — drop oldest if flooding
-                if len(self._debounce_buffers[channel_key]) > self._debounce_max_buffer:
-                    dropped = len(self._debounce_buffers[channel_key]) - self._debounce_max_buffer
-                    self._debounce_buffers[channel_key] = self._debounce_buffers[channel_key][-self._debounce_max_buffer:]
-                    logger.warning(f"Debounce: dropped {dropped} oldest in {channel_key} (buffer cap)")
-
-                # Count-based trigger: force-flush when batch limit reached
-                if len(self._debounce_buffers[channel_key]) >= self._debounce_batch_limit:
-                    existing = self._debounce_timers.pop(channel_key, None)
-                    if existing and not existing.done():
-                        existing.cancel()
-                    self._enqueue_batch(channel_key)
-                else:
-                    # Time-based trigger: reset sliding window timer
-                    existing = self._debounce_timers.get(channel_key)
-                    if existing and not existing.done():
-                        existing.cancel()
-                    self._debounce_timers[channel_key] = asyncio.create_task(
-                        self._debounce_timer(channel_key)
-                    )
-
-            except asyncio.TimeoutError:
-                continue
     
     async def close_mcp(self) -> None:
         """Close MCP connections and shutdown Ene modules."""
@@ -1552,12 +1827,20 @@ class AgentLoop:
     def stop(self) -> None:
         """Stop the agent loop."""
         self._running = False
+        # Ene: wake run() now instead of leaving it parked on an empty queue
+        self.bus.close_inbound()
+        # Ene: sessions may be write-behind — persist whatever is still pending
+        self.sessions.flush_all()
 
         # Cancel background tasks
         if self._idle_watcher_task and not self._idle_watcher_task.done():
             self._idle_watcher_task.cancel()
         if hasattr(self, "_daily_trigger_task") and self._daily_trigger_task and not self._daily_trigger_task.done():
             self._daily_trigger_task.cancel()
+        for key in list(self._rotation_tasks):
+            self._discard_rotation(key)
+        for task in self._summary_tasks.values():
+            task.cancel()
 
         logger.info("Agent loop stopping")
     
@@ -1634,97 +1917,232 @@ class AgentLoop:
         except ValueError:
             return False
 
-    async def _generate_running_summary(self, session: Session, key: str) -> str | None:
-        """Generate or update a running summary of older conversation messages.
+    def _prepare_rotation(self, session: Session, key: str) -> None:
+        """Start preparing the rotation summary in the background (once per session)."""
+        prepared = self._rotation_ready.get(key)
+        if prepared is not None and prepared.is_current(session):
+            return
+        task = self._rotation_tasks.get(key)
+        if task is not None and not task.done():
+            return
+        self._rotation_ready.pop(key, None)
+        self._rotation_tasks[key] = asyncio.create_task(self._build_rotation(session, key))
 
-        Uses recursive summarization: summarize the old summary + new messages
-        into a fresh summary. This keeps context compact while preserving
+    async def _build_rotation(self, session: Session, key: str) -> None:
+        """Summarize everything before the verbatim window for a later rotation."""
+        covered = session.recent_window_start(self._recent_history_tokens)
+        if covered == 0:
+            return
+        # Captured before the LLM call: messages arriving meanwhile are carried over
+        prepared = PreparedRotation.capture(session, "", covered)
+        try:
+            prepared.summary = await self._generate_running_summary(session, key, force=True) or ""
+        except Exception as e:
+            logger.warning(f"Failed to prepare rotation summary for {key}: {e}")
+            return
+        finally:
+            if self._rotation_tasks.get(key) is asyncio.current_task():
+                del self._rotation_tasks[key]
+        self._rotation_ready[key] = prepared
+        logger.debug(f"Rotation summary ready for {key} ({covered} messages covered)")
+
+    async def _generate_rotation_inline(self, session: Session, key: str) -> PreparedRotation:
+        """Summarize the history before rotating (nothing was prepared in time)."""
+        covered = session.recent_window_start(self._recent_history_tokens) or len(session.messages)
+        prepared = PreparedRotation.capture(session, "", covered)
+        try:
+            prepared.summary = await self._generate_running_summary(session, key, force=True) or ""
+        except Exception as e:
+            logger.warning(f"Failed to summarize {key} before rotating: {e}")
+        return prepared
+
+    def _discard_rotation(self, key: str) -> None:
+        """Drop a prepared or in-progress rotation summary."""
+        self._rotation_ready.pop(key, None)
+        task = self._rotation_tasks.pop(key, None)
+        if task is not None and not task.done():
+            task.cancel()
+
+    async def _rotate_session(self, session: Session, key: str, estimated_tokens: int) -> None:
+        """Swap a prepared summary in for the session's history (no LLM call).
+
+        If the summary is still being prepared, rotation waits for it until
+        the session exceeds the full budget. Past that, or with nothing
+        prepared, the last running summary seeds the new session instead;
+        with no running summary either, one is generated inline.
+        """
+        budget = self._history_token_budget
+        prepared = self._rotation_ready.get(key)
+        if prepared is None or not prepared.is_current(session):
+            pending = self._rotation_tasks.get(key)
+            if estimated_tokens <= budget and (
+                (pending is not None and not pending.done()) or len(session.messages) > 5
+            ):
+                self._prepare_rotation(session, key)
+                return
+            running = RunningSummary.load(session)
+            if running is not None or len(session.messages) <= 5:
+                prepared = PreparedRotation.capture(
+                    session, running.text if running else "", len(session.messages),
+                )
+            else:
+                prepared = await self._generate_rotation_inline(session, key)
+
+        logger.warning(
+            f"Session {key} at {estimated_tokens} tokens "
+            f"(~{estimated_tokens * 100 // budget}% budget), auto-rotating"
+        )
+        self._discard_rotation(key)
+        messages_to_archive = prepared.apply(session)
+        RunningSummary.clear(session)
+        self.sessions.save(session)
+        self.sessions.invalidate(session.key)
+
+        # Background consolidation of archived messages
+        async def _consolidate_old(_msgs=messages_to_archive, _key=key):
+            temp_session = Session(key=_key)
+            temp_session.messages = _msgs
+            await self._consolidate_memory(temp_session, archive_all=True)
+        asyncio.create_task(_consolidate_old())
+        logger.info(
+            f"Auto-rotated session {key} ({estimated_tokens} tokens), "
+            f"summary {'injected' if prepared.summary else 'empty'}, "
+            f"{len(session.messages) - bool(prepared.summary)} messages carried over"
+        )
+
+    async def _generate_running_summary(
+        self, session: Session, key: str, force: bool = False,
+    ) -> str | None:
+        """Running summary of the conversation before the verbatim window.
+
+        Uses recursive summarization: fold new messages into the old summary
+        to get a fresh one. This keeps context compact while preserving
         important information. (Wang et al. 2023, MemGPT pattern)
 
-        Only called when session has enough messages to warrant summarization.
+        The summary is persisted in the session with the message offset it
+        covers (nanobot.session.summary), so restarts don't regenerate it and
+        each update only folds in messages added since. The first summary is
+        generated inline; after that the stored one is returned at once and
+        an update is scheduled in the background when enough unsummarized
+        messages have piled up (get_hybrid_history keeps those verbatim
+        meanwhile). force waits for a summary of the whole prefix (rotation).
         """
-        # How many recent messages to keep verbatim
-        recent_count = 12
-
-        if len(session.messages) <= recent_count:
-            return self._session_summaries.get(key)
-
-        # Ene: throttle — only regenerate summary every 3 messages to avoid extra LLM calls
-        counter = self._summary_msg_counters.get(key, 0) + 1
-        self._summary_msg_counters[key] = counter
-        if counter < 3 and key in self._session_summaries:
-            return self._session_summaries[key]  # reuse cached summary
-        self._summary_msg_counters[key] = 0  # reset counter on regen
-
-        # Messages that need summarizing: everything before the recent window
-        older_messages = session.messages[:-recent_count]
-        if not older_messages:
-            return self._session_summaries.get(key)
-
-        # Ene: structured speaker-tagged formatting (same as diary consolidation)
-        author_re = re.compile(r'(?:^|\n)(.+?) \(@(\w+)\): ', re.MULTILINE)
-        lines = []
-        for m in older_messages[-40:]:  # Cap at 40 messages to avoid huge prompts
-            content = m.get("content", "")
-            if not content:
-                continue
-            if m["role"] == "assistant":
-                lines.append(f"[Ene]: {content[:300]}")
-            else:
-                # Parse author from merged message format
-                matches = list(author_re.finditer(content))
-                if matches:
-                    for i, match in enumerate(matches):
-                        display, username = match.group(1), match.group(2)
-                        start = match.end()
-                        end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
-                        text = content[start:end].strip()
-                        lines.append(f"[{display} @{username}]: {text[:300]}")
-                else:
-                    display = m.get("author_name") or "Someone"
-                    lines.append(f"[{display}]: {content[:300]}")
-        if not lines:
-            return self._session_summaries.get(key)
-
-        older_text = "\n".join(lines)
-
-        existing_summary = self._session_summaries.get(key, "")
-        if existing_summary:
-            prompt = self._prompts.load(
-                "summary_update",
-                existing_summary=existing_summary,
-                older_text=older_text,
+        # Everything before the verbatim window (same budget as get_hybrid_history)
+        recent_start = session.recent_window_start(self._recent_history_tokens)
+        current = RunningSummary.load(session)
+        if recent_start == 0 or (current is not None and current.covered >= recent_start):
+            return current.text if current else None
+
+        if current is not None and not force:
+            backlog = sum(
+                message_tokens(m, self.sessions.token_model)
+                for m in session.messages[current.covered:recent_start]
             )
-        else:
-            prompt = self._prompts.load("summary_new", older_text=older_text)
-
+            if backlog >= self._summary_fold_tokens:
+                self._schedule_summary(session, key)
+            return current.text
+
+        pending = self._summary_tasks.get(key)
+        if pending is not None:
+            await asyncio.shield(pending)  # Let an update in flight land first
+            current = RunningSummary.load(session)
+            if current is not None and current.covered >= recent_start:
+                return current.text
+        await asyncio.shield(self._schedule_summary(session, key))
+        current = RunningSummary.load(session)
+        return current.text if current else None
+
+    def _schedule_summary(self, session: Session, key: str) -> asyncio.Task:
+        """Start a background summary update (one per session at a time)."""
+        task = self._summary_tasks.get(key)
+        if task is None or task.done():
+            task = asyncio.create_task(self._fold_summary(session, key))
+            self._summary_tasks[key] = task
+        return task
+
+    async def _fold_summary(self, session: Session, key: str) -> None:
+        """Fold messages that left the verbatim window into the stored summary."""
         try:
-            model = self.consolidation_model or self.model
-            _obs_start = _time.perf_counter()
-            response = await self.provider.chat(
-                messages=[
-                    {"role": "system", "content": self._prompts.load("summary_system")},
-                    {"role": "user", "content": prompt},
-                ],
-                model=model,
-            )
-            if self._observatory:
-                self._observatory.record(
-                    response, call_type="summary", model=model,
-                    caller_id="system", latency_start=_obs_start,
+            recent_start = session.recent_window_start(self._recent_history_tokens)
+            current = RunningSummary.load(session)
+            new_messages = session.messages[current.covered if current else 0:recent_start]
+            if not new_messages:
+                return
+            # Captured before the LLM call: the summary will cover exactly these
+            target = RunningSummary.capture(session, recent_start, current.text if current else "")
+
+            # Ene: structured speaker-tagged formatting (same as diary consolidation)
+            author_re = re.compile(r'(?:^|\n)(.+?) \(@(\w+)\): ', re.MULTILINE)
+            lines = []
+            for m in new_messages[-40:]:  # Cap at 40 messages to avoid huge prompts
+                content = m.get("content", "")
+                if not content:
+                    continue
+                if m["role"] == "assistant":
+                    lines.append(f"[Ene]: {content[:300]}")
+                else:
+                    # Parse author from merged message format
+                    matches = list(author_re.finditer(content))
+                    if matches:
+                        for i, match in enumerate(matches):
+                            display, username = match.group(1), match.group(2)
+                            start = match.end()
+                            end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+                            text = content[start:end].strip()
+                            lines.append(f"[{display} @{username}]: {text[:300]}")
+                    else:
+                        display = m.get("author_name") or "Someone"
+                        lines.append(f"[{display}]: {content[:300]}")
+
+            if lines:
+                older_text = "\n".join(lines)
+                if target.text:
+                    prompt = self._prompts.load(
+                        "summary_update",
+                        existing_summary=target.text,
+                        older_text=older_text,
+                    )
+                else:
+                    prompt = self._prompts.load("summary_new", older_text=older_text)
+
+                model = self.consolidation_model or self.model
+                _obs_start = _time.perf_counter()
+                response = await self.provider.chat(
+                    messages=[
+                        {"role": "system", "content": self._prompts.load("summary_system")},
+                        {"role": "user", "content": prompt},
+                    ],
+                    model=model,
                 )
-            summary = (response.content or "").strip()
-            if summary:
+                if self._observatory:
+                    self._observatory.record(
+                        response, call_type="summary", model=model,
+                        caller_id="system", latency_start=_obs_start,
+                    )
+                summary = (response.content or "").strip()
+                if not summary:
+                    return
                 # Strip markdown fences
                 if summary.startswith("```"):
                     summary = summary.split("\n", 1)[-1].rsplit("```", 1)[0].strip()
-                self._session_summaries[key] = summary
-                logger.debug(f"Updated running summary for {key}: {summary[:80]}")
-                return summary
+                target.text = summary
+            if not target.text:
+                return
+
+            # The session may have been evicted and reloaded meanwhile — store
+            # on the live object, as long as it still starts with what we summarized
+            live = self.sessions.get_or_create(key)
+            if not target.is_current(live):
+                logger.debug(f"Discarded running summary for {key}: history changed meanwhile")
+                return
+            target.store(live)
+            self.sessions.save(live)
+            logger.debug(f"Updated running summary for {key} ({target.covered} messages): {target.text[:80]}")
         except Exception as e:
             logger.warning(f"Failed to generate running summary: {e}")
-
-        return self._session_summaries.get(key)
+        finally:
+            if self._summary_tasks.get(key) is asyncio.current_task():
+                del self._summary_tasks[key]
 
     def _should_reanchor(self, session: Session) -> bool:
         """Check if identity re-anchoring is needed to prevent persona drift.
@@ -1732,16 +2150,23 @@ class AgentLoop:
         Research (DeepSeek v3.2 documented): persona drift starts at 8-12 turns.
         We inject a brief identity reminder every N assistant messages.
         """
-        assistant_count = sum(1 for m in session.messages if m.get("role") == "assistant")
+        assistant_count = session.get_responded_count()
         return assistant_count > 0 and assistant_count % self._reanchor_interval == 0
 
-    async def _process_message(self, msg: InboundMessage, session_key: str | None = None) -> OutboundMessage | None:
+    async def _process_message(
+        self,
+        msg: InboundMessage,
+        session_key: str | None = None,
+        batch: BatchContext | None = None,
+    ) -> OutboundMessage | None:
         """
         Process a single inbound message.
         
         Args:
             msg: The inbound message to process.
             session_key: Override session key (used by process_direct).
+            batch: Per-batch execution context from _process_batch. A fresh
+                one is created for direct calls (CLI, cron, system bypass).
         
         Returns:
             The response message, or None if no response needed.
@@ -1750,20 +2175,18 @@ class AgentLoop:
         if msg.channel == "system":
             return await self._process_system_message(msg)
 
-        # Ene: track who's talking for tool permission checks
-        self._current_caller_id = f"{msg.channel}:{msg.sender_id}"
-        self._current_inbound_msg = msg  # Ene: for message tool cleaning
-        self._last_message_content = None  # Reset per-batch
+        if batch is None:
+            batch = BatchContext(channel_key=session_key or msg.session_key)
+            bind_batch(batch)
+
+        # Ene: track who's talking (tool permissions, person cards, message tool cleaning)
+        batch.bind_message(msg)
         self._last_message_time = _time.time()  # Ene: update for idle tracking
 
         # Ene: start debug trace for this message
-        self._trace = DebugTrace(self._log_dir, msg.sender_id, msg.channel)
-        self._trace.log_inbound(msg)
-
-        # Ene: tell modules who is speaking (for person cards, trust context)
-        self.module_registry.set_current_sender(
-            msg.sender_id, msg.channel, msg.metadata or {}
-        )
+        batch.trace = DebugTrace(self._log_dir, msg.sender_id, msg.channel)
+        batch.trace.log_inbound(msg)
+        trace = batch.trace
 
         # Ene: pass mute state to context builder so Ene sees who she's muted
         self.context.set_mute_state(self._muted_users)
@@ -1792,10 +2215,9 @@ class AgentLoop:
                 "*Not listening to you right now.* \U0001f44b",
             ]
             logger.debug(f"Muted response to {_mute_caller}")
-            if self._trace:
-                self._trace.log_should_respond(False, "user is muted")
-                self._trace.log_final(None)
-                self._trace.save()
+            trace.log_should_respond(False, "user is muted")
+            trace.log_final(None)
+            trace.save()
             return OutboundMessage(
                 channel=msg.channel,
                 chat_id=msg.chat_id,
@@ -1812,10 +2234,9 @@ class AgentLoop:
                 decision=False,
                 reason="lurk mode",
             )
-            if self._trace:
-                self._trace.log_should_respond(False, "lurk mode")
-                self._trace.log_final(None)
-                self._trace.save()
+            trace.log_should_respond(False, "lurk mode")
+            trace.log_final(None)
+            trace.save()
             author = self._format_author(msg)
             caller_id = f"{msg.channel}:{msg.sender_id}"
 
@@ -1845,7 +2266,8 @@ class AgentLoop:
         if cmd == "/new":
             # Ene: capture running summary BEFORE clearing so the new session
             # starts with context from the previous conversation
-            existing_summary = self._session_summaries.get(key, "")
+            running = RunningSummary.load(session)
+            existing_summary = running.text if running else ""
             if not existing_summary and len(session.messages) > 5:
                 try:
                     existing_summary = await self._generate_running_summary(session, key) or ""
@@ -1855,6 +2277,7 @@ class AgentLoop:
             # Capture messages before clearing (avoid race condition with background task)
             messages_to_archive = session.messages.copy()
             session.clear()
+            RunningSummary.clear(session)  # Ene: clear running summary
 
             # Inject summary as seed context for new session
             if existing_summary:
@@ -1865,8 +2288,7 @@ class AgentLoop:
 
             self.sessions.save(session)
             self.sessions.invalidate(session.key)
-            self._session_summaries.pop(key, None)  # Ene: clear running summary
-            self._summary_msg_counters.pop(key, None)  # Ene: clear summary throttle
+            self._discard_rotation(key)  # Ene: prepared summary no longer applies
 
             async def _consolidate_and_cleanup():
                 temp_session = Session(key=session.key)
@@ -1886,7 +2308,7 @@ class AgentLoop:
         # 2. Token estimate > 50% of context budget (auto-compaction)
         #    DeepSeek v3.2 has 128K context, but we budget ~60K for history
         #    to leave room for system prompt, tools, and output
-        HISTORY_TOKEN_BUDGET = 60_000
+        HISTORY_TOKEN_BUDGET = self._history_token_budget
         responded_count = session.get_responded_count()
         estimated_tokens = session.estimate_tokens()
         should_consolidate = (
@@ -1895,7 +2317,7 @@ class AgentLoop:
         )
         if should_consolidate:
             asyncio.create_task(self._consolidate_memory(session))
-            if estimated_tokens > HISTORY_TOKEN_BUDGET * 0.8:
+            if estimated_tokens > HISTORY_TOKEN_BUDGET * self._rotation_at:
                 # Auto-rotation in _process_batch handles this, but log as safety net
                 logger.info(
                     f"Session {key} at {estimated_tokens} tokens "
@@ -1908,13 +2330,16 @@ class AgentLoop:
         # Ene: hybrid context window
         # If session is large enough, use summary of older + verbatim recent
         # (per "Lost in the Middle" research: summaries in middle, recent at end)
-        recent_verbatim = 12  # Recent messages kept word-for-word (reduced from 20 to cut token cost)
-        if len(session.messages) > recent_verbatim + 5:
+        # Recent messages are kept word-for-word up to a token budget, so a few
+        # long messages can't blow the window and many short ones aren't cut early
+        if session.recent_window_start(self._recent_history_tokens) > 5:
             # Generate/update running summary for older messages
             summary = await self._generate_running_summary(session, key)
+            running = RunningSummary.load(session)
             history = session.get_hybrid_history(
-                recent_count=recent_verbatim,
                 summary=summary,
+                token_budget=self._recent_history_tokens,
+                summary_covers=running.covered if running else None,
             )
         else:
             history = session.get_history(max_messages=self.memory_window)
@@ -1959,21 +2384,38 @@ class AgentLoop:
             reason="matched response criteria",
         )
 
-        initial_messages = self.context.build_messages(
+        initial_messages = await self.context.build_messages_async(
             history=history,
             current_message=sanitized_current,
             media=msg.media if msg.media else None,
             channel=msg.channel,
             chat_id=msg.chat_id,
             reanchor=reanchor_text,
+            batch=batch,
+            history_tokens=session.history_tokens(history),
         )
 
+        # Ene: fast lane — the daemon checked addressed messages while the
+        # context above was built. Apply its verdict before spending an LLM call.
+        if batch.pending_checks is not None:
+            await self._resolve_pending_checks(batch)
+        if f"{msg.channel}:{msg.sender_id}" in batch.blocked_senders:
+            logger.info(f"Fast lane: reply in {key} blocked (sender auto-muted by daemon)")
+            self._live.emit("should_respond", key, decision=False, reason="auto-muted by daemon")
+            trace.log_should_respond(False, "auto-muted by daemon")
+            trace.log_final(None)
+            trace.save()
+            return None
+        if batch.late_context:
+            # Daemon notes arrived after the prompt was assembled — add them
+            # to the per-call context rather than a message of their own
+            self.context.add_late_context(initial_messages, batch.late_context)
+
         # Ene: trace the full prompt being sent
-        if self._trace:
-            self._trace.log_should_respond(True, "matched response criteria")
-            if initial_messages and initial_messages[0].get("role") == "system":
-                self._trace.log_system_prompt(initial_messages[0].get("content", ""))
-            self._trace.log_messages_array(initial_messages)
+        trace.log_should_respond(True, "matched response criteria")
+        if initial_messages and initial_messages[0].get("role") == "system":
+            trace.log_system_prompt(initial_messages[0].get("content", ""))
+        trace.log_messages_array(initial_messages)
 
         # Ene: prompt log — emit the full prompt array we're about to send to Ene
         self._live.emit_prompt(
@@ -1982,16 +2424,46 @@ class AgentLoop:
             messages=initial_messages,
         )
 
-        # Ene: if the LLM is slow (API lag), send a canned notice after 18s.
-        # Timer is cancelled immediately when _run_agent_loop returns.
-        _reply_to = (msg.metadata or {}).get("message_id")
-        _latency_task = asyncio.create_task(
-            self._latency_warning(msg.channel, msg.chat_id, _reply_to)
-        )
+        # Ene: streamed replies show progress as they are generated, so the
+        # canned latency notice is only needed for non-streamed calls.
+        _latency_task = None
+        if self.stream_responses:
+            batch.streamer = ReplyStreamer(
+                self.bus, msg, lambda text: self._ene_clean_response(text, msg),
+            )
+        else:
+            # Ene: if the LLM is slow (API lag), send a canned notice after 18s.
+            # Timer is cancelled immediately when _run_agent_loop returns.
+            _reply_to = (msg.metadata or {}).get("message_id")
+            _latency_task = asyncio.create_task(
+                self._latency_warning(msg.channel, msg.chat_id, _reply_to)
+            )
         try:
-            final_content, tools_used = await self._run_agent_loop(initial_messages)
+            final_content, tools_used = await self._run_agent_loop(initial_messages, batch=batch)
         finally:
-            _latency_task.cancel()
+            if _latency_task:
+                _latency_task.cancel()
+
+        try:
+            return await self._finish_response(
+                msg, key, session, batch, trace, final_content, tools_used,
+            )
+        finally:
+            if batch.streamer:
+                await batch.streamer.close()  # Retract a preview that never became a reply
+                batch.streamer = None
+
+    async def _finish_response(
+        self,
+        msg: InboundMessage,
+        key: str,
+        session: Session,
+        batch: BatchContext,
+        trace: DebugTrace,
+        final_content: str | None,
+        tools_used: list[str],
+    ) -> OutboundMessage | None:
+        """Record the agent loop's result and build the outbound reply (if any)."""
 
         # Ene: if agent loop returned None, the response was already sent via
         # message tool OR the loop broke (tool loop, duplicate sends, etc.).
@@ -2014,7 +2486,7 @@ class AgentLoop:
                 _hist_pid = f"{msg.channel}:{msg.sender_id}"
                 _hist_content = condense_for_session(msg.content, msg.metadata or {})
                 session.add_message("user", sanitize_dad_ids(_hist_content, _hist_pid))
-                _assistant_content = self._last_message_content or "[no response]"
+                _assistant_content = batch.last_message_content or "[no response]"
                 session.add_message("assistant", _assistant_content,
                                     tools_used=tools_used)
                 self.sessions.save(session)
@@ -2082,12 +2554,11 @@ class AgentLoop:
         )
 
         # Ene: trace cleaning and final output
-        if self._trace:
-            self._trace.log_cleaning(final_content, cleaned)
-            self._trace.log_final(cleaned)
-            trace_path = self._trace.save()
-            logger.debug(f"Debug trace saved: {trace_path}")
-            self._trace = None
+        trace.log_cleaning(final_content, cleaned)
+        trace.log_final(cleaned)
+        trace_path = trace.save()
+        logger.debug(f"Debug trace saved: {trace_path}")
+        batch.trace = None
 
         if not cleaned:
             logger.debug("Response cleaned to empty, not sending")
@@ -2102,13 +2573,16 @@ class AgentLoop:
         preview = cleaned[:120] + "..." if len(cleaned) > 120 else cleaned
         logger.info(f"Response to {msg.channel}:{msg.sender_id}: {preview}")
 
-        return OutboundMessage(
+        outbound = OutboundMessage(
             channel=msg.channel,
             chat_id=msg.chat_id,
             content=cleaned,
             reply_to=msg.metadata.get("message_id"),  # Ene: thread replies to original message
             metadata=msg.metadata or {},
         )
+        if batch.streamer:
+            outbound = await batch.streamer.finalize(outbound)
+        return outbound
     
     async def _process_system_message(self, msg: InboundMessage) -> OutboundMessage | None:
         """
@@ -2132,11 +2606,13 @@ class AgentLoop:
         session_key = f"{origin_channel}:{origin_chat_id}"
         session = self.sessions.get_or_create(session_key)
         self._set_tool_context(origin_channel, origin_chat_id)
-        initial_messages = self.context.build_messages(
-            history=session.get_history(max_messages=self.memory_window),
+        history = session.get_history(max_messages=self.memory_window)
+        initial_messages = await self.context.build_messages_async(
+            history=history,
             current_message=msg.content,
             channel=origin_channel,
             chat_id=origin_chat_id,
+            history_tokens=session.history_tokens(history),
         )
         final_content, _ = await self._run_agent_loop(initial_messages)
 
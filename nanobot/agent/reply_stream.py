@@ -0,0 +1,186 @@
+"""Progressive reply delivery — turns a streamed LLM response into message edits.
+
+The provider reports cumulative (content, tool_calls) snapshots while the
+response is generated. ReplyStreamer picks out the text that will become
+Ene's reply — plain content, or the partial ``content`` argument of a
+``message`` tool call — runs it through the normal response cleaner, and
+publishes throttled OutboundMessage updates sharing one stream_id.
+Channels that can edit messages (Discord, Telegram, Slack) post the first
+update and edit it in place; other channels ignore partial updates and
+only send the final message.
+
+Lifecycle (one streamer per _process_message call):
+
+    on_delta()   many times, across every LLM turn of the agent loop
+    finalize()   once, on the outbound message that is actually sent —
+                 tags it as the stream's final update so the preview is
+                 replaced rather than duplicated
+    close()      always; retracts a preview that never got finalized
+                 (loop broke, response cleaned to empty, tool-only turn)
+
+A preview can't be moved once posted: if the final message targets a
+different chat or reply thread than the preview, the preview is
+retracted and the final message is sent fresh.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+import uuid
+from typing import TYPE_CHECKING, Callable
+
+import json_repair
+from loguru import logger
+
+from nanobot.bus.events import OutboundMessage
+
+if TYPE_CHECKING:
+    from nanobot.bus.events import InboundMessage
+    from nanobot.bus.queue import MessageBus
+    from nanobot.providers.base import ToolCallBuffer
+
+# Minimum seconds between preview edits. Discord allows ~5 edits per 5s per
+# channel; one per second leaves headroom for typing and other sends.
+STREAM_UPDATE_INTERVAL: float = 1.0
+
+# Don't post a preview until there's something worth reading
+STREAM_MIN_CHARS: int = 24
+
+# Raw tool-call XML leaking as text (DeepSeek) must never be previewed
+_RAW_TOOL_XML = re.compile(r'<\s*(?:function|invoke|parameter)', re.IGNORECASE)
+
+
+class ReplyStreamer:
+    """Publishes progressive updates of one reply to the outbound bus."""
+
+    def __init__(
+        self,
+        bus: "MessageBus",
+        msg: "InboundMessage",
+        clean: Callable[[str], str | None],
+        update_interval: float = STREAM_UPDATE_INTERVAL,
+    ) -> None:
+        self._bus = bus
+        self._msg = msg
+        self._clean = clean
+        self._update_interval = update_interval
+        self.stream_id = uuid.uuid4().hex[:12]
+        self._shown = ""  # Last text published as a preview
+        self._shown_target: tuple[str, str, str | None] | None = None
+        self._last_publish = 0.0
+        self._done = False
+        self.updates = 0  # Preview updates published (sends + edits)
+
+    @property
+    def has_preview(self) -> bool:
+        """Whether a partial reply is currently visible in the channel."""
+        return bool(self._shown)
+
+    async def on_delta(self, content: str, tool_calls: list["ToolCallBuffer"]) -> None:
+        """StreamCallback: preview the reply text in the latest snapshot."""
+        if self._done:
+            return
+        now = time.monotonic()
+        if now - self._last_publish < self._update_interval:
+            return
+
+        extracted = self._extract(content, tool_calls)
+        if extracted is None:
+            return
+        text, target = extracted
+        if self._shown_target is not None and target != self._shown_target:
+            return  # Can't move a posted preview; finalize() handles the switch
+
+        try:
+            cleaned = self._clean(text)
+        except Exception as e:
+            logger.debug(f"Stream preview cleaning failed: {e}")
+            return
+        if not cleaned or cleaned == self._shown:
+            return
+        if not self._shown and len(cleaned) < STREAM_MIN_CHARS:
+            return
+
+        channel, chat_id, reply_to = target
+        await self._bus.publish_outbound(OutboundMessage(
+            channel=channel,
+            chat_id=chat_id,
+            content=cleaned,
+            reply_to=reply_to,
+            metadata=self._msg.metadata or {},
+            stream_id=self.stream_id,
+        ))
+        self._shown = cleaned
+        self._shown_target = target
+        self._last_publish = now
+        self.updates += 1
+
+    async def finalize(self, outbound: OutboundMessage) -> OutboundMessage:
+        """Mark outbound as this stream's final update (replacing the preview).
+
+        Returns the message to publish. Without a preview it is returned
+        untouched; if it targets somewhere else the preview is retracted
+        first and the message goes out as a normal send.
+        """
+        if self._done:
+            return outbound
+        self._done = True
+        if not self._shown:
+            return outbound
+        if (outbound.channel, outbound.chat_id, outbound.reply_to) != self._shown_target:
+            await self._retract()
+            return outbound
+        outbound.stream_id = self.stream_id
+        outbound.stream_final = True
+        return outbound
+
+    async def close(self) -> None:
+        """End the stream, retracting a preview that was never finalized."""
+        if self._done:
+            return
+        self._done = True
+        if self._shown:
+            await self._retract()
+
+    async def _retract(self) -> None:
+        channel, chat_id, reply_to = self._shown_target or (self._msg.channel, self._msg.chat_id, None)
+        await self._bus.publish_outbound(OutboundMessage(
+            channel=channel,
+            chat_id=chat_id,
+            content="",
+            reply_to=reply_to,
+            stream_id=self.stream_id,
+            stream_final=True,
+        ))
+        self._shown = ""
+
+    def _extract(
+        self, content: str, tool_calls: list["ToolCallBuffer"],
+    ) -> tuple[str, tuple[str, str, str | None]] | None:
+        """Return (reply text, (channel, chat_id, reply_to)) or None if not a reply."""
+        if tool_calls:
+            message_call = next((tc for tc in tool_calls if tc.name == "message"), None)
+            if message_call is None or not message_call.arguments:
+                return None  # Tool-only turn: nothing user-facing yet
+            try:
+                args = json_repair.loads(message_call.arguments)
+            except Exception:
+                return None
+            if not isinstance(args, dict) or not isinstance(args.get("content"), str):
+                return None
+            reply_to = args.get("reply_to") or None
+            if isinstance(reply_to, str) and reply_to.startswith("#msg"):
+                reply_to = (self._msg.metadata or {}).get("msg_id_map", {}).get(reply_to)
+            target = (
+                args.get("channel") or self._msg.channel,
+                args.get("chat_id") or self._msg.chat_id,
+                reply_to if isinstance(reply_to, str) else None,
+            )
+            return args["content"], target
+
+        if not content or _RAW_TOOL_XML.search(content):
+            return None
+        return content, (
+            self._msg.channel, self._msg.chat_id, (self._msg.metadata or {}).get("message_id"),
+        )
@@ -0,0 +1,64 @@
+"""Predictive session rotation.
+
+A session that outgrows the history budget is rotated: its messages are
+archived and the new session starts from a summary of the old one. The
+summary is an LLM call, so AgentLoop prepares it in the background once
+the session passes a lower watermark, and the batch that crosses the
+rotation threshold only swaps the prepared summary in.
+
+Messages that arrived after the summary was taken are carried over into
+the new session verbatim, so nothing falls between the summary and the
+rotation.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from nanobot.session.manager import Session
+
+
+@dataclass
+class PreparedRotation:
+    """A rotation summary prepared ahead of time for one session."""
+
+    summary: str
+    covered: int  # session.messages[:covered] are folded into the summary
+    anchor: dict[str, Any] | None  # session.messages[covered - 1] when prepared
+
+    @classmethod
+    def capture(cls, session: Session, summary: str, covered: int) -> PreparedRotation:
+        """Record which messages a summary covers (call before awaiting anything)."""
+        return cls(
+            summary=summary,
+            covered=covered,
+            anchor=session.messages[covered - 1] if covered else None,
+        )
+
+    def is_current(self, session: Session) -> bool:
+        """Whether the covered messages are still the session's prefix.
+
+        False once the session was cleared, rotated, edited or reloaded
+        since the summary was prepared — the summary no longer lines up.
+        """
+        if len(session.messages) < self.covered:
+            return False
+        return self.covered == 0 or session.messages[self.covered - 1] is self.anchor
+
+    def apply(self, session: Session) -> list[dict[str, Any]]:
+        """Rotate the session in place and return the archived messages.
+
+        The new session holds the summary seed followed by every message
+        the summary doesn't cover.
+        """
+        archived = session.messages[:self.covered]
+        carried = session.messages[self.covered:]
+        session.clear()
+        if self.summary:
+            session.messages.append({
+                "role": "system",
+                "content": f"[Previous session summary: {self.summary}]",
+            })
+        session.messages.extend(carried)
+        return archived
@@ -1,28 +1,166 @@
 """Skills loader for agent capabilities."""
 
+import hashlib
 import json
 import os
 import re
 import shutil
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 
 # Default builtin skills directory (relative to this file)
 BUILTIN_SKILLS_DIR = Path(__file__).parent.parent / "skills"
 
 
+@dataclass
+class SkillEntry:
+    """One indexed skill: everything the loader needs without touching disk."""
+
+    name: str
+    path: Path
+    source: str  # "workspace" or "builtin"
+    content: str
+    content_hash: str
+    stamp: tuple[int, int]  # (mtime_ns, size) of SKILL.md when read
+    metadata: dict = field(default_factory=dict)  # Frontmatter
+    nanobot_meta: dict = field(default_factory=dict)  # Parsed "metadata" JSON
+    missing: str = ""  # Unmet requirements, empty when available
+
+    @property
+    def description(self) -> str:
+        return self.metadata.get("description") or self.name
+
+    @property
+    def available(self) -> bool:
+        return not self.missing
+
+
 class SkillsLoader:
     """
     Loader for agent skills.
     
     Skills are markdown files (SKILL.md) that teach the agent how to use
     specific tools or perform certain tasks.
+    
+    Every SKILL.md is read and parsed once into an in-memory index. The
+    skill directories are polled (stat only) at most every poll_interval
+    seconds and changed files are re-read; reload() forces a full rebuild.
+    Requirement checks (CLI on PATH, env vars) are cached for
+    requirements_ttl seconds. `version` changes whenever anything served
+    from the index changes, so callers can cache what they derive from it.
     """
     
-    def __init__(self, workspace: Path, builtin_skills_dir: Path | None = None):
+    def __init__(
+        self,
+        workspace: Path,
+        builtin_skills_dir: Path | None = None,
+        poll_interval: float = 2.0,
+        requirements_ttl: float = 60.0,
+    ):
         self.workspace = workspace
         self.workspace_skills = workspace / "skills"
         self.builtin_skills = builtin_skills_dir or BUILTIN_SKILLS_DIR
+        self.poll_interval = poll_interval
+        self.requirements_ttl = requirements_ttl
+        self._index: dict[str, SkillEntry] | None = None
+        self._version = 0
+        self._polled_at = 0.0
+        self._checked_at = 0.0
     
+    # ── Index ──────────────────────────────────────────────
+
+    @property
+    def version(self) -> int:
+        """Bumped whenever a skill is added, removed, edited or changes availability."""
+        self._ensure_index()
+        return self._version
+
+    def reload(self) -> None:
+        """Rebuild the index from disk now (re-reads every SKILL.md)."""
+        self._index = None
+        self._ensure_index()
+
+    def _ensure_index(self) -> dict[str, SkillEntry]:
+        now = time.monotonic()
+        if self._index is None or now - self._polled_at >= self.poll_interval:
+            if self._index is None:
+                self._checked_at = now  # Fresh entries are checked as they're read
+            self._polled_at = now
+            self._refresh()
+        if now - self._checked_at >= self.requirements_ttl:
+            self._checked_at = now
+            self._recheck_requirements()
+        return self._index
+
+    def _scan(self) -> dict[str, tuple[Path, str, tuple[int, int]]]:
+        """Stat every SKILL.md: name -> (path, source, stamp). Workspace shadows builtin."""
+        found: dict[str, tuple[Path, str, tuple[int, int]]] = {}
+        for root, source in ((self.workspace_skills, "workspace"), (self.builtin_skills, "builtin")):
+            if not root or not root.exists():
+                continue
+            for skill_dir in sorted(root.iterdir()):
+                if skill_dir.name in found:
+                    continue
+                skill_file = skill_dir / "SKILL.md"
+                try:
+                    stat = skill_file.stat()
+                except OSError:
+                    continue
+                found[skill_dir.name] = (skill_file, source, (stat.st_mtime_ns, stat.st_size))
+        return found
+
+    def _refresh(self) -> None:
+        """Re-read skills whose file changed; drop skills that disappeared."""
+        old = self._index or {}
+        index: dict[str, SkillEntry] = {}
+        for name, (path, source, stamp) in self._scan().items():
+            entry = old.get(name)
+            if entry is None or entry.path != path or entry.stamp != stamp:
+                entry = self._read_entry(name, path, source, stamp)
+                if entry is None:
+                    continue
+            index[name] = entry
+
+        def contents(entries: dict[str, SkillEntry]) -> dict[str, tuple[Path, str]]:
+            return {name: (e.path, e.content_hash) for name, e in entries.items()}
+
+        if self._index is None or contents(index) != contents(old):
+            self._version += 1
+        self._index = index
+
+    def _read_entry(self, name: str, path: Path, source: str, stamp: tuple[int, int]) -> SkillEntry | None:
+        try:
+            content = path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        metadata = self._parse_frontmatter(content) or {}
+        nanobot_meta = self._parse_nanobot_metadata(metadata.get("metadata", ""))
+        return SkillEntry(
+            name=name,
+            path=path,
+            source=source,
+            content=content,
+            content_hash=hashlib.sha256(content.encode("utf-8")).hexdigest(),
+            stamp=stamp,
+            metadata=metadata,
+            nanobot_meta=nanobot_meta,
+            missing=self._get_missing_requirements(nanobot_meta),
+        )
+
+    def _recheck_requirements(self) -> None:
+        """Re-run requirement checks; a skill changing availability bumps the version."""
+        flipped = False
+        for entry in self._index.values():
+            missing = self._get_missing_requirements(entry.nanobot_meta)
+            if missing != entry.missing:
+                entry.missing = missing
+                flipped = True
+        if flipped:
+            self._version += 1
+
+    # ── Queries (served from the index) ────────────────────
+
     def list_skills(self, filter_unavailable: bool = True) -> list[dict[str, str]]:
         """
         List all available skills.
@@ -33,28 +171,11 @@ class SkillsLoader:
         Returns:
             List of skill info dicts with 'name', 'path', 'source'.
         """
-        skills = []
-        
-        # Workspace skills (highest priority)
-        if self.workspace_skills.exists():
-            for skill_dir in self.workspace_skills.iterdir():
-                if skill_dir.is_dir():
-                    skill_file = skill_dir / "SKILL.md"
-                    if skill_file.exists():
-                        skills.append({"name": skill_dir.name, "path": str(skill_file), "source": "workspace"})
-        
-        # Built-in skills
-        if self.builtin_skills and self.builtin_skills.exists():
-            for skill_dir in self.builtin_skills.iterdir():
-                if skill_dir.is_dir():
-                    skill_file = skill_dir / "SKILL.md"
-                    if skill_file.exists() and not any(s["name"] == skill_dir.name for s in skills):
-                        skills.append({"name": skill_dir.name, "path": str(skill_file), "source": "builtin"})
-        
-        # Filter by requirements
-        if filter_unavailable:
-            return [s for s in skills if self._check_requirements(self._get_skill_meta(s["name"]))]
-        return skills
+        return [
+            {"name": e.name, "path": str(e.path), "source": e.source}
+            for e in self._ensure_index().values()
+            if e.available or not filter_unavailable
+        ]
     
     def load_skill(self, name: str) -> str | None:
         """
@@ -66,18 +187,8 @@ class SkillsLoader:
         Returns:
             Skill content or None if not found.
         """
-        # Check workspace first
-        workspace_skill = self.workspace_skills / name / "SKILL.md"
-        if workspace_skill.exists():
-            return workspace_skill.read_text(encoding="utf-8")
-        
-        # Check built-in
-        if self.builtin_skills:
-            builtin_skill = self.builtin_skills / name / "SKILL.md"
-            if builtin_skill.exists():
-                return builtin_skill.read_text(encoding="utf-8")
-        
-        return None
+        entry = self._ensure_index().get(name)
+        return entry.content if entry else None
     
     def load_skills_for_context(self, skill_names: list[str]) -> str:
         """
@@ -108,31 +219,23 @@ class SkillsLoader:
         Returns:
             XML-formatted skills summary.
         """
-        all_skills = self.list_skills(filter_unavailable=False)
-        if not all_skills:
+        entries = list(self._ensure_index().values())
+        if not entries:
             return ""
         
         def escape_xml(s: str) -> str:
             return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
         
         lines = ["<skills>"]
-        for s in all_skills:
-            name = escape_xml(s["name"])
-            path = s["path"]
-            desc = escape_xml(self._get_skill_description(s["name"]))
-            skill_meta = self._get_skill_meta(s["name"])
-            available = self._check_requirements(skill_meta)
-            
-            lines.append(f"  <skill available=\"{str(available).lower()}\">")
-            lines.append(f"    <name>{name}</name>")
-            lines.append(f"    <description>{desc}</description>")
-            lines.append(f"    <location>{path}</location>")
+        for e in entries:
+            lines.append(f"  <skill available=\"{str(e.available).lower()}\">")
+            lines.append(f"    <name>{escape_xml(e.name)}</name>")
+            lines.append(f"    <description>{escape_xml(e.description)}</description>")
+            lines.append(f"    <location>{e.path}</location>")
             
             # Show missing requirements for unavailable skills
-            if not available:
-                missing = self._get_missing_requirements(skill_meta)
-                if missing:
-                    lines.append(f"    <requires>{escape_xml(missing)}</requires>")
+            if not e.available:
+                lines.append(f"    <requires>{escape_xml(e.missing)}</requires>")
             
             lines.append(f"  </skill>")
         lines.append("</skills>")
@@ -151,13 +254,6 @@ class SkillsLoader:
                 missing.append(f"ENV: {env}")
         return ", ".join(missing)
     
-    def _get_skill_description(self, name: str) -> str:
-        """Get the description of a skill from its frontmatter."""
-        meta = self.get_skill_metadata(name)
-        if meta and meta.get("description"):
-            return meta["description"]
-        return name  # Fallback to skill name
-    
     def _strip_frontmatter(self, content: str) -> str:
         """Remove YAML frontmatter from markdown content."""
         if content.startswith("---"):
@@ -174,31 +270,12 @@ class SkillsLoader:
         except (json.JSONDecodeError, TypeError):
             return {}
     
-    def _check_requirements(self, skill_meta: dict) -> bool:
-        """Check if skill requirements are met (bins, env vars)."""
-        requires = skill_meta.get("requires", {})
-        for b in requires.get("bins", []):
-            if not shutil.which(b):
-                return False
-        for env in requires.get("env", []):
-            if not os.environ.get(env):
-                return False
-        return True
-    
-    def _get_skill_meta(self, name: str) -> dict:
-        """Get nanobot metadata for a skill (cached in frontmatter)."""
-        meta = self.get_skill_metadata(name) or {}
-        return self._parse_nanobot_metadata(meta.get("metadata", ""))
-    
     def get_always_skills(self) -> list[str]:
         """Get skills marked as always=true that meet requirements."""
-        result = []
-        for s in self.list_skills(filter_unavailable=True):
-            meta = self.get_skill_metadata(s["name"]) or {}
-            skill_meta = self._parse_nanobot_metadata(meta.get("metadata", ""))
-            if skill_meta.get("always") or meta.get("always"):
-                result.append(s["name"])
-        return result
+        return [
+            e.name for e in self._ensure_index().values()
+            if e.available and (e.nanobot_meta.get("always") or e.metadata.get("always"))
+        ]
     
     def get_skill_metadata(self, name: str) -> dict | None:
         """
@@ -210,10 +287,11 @@ class SkillsLoader:
         Returns:
             Metadata dict or None.
         """
-        content = self.load_skill(name)
-        if not content:
-            return None
-        
+        entry = self._ensure_index().get(name)
+        return dict(entry.metadata) if entry and entry.metadata else None
+
+    def _parse_frontmatter(self, content: str) -> dict | None:
+        """Parse simple YAML frontmatter into a flat dict."""
         if content.startswith("---"):
             match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
             if match:
@@ -20,6 +20,11 @@ class Tool(ABC):
         "array": list,
         "object": dict,
     }
+
+    # Side-effect free tools may run concurrently with other read-only calls
+    # from the same LLM turn. Anything that sends, writes, or mutates state
+    # keeps the default and runs strictly in the order the model emitted it.
+    read_only: bool = False
     
     @property
     @abstractmethod
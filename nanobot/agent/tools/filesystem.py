@@ -16,6 +16,8 @@ def _resolve_path(path: str, allowed_dir: Path | None = None) -> Path:
 
 class ReadFileTool(Tool):
     """Tool to read file contents."""
+
+    read_only = True
     
     def __init__(self, allowed_dir: Path | None = None):
         self._allowed_dir = allowed_dir
@@ -163,6 +165,8 @@ class EditFileTool(Tool):
 
 class ListDirTool(Tool):
     """Tool to list directory contents."""
+
+    read_only = True
     
     def __init__(self, allowed_dir: Path | None = None):
         self._allowed_dir = allowed_dir
@@ -18,6 +18,9 @@ class MCPToolWrapper(Tool):
         self._name = f"mcp_{server_name}_{tool_def.name}"
         self._description = tool_def.description or tool_def.name
         self._parameters = tool_def.inputSchema or {"type": "object", "properties": {}}
+        # Servers may advertise side-effect free tools via annotations.readOnlyHint
+        annotations = getattr(tool_def, "annotations", None)
+        self.read_only = bool(getattr(annotations, "readOnlyHint", False))
 
     @property
     def name(self) -> str:
@@ -31,6 +31,11 @@ class ToolRegistry:
         """Check if a tool is registered."""
         return name in self._tools
     
+    def is_read_only(self, name: str) -> bool:
+        """Check if a tool is side-effect free (unknown tools are not)."""
+        tool = self._tools.get(name)
+        return bool(tool and tool.read_only)
+
     def get_definitions(self) -> list[dict[str, Any]]:
         """Get all tool definitions in OpenAI format."""
         return [tool.to_schema() for tool in self._tools.values()]
@@ -1,6 +1,7 @@
 """Message bus module for decoupled channel-agent communication."""
 
 from nanobot.bus.events import InboundMessage, OutboundMessage
+from nanobot.bus.fair_queue import QueueClosedError
 from nanobot.bus.queue import MessageBus
 
-__all__ = ["MessageBus", "InboundMessage", "OutboundMessage"]
+__all__ = ["MessageBus", "InboundMessage", "OutboundMessage", "QueueClosedError"]
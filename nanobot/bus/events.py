@@ -33,5 +33,11 @@ class OutboundMessage:
     reply_to: str | None = None
     media: list[str] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
+    # Streamed replies: every update of one reply shares a stream_id. Channels
+    # that can edit messages send the first update and edit it in place after
+    # that. The final update has stream_final=True; empty final content
+    # retracts whatever was shown.
+    stream_id: str | None = None
+    stream_final: bool = False
 
 
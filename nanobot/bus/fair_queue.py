@@ -0,0 +1,229 @@
+"""Bounded inbound queue with priority lanes and per-key round-robin fairness.
+
+A plain FIFO lets one noisy group chat starve everyone else: during a raid
+hundreds of messages from one guild sit in front of a DM or a cron job,
+and the queue grows without bound. FairQueue fixes both:
+
+- Lanes: items are classified into priority lanes (system/cron, priority
+  senders, direct messages, group chatter). get() always serves the most
+  urgent non-empty lane first.
+- Fairness: within a lane, items are grouped by key (the session key) and
+  keys are served round-robin, one item at a time.
+- Bounds: with maxsize set, a full queue either blocks the producer,
+  rejects the new item, or evicts the oldest item of the noisiest key in
+  the least urgent lane — never from a lane more urgent than the new
+  item's, so group chatter can't push out system or priority items.
+
+With the default classifiers (one lane, one key) it behaves as an
+unbounded FIFO, identical to asyncio.Queue.
+
+Consumers iterate with ``async for item in queue`` and block on a future
+until an item arrives — no polling. close() wakes every waiter: producers
+get rejected, consumers drain what's left and then stop.
+"""
+
+import asyncio
+from collections import OrderedDict, deque
+from enum import IntEnum
+from typing import Callable, Generic, Literal, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+OverflowPolicy = Literal["block", "drop_oldest", "drop_newest"]
+
+
+class QueueClosedError(Exception):
+    """Raised by get() once the queue is closed and drained."""
+
+
+class Lane(IntEnum):
+    """Inbound priority lanes, most urgent first."""
+    SYSTEM = 0  # System/cron/subagent announcements
+    PRIORITY = 1  # Priority senders (e.g. the owner)
+    DIRECT = 2  # Direct messages
+    GROUP = 3  # Group chatter
+
+
+class FairQueue(Generic[T]):
+    """Async queue with priority lanes, per-key round-robin and a size bound."""
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        overflow: OverflowPolicy = "block",
+        lane_of: Callable[[T], int] | None = None,
+        key_of: Callable[[T], str] | None = None,
+    ):
+        """
+        Args:
+            maxsize: Maximum queued items (0 = unbounded).
+            overflow: What put() does when full — "block" waits for space,
+                "drop_newest" rejects the new item, "drop_oldest" evicts the
+                oldest item of the busiest key in the least urgent lane (at
+                most as urgent as the new item; otherwise the new item is
+                rejected).
+            lane_of: Maps an item to its Lane (default: everything in SYSTEM).
+            key_of: Maps an item to its fairness key (default: one shared key).
+        """
+        if overflow not in ("block", "drop_oldest", "drop_newest"):
+            raise ValueError(f"Unknown overflow policy: {overflow!r}")
+        self._maxsize = max(0, maxsize)
+        self._overflow = overflow
+        self._lane_of = lane_of or (lambda _item: Lane.SYSTEM)
+        self._key_of = key_of or (lambda _item: "")
+        self._lanes: list[OrderedDict[str, deque[T]]] = [OrderedDict() for _ in Lane]
+        self._size = 0
+        self._getters: deque[asyncio.Future[None]] = deque()
+        self._putters: deque[asyncio.Future[None]] = deque()
+        self._closed = False
+        self.dropped = 0  # Items rejected or evicted by the overflow policy
+
+    def qsize(self) -> int:
+        """Number of queued items."""
+        return self._size
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+    def full(self) -> bool:
+        return bool(self._maxsize) and self._size >= self._maxsize
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def lane_sizes(self) -> dict[str, int]:
+        """Queued items per lane (for monitoring)."""
+        return {
+            lane.name.lower(): sum(len(q) for q in self._lanes[lane].values())
+            for lane in Lane
+        }
+
+    async def put(self, item: T) -> bool:
+        """Queue an item. Returns False if it was rejected (overflow or closed)."""
+        while self.full() and not self._closed:
+            if self._overflow == "drop_newest":
+                self._record_drop("rejected new item")
+                return False
+            if self._overflow == "drop_oldest":
+                if not self._evict(self._lane_index(item)):
+                    self._record_drop("rejected new item (only more urgent items queued)")
+                    return False
+                break
+            await self._wait(self._putters)
+        if self._closed:
+            return False
+        self._push(item)
+        self._wakeup_next(self._getters)
+        return True
+
+    async def get(self) -> T:
+        """Remove and return the next item (blocks until one is available).
+
+        Raises:
+            QueueClosedError: The queue was closed and has no items left.
+        """
+        while self._size == 0:
+            if self._closed:
+                raise QueueClosedError()
+            await self._wait(self._getters)
+        item = self._pop()
+        self._wakeup_next(self._putters)
+        return item
+
+    def close(self) -> None:
+        """Close the queue: reject new items, let consumers drain, then stop."""
+        self._closed = True
+        for waiters in (self._getters, self._putters):
+            while waiters:
+                fut = waiters.popleft()
+                if not fut.done():
+                    fut.set_result(None)
+
+    def __aiter__(self) -> "FairQueue[T]":
+        return self
+
+    async def __anext__(self) -> T:
+        try:
+            return await self.get()
+        except QueueClosedError:
+            raise StopAsyncIteration from None
+
+    async def _wait(self, waiters: deque[asyncio.Future[None]]) -> None:
+        fut = asyncio.get_running_loop().create_future()
+        waiters.append(fut)
+        try:
+            await fut
+        except BaseException:
+            fut.cancel()
+            try:
+                waiters.remove(fut)
+            except ValueError:
+                pass
+            # We were woken but cancelled before acting — pass the wakeup on
+            if waiters is self._getters and self._size:
+                self._wakeup_next(self._getters)
+            elif waiters is self._putters and not self.full():
+                self._wakeup_next(self._putters)
+            raise
+
+    @staticmethod
+    def _wakeup_next(waiters: deque[asyncio.Future[None]]) -> None:
+        while waiters:
+            fut = waiters.popleft()
+            if not fut.done():
+                fut.set_result(None)
+                return
+
+    def _lane_index(self, item: T) -> int:
+        return min(max(int(self._lane_of(item)), 0), len(self._lanes) - 1)
+
+    def _push(self, item: T) -> None:
+        key = self._key_of(item)
+        keys = self._lanes[self._lane_index(item)]
+        if key not in keys:
+            keys[key] = deque()
+        keys[key].append(item)
+        self._size += 1
+
+    def _pop(self) -> T:
+        for keys in self._lanes:
+            if not keys:
+                continue
+            key, items = next(iter(keys.items()))
+            item = items.popleft()
+            # Round-robin: the served key goes to the back of its lane
+            del keys[key]
+            if items:
+                keys[key] = items
+            self._size -= 1
+            return item
+        raise RuntimeError("FairQueue is empty")  # Callers check _size first
+
+    def _evict(self, lane: int) -> bool:
+        """Drop the oldest item of the busiest key in the least urgent lane.
+
+        Only lanes at or below `lane` in urgency are considered. Returns
+        False if they are all empty.
+        """
+        for keys in reversed(self._lanes[lane:]):
+            if not keys:
+                continue
+            key = max(keys, key=lambda k: len(keys[k]))
+            keys[key].popleft()
+            if not keys[key]:
+                del keys[key]
+            self._size -= 1
+            self._record_drop(f"evicted oldest from {key or 'queue'}")
+            return True
+        return False
+
+    def _record_drop(self, reason: str) -> None:
+        self.dropped += 1
+        # One warning per burst is enough — raids would otherwise flood the log
+        if self.dropped == 1 or self.dropped % 100 == 0:
+            logger.warning(f"Inbound queue full ({self._maxsize}): {reason} (total dropped: {self.dropped})")
+        else:
+            logger.debug(f"Inbound queue full: {reason}")
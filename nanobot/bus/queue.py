@@ -1,81 +1,241 @@
 """Async message queue for decoupled channel-agent communication."""
 
 import asyncio
-from typing import Callable, Awaitable
+from typing import AsyncIterator, Callable, Awaitable
 
 from loguru import logger
 
 from nanobot.bus.events import InboundMessage, OutboundMessage
+from nanobot.bus.fair_queue import FairQueue, Lane, OverflowPolicy
+
+# Seconds a closing dispatcher waits for channels to finish queued sends
+OUTBOUND_DRAIN_TIMEOUT = 5.0
+
+# Sends queued per channel before ChannelFanout.submit() waits
+CHANNEL_QUEUE_SIZE = 100
+
+
+def is_direct_message(msg: InboundMessage) -> bool:
+    """Best-effort DM detection from channel-specific metadata."""
+    meta = msg.metadata or {}
+    if "is_group" in meta:  # Telegram, Mochat
+        return not meta["is_group"]
+    if msg.channel == "discord":
+        return not meta.get("guild_id")
+    if msg.channel == "slack":
+        return (meta.get("slack") or {}).get("channel_type") == "im"
+    if msg.channel == "feishu":
+        return meta.get("chat_type") == "p2p"
+    return False
+
+
+def inbound_lane(msg: InboundMessage, priority_senders: set[str] | frozenset[str] = frozenset()) -> Lane:
+    """Classify an inbound message into a priority lane."""
+    if msg.channel == "system":
+        return Lane.SYSTEM
+    if f"{msg.channel}:{msg.sender_id}" in priority_senders:
+        return Lane.PRIORITY
+    if is_direct_message(msg):
+        return Lane.DIRECT
+    return Lane.GROUP
+
+
+class ChannelFanout:
+    """
+    Per-channel outbound workers.
+
+    Each channel gets its own queue and sender task, so a slow channel
+    (e.g. Discord sleeping through a rate-limit backoff) can't hold up
+    sends to the others. Messages for the same channel are still sent one
+    at a time, in order — streamed reply edits depend on that.
+
+    Each channel queue holds at most maxsize sends. Like the outbound bus
+    queue, a full one blocks rather than drops (replies are never lost):
+    submit() waits, and the backlog stays in the bus's outbound FairQueue.
+    """
+
+    def __init__(self, send: Callable[[OutboundMessage], Awaitable[None]], maxsize: int = CHANNEL_QUEUE_SIZE):
+        self._send = send
+        self._maxsize = maxsize
+        self._queues: dict[str, asyncio.Queue[OutboundMessage]] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    async def submit(self, msg: OutboundMessage) -> None:
+        """Hand a message to its channel's worker (waits while that channel's queue is full)."""
+        queue = self._queues.get(msg.channel)
+        if queue is None:
+            queue = self._queues[msg.channel] = asyncio.Queue(maxsize=self._maxsize)
+            self._tasks[msg.channel] = asyncio.create_task(self._worker(msg.channel, queue))
+        if queue.full():
+            logger.warning(f"Outbound queue for {msg.channel} full ({self._maxsize}), waiting")
+        await queue.put(msg)
+
+    async def _worker(self, channel: str, queue: asyncio.Queue[OutboundMessage]) -> None:
+        while True:
+            msg = await queue.get()
+            try:
+                await self._send(msg)
+            except Exception as e:
+                logger.error(f"Error dispatching to {channel}: {e}")
+            finally:
+                queue.task_done()
+
+    async def close(self, drain_timeout: float = 0.0) -> None:
+        """Stop all workers.
+
+        Args:
+            drain_timeout: Seconds to let workers finish already-submitted
+                sends before cancelling them (0 = abandon pending sends).
+        """
+        if drain_timeout > 0 and self._queues:
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*(q.join() for q in self._queues.values())),
+                    timeout=drain_timeout,
+                )
+            except asyncio.TimeoutError:
+                logger.warning("Outbound fan-out drain timed out; abandoning pending sends")
+        for task in self._tasks.values():
+            task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        self._tasks.clear()
+        self._queues.clear()
 
 
 class MessageBus:
     """
     Async message bus that decouples chat channels from the agent core.
-    
+
     Channels push messages to the inbound queue, and the agent processes
     them and pushes responses to the outbound queue.
+
+    By default both queues are unbounded FIFOs. With fair=True, inbound
+    messages are served by priority lane (system, priority senders, DMs,
+    group chat) and round-robin across session keys; max_inbound bounds
+    the inbound queue, with overflow deciding what happens when it's full.
+
+    Consumers iterate (``async for msg in bus.inbound_messages()``) rather
+    than poll. close() ends that iteration as soon as the queued messages
+    are drained, so shutdown doesn't wait out a polling timeout.
     """
-    
-    def __init__(self):
-        self.inbound: asyncio.Queue[InboundMessage] = asyncio.Queue()
-        self.outbound: asyncio.Queue[OutboundMessage] = asyncio.Queue()
+
+    def __init__(
+        self,
+        max_inbound: int = 0,
+        max_outbound: int = 0,
+        overflow: OverflowPolicy = "block",
+        fair: bool = False,
+        priority_senders: set[str] | None = None,
+    ):
+        self._priority_senders = frozenset(priority_senders or ())
+        self.inbound: FairQueue[InboundMessage] = FairQueue(
+            maxsize=max_inbound,
+            overflow=overflow,
+            lane_of=(lambda m: inbound_lane(m, self._priority_senders)) if fair else None,
+            key_of=(lambda m: m.session_key) if fair else None,
+        )
+        self.outbound: FairQueue[OutboundMessage] = FairQueue(maxsize=max_outbound)
         self._outbound_subscribers: dict[str, list[Callable[[OutboundMessage], Awaitable[None]]]] = {}
-        self._running = False
-    
+
     async def publish_inbound(self, msg: InboundMessage) -> None:
         """Publish a message from a channel to the agent."""
-        await self.inbound.put(msg)
-    
+        if not await self.inbound.put(msg) and self.inbound.closed:
+            logger.debug(f"Bus closed, dropping inbound message from {msg.channel}:{msg.sender_id}")
+
     async def consume_inbound(self) -> InboundMessage:
-        """Consume the next inbound message (blocks until available)."""
+        """Consume the next inbound message (blocks until available).
+
+        Raises:
+            QueueClosedError: The bus was closed and no inbound messages are left.
+        """
         return await self.inbound.get()
-    
+
+    def inbound_messages(self) -> AsyncIterator[InboundMessage]:
+        """Iterate inbound messages until the inbound side is closed and drained."""
+        return aiter(self.inbound)
+
     async def publish_outbound(self, msg: OutboundMessage) -> None:
         """Publish a response from the agent to channels."""
-        await self.outbound.put(msg)
-    
+        if not await self.outbound.put(msg):
+            logger.debug(f"Bus closed, dropping outbound message to {msg.channel}:{msg.chat_id}")
+
     async def consume_outbound(self) -> OutboundMessage:
-        """Consume the next outbound message (blocks until available)."""
+        """Consume the next outbound message (blocks until available).
+
+        Raises:
+            QueueClosedError: The bus was closed and no outbound messages are left.
+        """
         return await self.outbound.get()
-    
+
+    def outbound_messages(self) -> AsyncIterator[OutboundMessage]:
+        """Iterate outbound messages until the outbound side is closed and drained."""
+        return aiter(self.outbound)
+
     def subscribe_outbound(
-        self, 
-        channel: str, 
+        self,
+        channel: str,
         callback: Callable[[OutboundMessage], Awaitable[None]]
     ) -> None:
         """Subscribe to outbound messages for a specific channel."""
         if channel not in self._outbound_subscribers:
             self._outbound_subscribers[channel] = []
         self._outbound_subscribers[channel].append(callback)
-    
+
+    async def _notify_subscribers(self, msg: OutboundMessage) -> None:
+        for callback in self._outbound_subscribers.get(msg.channel, []):
+            try:
+                await callback(msg)
+            except Exception as e:
+                logger.error(f"Error dispatching to {msg.channel}: {e}")
+
     async def dispatch_outbound(self) -> None:
         """
         Dispatch outbound messages to subscribed channels.
-        Run this as a background task.
+        Run this as a background task. Channels are served concurrently.
+        Returns once the outbound side is closed and everything queued has
+        been handed to the channels.
         """
-        self._running = True
-        while self._running:
-            try:
-                msg = await asyncio.wait_for(self.outbound.get(), timeout=1.0)
-                subscribers = self._outbound_subscribers.get(msg.channel, [])
-                for callback in subscribers:
-                    try:
-                        await callback(msg)
-                    except Exception as e:
-                        logger.error(f"Error dispatching to {msg.channel}: {e}")
-            except asyncio.TimeoutError:
-                continue
-    
+        fanout = ChannelFanout(self._notify_subscribers)
+        try:
+            async for msg in self.outbound_messages():
+                await fanout.submit(msg)
+            await fanout.close(drain_timeout=OUTBOUND_DRAIN_TIMEOUT)
+        finally:
+            await fanout.close()
+
+    def close_inbound(self) -> None:
+        """Stop accepting inbound messages; the agent drains what's queued and stops."""
+        self.inbound.close()
+
+    def close_outbound(self) -> None:
+        """Stop accepting outbound messages; dispatchers drain what's queued and stop."""
+        self.outbound.close()
+
+    def close(self) -> None:
+        """Close both directions, waking every consumer immediately."""
+        self.close_inbound()
+        self.close_outbound()
+
     def stop(self) -> None:
-        """Stop the dispatcher loop."""
-        self._running = False
-    
+        """Stop the dispatcher loop (alias for close())."""
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        """Whether both directions have been closed."""
+        return self.inbound.closed and self.outbound.closed
+
     @property
     def inbound_size(self) -> int:
         """Number of pending inbound messages."""
         return self.inbound.qsize()
-    
+
     @property
     def outbound_size(self) -> int:
         """Number of pending outbound messages."""
         return self.outbound.qsize()
+
+    @property
+    def inbound_dropped(self) -> int:
+        """Inbound messages dropped by the overflow policy."""
+        return self.inbound.dropped
@@ -0,0 +1,216 @@
+"""Sharded gateway: run agent workers in separate processes, keyed by session.
+
+Everything in a single gateway process shares one core — token counting,
+response cleaning, session serialization and memory queries all queue up
+behind each other. ShardRouter keeps the channels in the front process and
+forwards each inbound message to one of N worker processes, picked by a
+stable hash of its session key. Each worker runs its own MessageBus and
+AgentLoop; replies travel back over a shared queue and are published on
+the front bus, where ChannelManager delivers them as usual.
+
+    front process                          worker processes
+    ─────────────                          ────────────────
+    channels → bus.inbound → ShardRouter ─→ shard 0: bus → AgentLoop
+                                        ├─→ shard 1: bus → AgentLoop
+                                        └─→ ...
+    channels ← bus.outbound ←── reply queue ←── (all shards)
+
+Hashing by session key keeps every chat on one worker, so a session file,
+its debounce buffer and its conversation threads only ever have one
+writer. Stores shared across chats (people, core memory, vector memory,
+metrics) are still opened by every worker; the session index is shared
+under a file lock (nanobot.session.index).
+
+Process-wide duties run in shard 0 only, and so only cover shard 0's chats:
+
+- the observatory dashboard's live view and its controls (mute, hard
+  reset, brain toggle); its stats come from the shared metrics store and
+  cover every shard
+- the idle watcher (idle time is measured from shard 0's messages)
+- daily maintenance (runs once, against the shared stores)
+
+Cron jobs and heartbeats run on the front process's agent.
+"""
+
+import asyncio
+import multiprocessing as mp
+import threading
+import zlib
+from typing import Any, Awaitable, Callable
+
+from loguru import logger
+
+from nanobot.bus.events import InboundMessage
+from nanobot.bus.queue import MessageBus
+
+# Seconds a worker gets to finish after its stop sentinel before it's killed
+WORKER_STOP_TIMEOUT = 10.0
+
+# Stop sentinel on the IPC queues
+_STOP = None
+
+# Runs inside a worker: build an agent on the given bus and run it until the
+# bus's inbound side closes. Must be a module-level function (it's pickled
+# into the worker process).
+ShardWorker = Callable[[int, MessageBus], Awaitable[None]]
+
+
+def shard_for(session_key: str, shards: int) -> int:
+    """Stable shard index for a session key (same chat → same worker, across restarts)."""
+    if shards <= 1:
+        return 0
+    return zlib.crc32(session_key.encode("utf-8")) % shards
+
+
+def _start_reader(
+    queue: Any,
+    loop: asyncio.AbstractEventLoop,
+    deliver: Callable[[Any], Awaitable[None]],
+    name: str,
+    on_stop: Callable[[], None] | None = None,
+) -> threading.Thread:
+    """Forward items from a blocking IPC queue into the event loop until _STOP."""
+    def read() -> None:
+        while True:
+            item = queue.get()
+            try:
+                if item is _STOP:
+                    if on_stop:
+                        loop.call_soon_threadsafe(on_stop)
+                    return
+                asyncio.run_coroutine_threadsafe(deliver(item), loop).result()
+            except RuntimeError:
+                return  # Event loop closed underneath us
+
+    # Daemon: a reader parked in queue.get() must never hold up process exit
+    thread = threading.Thread(target=read, name=name, daemon=True)
+    thread.start()
+    return thread
+
+
+async def _serve_shard(shard_id: int, worker: ShardWorker, inbound: Any, outbound: Any) -> None:
+    """Bridge the IPC queues to a worker-local bus and run the worker on it."""
+    bus = MessageBus()
+    # _STOP from the front closes the inbound side, so AgentLoop.run() returns
+    _start_reader(
+        inbound, asyncio.get_running_loop(), bus.publish_inbound,
+        name=f"shard-{shard_id}-inbound", on_stop=bus.close_inbound,
+    )
+
+    async def forward_outbound() -> None:
+        async for msg in bus.outbound_messages():
+            outbound.put(msg)
+
+    forwarder = asyncio.create_task(forward_outbound())
+    try:
+        await worker(shard_id, bus)
+    finally:
+        bus.close()
+        await forwarder  # Flush replies still queued on the worker bus
+
+
+def _worker_main(shard_id: int, worker: ShardWorker, inbound: Any, outbound: Any) -> None:
+    """Worker process entry point."""
+    try:
+        asyncio.run(_serve_shard(shard_id, worker, inbound, outbound))
+    except KeyboardInterrupt:
+        pass  # The front process drives shutdown
+
+
+class ShardRouter:
+    """
+    Routes inbound bus messages to worker processes by session key.
+
+    Runs in the front process in place of AgentLoop.run(). A worker that
+    dies is restarted the next time a message is routed to it.
+    """
+
+    def __init__(
+        self,
+        bus: MessageBus,
+        workers: int,
+        worker: ShardWorker,
+        start_method: str = "spawn",
+    ):
+        """
+        Args:
+            bus: The front process bus (channels publish inbound, consume outbound).
+            workers: Number of worker processes.
+            worker: Module-level coroutine function run inside each worker.
+            start_method: multiprocessing start method. "spawn" gives each
+                worker a clean interpreter (no inherited event loop or sockets).
+        """
+        if workers < 1:
+            raise ValueError("ShardRouter needs at least one worker")
+        self.bus = bus
+        self.workers = workers
+        self._worker = worker
+        self._ctx = mp.get_context(start_method)
+        self._inbound: list[Any] = []
+        self._processes: list[Any] = []
+        self._outbound: Any = None
+        self._started = False
+        self.routed = [0] * workers  # Messages routed per shard
+        self.restarts = 0
+
+    def start(self) -> None:
+        """Spawn the worker processes and start relaying their replies."""
+        if self._started:
+            return
+        self._outbound = self._ctx.Queue()
+        self._inbound = [self._ctx.Queue() for _ in range(self.workers)]
+        self._processes = [self._spawn(i) for i in range(self.workers)]
+        _start_reader(
+            self._outbound, asyncio.get_running_loop(), self.bus.publish_outbound,
+            name="shard-replies",
+        )
+        self._started = True
+        logger.info(f"Shard router started with {self.workers} workers")
+
+    def _spawn(self, shard_id: int) -> Any:
+        proc = self._ctx.Process(
+            target=_worker_main,
+            args=(shard_id, self._worker, self._inbound[shard_id], self._outbound),
+            name=f"nanobot-shard-{shard_id}",
+        )
+        proc.start()
+        return proc
+
+    def route(self, msg: InboundMessage) -> int:
+        """Send one message to its shard. Returns the shard index."""
+        shard = shard_for(msg.session_key, self.workers)
+        if not self._processes[shard].is_alive():
+            logger.error(
+                f"Shard {shard} died (exit code {self._processes[shard].exitcode}), restarting"
+            )
+            self._processes[shard] = self._spawn(shard)
+            self.restarts += 1
+        self._inbound[shard].put(msg)
+        self.routed[shard] += 1
+        return shard
+
+    async def run(self) -> None:
+        """Route inbound messages until the front bus's inbound side closes."""
+        self.start()
+        async for msg in self.bus.inbound_messages():
+            self.route(msg)
+
+    async def stop(self, timeout: float = WORKER_STOP_TIMEOUT) -> None:
+        """Stop every worker (letting it flush replies), then the reply relay."""
+        if not self._started:
+            return
+        self._started = False
+        for queue in self._inbound:
+            queue.put(_STOP)
+
+        def join_all() -> None:
+            for proc in self._processes:
+                proc.join(timeout)
+                if proc.is_alive():
+                    logger.warning(f"{proc.name} did not stop in {timeout}s, terminating")
+                    proc.terminate()
+                    proc.join()
+
+        await asyncio.to_thread(join_all)
+        self._outbound.put(_STOP)
+        logger.info("Shard router stopped")
@@ -18,6 +18,7 @@ class BaseChannel(ABC):
     """
     
     name: str = "base"
+    supports_edits: bool = False  # Can edit sent messages (streamed replies)
     
     def __init__(self, config: Any, bus: MessageBus):
         """
@@ -30,6 +31,7 @@ class BaseChannel(ABC):
         self.config = config
         self.bus = bus
         self._running = False
+        self._stream_messages: dict[str, str] = {}  # stream_id -> platform message ID
     
     @abstractmethod
     async def start(self) -> None:
@@ -58,6 +60,67 @@ class BaseChannel(ABC):
         """
         pass
     
+    async def send_tracked(self, msg: OutboundMessage) -> str | None:
+        """
+        Send a message and return its platform message ID, if known.
+
+        Optional hook for edit-capable channels. The default just calls
+        send() and returns None, so deliver() falls back to sending the
+        final update instead of editing.
+        """
+        await self.send(msg)
+        return None
+
+    async def edit_message(self, chat_id: str, message_id: str, content: str) -> None:
+        """Replace the text of a previously sent message. Optional hook; no-op by default."""
+        return None
+
+    async def delete_message(self, chat_id: str, message_id: str) -> None:
+        """Delete a previously sent message. Optional hook; no-op by default."""
+        return None
+
+    async def deliver(self, msg: OutboundMessage) -> None:
+        """
+        Deliver an outbound message, handling streamed reply updates.
+
+        Plain messages go straight to send(). For a streamed reply, channels
+        with supports_edits send the first update and edit it in place after
+        that; other channels skip partial updates and only send the final
+        one, so they behave exactly as before streaming existed.
+
+        Args:
+            msg: The message (or stream update) to deliver.
+        """
+        if not msg.stream_id:
+            await self.send(msg)
+            return
+
+        if not self.supports_edits:
+            if msg.stream_final and msg.content:
+                await self.send(msg)
+            return
+
+        sent_id = self._stream_messages.get(msg.stream_id)
+        if msg.stream_final:
+            self._stream_messages.pop(msg.stream_id, None)
+            if not sent_id:
+                if msg.content:
+                    await self.send(msg)
+            elif msg.content:
+                await self.edit_message(msg.chat_id, sent_id, msg.content)
+            else:
+                await self.delete_message(msg.chat_id, sent_id)
+            return
+
+        if not msg.content:
+            return
+        if sent_id is None:
+            # An empty ID means send_tracked() couldn't report one: skip the
+            # remaining partials and send the final update as a new message.
+            self._stream_messages[msg.stream_id] = await self.send_tracked(msg) or ""
+        elif sent_id:
+            await self.edit_message(msg.chat_id, sent_id, msg.content)
+
     def is_allowed(self, sender_id: str) -> bool:
         """
         Check if a sender is allowed to use this bot.
@@ -34,6 +34,7 @@ class DiscordChannel(BaseChannel):
     """Discord channel using Gateway websocket."""
 
     name = "discord"
+    supports_edits = True
 
     def __init__(self, config: DiscordConfig, bus: MessageBus):
         super().__init__(config, bus)
@@ -98,9 +99,13 @@ class DiscordChannel(BaseChannel):
 
     async def send(self, msg: OutboundMessage) -> None:
         """Send a message through Discord REST API."""
+        await self.send_tracked(msg)
+
+    async def send_tracked(self, msg: OutboundMessage) -> str | None:
+        """Send a message and return its Discord message ID."""
         if not self._http:
             logger.warning("Discord HTTP client not initialized")
-            return
+            return None
 
         url = f"{DISCORD_API_BASE}/channels/{msg.chat_id}/messages"
         payload: dict[str, Any] = {"content": msg.content}
@@ -109,28 +114,49 @@ class DiscordChannel(BaseChannel):
             payload["message_reference"] = {"message_id": msg.reply_to}
             payload["allowed_mentions"] = {"replied_user": False}
 
-        headers = {"Authorization": f"Bot {self.config.token}"}
-
         try:
-            for attempt in range(3):
-                try:
-                    response = await self._http.post(url, headers=headers, json=payload)
-                    if response.status_code == 429:
-                        data = response.json()
-                        retry_after = float(data.get("retry_after", 1.0))
-                        logger.warning(f"Discord rate limited, retrying in {retry_after}s")
-                        await asyncio.sleep(retry_after)
-                        continue
-                    response.raise_for_status()
-                    return
-                except Exception as e:
-                    if attempt == 2:
-                        logger.error(f"Error sending Discord message: {e}")
-                    else:
-                        await asyncio.sleep(1)
+            data = await self._rest("POST", url, payload, action="sending Discord message")
+            return str(data["id"]) if data and data.get("id") else None
         finally:
             await self._stop_typing(msg.chat_id)
 
+    async def edit_message(self, chat_id: str, message_id: str, content: str) -> None:
+        """Edit a sent message in place (streamed replies)."""
+        url = f"{DISCORD_API_BASE}/channels/{chat_id}/messages/{message_id}"
+        await self._rest("PATCH", url, {"content": content}, action="editing Discord message")
+
+    async def delete_message(self, chat_id: str, message_id: str) -> None:
+        """Delete a sent message (retracted streamed reply)."""
+        url = f"{DISCORD_API_BASE}/channels/{chat_id}/messages/{message_id}"
+        await self._rest("DELETE", url, None, action="deleting Discord message")
+
+    async def _rest(
+        self, method: str, url: str, payload: dict[str, Any] | None, action: str,
+    ) -> dict[str, Any] | None:
+        """Make a REST call with rate-limit handling and up to 3 attempts."""
+        if not self._http:
+            return None
+        headers = {"Authorization": f"Bot {self.config.token}"}
+        for attempt in range(3):
+            try:
+                response = await self._http.request(method, url, headers=headers, json=payload)
+                if response.status_code == 429:
+                    data = response.json()
+                    retry_after = float(data.get("retry_after", 1.0))
+                    logger.warning(f"Discord rate limited, retrying in {retry_after}s")
+                    await asyncio.sleep(retry_after)
+                    continue
+                response.raise_for_status()
+                if response.status_code == 204 or not response.content:
+                    return {}
+                return response.json()
+            except Exception as e:
+                if attempt == 2:
+                    logger.error(f"Error {action}: {e}")
+                else:
+                    await asyncio.sleep(1)
+        return None
+
     async def _gateway_loop(self) -> None:
         """Main gateway loop: identify, heartbeat, dispatch events."""
         if not self._ws:
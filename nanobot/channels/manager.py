@@ -8,7 +8,7 @@ from typing import Any
 from loguru import logger
 
 from nanobot.bus.events import OutboundMessage
-from nanobot.bus.queue import MessageBus
+from nanobot.bus.queue import OUTBOUND_DRAIN_TIMEOUT, ChannelFanout, MessageBus
 from nanobot.channels.base import BaseChannel
 from nanobot.config.schema import Config
 
@@ -166,12 +166,13 @@ class ChannelManager:
         """Stop all channels and the dispatcher."""
         logger.info("Stopping all channels...")
         
-        # Stop dispatcher
+        # Stop dispatcher: closing the outbound side lets it flush queued
+        # replies and return; cancel only if a channel is stuck
         if self._dispatch_task:
-            self._dispatch_task.cancel()
+            self.bus.close_outbound()
             try:
-                await self._dispatch_task
-            except asyncio.CancelledError:
+                await asyncio.wait_for(self._dispatch_task, timeout=OUTBOUND_DRAIN_TIMEOUT + 1)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
                 pass
         
         # Stop all channels
@@ -183,29 +184,30 @@ class ChannelManager:
                 logger.error(f"Error stopping {name}: {e}")
     
     async def _dispatch_outbound(self) -> None:
-        """Dispatch outbound messages to the appropriate channel."""
+        """Dispatch outbound messages to the appropriate channel.
+
+        Each channel sends from its own worker, so a rate-limited channel
+        only delays its own messages.
+        """
         logger.info("Outbound dispatcher started")
-        
-        while True:
-            try:
-                msg = await asyncio.wait_for(
-                    self.bus.consume_outbound(),
-                    timeout=1.0
-                )
-                
-                channel = self.channels.get(msg.channel)
-                if channel:
-                    try:
-                        await channel.send(msg)
-                    except Exception as e:
-                        logger.error(f"Error sending to {msg.channel}: {e}")
+        fanout = ChannelFanout(self._send_to_channel)
+
+        try:
+            async for msg in self.bus.outbound_messages():
+                if msg.channel in self.channels:
+                    await fanout.submit(msg)
                 else:
                     logger.warning(f"Unknown channel: {msg.channel}")
-                    
-            except asyncio.TimeoutError:
-                continue
-            except asyncio.CancelledError:
-                break
+            await fanout.close(drain_timeout=OUTBOUND_DRAIN_TIMEOUT)
+        finally:
+            await fanout.close()
+
+    async def _send_to_channel(self, msg: OutboundMessage) -> None:
+        """Deliver one outbound message through its channel."""
+        try:
+            await self.channels[msg.channel].deliver(msg)
+        except Exception as e:
+            logger.error(f"Error sending to {msg.channel}: {e}")
     
     def get_channel(self, name: str) -> BaseChannel | None:
         """Get a channel by name."""
@@ -70,8 +70,7 @@ class MockChannel(BaseChannel):
 
     async def _on_outbound(self, msg: OutboundMessage) -> None:
         """Subscriber callback for outbound messages on 'mock' channel."""
-        self._responses.append(msg)
-        self._response_event.set()
+        await self.deliver(msg)
 
     # ── Message injection ─────────────────────────────────
 
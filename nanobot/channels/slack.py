@@ -20,6 +20,7 @@ class SlackChannel(BaseChannel):
     """Slack channel using Socket Mode."""
 
     name = "slack"
+    supports_edits = True
 
     def __init__(self, config: SlackConfig, bus: MessageBus):
         super().__init__(config, bus)
@@ -73,22 +74,46 @@ class SlackChannel(BaseChannel):
 
     async def send(self, msg: OutboundMessage) -> None:
         """Send a message through Slack."""
+        await self.send_tracked(msg)
+
+    async def send_tracked(self, msg: OutboundMessage) -> str | None:
+        """Send a message through Slack and return its timestamp (message ID)."""
         if not self._web_client:
             logger.warning("Slack client not running")
-            return
+            return None
         try:
             slack_meta = msg.metadata.get("slack", {}) if msg.metadata else {}
             thread_ts = slack_meta.get("thread_ts")
             channel_type = slack_meta.get("channel_type")
             # Only reply in thread for channel/group messages; DMs don't use threads
             use_thread = thread_ts and channel_type != "im"
-            await self._web_client.chat_postMessage(
+            response = await self._web_client.chat_postMessage(
                 channel=msg.chat_id,
                 text=msg.content or "",
                 thread_ts=thread_ts if use_thread else None,
             )
+            return response.get("ts")
         except Exception as e:
             logger.error(f"Error sending Slack message: {e}")
+            return None
+
+    async def edit_message(self, chat_id: str, message_id: str, content: str) -> None:
+        """Edit a sent message in place (streamed replies)."""
+        if not self._web_client:
+            return
+        try:
+            await self._web_client.chat_update(channel=chat_id, ts=message_id, text=content)
+        except Exception as e:
+            logger.warning(f"Error editing Slack message: {e}")
+
+    async def delete_message(self, chat_id: str, message_id: str) -> None:
+        """Delete a sent message (retracted streamed reply)."""
+        if not self._web_client:
+            return
+        try:
+            await self._web_client.chat_delete(channel=chat_id, ts=message_id)
+        except Exception as e:
+            logger.warning(f"Error deleting Slack message: {e}")
 
     async def _on_socket_request(
         self,
@@ -86,6 +86,7 @@ class TelegramChannel(BaseChannel):
     """
     
     name = "telegram"
+    supports_edits = True
     
     # Commands registered with Telegram's command menu
     BOT_COMMANDS = [
@@ -180,9 +181,13 @@ class TelegramChannel(BaseChannel):
     
     async def send(self, msg: OutboundMessage) -> None:
         """Send a message through Telegram."""
+        await self.send_tracked(msg)
+
+    async def send_tracked(self, msg: OutboundMessage) -> str | None:
+        """Send a message through Telegram and return its message ID."""
         if not self._app:
             logger.warning("Telegram bot not running")
-            return
+            return None
         
         # Stop typing indicator for this chat
         self._stop_typing(msg.chat_id)
@@ -192,23 +197,56 @@ class TelegramChannel(BaseChannel):
             chat_id = int(msg.chat_id)
             # Convert markdown to Telegram HTML
             html_content = _markdown_to_telegram_html(msg.content)
-            await self._app.bot.send_message(
+            sent = await self._app.bot.send_message(
                 chat_id=chat_id,
                 text=html_content,
                 parse_mode="HTML"
             )
+            return str(sent.message_id)
         except ValueError:
             logger.error(f"Invalid chat_id: {msg.chat_id}")
         except Exception as e:
             # Fallback to plain text if HTML parsing fails
             logger.warning(f"HTML parse failed, falling back to plain text: {e}")
             try:
-                await self._app.bot.send_message(
+                sent = await self._app.bot.send_message(
                     chat_id=int(msg.chat_id),
                     text=msg.content
                 )
+                return str(sent.message_id)
             except Exception as e2:
                 logger.error(f"Error sending Telegram message: {e2}")
+        return None
+
+    async def edit_message(self, chat_id: str, message_id: str, content: str) -> None:
+        """Edit a sent message in place (streamed replies)."""
+        if not self._app:
+            return
+        try:
+            await self._app.bot.edit_message_text(
+                chat_id=int(chat_id),
+                message_id=int(message_id),
+                text=_markdown_to_telegram_html(content),
+                parse_mode="HTML",
+            )
+        except Exception as e:
+            # Partial markdown often renders as broken HTML — retry as plain text
+            logger.debug(f"Telegram HTML edit failed, retrying as plain text: {e}")
+            try:
+                await self._app.bot.edit_message_text(
+                    chat_id=int(chat_id), message_id=int(message_id), text=content,
+                )
+            except Exception as e2:
+                logger.warning(f"Error editing Telegram message: {e2}")
+
+    async def delete_message(self, chat_id: str, message_id: str) -> None:
+        """Delete a sent message (retracted streamed reply)."""
+        if not self._app:
+            return
+        try:
+            await self._app.bot.delete_message(chat_id=int(chat_id), message_id=int(message_id))
+        except Exception as e:
+            logger.warning(f"Error deleting Telegram message: {e}")
     
     async def _on_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /start command."""
@@ -280,6 +280,7 @@ def _make_provider(config):
         extra_headers=p.extra_headers if p else None,
         provider_name=config.get_provider_name(),
         fallback_models=DEFAULT_FALLBACK_MODELS,
+        prompt_caching=config.agents.defaults.prompt_caching,
     )
 
 
@@ -288,6 +289,74 @@ def _make_provider(config):
 # ============================================================================
 
 
+def _make_session_manager(config):
+    """Create the gateway SessionManager (write-behind, bounded cache) from config."""
+    from nanobot.session.manager import SessionManager
+    defaults = config.agents.defaults
+    return SessionManager(
+        config.workspace_path,
+        flush_interval=defaults.session_flush_interval,
+        max_cached=defaults.session_cache_max,
+        max_cached_bytes=defaults.session_cache_max_mb * 1024 * 1024,
+        store=defaults.session_store,
+    )
+
+
+def _make_gateway_agent(config, bus, provider, cron, session_manager, background_tasks=True):
+    """Create the gateway AgentLoop from config."""
+    from nanobot.agent.loop import AgentLoop
+    return AgentLoop(
+        bus=bus,
+        provider=provider,
+        workspace=config.workspace_path,
+        model=config.agents.defaults.model,
+        consolidation_model=config.agents.defaults.consolidation_model,
+        diary_context_days=config.agents.defaults.diary_context_days,
+        temperature=config.agents.defaults.temperature,
+        max_tokens=config.agents.defaults.max_tokens,
+        max_iterations=config.agents.defaults.max_tool_iterations,
+        memory_window=config.agents.defaults.memory_window,
+        max_concurrent_batches=config.agents.defaults.max_concurrent_batches,
+        stream_responses=config.agents.defaults.stream_responses,
+        stable_prompt_prefix=config.agents.defaults.stable_prompt_prefix,
+        background_tasks=background_tasks,
+        brave_api_key=config.tools.web.search.api_key or None,
+        exec_config=config.tools.exec,
+        cron_service=cron,
+        restrict_to_workspace=config.tools.restrict_to_workspace,
+        session_manager=session_manager,
+        mcp_servers=config.tools.mcp_servers,
+        config=config,
+    )
+
+
+async def _run_gateway_shard(shard_id: int, bus) -> None:
+    """Worker process body for a sharded gateway (see nanobot.bus.shards)."""
+    from loguru import logger
+
+    from nanobot.config.loader import get_data_dir, load_config
+    from nanobot.cron.service import CronService
+
+    config = load_config()
+    # Process-wide duties have one owner: only shard 0 serves the dashboard
+    # and runs the idle/daily tasks (the others would fight over the port
+    # and repeat daily maintenance on the shared stores)
+    primary = shard_id == 0
+    if not primary:
+        config.agents.defaults.observatory.dashboard_enabled = False
+    # Workers share the cron store for the cron tool; only the front process runs jobs
+    cron = CronService(get_data_dir() / "cron" / "jobs.json")
+    agent = _make_gateway_agent(
+        config, bus, _make_provider(config), cron, _make_session_manager(config), background_tasks=primary,
+    )
+    logger.info(f"Shard {shard_id} agent starting")
+    try:
+        await agent.run()
+    finally:
+        await agent.close_mcp()
+        agent.stop()
+
+
 @app.command()
 def gateway(
     port: int = typer.Option(18790, "--port", "-p", help="Gateway port"),
@@ -296,9 +365,9 @@ def gateway(
     """Start the nanobot gateway."""
     from nanobot.config.loader import load_config, get_data_dir
     from nanobot.bus.queue import MessageBus
-    from nanobot.agent.loop import AgentLoop
+    from nanobot.bus.shards import ShardRouter
+    from nanobot.agent.security import DAD_IDS
     from nanobot.channels.manager import ChannelManager
-    from nanobot.session.manager import SessionManager
     from nanobot.cron.service import CronService
     from nanobot.cron.types import CronJob
     from nanobot.heartbeat.service import HeartbeatService
@@ -310,33 +379,33 @@ def gateway(
     console.print(f"{__logo__} Starting nanobot gateway on port {port}...")
     
     config = load_config()
-    bus = MessageBus()
+    bus_cfg = config.gateway.bus
+    bus = MessageBus(
+        max_inbound=bus_cfg.max_inbound,
+        max_outbound=bus_cfg.max_outbound,
+        overflow=bus_cfg.overflow,
+        fair=bus_cfg.fair,
+        priority_senders=DAD_IDS,
+    )
     provider = _make_provider(config)
-    session_manager = SessionManager(config.workspace_path)
+    session_manager = _make_session_manager(config)
     
     # Create cron service first (callback set after agent creation)
     cron_store_path = get_data_dir() / "cron" / "jobs.json"
     cron = CronService(cron_store_path)
     
+    # Sharded mode: chats are handled by worker processes; the in-process
+    # agent only serves cron and heartbeat, and leaves the dashboard and the
+    # idle/daily tasks to shard 0
+    workers = config.gateway.workers
+    agent_config = config
+    if workers > 1:
+        agent_config = config.model_copy(deep=True)
+        agent_config.agents.defaults.observatory.dashboard_enabled = False
+
     # Create agent with cron service
-    agent = AgentLoop(
-        bus=bus,
-        provider=provider,
-        workspace=config.workspace_path,
-        model=config.agents.defaults.model,
-        consolidation_model=config.agents.defaults.consolidation_model,
-        diary_context_days=config.agents.defaults.diary_context_days,
-        temperature=config.agents.defaults.temperature,
-        max_tokens=config.agents.defaults.max_tokens,
-        max_iterations=config.agents.defaults.max_tool_iterations,
-        memory_window=config.agents.defaults.memory_window,
-        brave_api_key=config.tools.web.search.api_key or None,
-        exec_config=config.tools.exec,
-        cron_service=cron,
-        restrict_to_workspace=config.tools.restrict_to_workspace,
-        session_manager=session_manager,
-        mcp_servers=config.tools.mcp_servers,
-        config=config,
+    agent = _make_gateway_agent(
+        agent_config, bus, provider, cron, session_manager, background_tasks=workers == 1,
     )
     
     # Set cron callback (needs agent)
@@ -384,12 +453,19 @@ def gateway(
     
     console.print(f"[green]✓[/green] Heartbeat: every 30m")
     
+    router = ShardRouter(bus, workers, _run_gateway_shard) if workers > 1 else None
+    if router:
+        console.print(f"[green]✓[/green] Sharded: {workers} agent worker processes")
+    
     async def run():
         try:
+            if router:
+                # agent.run() isn't called: set up its modules for cron and heartbeat
+                await agent.initialize()
             await cron.start()
             await heartbeat.start()
             await asyncio.gather(
-                agent.run(),
+                router.run() if router else agent.run(),
                 channels.start_all(),
             )
         except KeyboardInterrupt:
@@ -399,6 +475,8 @@ def gateway(
             heartbeat.stop()
             cron.stop()
             agent.stop()
+            if router:
+                await router.stop()
             await channels.stop_all()
     
     asyncio.run(run())
@@ -445,6 +523,7 @@ def agent(
         max_tokens=config.agents.defaults.max_tokens,
         max_iterations=config.agents.defaults.max_tool_iterations,
         memory_window=config.agents.defaults.memory_window,
+        stable_prompt_prefix=config.agents.defaults.stable_prompt_prefix,
         brave_api_key=config.tools.web.search.api_key or None,
         exec_config=config.tools.exec,
         restrict_to_workspace=config.tools.restrict_to_workspace,
@@ -1,6 +1,8 @@
 """Configuration schema using Pydantic."""
 
 from pathlib import Path
+from typing import Literal
+
 from pydantic import BaseModel, Field, ConfigDict
 from pydantic_settings import BaseSettings
 
@@ -192,11 +194,22 @@ class AgentDefaults(BaseModel):
     model: str = "anthropic/claude-opus-4-5"
     consolidation_model: str | None = None  # Ene: separate model for diary consolidation + utility tasks
     daemon_model: str | None = None  # Ene: model for subconscious daemon (free tier pre-processor)
+    daemon_batch_size: int = 1  # Ene: messages per batched daemon prompt (1 = one call per message)
     max_tokens: int = 8192
     temperature: float = 0.7
     max_tool_iterations: int = 20
     memory_window: int = 50
     diary_context_days: int = 3  # Ene: how many diary days to load into context
+    max_concurrent_batches: int = 4  # Ene: global cap on message batches processed in parallel across channels
+    stream_responses: bool = False  # Ene: stream replies as progressive edits (Discord/Telegram/Slack); opt-in
+    stable_prompt_prefix: bool = False  # Ene: opt-in cache-friendly prompt layout (volatile context in the current user message)
+    prompt_caching: bool = True  # Ene: send cache-control hints to providers that need them (Anthropic)
+    module_context_tokens: int | None = 8000  # Ene: token budget for module context, packed by priority (None = unbounded)
+    module_context_timeout: float | None = 2.0  # Ene: seconds each module gets for per-message context before it's skipped
+    session_flush_interval: float = 1.0  # Ene: gateway write-behind delay for session saves (0 = write every save)
+    session_cache_max: int = 256  # Ene: sessions kept in memory (LRU)
+    session_cache_max_mb: int = 64  # Ene: estimated MB of cached session messages (LRU)
+    session_store: Literal["auto", "jsonl", "sqlite"] = "auto"  # Ene: session backend ("auto" = sqlite if sessions.db exists)
     memory: MemoryConfig = Field(default_factory=MemoryConfig)  # Ene: memory system config
     social: SocialConfig = Field(default_factory=SocialConfig)  # Ene: social/trust config
     observatory: ObservatoryConfig = Field(default_factory=ObservatoryConfig)  # Ene: metrics
@@ -231,10 +244,24 @@ class ProvidersConfig(BaseModel):
     aihubmix: ProviderConfig = Field(default_factory=ProviderConfig)  # AiHubMix API gateway
 
 
+class BusConfig(BaseModel):
+    """Message bus queueing configuration (gateway only)."""
+    max_inbound: int = 0  # 0 = unbounded
+    max_outbound: int = 0  # 0 = unbounded; replies are never dropped, producers wait
+    overflow: Literal["block", "drop_oldest", "drop_newest"] = "block"  # Dropping is opt-in
+    fair: bool = True  # Priority lanes (system, Dad, DMs, groups) + round-robin per chat
+
+
 class GatewayConfig(BaseModel):
     """Gateway/server configuration."""
     host: str = "0.0.0.0"
     port: int = 18790
+    bus: BusConfig = Field(default_factory=BusConfig)
+    # Agent worker processes. 1 runs the agent in the gateway process; more
+    # shards chats across processes by session key (nanobot.bus.shards).
+    # Worker 0 alone serves the dashboard (live view and controls) and runs
+    # the idle/daily tasks, so those only see its chats; see nanobot.bus.shards
+    workers: int = 1
 
 
 class WebSearchConfig(BaseModel):
@@ -12,6 +12,8 @@ Adding a new module:
 
 from __future__ import annotations
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -19,12 +21,31 @@ from typing import Any, TYPE_CHECKING
 
 from loguru import logger
 
+from nanobot.ene.context_packer import ContextFragment, pack_fragments
+
 if TYPE_CHECKING:
     from nanobot.bus.events import InboundMessage
     from nanobot.bus.queue import MessageBus
     from nanobot.providers.base import LLMProvider
     from nanobot.session.manager import SessionManager
     from nanobot.agent.tools.base import Tool
+    from nanobot.agent.batch_context import BatchContext
+    from nanobot.agent.context_profile import ContextProfile
+
+
+@dataclass(frozen=True)
+class SenderContext:
+    """Who a per-message context build is for.
+
+    Passed to the per-message context hooks instead of being set on the
+    (shared) module instances, so concurrent batches — and worker threads
+    still running after a timeout — can't read each other's sender.
+    """
+
+    platform_id: str = ""  # "channel:sender_id"
+    metadata: dict[str, Any] = field(default_factory=dict)
+    participant_ids: list[str] | None = None  # Scene participants (multi-person batch)
+    daemon_result: Any = None  # DaemonResult for the message being answered, if any
 
 
 @dataclass
@@ -45,7 +66,7 @@ class EneModule(ABC):
         1. initialize(ctx) — called once on startup
         2. get_tools() — tools registered with the agent
         3. get_context_block() — static text injected into every system prompt
-        4. get_context_block_for_message(msg) — dynamic text per message
+        4. get_context_block_for_message(msg, sender) — dynamic text per message
         5. on_message(msg, responded) — called after each message
         6. on_idle(seconds) — called when conversation goes idle
         7. on_daily() — called on daily maintenance schedule
@@ -68,29 +89,77 @@ class EneModule(ABC):
         """Return tools this module provides to the agent."""
         ...
 
+    # Priority of this module's context fragments when the prompt's
+    # module-context token budget is tight (higher is kept first)
+    context_priority: int = 50
+
+    # Whether per-message context does blocking I/O (vector search, disk
+    # reads). The async context path runs such modules in a worker thread.
+    context_blocking: bool = False
+
     def get_context_block(self) -> str | None:
         """Return static text to inject into every system prompt.
 
-        Returns None to skip. Called once per system prompt build.
+        Returns None to skip. Called once per system prompt build, unless
+        context_version() says the last block is still current.
         """
         return None
 
-    def set_sender_context(self, platform_id: str, metadata: dict) -> None:
-        """Optional: receive current sender info before context building.
+    def get_context_fragments(self) -> list[ContextFragment]:
+        """Static context as prioritized fragments for the context packer.
 
-        Called before get_context_block_for_message() so modules can
-        look up the speaker and prepare per-message context.
-        Default is a no-op.
+        Default: get_context_block() as one fragment at context_priority.
+        Override to split a block into parts of different value (e.g.
+        core memory vs. diary) so the packer can trim the cheap parts.
         """
+        block = self.get_context_block()
+        return [ContextFragment(block, priority=self.context_priority)] if block else []
 
-    def get_context_block_for_message(self, message: str) -> str | None:
+    def context_version(self) -> Any:
+        """Version of get_context_fragments()' output, for prompt caching.
+
+        The registry re-renders the block only when this value changes.
+        Return something cheap to compute (a counter, file mtimes). The
+        default None means "unknown": the block is rendered on every build.
+        """
+        return None
+
+    def get_context_block_for_message(
+        self, message: str, sender: SenderContext | None = None
+    ) -> str | None:
         """Return dynamic context based on the current user message.
 
         Used for retrieval-augmented context (e.g., searching memories
-        relevant to the current conversation). Returns None to skip.
+        relevant to the current conversation). sender says who is
+        speaking; read it from the argument, never from instance state —
+        the same module serves concurrent batches. Returns None to skip.
         """
         return None
 
+    def get_context_fragments_for_message(
+        self, message: str, sender: SenderContext | None = None
+    ) -> list[ContextFragment]:
+        """Per-message context as prioritized fragments for the context packer.
+
+        Default: get_context_block_for_message() as one fragment at
+        context_priority.
+        """
+        block = self.get_context_block_for_message(message, sender)
+        return [ContextFragment(block, priority=self.context_priority)] if block else []
+
+    async def get_context_fragments_for_message_async(
+        self, message: str, sender: SenderContext | None = None
+    ) -> list[ContextFragment]:
+        """Async per-message context, used by ModuleRegistry.gather_dynamic_context().
+
+        Default: the sync get_context_fragments_for_message(), in a worker
+        thread when context_blocking is set. Override with a native async
+        implementation where one exists.
+        """
+        if self.context_blocking:
+            return await asyncio.to_thread(self.get_context_fragments_for_message, message, sender)
+        return self.get_context_fragments_for_message(message, sender)
+
     async def on_message(self, msg: "InboundMessage", responded: bool) -> None:
         """Hook called after every inbound message (lurked or responded).
 
@@ -127,6 +196,20 @@ class ModuleRegistry:
         self._current_channel: str = ""
         self._current_metadata: dict = {}
         self._scene_participant_ids: list[str] | None = None  # Set by loop.py per batch
+        self._context_cache: dict[str, tuple[Any, list[ContextFragment]]] = {}  # name -> (version, fragments)
+        # Token budget for all module context (static blocks + per-message
+        # blocks); None = unbounded. Static blocks sit in the cacheable
+        # system prompt, so they're packed on their own, into the budget
+        # minus dynamic_context_share; per-message blocks (conversation
+        # focus, daemon verdict, ...) get that share plus whatever static
+        # blocks leave unused, so low-priority static blocks can't starve them.
+        self.context_token_budget: int | None = None
+        self.dynamic_context_share = 0.35
+        self._static_context_tokens = 0
+        # Async per-message context: seconds each module gets before it's
+        # skipped (None = wait). Sender state travels as a SenderContext
+        # argument, so concurrent batches gather without a lock.
+        self.dynamic_context_timeout: float | None = 2.0
 
     def set_current_sender(
         self, sender_id: str, channel: str, metadata: dict
@@ -171,6 +254,7 @@ class ModuleRegistry:
         if module.name in self._modules:
             logger.warning(f"Module '{module.name}' already registered, replacing")
         self._modules[module.name] = module
+        self._context_cache.pop(module.name, None)
         logger.info(f"Registered Ene module: {module.name}")
 
     def get(self, name: str) -> EneModule | None:
@@ -201,72 +285,217 @@ class ModuleRegistry:
                 logger.error(f"Error getting tools from '{module.name}': {e}")
         return tools
 
-    def get_all_context_blocks(self) -> str:
+    def get_all_context_blocks(self, profile: "ContextProfile | None" = None) -> str:
         """Aggregate static context blocks from all modules.
 
-        Returns a single string with all blocks joined by newlines.
+        Returns a single string with all blocks joined by newlines,
+        packed by fragment priority into context_token_budget less the
+        share reserved for per-message blocks. Fragments
+        are re-rendered only when the module's context_version() changes
+        (or is None). With a profile, each module's render time and kept
+        tokens are attributed to the module name.
         """
-        blocks: list[str] = []
+        fragments: list[ContextFragment] = []
         for module in self._modules.values():
             try:
-                block = module.get_context_block()
-                if block:
-                    blocks.append(block)
+                fragments.extend(self._measure(profile, module.name, lambda: self._get_context_fragments(module)))
             except Exception as e:
                 logger.error(f"Error getting context from '{module.name}': {e}")
-        return "\n\n".join(blocks)
-
-    def get_all_dynamic_context(self, message: str) -> str:
+        budget = self.context_token_budget
+        if budget is not None:
+            budget = int(budget * (1 - self.dynamic_context_share))
+        kept = self._pack(fragments, budget, profile)
+        self._static_context_tokens = sum(f.tokens for f in kept)
+        return "\n\n".join(f.text for f in kept)
+
+    def _get_context_fragments(self, module: EneModule) -> list[ContextFragment]:
+        """A module's static fragments, memoized by its context_version()."""
+        version = module.context_version()
+        if version is not None:
+            cached = self._context_cache.get(module.name)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+        fragments = [self._with_source(f, module.name) for f in module.get_context_fragments()]
+        if version is not None:
+            self._context_cache[module.name] = (version, fragments)
+        return fragments
+
+    @staticmethod
+    def _with_source(fragment: ContextFragment, component: str) -> ContextFragment:
+        """Tag fragment with the component it was built (and timed) under."""
+        if not fragment.source:
+            fragment.source = component
+        fragment.component = component
+        return fragment
+
+    @staticmethod
+    def _pack(
+        fragments: list[ContextFragment], budget: int | None, profile: "ContextProfile | None"
+    ) -> list[ContextFragment]:
+        kept = pack_fragments(fragments, budget)
+        if profile is not None:
+            for fragment in kept:
+                profile.add(fragment.component or fragment.source, fragment.text)
+        return kept
+
+    @staticmethod
+    def _measure(profile: "ContextProfile | None", component: str, build: Any) -> Any:
+        return profile.measure(component, build) if profile is not None else build()
+
+    def get_all_dynamic_context(
+        self,
+        message: str,
+        batch: "BatchContext | None" = None,
+        profile: "ContextProfile | None" = None,
+    ) -> str:
         """Aggregate dynamic context from all modules for a given message.
 
-        First tells modules who is speaking (via set_sender_context),
-        then collects dynamic context blocks. If scene participants are
-        set (multi-person batch), uses get_scene_context() on the social
-        module instead of the single-person card.
-        Returns a single string with all dynamic blocks joined by newlines.
+        Each module gets who is speaking as a SenderContext argument. If
+        scene participants are set (multi-person batch), uses
+        get_scene_context() on the social module instead of the
+        single-person card.
+
+        Args:
+            message: The current message content.
+            batch: Per-batch execution context. When given, sender and
+                scene come from it instead of the registry's shared state.
+            profile: Optional build profile; each module's block is
+                attributed to "<module>:message" (scene cards to "social:scene").
+
+        Returns:
+            A single string with all dynamic blocks joined by newlines,
+            packed into the budget left after the static blocks.
         """
-        # Tell modules who is speaking before asking for context
-        platform_id = self.get_current_platform_id()
-        metadata = self.get_current_metadata()
-        if platform_id:
-            for module in self._modules.values():
-                try:
-                    module.set_sender_context(platform_id, metadata)
-                except Exception as e:
-                    logger.error(
-                        f"Error setting sender context on '{module.name}': {e}"
-                    )
+        sender = self._sender_context(batch)
 
-        blocks: list[str] = []
-
-        # If scene participants are set, use scene context from social module
-        # instead of the per-module loop for the social module's card
-        scene_used = False
-        if self._scene_participant_ids is not None:
-            social_mod = self._modules.get("social")
-            if social_mod and hasattr(social_mod, "get_scene_context"):
-                try:
-                    scene_block = social_mod.get_scene_context(
-                        primary_id=platform_id,
-                        participant_ids=self._scene_participant_ids,
-                    )
-                    if scene_block:
-                        blocks.append(scene_block)
-                        scene_used = True
-                except Exception as e:
-                    logger.error(f"Error getting scene context from social: {e}")
+        scene: list[ContextFragment] = []
+        social_mod = self._modules.get("social")
+        if sender.participant_ids is not None and social_mod and hasattr(social_mod, "get_scene_context"):
+            try:
+                scene = self._scene_fragments(social_mod, self._measure(
+                    profile, "social:scene",
+                    lambda: social_mod.get_scene_context(
+                        primary_id=sender.platform_id,
+                        participant_ids=sender.participant_ids,
+                    ),
+                ))
+            except Exception as e:
+                logger.error(f"Error getting scene context from social: {e}")
 
+        fragments: list[ContextFragment] = list(scene)
         for module in self._modules.values():
             try:
                 # Skip social module's per-message card if scene context was used
-                if scene_used and module.name == "social":
+                if scene and module.name == "social":
                     continue
-                block = module.get_context_block_for_message(message)
-                if block:
-                    blocks.append(block)
+                source = f"{module.name}:message"
+                fragments.extend(
+                    self._with_source(f, source)
+                    for f in self._measure(
+                        profile, source, lambda: module.get_context_fragments_for_message(message, sender)
+                    )
+                )
             except Exception as e:
                 logger.error(f"Error getting dynamic context from '{module.name}': {e}")
-        return "\n\n".join(blocks)
+        return self._pack_dynamic(fragments, profile)
+
+    async def gather_dynamic_context(
+        self,
+        message: str,
+        batch: "BatchContext | None" = None,
+        profile: "ContextProfile | None" = None,
+    ) -> str:
+        """Async get_all_dynamic_context(): modules are queried concurrently.
+
+        Blocking modules (context_blocking) run in worker threads, and
+        each module gets dynamic_context_timeout seconds — a slow vector
+        search is skipped instead of holding up the reply. The scene
+        brief is built alongside the speaker card; the card is dropped
+        if the scene has content. Modules only see the SenderContext
+        snapshot taken here, so concurrent gathers don't need to
+        serialize.
+        """
+        sender = self._sender_context(batch)
+
+        modules = list(self._modules.values())
+        calls = [
+            self._timed(
+                f"{module.name}:message", profile,
+                lambda module=module: module.get_context_fragments_for_message_async(message, sender),
+            )
+            for module in modules
+        ]
+        social_mod = self._modules.get("social")
+        want_scene = (
+            sender.participant_ids is not None and social_mod is not None
+            and hasattr(social_mod, "get_scene_context")
+        )
+        if want_scene:
+            calls.append(self._timed(
+                "social:scene", profile,
+                lambda: asyncio.to_thread(
+                    social_mod.get_scene_context,
+                    primary_id=sender.platform_id,
+                    participant_ids=sender.participant_ids,
+                ),
+            ))
+        results = await asyncio.gather(*calls)
+
+        scene = self._scene_fragments(social_mod, results.pop()) if want_scene else []
+        fragments: list[ContextFragment] = list(scene)
+        for module, result in zip(modules, results):
+            if scene and module.name == "social":
+                continue
+            fragments.extend(self._with_source(f, f"{module.name}:message") for f in result or [])
+        return self._pack_dynamic(fragments, profile)
+
+    async def _timed(self, component: str, profile: "ContextProfile | None", call: Any) -> Any:
+        """Await call() under the per-module timeout; None on timeout or error."""
+        start = time.perf_counter()
+        try:
+            return await asyncio.wait_for(call(), timeout=self.dynamic_context_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Dynamic context '{component}' took over {self.dynamic_context_timeout}s, skipped")
+        except Exception as e:
+            logger.error(f"Error getting dynamic context '{component}': {e}")
+        finally:
+            if profile is not None:
+                profile.add(component, None, time.perf_counter() - start, tokens=0)
+        return None
+
+    def _sender_context(self, batch: "BatchContext | None") -> SenderContext:
+        """Snapshot of who is speaking: from the batch, else the registry's shared sender."""
+        if batch is not None:
+            participants = batch.scene_participant_ids
+            return SenderContext(
+                platform_id=batch.platform_id,
+                metadata=dict(batch.sender_metadata),
+                participant_ids=list(participants) if participants is not None else None,
+                daemon_result=batch.daemon_result,
+            )
+        participants = self._scene_participant_ids
+        return SenderContext(
+            platform_id=self.get_current_platform_id(),
+            metadata=dict(self.get_current_metadata()),
+            participant_ids=list(participants) if participants is not None else None,
+        )
+
+    @staticmethod
+    def _scene_fragments(social_mod: EneModule, scene_block: str | None) -> list[ContextFragment]:
+        if not scene_block:
+            return []
+        return [ContextFragment(
+            scene_block, priority=social_mod.context_priority,
+            truncatable=True, source="social:scene", component="social:scene",
+        )]
+
+    def _pack_dynamic(self, fragments: list[ContextFragment], profile: "ContextProfile | None") -> str:
+        """Pack per-message fragments into the budget the static blocks left."""
+        budget = self.context_token_budget
+        if budget is not None:
+            budget = max(0, budget - self._static_context_tokens)
+        kept = self._pack(fragments, budget, profile)
+        return "\n\n".join(f.text for f in kept)
 
     async def notify_message(
         self, msg: "InboundMessage", responded: bool
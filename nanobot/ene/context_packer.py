@@ -0,0 +1,107 @@
+"""Token-budgeted packing of module context.
+
+Modules contribute context as ContextFragments, each with a priority.
+pack_fragments() fills a token budget highest-priority first: fragments
+that fit are kept whole, truncatable fragments are cut (whole lines,
+from the end, or from the start with keep="tail") to the room that's
+left, and anything else that doesn't fit is dropped. Kept fragments come
+back in their original order, so the prompt layout doesn't depend on
+priorities.
+
+    fragments = [
+        ContextFragment(core_memory, priority=90),
+        ContextFragment(diary, priority=30, truncatable=True, keep="tail"),
+    ]
+    kept = pack_fragments(fragments, budget=6000)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Literal
+
+from loguru import logger
+
+from nanobot.session.tokens import count_tokens_cached
+
+TRUNCATION_MARKER = "[...trimmed to fit the context budget]"
+
+
+@dataclass
+class ContextFragment:
+    """A piece of module context competing for the prompt's token budget."""
+
+    text: str
+    priority: int = 50  # Higher is packed first
+    truncatable: bool = False  # May be cut down instead of dropped
+    source: str = ""  # Component name (module name); filled in by the registry
+    keep: Literal["head", "tail"] = "head"  # Which end survives truncation ("tail" for oldest-first logs)
+    component: str = ""  # Profiling key the fragment was built under; filled in by the registry
+
+    @property
+    def tokens(self) -> int:
+        return count_tokens_cached(self.text)
+
+
+def pack_fragments(fragments: list[ContextFragment], budget: int | None) -> list[ContextFragment]:
+    """Keep the fragments that fit budget tokens, by priority.
+
+    Args:
+        fragments: Candidate fragments, in prompt order.
+        budget: Token budget; None keeps everything.
+
+    Returns:
+        The kept fragments (truncated ones replaced by their cut-down
+        copy), in their original order.
+    """
+    candidates = [f for f in fragments if f.text]
+    if budget is None:
+        return candidates
+
+    remaining = budget
+    kept: dict[int, ContextFragment] = {}
+    # sorted() is stable: equal priorities keep prompt order
+    for i in sorted(range(len(candidates)), key=lambda i: -candidates[i].priority):
+        fragment = candidates[i]
+        tokens = fragment.tokens
+        if tokens <= remaining:
+            kept[i] = fragment
+            remaining -= tokens
+            continue
+        if fragment.truncatable:
+            text = _truncate(fragment.text, remaining, fragment.keep)
+            if text:
+                kept[i] = replace(fragment, text=text)
+                remaining -= kept[i].tokens
+                logger.debug(f"Context packer: trimmed '{fragment.source}' from {tokens} tokens")
+                continue
+        logger.debug(f"Context packer: dropped '{fragment.source}' ({tokens} tokens, priority {fragment.priority})")
+    return [kept[i] for i in sorted(kept)]
+
+
+def _truncate(text: str, budget: int, keep: str = "head") -> str:
+    """Whole lines of text that fit budget tokens (marker included), or "".
+
+    keep="head" keeps leading lines; keep="tail" keeps trailing ones, plus
+    a leading markdown heading so the block still says what it is.
+    """
+    lines = text.split("\n")
+    heading: list[str] = []
+    if keep == "tail":
+        if lines[0].startswith("#"):
+            heading = [lines.pop(0)]
+        lines.reverse()
+
+    used = count_tokens_cached(TRUNCATION_MARKER) + sum(count_tokens_cached(line) + 1 for line in heading)
+    kept: list[str] = []
+    for line in lines:
+        cost = count_tokens_cached(line) + 1  # + the newline
+        if used + cost > budget:
+            break
+        kept.append(line)
+        used += cost
+    if not any(line.strip() for line in kept):
+        return ""
+    if keep == "tail":
+        return "\n".join(heading + [TRUNCATION_MARKER] + kept[::-1])
+    return "\n".join(kept + [TRUNCATION_MARKER])
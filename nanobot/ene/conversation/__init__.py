@@ -21,11 +21,12 @@ Hooks into the pipeline:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from contextvars import ContextVar
+from typing import Any, TYPE_CHECKING
 
 from loguru import logger
 
-from nanobot.ene import EneModule, EneContext
+from nanobot.ene import EneModule, EneContext, SenderContext
 
 if TYPE_CHECKING:
     from nanobot.agent.tools.base import Tool
@@ -44,12 +45,18 @@ class ConversationTrackerModule(EneModule):
     - Disk persistence for thread state across restarts
     """
 
+    context_priority = 95  # Thread instructions and Focus directive
+
     def __init__(self) -> None:
         self.tracker: ConversationTracker | None = None
         self._ctx: EneContext | None = None
         self._save_cooldown = 60.0  # Save at most every 60s
         self._last_save = 0.0
-        self._focus_target: dict | None = None  # Phase 2.2: per-thread focus directive
+        # Phase 2.2: per-thread focus directive. Scoped to the running asyncio
+        # task so concurrent batches on different channels keep their own target.
+        self._focus_var: ContextVar[dict | None] = ContextVar(
+            f"conversation_focus_{id(self)}", default=None
+        )
 
     @property
     def name(self) -> str:
@@ -86,26 +93,38 @@ class ConversationTrackerModule(EneModule):
             "you're responding to."
         )
 
+    def context_version(self) -> Any:
+        """The instructions above never change."""
+        return 1
+
     def set_focus_target(self, name: str, topic: str | None = None) -> None:
         """Set the per-thread focus target for the next LLM call.
 
         Called from loop.py before each per-thread _run_agent_loop().
         The focus directive tells the LLM exactly who to respond to.
         """
-        self._focus_target = {"name": name, "topic": topic or "their message"}
+        self._focus_var.set({"name": name, "topic": topic or "their message"})
 
     def clear_focus_target(self) -> None:
         """Clear the focus target after a per-thread LLM call completes."""
-        self._focus_target = None
+        self._focus_var.set(None)
+
+    @property
+    def _focus_target(self) -> dict | None:
+        """Focus target for the running task (None outside a per-thread call)."""
+        return self._focus_var.get()
 
-    def get_context_block_for_message(self, message: str) -> str | None:
+    def get_context_block_for_message(
+        self, message: str, sender: SenderContext | None = None
+    ) -> str | None:
         """Return per-thread Focus directive if a focus target is set."""
-        if not self._focus_target:
+        focus = self._focus_target
+        if not focus:
             return None
         return (
             "## Focus\n"
-            f"Your primary target is **{self._focus_target['name']}** "
-            f"in the thread about {self._focus_target.get('topic', 'their message')}.\n"
+            f"Your primary target is **{focus['name']}** "
+            f"in the thread about {focus.get('topic', 'their message')}.\n"
             "Respond to them. One message."
         )
 
@@ -28,14 +28,13 @@ from loguru import logger
 # Word-boundary match to avoid false positives ("generic", "scene", etc.)
 _ENE_PATTERN = re.compile(r"\bene\b", re.IGNORECASE)
 
-from nanobot.ene import EneModule, EneContext
+from nanobot.ene import EneModule, EneContext, SenderContext
 
 if TYPE_CHECKING:
     from nanobot.agent.tools.base import Tool
-    from nanobot.bus.events import InboundMessage
 
-from .models import Classification, DaemonResult, SecurityFlag
-from .processor import DaemonProcessor
+from .models import Classification, DaemonRequest, DaemonResult, SecurityFlag
+from .processor import DEFAULT_BATCH_SIZE, DaemonProcessor
 
 
 class DaemonModule(EneModule):
@@ -49,10 +48,11 @@ class DaemonModule(EneModule):
     - Model rotation across free models for reliability
     """
 
+    context_priority = 85  # Security alerts and implicit mentions
+
     def __init__(self) -> None:
         self.processor: DaemonProcessor | None = None
         self._ctx: EneContext | None = None
-        self._last_result: DaemonResult | None = None
 
     @property
     def name(self) -> str:
@@ -71,12 +71,15 @@ class DaemonModule(EneModule):
         # Get observatory (wired later in post-init, but set here if available)
         observatory = None
 
+        batch_size = getattr(defaults, "daemon_batch_size", DEFAULT_BATCH_SIZE)
+
         self.processor = DaemonProcessor(
             provider=ctx.provider,
             model=model,
             temperature=0.1,
             timeout_seconds=10.0,  # 10s — free models can be slow
             observatory=observatory,
+            batch_size=batch_size if isinstance(batch_size, int) else DEFAULT_BATCH_SIZE,
         )
 
         logger.info(f"Daemon module initialized (model: {model or 'free rotation'})")
@@ -89,15 +92,18 @@ class DaemonModule(EneModule):
         """No static context block — daemon injects dynamically per message."""
         return None
 
-    def get_context_block_for_message(self, message: str) -> str | None:
+    def get_context_block_for_message(
+        self, message: str, sender: SenderContext | None = None
+    ) -> str | None:
         """Inject daemon analysis into Ene's context for the current message.
 
-        Only injects when there's something worth telling Ene about:
+        The analysis is sender.daemon_result (the pipeline keeps it on the
+        batch). Only injects when there's something worth telling Ene about:
         - Security alerts (always)
         - Implicit Ene references (so she knows someone is talking about her)
         - Hostile/suspicious tone (heads up)
         """
-        result = self._last_result
+        result = sender.daemon_result if sender is not None else None
         if not result:
             return None
 
@@ -151,8 +157,8 @@ class DaemonModule(EneModule):
     ) -> DaemonResult:
         """Run daemon analysis on a message.
 
-        Called from _flush_debounce in the pipeline. Stores the result
-        for later context injection via get_context_block_for_message().
+        Called from _flush_debounce in the pipeline. The pipeline keeps the
+        result on its batch for context injection (SenderContext.daemon_result).
 
         Args:
             content: Raw message text
@@ -196,7 +202,6 @@ class DaemonModule(EneModule):
                     fallback_used=True,
                     model_used="not_initialized",
                 )
-            self._last_result = result
             return result
 
         result = await self.processor.process(
@@ -209,9 +214,6 @@ class DaemonModule(EneModule):
             recent_context=recent_context,
         )
 
-        # Store for context injection
-        self._last_result = result
-
         # Log interesting results
         if result.has_security_flags:
             flags_str = ", ".join(
@@ -233,10 +235,58 @@ class DaemonModule(EneModule):
 
         return result
 
-    async def on_message(self, msg: "InboundMessage", responded: bool) -> None:
-        """Clear last result after message is processed."""
-        # Result is consumed — clear for next message
-        self._last_result = None
+    @property
+    def batch_enabled(self) -> bool:
+        """True when multi-message daemon prompts are configured."""
+        return self.processor is not None and self.processor.batch_size > 1
+
+    async def process_batch(
+        self,
+        requests: list[DaemonRequest],
+        channel_state=None,
+        recent_context: list[str] | None = None,
+    ) -> list[DaemonResult]:
+        """Run daemon analysis on a whole debounce batch.
+
+        Uses one multi-message LLM call per chunk when a processor is
+        available; otherwise falls back to process_message() per entry.
+
+        Args:
+            requests: Messages to classify, in batch order.
+            channel_state: ChannelState for math-based classification fallback.
+            recent_context: Recent chat lines shared by the batch.
+
+        Returns:
+            One DaemonResult per request, in input order.
+        """
+        if not self.processor:
+            return [
+                await self.process_message(
+                    req.content, req.sender_name, req.sender_id, req.is_dad,
+                    req.metadata, channel_state, recent_context,
+                )
+                for req in requests
+            ]
+
+        results = await self.processor.process_batch(
+            requests, channel_state=channel_state, recent_context=recent_context,
+        )
+
+        for req, result in zip(requests, results):
+            if result.has_security_flags:
+                flags_str = ", ".join(
+                    f"{f.type}({f.severity})" for f in result.security_flags
+                )
+                logger.warning(
+                    f"Daemon: security flags for {req.sender_name}: {flags_str}"
+                )
+            if result.classification == Classification.DROP:
+                logger.info(
+                    f"Daemon: dropping message from {req.sender_name} "
+                    f"({result.classification_reason})"
+                )
+
+        return results
 
     async def shutdown(self) -> None:
         """No cleanup needed."""
@@ -60,6 +60,16 @@ class DaemonResult:
         return any(f.severity == "high" for f in self.security_flags)
 
 
+@dataclass
+class DaemonRequest:
+    """One message to classify in a batched daemon call."""
+    content: str
+    sender_name: str
+    sender_id: str       # Platform ID, e.g. "discord:123456"
+    is_dad: bool = False
+    metadata: dict | None = None
+
+
 # ── Free model configuration ──────────────────────────────────────────
 
 # Models to rotate through when primary model fails or is rate-limited.
@@ -15,6 +15,7 @@ from __future__ import annotations
 import asyncio
 import json
 import re
+import secrets
 import time as _time
 from typing import TYPE_CHECKING
 
@@ -22,6 +23,7 @@ from loguru import logger
 
 from nanobot.ene.daemon.models import (
     Classification,
+    DaemonRequest,
     DaemonResult,
     SecurityFlag,
     DEFAULT_FREE_MODELS,
@@ -55,6 +57,13 @@ _prompt_loader = _PromptLoader()
 # Module-level constant — loaded from file, no template vars needed
 DAEMON_PROMPT = _prompt_loader.load("daemon_system")
 
+# Batch mode: same rules, multi-message input, JSON array output
+DAEMON_BATCH_PROMPT = DAEMON_PROMPT + "\n\n" + _prompt_loader.load("daemon_batch")
+
+DEFAULT_BATCH_SIZE = 1  # Max messages packed into one batched daemon call (1 = no batching)
+BATCH_TOKENS_PER_MESSAGE = 160  # Output budget per message in a batched call
+BATCH_TIMEOUT_PER_MESSAGE = 1.0  # Extra seconds of timeout per message in a batch
+
 
 class DaemonProcessor:
     """Runs a free LLM call to classify and sanitize messages."""
@@ -67,6 +76,7 @@ class DaemonProcessor:
         temperature: float = 0.1,
         timeout_seconds: float = 5.0,
         observatory: MetricsCollector | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
     ):
         self._provider = provider
         self._model = model
@@ -74,6 +84,7 @@ class DaemonProcessor:
         self._temperature = temperature
         self._timeout = timeout_seconds
         self._observatory = observatory
+        self.batch_size = max(1, batch_size)
 
         # Model rotation tracking
         self._model_index = 0
@@ -155,6 +166,126 @@ class DaemonProcessor:
 
             return self._hardcoded_fallback(content, sender_id, is_dad, start, metadata, channel_state)
 
+    async def process_batch(
+        self,
+        messages: list[DaemonRequest],
+        channel_state=None,
+        recent_context: list[str] | None = None,
+    ) -> list[DaemonResult]:
+        """Classify several messages with one LLM call per chunk.
+
+        Packs up to ``batch_size`` messages into a single prompt with
+        per-message IDs, so the system prompt and recent chat are sent
+        once instead of per message. Entries missing from (or unparseable
+        in) the returned JSON array are re-run through process(). A chunk
+        that times out uses the hardcoded fallback — the model is slow,
+        so per-message retries would only add latency.
+
+        Args:
+            messages: Messages to classify, in batch order.
+            channel_state: ChannelState for the math-classifier fallback.
+            recent_context: Recent chat lines shared by the whole batch.
+
+        Returns:
+            One DaemonResult per input message, in input order.
+        """
+        results: list[DaemonResult] = []
+        for i in range(0, len(messages), self.batch_size):
+            chunk = messages[i:i + self.batch_size]
+            if len(chunk) == 1:
+                req = chunk[0]
+                results.append(await self.process(
+                    req.content, req.sender_name, req.sender_id, req.is_dad,
+                    req.metadata, channel_state, recent_context,
+                ))
+            else:
+                results.extend(await self._process_chunk(chunk, channel_state, recent_context))
+        return results
+
+    async def _process_chunk(
+        self,
+        chunk: list[DaemonRequest],
+        channel_state,
+        recent_context: list[str] | None,
+    ) -> list[DaemonResult]:
+        """Run one batched LLM call and fill gaps with per-message calls."""
+        start = _time.perf_counter()
+        timeout = self._timeout + BATCH_TIMEOUT_PER_MESSAGE * len(chunk)
+        model = self._get_current_model()
+
+        try:
+            parsed = await asyncio.wait_for(
+                self._llm_process_batch(chunk, recent_context),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Daemon: batch of {len(chunk)} timed out after {timeout:.0f}s on {model}, falling back"
+            )
+            self._record_failure(model)
+            self._rotate_model()
+            if _metrics:
+                _metrics.record(
+                    "timeout",
+                    model_attempted=model,
+                    batch_size=len(chunk),
+                    fallback_to="math_classifier" if channel_state else "regex",
+                )
+            return [
+                self._hardcoded_fallback(
+                    req.content, req.sender_id, req.is_dad, start, req.metadata, channel_state,
+                )
+                for req in chunk
+            ]
+        except Exception as e:
+            logger.warning(f"Daemon: batch call failed on {model} ({e}), retrying per message")
+            self._record_failure(model)
+            self._rotate_model()
+            parsed = {}
+
+        latency_ms = int((_time.perf_counter() - start) * 1000)
+        results: list[DaemonResult | None] = []
+        for idx, req in enumerate(chunk):
+            result = parsed.get(idx)
+            if result is not None:
+                result.latency_ms = latency_ms
+                if _metrics:
+                    _metrics.record(
+                        "classified",
+                        model_used=result.model_used,
+                        classification=result.classification.value,
+                        confidence=result.confidence,
+                        topic=result.topic_summary,
+                        emotional_tone=result.emotional_tone,
+                        security_flags=[f.type for f in result.security_flags],
+                        latency_ms=latency_ms,
+                        batched=True,
+                    )
+            results.append(result)
+
+        missing = [idx for idx, r in enumerate(results) if r is None]
+        if _metrics:
+            _metrics.record(
+                "batch_call",
+                model_used=model,
+                batch_size=len(chunk),
+                parsed=len(chunk) - len(missing),
+                latency_ms=latency_ms,
+            )
+        if missing:
+            logger.debug(f"Daemon: {len(missing)}/{len(chunk)} batch entries unparsed, retrying per message")
+            retried = await asyncio.gather(*(
+                self.process(
+                    chunk[idx].content, chunk[idx].sender_name, chunk[idx].sender_id,
+                    chunk[idx].is_dad, chunk[idx].metadata, channel_state, recent_context,
+                )
+                for idx in missing
+            ))
+            for idx, result in zip(missing, retried):
+                results[idx] = result
+
+        return results  # type: ignore[return-value]
+
     # ── Internal ───────────────────────────────────────────────────────
 
     def _get_current_model(self) -> str:
@@ -192,14 +323,7 @@ class DaemonProcessor:
         model = self._get_current_model()
 
         # Build compact user message with conversation context
-        user_msg = f"Sender: {sender_name} (ID: {sender_id})"
-        if is_dad:
-            user_msg += " [THIS IS DAD - respond unless clearly talking to someone else]"
-        if metadata and metadata.get("is_reply_to_ene"):
-            user_msg += " [REPLYING TO ENE]"
-        if metadata and metadata.get("_is_stale"):
-            stale_min = metadata.get("_stale_minutes", "?")
-            user_msg += f" [MESSAGE IS STALE - sent {stale_min} min ago]"
+        user_msg = self._format_message_header(sender_name, sender_id, is_dad, metadata)
         if recent_context:
             user_msg += "\n\nRecent chat:\n" + "\n".join(recent_context)
         user_msg += f"\n\nNew message to classify:\n{content[:2000]}"
@@ -232,6 +356,93 @@ class DaemonProcessor:
 
         return result
 
+    @staticmethod
+    def _format_message_header(
+        sender_name: str, sender_id: str, is_dad: bool, metadata: dict | None,
+    ) -> str:
+        """Sender line with Dad / reply / stale tags (shared by single and batch prompts)."""
+        header = f"Sender: {sender_name} (ID: {sender_id})"
+        if is_dad:
+            header += " [THIS IS DAD - respond unless clearly talking to someone else]"
+        if metadata and metadata.get("is_reply_to_ene"):
+            header += " [REPLYING TO ENE]"
+        if metadata and metadata.get("_is_stale"):
+            stale_min = metadata.get("_stale_minutes", "?")
+            header += f" [MESSAGE IS STALE - sent {stale_min} min ago]"
+        return header
+
+    async def _llm_process_batch(
+        self,
+        chunk: list[DaemonRequest],
+        recent_context: list[str] | None = None,
+    ) -> dict[int, DaemonResult]:
+        """Make one LLM call for a chunk of messages.
+
+        Returns parsed results keyed by chunk index. Entries the model
+        skipped or mangled are simply absent.
+        """
+        model = self._get_current_model()
+
+        parts: list[str] = []
+        if recent_context:
+            parts.append("Recent chat:\n" + "\n".join(recent_context))
+        # Random IDs per call: a message can't forge a label for another one
+        ids = [f"m{idx + 1}-{secrets.token_hex(3)}" for idx in range(len(chunk))]
+        lines = [f"New messages to classify ({len(chunk)}):"]
+        for msg_id, req in zip(ids, chunk):
+            header = self._format_message_header(
+                req.sender_name, req.sender_id, req.is_dad, req.metadata,
+            )
+            lines.append(f"[{msg_id}] {header}\n{req.content[:2000]}")
+        parts.append("\n\n".join(lines))
+
+        messages = [
+            {"role": "system", "content": DAEMON_BATCH_PROMPT},
+            {"role": "user", "content": "\n\n".join(parts)},
+        ]
+
+        obs_start = _time.perf_counter()
+        response = await self._provider.chat(
+            messages=messages,
+            model=model,
+            max_tokens=BATCH_TOKENS_PER_MESSAGE * len(chunk) + 256,
+            temperature=self._temperature,
+        )
+
+        if self._observatory:
+            self._observatory.record(
+                response, call_type="daemon", model=model,
+                caller_id="system", latency_start=obs_start,
+            )
+
+        parsed = self._parse_batch_response(response.content or "", model, ids)
+        if parsed:
+            self._model_failures[model] = 0
+        return parsed
+
+    def _parse_batch_response(self, text: str, model: str, ids: list[str]) -> dict[int, DaemonResult]:
+        """Parse a JSON array of per-message results keyed by the IDs sent.
+
+        Any ID that wasn't sent, or is repeated, rejects the whole response
+        (every message falls back to a single call); missing ones are absent.
+        """
+        items = self._extract_json_array(text) if text else None
+        if not items:
+            logger.debug(f"Daemon: failed to parse batch JSON from {model}: {text[:200]}")
+            return {}
+
+        index = {msg_id: idx for idx, msg_id in enumerate(ids)}
+        parsed: dict[int, DaemonResult] = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            idx = index.get(str(item.get("id", "")).strip().strip("[]").lower())
+            if idx is None or idx in parsed:
+                logger.warning(f"Daemon: batch response from {model} has unexpected ID {item.get('id')!r}")
+                return {}
+            parsed[idx] = self._result_from_dict(item, model)
+        return parsed
+
     def _parse_response(self, text: str, model: str) -> DaemonResult:
         """Parse daemon LLM response into DaemonResult.
 
@@ -252,6 +463,13 @@ class DaemonProcessor:
             result.fallback_used = True
             return result
 
+        return self._result_from_dict(data, model)
+
+    @staticmethod
+    def _result_from_dict(data: dict, model: str) -> DaemonResult:
+        """Map one parsed JSON object onto a DaemonResult."""
+        result = DaemonResult(model_used=model)
+
         # Map fields
         classification_str = str(data.get("classification", "context")).lower()
         if classification_str in ("respond", "context", "drop"):
@@ -278,6 +496,35 @@ class DaemonProcessor:
 
         return result
 
+    @staticmethod
+    def _extract_json_array(text: str) -> list | None:
+        """Extract a JSON array from LLM response (raw, markdown block, or bracket match).
+
+        Also accepts an object wrapping the array ({"results": [...]}) or a
+        lone object, which some models return for single-entry batches.
+        """
+        candidates = [text]
+        block = re.search(r"```(?:json)?\s*([\s\S]*?)```", text)
+        if block:
+            candidates.append(block.group(1))
+        bracket = re.search(r"\[[\s\S]*\]", text)
+        if bracket:
+            candidates.append(bracket.group())
+
+        for candidate in candidates:
+            try:
+                data = json.loads(candidate)
+            except (json.JSONDecodeError, ValueError):
+                continue
+            if isinstance(data, list):
+                return data
+            if isinstance(data, dict):
+                for value in data.values():
+                    if isinstance(value, list):
+                        return value
+                return [data]
+        return None
+
     @staticmethod
     def _extract_json(text: str) -> dict | None:
         """Extract JSON from LLM response, handling markdown blocks etc."""
@@ -10,7 +10,7 @@ from typing import Any, TYPE_CHECKING
 
 from loguru import logger
 
-from nanobot.ene import EneModule, EneContext
+from nanobot.ene import ContextFragment, EneModule, EneContext, SenderContext
 
 if TYPE_CHECKING:
     from nanobot.agent.tools.base import Tool
@@ -29,6 +29,9 @@ class MemoryModule(EneModule):
         6. on_daily() — triggers sleep agent deep processing
     """
 
+    context_priority = 60  # Retrieved memories (core/diary set their own)
+    context_blocking = True  # Embeds the message and queries ChromaDB
+
     def __init__(
         self,
         token_budget: int = 4000,
@@ -115,13 +118,41 @@ class MemoryModule(EneModule):
             return None
         return self._system.get_memory_context()
 
-    def get_context_block_for_message(self, message: str) -> str | None:
+    def get_context_fragments(self) -> list[ContextFragment]:
+        """Core memory (kept first) and the recent diary (trimmed first)."""
+        if self._system is None:
+            return []
+        core, diary = self._system.get_memory_context_parts()
+        fragments = []
+        if core:
+            fragments.append(ContextFragment(core, priority=90, source="memory:core"))
+        if diary:
+            # Oldest entry first: trimming keeps the most recent ones
+            fragments.append(ContextFragment(diary, priority=30, truncatable=True, source="memory:diary", keep="tail"))
+        return fragments
+
+    def context_version(self) -> Any:
+        """Changes whenever core memory is saved or a diary file in range changes."""
+        if self._system is None:
+            return None
+        return self._system.get_memory_context_version()
+
+    def get_context_block_for_message(
+        self, message: str, sender: SenderContext | None = None
+    ) -> str | None:
         """Return retrieval-augmented context for the current message."""
         if self._system is None:
             return None
         context = self._system.get_relevant_context(message)
         return context if context else None
 
+    def get_context_fragments_for_message(
+        self, message: str, sender: SenderContext | None = None
+    ) -> list[ContextFragment]:
+        """Retrieved memories — trimmed (least relevant last) rather than dropped."""
+        block = self.get_context_block_for_message(message, sender)
+        return [ContextFragment(block, priority=self.context_priority, truncatable=True)] if block else []
+
     async def on_message(self, msg: "InboundMessage", responded: bool) -> None:
         """Reset idle processing flag on each message."""
         self._idle_processed = False
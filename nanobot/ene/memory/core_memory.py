@@ -53,10 +53,12 @@ class CoreMemory:
         self.path = memory_dir / "core.json"
         self.token_budget = token_budget
         self._data: dict[str, Any] = {}
+        self.revision = 0  # Bumped on every load/save — tells prompt caches to re-render
         self.load()
 
     def load(self) -> None:
         """Load core.json from disk, or initialize empty if missing."""
+        self.revision += 1
         if self.path.exists():
             try:
                 raw = self.path.read_text(encoding="utf-8")
@@ -91,6 +93,7 @@ class CoreMemory:
 
     def save(self) -> None:
         """Persist core.json to disk."""
+        self.revision += 1
         self._recount()
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self.path.write_text(
@@ -94,18 +94,33 @@ class MemorySystem:
 
         Returns core memory + recent diary entries formatted as markdown.
         """
-        parts: list[str] = []
-
-        # Core memory
-        if self._core:
-            parts.append(self._core.render_for_context())
+        return "\n\n".join(part for part in self.get_memory_context_parts() if part)
 
-        # Recent diary entries
+    def get_memory_context_parts(self) -> tuple[str, str]:
+        """Core memory and recent diary blocks, separately ("" when empty)."""
+        core = self._core.render_for_context() if self._core else ""
         diary_text = self._load_recent_diary()
-        if diary_text:
-            parts.append(f"## Recent Diary\n{diary_text}")
+        diary = f"## Recent Diary\n{diary_text}" if diary_text else ""
+        return core, diary
 
-        return "\n\n".join(parts)
+    def get_memory_context_version(self) -> tuple:
+        """Cheap fingerprint of everything get_memory_context() reads.
+
+        Core memory's save counter, the date (the diary window moves at
+        midnight), and the mtime of each diary file in the window.
+        """
+        from datetime import datetime, timedelta
+
+        today = datetime.now().date()
+        diary = []
+        for days_ago in range(self._diary_context_days):
+            diary_file = self._diary_dir / f"{(today - timedelta(days=days_ago)).isoformat()}.md"
+            try:
+                diary.append(diary_file.stat().st_mtime_ns)
+            except OSError:
+                diary.append(None)
+        core = self._core.revision if self._core else None
+        return (core, today.isoformat(), tuple(diary))
 
     def get_relevant_context(self, message: str) -> str:
         """Get retrieval-augmented context for a specific message.
@@ -272,6 +272,8 @@ class SearchMemoryTool(Tool):
     excerpts, reflections, and entities.
     """
 
+    read_only = True
+
     def __init__(self, system: "MemorySystem"):
         self._system = system
 
@@ -78,6 +78,7 @@ class MetricsCollector:
             prompt_tokens = usage.get("prompt_tokens", 0)
             completion_tokens = usage.get("completion_tokens", 0)
             total_tokens = usage.get("total_tokens", prompt_tokens + completion_tokens)
+            cached_tokens = usage.get("cached_tokens", 0)
 
             # Calculate cost
             cost = calculate_cost(model, prompt_tokens, completion_tokens)
@@ -111,6 +112,8 @@ class MetricsCollector:
                 error=error,
                 experiment_id=experiment_id,
                 variant_id=variant_id,
+                ttft_ms=response.ttft_ms,
+                cached_tokens=cached_tokens,
             )
 
             row_id = self._store.record_call(record)
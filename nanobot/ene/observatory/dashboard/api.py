@@ -132,6 +132,23 @@ def create_api_routes(
     async def latency(request: web.Request) -> web.Response:
         hours = int(request.query.get("hours", "24"))
         data = store.get_latency_percentiles(min(hours, 168))
+        data["ttft"] = store.get_ttft_percentiles(min(hours, 168))
+        return web.json_response(data)
+
+    async def prompt_cache(request: web.Request) -> web.Response:
+        hours = int(request.query.get("hours", "24"))
+        data = store.get_prompt_cache_stats(min(hours, 168))
+        return web.json_response(data)
+
+    async def context_breakdown(request: web.Request) -> web.Response:
+        hours = int(request.query.get("hours", "24"))
+        data = store.get_context_build_stats(min(hours, 168))
+        return web.json_response(data)
+
+    async def context_top_consumers(request: web.Request) -> web.Response:
+        hours = int(request.query.get("hours", "24"))
+        limit = int(request.query.get("limit", "5"))
+        data = store.get_top_context_consumers(min(hours, 168), min(limit, 50))
         return web.json_response(data)
 
     async def errors(request: web.Request) -> web.Response:
@@ -329,6 +346,11 @@ def create_api_routes(
         except Exception:
             modules["memory"] = {"error": "unavailable"}
 
+        try:
+            modules["context"] = store.get_context_build_stats(hours=hours)
+        except Exception:
+            modules["context"] = {"error": "unavailable"}
+
         try:
             from nanobot.agent.prompts.loader import PromptLoader
             modules["prompts"] = {"version": PromptLoader().version}
@@ -761,17 +783,27 @@ def create_api_routes(
     # ── Session endpoints ─────────────────────────────────────────────────
 
     async def sessions_list(request: web.Request) -> web.Response:
-        """List all sessions with metadata."""
+        """List sessions with metadata, most recent first (?limit=&offset=)."""
         sessions = _ctrl.sessions
         if not sessions:
             return web.json_response([])
 
+        limit = min(int(request.query.get("limit", "100")), 1000)
+        offset = max(int(request.query.get("offset", "0")), 0)
         try:
-            session_list = sessions.list_sessions()
+            session_list = sessions.list_sessions(limit=limit, offset=offset)
+            total = sessions.count_sessions()
         except Exception:
-            session_list = []
+            session_list, total = [], 0
+
+        return web.json_response(session_list, headers={"X-Total-Count": str(total)})
 
-        return web.json_response(session_list)
+    async def session_cache(request: web.Request) -> web.Response:
+        """Session cache occupancy and hit/miss/eviction counters."""
+        sessions = _ctrl.sessions
+        if not sessions:
+            return web.json_response({"error": "Sessions not available"}, status=503)
+        return web.json_response(sessions.cache_stats())
 
     async def session_history(request: web.Request) -> web.Response:
         """Get recent messages from a session."""
@@ -783,10 +815,14 @@ def create_api_routes(
         limit = int(request.query.get("limit", "20"))
 
         try:
-            session = sessions.get_or_create(key)
-            history = session.get_history(max_messages=min(limit, 100))
-            token_est = session.estimate_tokens()
-            responded = session.get_responded_count()
+            # Range read: viewing a session shouldn't pull its whole body into the cache
+            history = [
+                {"role": m["role"], "content": m["content"]}
+                for m in sessions.read_messages(key, -min(limit, 100))
+            ]
+            summary = next((e for e in sessions.list_sessions() if e["key"] == key), {})
+            token_est = summary.get("token_estimate")
+            responded = summary.get("responded_count")
         except Exception as e:
             return web.json_response({"error": str(e)}, status=500)
 
@@ -1027,7 +1063,8 @@ def create_api_routes(
         sessions = _ctrl.sessions
         if sessions:
             try:
-                session_list = sessions.list_sessions()
+                # Only the most recent few — each one means loading its body
+                session_list = sessions.list_sessions(limit=5)
                 active_sessions = []
                 for s in session_list:
                     key = s.get("key", "")
@@ -1038,7 +1075,7 @@ def create_api_routes(
                         history = session.get_history(max_messages=6)
                         active_sessions.append({
                             "key": key,
-                            "msg_count": s.get("msg_count", len(history)),
+                            "msg_count": len(session.messages),
                             "token_estimate": session.estimate_tokens(),
                             "responded_count": session.get_responded_count(),
                             "recent": [
@@ -1069,6 +1106,9 @@ def create_api_routes(
         web.get("/api/cost/by-type", cost_by_type),
         web.get("/api/activity/hourly", activity_hourly),
         web.get("/api/latency", latency),
+        web.get("/api/prompt-cache", prompt_cache),
+        web.get("/api/context/breakdown", context_breakdown),
+        web.get("/api/context/top-consumers", context_top_consumers),
         web.get("/api/errors", errors),
         web.get("/api/calls/recent", recent_calls),
         web.get("/api/health", health_status),
@@ -1103,6 +1143,7 @@ def create_api_routes(
         web.patch("/api/threads/{id}", thread_update),
         # Sessions (new)
         web.get("/api/sessions", sessions_list),
+        web.get("/api/sessions/cache", session_cache),
         web.get("/api/sessions/{key}/history", session_history),
         web.delete("/api/sessions/{key}", session_clear),
         # Security (new)
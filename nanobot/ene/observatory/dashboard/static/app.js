@@ -33,6 +33,8 @@ let chartCostDaily = null;
 let chartHourly = null;
 let chartModel = null;
 let chartType = null;
+let chartContext = null;
+let contextTimings = [];  // Tooltip detail for chartContext bars
 
 function initCharts() {
     // Cost over time (line chart)
@@ -88,6 +90,24 @@ function initCharts() {
             }
         }
     });
+
+    // Prompt composition (avg tokens per component, horizontal bars)
+    chartContext = new Chart(document.getElementById('chart-context'), {
+        type: 'bar',
+        data: { labels: [], datasets: [{ label: 'Avg tokens', data: [], backgroundColor: COLORS.purple + '80', borderRadius: 4 }] },
+        options: {
+            indexAxis: 'y',
+            responsive: true,
+            plugins: {
+                legend: { display: false },
+                tooltip: { callbacks: { afterLabel: ctx => `${contextTimings[ctx.dataIndex] || ''}` } }
+            },
+            scales: {
+                x: { beginAtZero: true, grid: { color: COLORS.border + '40' } },
+                y: { grid: { display: false } }
+            }
+        }
+    });
 }
 
 // ── Data Fetching ────────────────────────────────────
@@ -113,6 +133,7 @@ async function updateSummary() {
     document.getElementById('today-latency').textContent = Math.round(data.avg_latency_ms) + 'ms';
     document.getElementById('today-errors').textContent = data.error_count;
     document.getElementById('today-callers').textContent = data.unique_callers;
+    document.getElementById('today-cache').textContent = Math.round((data.cache_hit_rate || 0) * 100) + '%';
 }
 
 async function updateCostChart() {
@@ -151,6 +172,17 @@ async function updateTypeChart() {
     chartType.update('none');
 }
 
+async function updateContextChart() {
+    const data = await fetchJSON('/api/context/breakdown?hours=24');
+    if (!data || !chartContext) return;
+
+    chartContext.data.labels = data.components.map(c => c.component);
+    chartContext.data.datasets[0].data = data.components.map(c => c.avg_tokens);
+    contextTimings = data.components.map(c =>
+        `${Math.round(c.token_share * 100)}% of prompt, ${c.avg_ms}ms avg build`);
+    chartContext.update('none');
+}
+
 async function updateHealth() {
     const data = await fetchJSON('/api/health');
     if (!data) return;
@@ -260,6 +292,7 @@ function connectSSE() {
             document.getElementById('today-latency').textContent = Math.round(data.avg_latency_ms) + 'ms';
             document.getElementById('today-errors').textContent = data.error_count;
             document.getElementById('today-callers').textContent = data.unique_callers;
+            document.getElementById('today-cache').textContent = Math.round((data.cache_hit_rate || 0) * 100) + '%';
             updateTimestamp();
         } catch (e) {
             console.warn('SSE parse error:', e);
@@ -285,6 +318,7 @@ async function init() {
         updateHourlyChart(),
         updateModelChart(),
         updateTypeChart(),
+        updateContextChart(),
         updateHealth(),
         updateRecentCalls(),
         updateExperiments(),
@@ -301,6 +335,7 @@ async function init() {
             updateHourlyChart(),
             updateModelChart(),
             updateTypeChart(),
+            updateContextChart(),
             updateHealth(),
             updateRecentCalls(),
             updateExperiments(),
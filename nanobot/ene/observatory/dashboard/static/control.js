@@ -580,10 +580,23 @@ const sessionDetail = document.getElementById('session-detail');
 const sessionDetailContent = document.getElementById('session-detail-content');
 const sessionBack = document.getElementById('session-back');
 
+async function loadSessionCacheStats() {
+    const el = document.getElementById('session-cache-stats');
+    const c = await fetchJSON('/api/sessions/cache');
+    if (c.error) {
+        el.textContent = '';
+        return;
+    }
+    const mb = (c.bytes / 1048576).toFixed(1);
+    const hitRate = c.hit_rate != null ? `${Math.round(c.hit_rate * 100)}% hits` : 'no lookups';
+    el.textContent = `Cache: ${c.entries}/${c.max_entries} · ${mb} MB · ${hitRate} · ${c.evictions} evicted`;
+}
+
 async function loadSessions() {
     sessionDetail.style.display = 'none';
     sessionsList.style.display = 'block';
 
+    loadSessionCacheStats();
     const data = await fetchJSON('/api/sessions');
     if (data.error) {
         sessionsList.innerHTML = `<p class="empty-msg">${esc(data.error)}</p>`;
@@ -25,6 +25,7 @@ const TYPE_CLASS = {
     rate_limited:   'evt-error',
     debounce_add:   'evt-system',
     debounce_flush: 'evt-arrival',
+    debounce_window: 'evt-system',
     daemon_result:  'evt-classify',
     classification: 'evt-classify',
     dad_promotion:  'evt-classify',
@@ -57,6 +58,7 @@ const TYPE_LABEL = {
     rate_limited:   'RATE LIM',
     debounce_add:   'BUFFER',
     debounce_flush: 'FLUSH',
+    debounce_window: 'WINDOW',
     daemon_result:  'DAEMON',
     classification: 'CLASSIFY',
     dad_promotion:  'PROMOTE',
@@ -99,6 +101,10 @@ function renderBody(evt) {
         case 'debounce_flush':
             return `${evt.batch_size} message${evt.batch_size > 1 ? 's' : ''} flushed (${esc(evt.trigger)})`;
 
+        case 'debounce_window':
+            return `<b>${esc(evt.tier)}</b> — ${evt.window}s window, flush at ${evt.batch_limit}` +
+                `<div class="evt-detail">${evt.rate} msgs/min</div>`;
+
         case 'daemon_result': {
             const cls = evt.classification || '?';
             const clsUpper = cls.toUpperCase();
@@ -24,6 +24,7 @@ from __future__ import annotations
 import json
 import time
 from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from typing import Any, Iterator, TYPE_CHECKING
 
@@ -62,7 +63,10 @@ class ModuleMetrics:
         self._module = module_name
         self._store = store
         self._tracer = tracer
-        self._trace_id: str | None = None
+        # Per asyncio task: concurrent batches each carry their own trace ID
+        self._trace_id_var: ContextVar[str | None] = ContextVar(
+            f"module_trace_id_{module_name}_{id(self)}", default=None
+        )
 
     @property
     def module_name(self) -> str:
@@ -73,9 +77,15 @@ class ModuleMetrics:
         """Set the trace ID for the current message batch.
 
         Called at debounce_flush — links all module events for one
-        processing cycle across the full pipeline.
+        processing cycle across the full pipeline. Scoped to the running
+        asyncio task, so parallel batches don't overwrite each other.
         """
-        self._trace_id = trace_id
+        self._trace_id_var.set(trace_id)
+
+    @property
+    def _trace_id(self) -> str | None:
+        """Trace ID for the running task's batch (None outside a batch)."""
+        return self._trace_id_var.get()
 
     def record(
         self,
@@ -37,6 +37,8 @@ class LLMCallRecord:
     error: str | None = None
     experiment_id: str | None = None
     variant_id: str | None = None
+    ttft_ms: int | None = None  # Time to first token (streamed calls only)
+    cached_tokens: int = 0  # Prompt tokens served from the provider's prompt cache
 
     def to_row(self) -> tuple:
         """Convert to a SQLite row tuple (excludes auto-increment id)."""
@@ -56,12 +58,14 @@ class LLMCallRecord:
             self.error,
             self.experiment_id,
             self.variant_id,
+            self.ttft_ms,
+            self.cached_tokens,
         )
 
 
 # ── Schema ──────────────────────────────────────────────────
 
-SCHEMA_VERSION = 2
+SCHEMA_VERSION = 4
 
 SCHEMA_SQL = """
 -- Every LLM call
@@ -81,7 +85,9 @@ CREATE TABLE IF NOT EXISTS llm_calls (
     finish_reason   TEXT DEFAULT 'stop',
     error           TEXT,
     experiment_id   TEXT,
-    variant_id      TEXT
+    variant_id      TEXT,
+    ttft_ms         INTEGER,
+    cached_tokens   INTEGER NOT NULL DEFAULT 0
 );
 
 -- Aggregated daily summaries (built lazily)
@@ -194,6 +200,13 @@ class MetricsStore:
         """Create tables and run migrations."""
         with self._cursor() as cur:
             cur.executescript(SCHEMA_SQL)
+            # v3: time-to-first-token for streamed calls
+            columns = {row["name"] for row in cur.execute("PRAGMA table_info(llm_calls)")}
+            if "ttft_ms" not in columns:
+                cur.execute("ALTER TABLE llm_calls ADD COLUMN ttft_ms INTEGER")
+            # v4: prompt-cache hits
+            if "cached_tokens" not in columns:
+                cur.execute("ALTER TABLE llm_calls ADD COLUMN cached_tokens INTEGER NOT NULL DEFAULT 0")
             # Set schema version
             cur.execute(
                 "INSERT OR REPLACE INTO schema_meta (key, value) VALUES (?, ?)",
@@ -216,8 +229,9 @@ class MetricsStore:
                 """INSERT INTO llm_calls
                    (timestamp, call_type, model, prompt_tokens, completion_tokens,
                     total_tokens, cost_usd, latency_ms, caller_id, session_key,
-                    tool_calls, finish_reason, error, experiment_id, variant_id)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    tool_calls, finish_reason, error, experiment_id, variant_id, ttft_ms,
+                    cached_tokens)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
                 record.to_row(),
             )
             return cur.lastrowid or 0
@@ -231,8 +245,9 @@ class MetricsStore:
                 """INSERT INTO llm_calls
                    (timestamp, call_type, model, prompt_tokens, completion_tokens,
                     total_tokens, cost_usd, latency_ms, caller_id, session_key,
-                    tool_calls, finish_reason, error, experiment_id, variant_id)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    tool_calls, finish_reason, error, experiment_id, variant_id, ttft_ms,
+                    cached_tokens)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
                 [r.to_row() for r in records],
             )
             return len(records)
@@ -254,7 +269,9 @@ class MetricsStore:
                      COALESCE(SUM(cost_usd), 0.0) as total_cost_usd,
                      COALESCE(AVG(latency_ms), 0.0) as avg_latency_ms,
                      COALESCE(SUM(CASE WHEN error IS NOT NULL THEN 1 ELSE 0 END), 0) as error_count,
-                     COUNT(DISTINCT caller_id) as unique_callers
+                     COUNT(DISTINCT caller_id) as unique_callers,
+                     COALESCE(SUM(prompt_tokens), 0) as prompt_tokens,
+                     COALESCE(SUM(cached_tokens), 0) as cached_tokens
                    FROM llm_calls
                    WHERE timestamp LIKE ?""",
                 (f"{date}%",),
@@ -270,6 +287,8 @@ class MetricsStore:
                 "avg_latency_ms": 0.0,
                 "error_count": 0,
                 "unique_callers": 0,
+                "cached_tokens": 0,
+                "cache_hit_rate": 0.0,
                 "model_breakdown": {},
                 "call_type_breakdown": {},
                 "caller_breakdown": {},
@@ -283,6 +302,8 @@ class MetricsStore:
             "avg_latency_ms": round(row["avg_latency_ms"], 1),
             "error_count": row["error_count"],
             "unique_callers": row["unique_callers"],
+            "cached_tokens": row["cached_tokens"],
+            "cache_hit_rate": round(row["cached_tokens"] / row["prompt_tokens"], 4) if row["prompt_tokens"] else 0.0,
             "model_breakdown": self._get_breakdown(date, "model"),
             "call_type_breakdown": self._get_breakdown(date, "call_type"),
             "caller_breakdown": self._get_breakdown(date, "caller_id"),
@@ -515,6 +536,75 @@ class MetricsStore:
             "max": latencies[-1],
         }
 
+    def get_ttft_percentiles(self, hours: int = 24) -> dict[str, Any]:
+        """Time-to-first-token percentiles for streamed calls in the last N hours."""
+        since = (datetime.now() - timedelta(hours=hours)).isoformat()
+        with self._cursor() as cur:
+            cur.execute(
+                """SELECT ttft_ms
+                   FROM llm_calls
+                   WHERE timestamp >= ? AND error IS NULL AND ttft_ms IS NOT NULL
+                   ORDER BY ttft_ms""",
+                (since,),
+            )
+            values = [row["ttft_ms"] for row in cur.fetchall()]
+
+        if not values:
+            return {"hours": hours, "count": 0, "p50": 0, "p90": 0, "p95": 0, "max": 0}
+
+        n = len(values)
+        return {
+            "hours": hours,
+            "count": n,
+            "p50": values[int(n * 0.50)],
+            "p90": values[int(n * 0.90)] if n >= 10 else values[-1],
+            "p95": values[int(n * 0.95)] if n >= 20 else values[-1],
+            "max": values[-1],
+        }
+
+    def get_prompt_cache_stats(self, hours: int = 24) -> dict[str, Any]:
+        """Share of prompt tokens served from provider prompt caches, per model."""
+        since = (datetime.now() - timedelta(hours=hours)).isoformat()
+        with self._cursor() as cur:
+            cur.execute(
+                """SELECT model,
+                     COUNT(*) as calls,
+                     SUM(CASE WHEN cached_tokens > 0 THEN 1 ELSE 0 END) as hits,
+                     COALESCE(SUM(prompt_tokens), 0) as prompt_tokens,
+                     COALESCE(SUM(cached_tokens), 0) as cached_tokens
+                   FROM llm_calls
+                   WHERE timestamp >= ? AND error IS NULL
+                   GROUP BY model
+                   ORDER BY prompt_tokens DESC""",
+                (since,),
+            )
+            rows = cur.fetchall()
+
+        def _rate(cached: int, prompt: int) -> float:
+            return round(cached / prompt, 4) if prompt else 0.0
+
+        by_model = {
+            row["model"]: {
+                "calls": row["calls"],
+                "hits": row["hits"],
+                "prompt_tokens": row["prompt_tokens"],
+                "cached_tokens": row["cached_tokens"],
+                "hit_rate": _rate(row["cached_tokens"], row["prompt_tokens"]),
+            }
+            for row in rows
+        }
+        prompt_tokens = sum(m["prompt_tokens"] for m in by_model.values())
+        cached_tokens = sum(m["cached_tokens"] for m in by_model.values())
+        return {
+            "hours": hours,
+            "calls": sum(m["calls"] for m in by_model.values()),
+            "hits": sum(m["hits"] for m in by_model.values()),
+            "prompt_tokens": prompt_tokens,
+            "cached_tokens": cached_tokens,
+            "hit_rate": _rate(cached_tokens, prompt_tokens),
+            "by_model": by_model,
+        }
+
     def get_recent_calls(self, limit: int = 50) -> list[dict[str, Any]]:
         """Get the most recent LLM calls."""
         with self._cursor() as cur:
@@ -996,6 +1086,63 @@ class MetricsStore:
             "avg_background_threads": avg_background,
         }
 
+    def get_context_build_stats(self, hours: int = 24) -> dict[str, Any]:
+        """Per-component prompt size and build time from context profiles.
+
+        Aggregates the context module's prompt_built events. Components
+        are sorted by total tokens, largest first.
+        """
+        since = (datetime.now() - timedelta(hours=hours)).isoformat()
+        with self._cursor() as cur:
+            cur.execute(
+                """SELECT data, duration_ms FROM module_events
+                   WHERE module = 'context' AND event_type = 'prompt_built'
+                     AND timestamp >= ?""",
+                (since,),
+            )
+            rows = cur.fetchall()
+
+        totals: dict[str, dict[str, float]] = {}
+        prompt_tokens = 0
+        build_ms = 0
+        for row in rows:
+            data = json.loads(row["data"]) if row["data"] else {}
+            prompt_tokens += data.get("total_tokens", 0)
+            build_ms += row["duration_ms"] or 0
+            for name, comp in data.get("components", {}).items():
+                entry = totals.setdefault(name, {"builds": 0, "tokens": 0, "ms": 0.0, "max_ms": 0.0})
+                entry["builds"] += 1
+                entry["tokens"] += comp.get("tokens", 0)
+                entry["ms"] += comp.get("ms", 0.0)
+                entry["max_ms"] = max(entry["max_ms"], comp.get("ms", 0.0))
+
+        components = [
+            {
+                "component": name,
+                "builds": t["builds"],
+                "total_tokens": int(t["tokens"]),
+                "avg_tokens": round(t["tokens"] / t["builds"], 1),
+                "token_share": round(t["tokens"] / prompt_tokens, 3) if prompt_tokens else 0.0,
+                "avg_ms": round(t["ms"] / t["builds"], 2),
+                "max_ms": round(t["max_ms"], 2),
+            }
+            for name, t in totals.items()
+        ]
+        components.sort(key=lambda c: c["total_tokens"], reverse=True)
+
+        builds = len(rows)
+        return {
+            "hours": hours,
+            "builds": builds,
+            "avg_prompt_tokens": round(prompt_tokens / builds, 1) if builds else 0.0,
+            "avg_build_ms": round(build_ms / builds, 1) if builds else 0.0,
+            "components": components,
+        }
+
+    def get_top_context_consumers(self, hours: int = 24, limit: int = 5) -> list[dict[str, Any]]:
+        """The prompt components that used the most tokens over the window."""
+        return self.get_context_build_stats(hours)["components"][:limit]
+
     def vacuum(self) -> None:
         """Reclaim space. Run periodically (e.g., weekly)."""
         conn = self._get_conn()
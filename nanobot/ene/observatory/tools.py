@@ -21,6 +21,8 @@ if TYPE_CHECKING:
 class ViewMetricsTool(Tool):
     """View observatory metrics — cost, calls, latency, errors."""
 
+    read_only = True
+
     def __init__(self, store: "MetricsStore", reporter: "ReportGenerator"):
         self._store = store
         self._reporter = reporter
@@ -70,6 +72,8 @@ class ViewMetricsTool(Tool):
 class ViewExperimentsTool(Tool):
     """View A/B experiment status and results."""
 
+    read_only = True
+
     def __init__(self, store: "MetricsStore"):
         self._store = store
 
@@ -124,6 +128,8 @@ class ViewExperimentsTool(Tool):
 class ViewModuleTool(Tool):
     """View module-level metrics and recent events."""
 
+    read_only = True
+
     def __init__(self, store: "MetricsStore"):
         self._store = store
 
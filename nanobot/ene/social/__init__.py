@@ -18,7 +18,7 @@ from typing import Any, TYPE_CHECKING
 
 from loguru import logger
 
-from nanobot.ene import EneModule, EneContext
+from nanobot.ene import ContextFragment, EneModule, EneContext, SenderContext
 
 if TYPE_CHECKING:
     from nanobot.agent.tools.base import Tool
@@ -32,20 +32,19 @@ class SocialModule(EneModule):
         1. initialize() — creates social dir, loads registry, ensures Dad exists
         2. get_tools() — returns update_person_note, view_person, list_people
         3. get_context_block() — returns social awareness guidance
-        4. set_sender_context() — receives current sender before context building
-        5. get_context_block_for_message(msg) — returns person card for speaker
-        6. on_message(msg, responded) — records interaction, updates signals
-        7. on_daily() — decay inactive users, snapshot trust history
+        4. get_context_block_for_message(msg, sender) — returns person card for speaker
+        5. on_message(msg, responded) — records interaction, updates signals
+        6. on_daily() — decay inactive users, snapshot trust history
     """
 
+    context_priority = 70  # Speaker card / scene brief
+    context_blocking = True  # Person profiles are loaded from disk
+
     def __init__(self) -> None:
         self._registry: Any = None       # PersonRegistry
         self._graph: Any = None           # SocialGraph
         self._calculator: Any = None      # TrustCalculator
         self._ctx: EneContext | None = None
-        self._current_platform_id: str = ""
-        self._current_metadata: dict = {}
-        self._current_person: Any = None  # Cached PersonProfile for context
 
     @property
     def name(self) -> str:
@@ -107,20 +106,9 @@ class SocialModule(EneModule):
             "- Dad is always inner_circle. This is hardcoded and immutable."
         )
 
-    def set_sender_context(self, platform_id: str, metadata: dict) -> None:
-        """Receive current sender info before context building.
-
-        Called by ModuleRegistry before get_context_block_for_message().
-        Looks up the person and caches them for the person card.
-        """
-        self._current_platform_id = platform_id
-        self._current_metadata = metadata
-
-        if self._registry is None:
-            self._current_person = None
-            return
-
-        self._current_person = self._registry.get_by_platform_id(platform_id)
+    def context_version(self) -> Any:
+        """The guidance block is fixed once the registry is up."""
+        return self._registry is not None
 
     def _render_person_card(self, person: Any, full: bool = True) -> str:
         """Render a person's info card.
@@ -248,21 +236,23 @@ class SocialModule(EneModule):
 
         return "\n".join(lines)
 
-    def get_context_block_for_message(self, message: str) -> str | None:
+    def get_context_block_for_message(
+        self, message: str, sender: SenderContext | None = None
+    ) -> str | None:
         """Return person card for the current speaker.
 
         Injected per-message into the system prompt so Ene knows
         who she's talking to and how to treat them.
         """
-        if self._registry is None:
+        if self._registry is None or sender is None or not sender.platform_id:
             return None
 
-        person = self._current_person
+        person = self._registry.get_by_platform_id(sender.platform_id)
 
         if person is None:
             return (
                 "## Current Speaker\n"
-                + self._render_unknown_card(self._current_platform_id, full=True)
+                + self._render_unknown_card(sender.platform_id, full=True)
             )
 
         lines = [
@@ -272,6 +262,13 @@ class SocialModule(EneModule):
 
         return "\n".join(lines)
 
+    def get_context_fragments_for_message(
+        self, message: str, sender: SenderContext | None = None
+    ) -> list[ContextFragment]:
+        """The speaker card, trimmed rather than dropped when space is tight."""
+        block = self.get_context_block_for_message(message, sender)
+        return [ContextFragment(block, priority=self.context_priority, truncatable=True)] if block else []
+
     async def on_message(self, msg: "InboundMessage", responded: bool) -> None:
         """Record interaction and update trust signals.
 
@@ -95,6 +95,8 @@ class ViewPersonTool(Tool):
     trust level, and connections.
     """
 
+    read_only = True
+
     def __init__(
         self, registry: "PersonRegistry", graph: "SocialGraph"
     ) -> None:
@@ -181,6 +183,8 @@ class ListPeopleTool(Tool):
     Provides a summary of everyone Ene knows.
     """
 
+    read_only = True
+
     def __init__(self, registry: "PersonRegistry") -> None:
         self._registry = registry
 
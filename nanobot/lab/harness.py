@@ -30,7 +30,7 @@ from typing import Any
 from loguru import logger
 
 from nanobot.bus.events import OutboundMessage
-from nanobot.bus.queue import MessageBus
+from nanobot.bus.queue import OUTBOUND_DRAIN_TIMEOUT, MessageBus
 from nanobot.channels.mock import MockChannel
 from nanobot.lab.state import (
     LabPaths,
@@ -199,7 +199,7 @@ class LabHarness:
 
         # Stop agent loop
         if self._agent_loop:
-            self._agent_loop._running = False
+            self._agent_loop.stop()
         if self._agent_task:
             self._agent_task.cancel()
             try:
@@ -207,14 +207,13 @@ class LabHarness:
             except (asyncio.CancelledError, Exception):
                 pass
 
-        # Stop bus
+        # Stop bus — the dispatcher flushes what's queued and returns
         if self._bus:
-            self._bus.stop()
+            self._bus.close()
         if self._dispatch_task:
-            self._dispatch_task.cancel()
             try:
-                await self._dispatch_task
-            except (asyncio.CancelledError, Exception):
+                await asyncio.wait_for(self._dispatch_task, timeout=OUTBOUND_DRAIN_TIMEOUT + 1)
+            except (asyncio.TimeoutError, asyncio.CancelledError, Exception):
                 pass
 
         # Stop mock channel
@@ -30,12 +30,14 @@ from __future__ import annotations
 
 import json
 import shutil
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 from typing import Any, NamedTuple
 
 from loguru import logger
 
+from nanobot.session.store import SQLITE_FILENAME
 from nanobot.utils.helpers import get_data_path
 
 
@@ -132,7 +134,7 @@ def create_snapshot(
     # Copy sessions (may not exist for fresh instances)
     dst_sessions = snap_dir / "sessions"
     if src_sessions.exists():
-        shutil.copytree(src_sessions, dst_sessions, dirs_exist_ok=True)
+        _copy_sessions(src_sessions, dst_sessions)
     else:
         dst_sessions.mkdir(parents=True, exist_ok=True)
 
@@ -227,7 +229,7 @@ def create_run(
         if snap_workspace.exists():
             shutil.copytree(snap_workspace, paths.workspace, dirs_exist_ok=True)
         if snap_sessions.exists():
-            shutil.copytree(snap_sessions, paths.sessions, dirs_exist_ok=True)
+            _copy_sessions(snap_sessions, paths.sessions)
 
         logger.info(f"Run '{run_name}' created from snapshot '{snapshot_name}'")
     else:
@@ -367,6 +369,28 @@ def get_cache_dir() -> Path:
 # ── Manifest builder ──────────────────────────────────────
 
 
+def _copy_sessions(src: Path, dst: Path) -> None:
+    """Copy a sessions directory, including a consistent copy of a live session DB.
+
+    A SQLite session store may be mid-write (its WAL not yet checkpointed),
+    so the database goes through SQLite's backup API — one file out, no
+    -wal/-shm companions — and everything else is copied as-is.
+    """
+    db = src / SQLITE_FILENAME
+    shutil.copytree(
+        src, dst, dirs_exist_ok=True,
+        ignore=shutil.ignore_patterns(f"{SQLITE_FILENAME}*") if db.exists() else None,
+    )
+    if db.exists():
+        source = sqlite3.connect(str(db))
+        target = sqlite3.connect(str(dst / SQLITE_FILENAME))
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+            source.close()
+
+
 def _build_manifest(
     name: str,
     source: str,
@@ -408,6 +432,7 @@ def _build_manifest(
         contents["session_files"] = len(list(sessions.glob("*.jsonl")))
     else:
         contents["session_files"] = 0
+    contents["session_db"] = (sessions / SQLITE_FILENAME).exists()
 
     contents["chroma_db"] = (workspace / "chroma_db").exists()
     contents["observatory_db"] = (workspace / "observatory.db").exists()
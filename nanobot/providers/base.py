@@ -1,8 +1,9 @@
 """Base LLM provider interface."""
 
+import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 
 @dataclass
@@ -21,6 +22,7 @@ class LLMResponse:
     finish_reason: str = "stop"
     usage: dict[str, int] = field(default_factory=dict)
     reasoning_content: str | None = None  # Kimi, DeepSeek-R1 etc.
+    ttft_ms: int | None = None  # Time to first token (streamed calls only)
     
     @property
     def has_tool_calls(self) -> bool:
@@ -28,6 +30,18 @@ class LLMResponse:
         return len(self.tool_calls) > 0
 
 
+@dataclass
+class ToolCallBuffer:
+    """A tool call being assembled from streamed deltas."""
+    id: str = ""
+    name: str = ""
+    arguments: str = ""  # Raw JSON text received so far (may be incomplete)
+
+
+# Receives cumulative snapshots: (content so far, tool calls so far)
+StreamCallback = Callable[[str, list[ToolCallBuffer]], Awaitable[None]]
+
+
 class LLMProvider(ABC):
     """
     Abstract base class for LLM providers.
@@ -64,6 +78,41 @@ class LLMProvider(ABC):
         """
         pass
     
+    async def chat_stream(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        on_delta: StreamCallback | None = None,
+    ) -> LLMResponse:
+        """
+        Send a chat completion request, reporting partial output as it arrives.
+
+        on_delta is called with cumulative snapshots, not increments, so a
+        consumer can always render the latest state (and a provider that
+        retries mid-stream simply starts the snapshot over).
+
+        The default implementation does not stream: it calls chat() and
+        reports the complete response once. Providers that support
+        streaming override this.
+
+        Returns:
+            The fully assembled LLMResponse, same as chat().
+        """
+        response = await self.chat(
+            messages=messages, tools=tools, model=model,
+            max_tokens=max_tokens, temperature=temperature,
+        )
+        if on_delta and response.finish_reason != "error":
+            buffers = [
+                ToolCallBuffer(id=tc.id, name=tc.name, arguments=json.dumps(tc.arguments))
+                for tc in response.tool_calls
+            ]
+            await on_delta(response.content or "", buffers)
+        return response
+
     @abstractmethod
     def get_default_model(self) -> str:
         """Get the default model for this provider."""
@@ -11,12 +11,18 @@ import json_repair
 import logging
 import os
 import time as _time
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 import litellm
 from litellm import acompletion
 
-from nanobot.providers.base import LLMProvider, LLMResponse, ToolCallRequest
+from nanobot.providers.base import (
+    LLMProvider,
+    LLMResponse,
+    StreamCallback,
+    ToolCallBuffer,
+    ToolCallRequest,
+)
 from nanobot.providers.registry import find_by_model, find_gateway
 
 logger = logging.getLogger(__name__)
@@ -35,6 +41,61 @@ LLM_CALL_TIMEOUT: float = 45.0
 # Recovery: how long to wait before probing primary model again after failure
 RECOVERY_COOLDOWN: float = 300.0  # 5 minutes
 
+# Models whose prompt caching needs explicit cache_control breakpoints.
+# OpenAI, DeepSeek and Gemini cache matching prefixes automatically.
+CACHE_CONTROL_MODELS: tuple[str, ...] = ("claude",)
+
+
+def apply_cache_control(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Mark prompt-cache breakpoints on a copy of the message list.
+
+    Two breakpoints: the leading system prompt (stable across calls and
+    channels), and the last history message before the current user
+    message (which carries the per-call context), so the conversation
+    so far is cached as well.
+    """
+    marked = list(messages)
+    targets = set()
+    if marked and marked[0].get("role") == "system":
+        targets.add(0)
+    # Walk back past the current user message and trailing system notes
+    i = len(marked) - 1
+    if i >= 0 and marked[i].get("role") == "user":
+        i -= 1
+    while i > 0 and marked[i].get("role") == "system":
+        i -= 1
+    if i > 0 and marked[i].get("role") in ("user", "assistant"):
+        targets.add(i)
+    for i in targets:
+        content = marked[i].get("content")
+        if isinstance(content, str) and content:
+            blocks = [{"type": "text", "text": content}]
+        elif isinstance(content, list) and content:
+            blocks = [dict(b) for b in content]
+        else:
+            continue
+        blocks[-1]["cache_control"] = {"type": "ephemeral"}
+        marked[i] = {**marked[i], "content": blocks}
+    return marked
+
+
+def _usage_dict(usage: Any) -> dict[str, int]:
+    """Token usage from a litellm usage object, including prompt-cache hits."""
+    result = {
+        "prompt_tokens": usage.prompt_tokens,
+        "completion_tokens": usage.completion_tokens,
+        "total_tokens": usage.total_tokens,
+    }
+    # litellm normalizes cache hits into prompt_tokens_details; older
+    # responses only carry the provider's own field
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", None) if details else None
+    if cached is None:
+        cached = getattr(usage, "cache_read_input_tokens", None) or getattr(usage, "prompt_cache_hit_tokens", None)
+    if isinstance(cached, int):
+        result["cached_tokens"] = cached
+    return result
+
 
 class LiteLLMProvider(LLMProvider):
     """
@@ -58,11 +119,13 @@ class LiteLLMProvider(LLMProvider):
         provider_name: str | None = None,
         fallback_models: list[str] | None = None,
         timeout: float = LLM_CALL_TIMEOUT,
+        prompt_caching: bool = True,
     ):
         super().__init__(api_key, api_base)
         self.default_model = default_model
         self.extra_headers = extra_headers or {}
         self._timeout = timeout
+        self.prompt_caching = prompt_caching
 
         # Model fallback rotation (adapted from daemon/processor.py)
         self._fallback_models = fallback_models or []
@@ -189,10 +252,7 @@ class LiteLLMProvider(LLMProvider):
 
     async def _attempt_recovery(
         self,
-        messages: list[dict[str, Any]],
-        tools: list[dict[str, Any]] | None,
-        max_tokens: int,
-        temperature: float,
+        attempt: Callable[[str], Awaitable[LLMResponse]],
     ) -> LLMResponse | None:
         """Probe the primary model to see if it has recovered.
 
@@ -211,9 +271,7 @@ class LiteLLMProvider(LLMProvider):
         )
 
         try:
-            response = await self._attempt_chat(
-                primary_model, messages, tools, max_tokens, temperature,
-            )
+            response = await attempt(primary_model)
             # Success — snap back to primary
             self._model_index = 0
             self._model_failures[primary_model] = 0
@@ -242,8 +300,29 @@ class LiteLLMProvider(LLMProvider):
         temperature: float,
     ) -> LLMResponse:
         """Make a single LLM call with timeout. Raises on failure."""
+        kwargs = self._build_kwargs(model, messages, tools, max_tokens, temperature)
+
+        # Timeout prevents indefinite blocking on provider issues
+        response = await asyncio.wait_for(
+            acompletion(**kwargs),
+            timeout=self._timeout,
+        )
+        return self._parse_response(response)
+
+    def _build_kwargs(
+        self,
+        model: str,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+        max_tokens: int,
+        temperature: float,
+    ) -> dict[str, Any]:
+        """Build acompletion() kwargs for one call."""
         resolved = self._resolve_model(model)
 
+        if self.prompt_caching and any(m in resolved.lower() for m in CACHE_CONTROL_MODELS):
+            messages = apply_cache_control(messages)
+
         kwargs: dict[str, Any] = {
             "model": resolved,
             "messages": messages,
@@ -262,13 +341,105 @@ class LiteLLMProvider(LLMProvider):
         if tools:
             kwargs["tools"] = tools
             kwargs["tool_choice"] = "auto"
+        return kwargs
 
-        # Timeout prevents indefinite blocking on provider issues
-        response = await asyncio.wait_for(
-            acompletion(**kwargs),
-            timeout=self._timeout,
+    async def _attempt_chat_stream(
+        self,
+        model: str,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+        max_tokens: int,
+        temperature: float,
+        on_delta: StreamCallback | None,
+    ) -> LLMResponse:
+        """Make a single streamed LLM call. Raises on failure.
+
+        The timeout applies to the gap between chunks rather than the whole
+        call: a slow-but-alive stream keeps going, a stalled one is cut off.
+        Tool calls arrive as fragments keyed by index and are assembled
+        here; arguments are parsed once the stream ends. The stream is
+        closed however the call ends.
+        """
+        kwargs = self._build_kwargs(model, messages, tools, max_tokens, temperature)
+        kwargs["stream"] = True
+        kwargs["stream_options"] = {"include_usage": True}
+
+        start = _time.perf_counter()
+        stream = await asyncio.wait_for(acompletion(**kwargs), timeout=self._timeout)
+        iterator = stream.__aiter__()
+
+        content = ""
+        reasoning = ""
+        buffers: dict[int, ToolCallBuffer] = {}
+        finish_reason = "stop"
+        usage: dict[str, int] = {}
+        ttft_ms: int | None = None
+
+        try:
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(iterator.__anext__(), timeout=self._timeout)
+                except StopAsyncIteration:
+                    break
+
+                chunk_usage = getattr(chunk, "usage", None)
+                if chunk_usage:
+                    usage = _usage_dict(chunk_usage)
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+                delta = choice.delta
+                if delta is None:
+                    continue
+
+                changed = False
+                if getattr(delta, "content", None):
+                    content += delta.content
+                    changed = True
+                if getattr(delta, "reasoning_content", None):
+                    reasoning += delta.reasoning_content
+                for tc in getattr(delta, "tool_calls", None) or []:
+                    index = getattr(tc, "index", None)
+                    if index is None:
+                        index = len(buffers)
+                    buf = buffers.setdefault(index, ToolCallBuffer())
+                    if tc.id:
+                        buf.id = tc.id
+                    if tc.function:
+                        if tc.function.name:
+                            buf.name += tc.function.name
+                        if tc.function.arguments:
+                            buf.arguments += tc.function.arguments
+                    changed = True
+
+                if changed:
+                    if ttft_ms is None:
+                        ttft_ms = int((_time.perf_counter() - start) * 1000)
+                    if on_delta:
+                        await on_delta(content, [buffers[i] for i in sorted(buffers)])
+        finally:
+            # Release the connection on timeout, cancellation or a failing on_delta
+            if hasattr(stream, "aclose"):
+                await stream.aclose()
+
+        tool_calls = [
+            ToolCallRequest(
+                id=buf.id,
+                name=buf.name,
+                arguments=json_repair.loads(buf.arguments) if buf.arguments else {},
+            )
+            for _, buf in sorted(buffers.items())
+        ]
+        return LLMResponse(
+            content=content or None,
+            tool_calls=tool_calls,
+            finish_reason=finish_reason,
+            usage=usage,
+            reasoning_content=reasoning or None,
+            ttft_ms=ttft_ms,
         )
-        return self._parse_response(response)
 
     async def chat(
         self,
@@ -294,15 +465,46 @@ class LiteLLMProvider(LLMProvider):
         Returns:
             LLMResponse with content and/or tool calls.
         """
-        requested = model or self.default_model
+        return await self._call_with_fallback(
+            model or self.default_model,
+            lambda m: self._attempt_chat(m, messages, tools, max_tokens, temperature),
+        )
+
+    async def chat_stream(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        on_delta: StreamCallback | None = None,
+    ) -> LLMResponse:
+        """
+        Streamed chat completion with the same fallback rotation as chat().
+
+        on_delta receives cumulative (content, tool_calls) snapshots. If a
+        stream fails partway and the fallback model is tried, the snapshots
+        start over from empty.
+        """
+        return await self._call_with_fallback(
+            model or self.default_model,
+            lambda m: self._attempt_chat_stream(
+                m, messages, tools, max_tokens, temperature, on_delta,
+            ),
+        )
+
+    async def _call_with_fallback(
+        self,
+        requested: str,
+        attempt: Callable[[str], Awaitable[LLMResponse]],
+    ) -> LLMResponse:
+        """Run attempt(model) with recovery probing and one fallback retry."""
         current_model = self._get_current_model(requested)
 
         # Recovery probe: if on a fallback model and cooldown elapsed,
         # try the primary model first. If it works, snap back.
         if self._should_try_recovery():
-            recovery_response = await self._attempt_recovery(
-                messages, tools, max_tokens, temperature,
-            )
+            recovery_response = await self._attempt_recovery(attempt)
             if recovery_response is not None:
                 return recovery_response
             # Recovery failed — fall through to current fallback
@@ -310,9 +512,7 @@ class LiteLLMProvider(LLMProvider):
 
         # First attempt with current model
         try:
-            result = await self._attempt_chat(
-                current_model, messages, tools, max_tokens, temperature,
-            )
+            result = await attempt(current_model)
             # Clear failure counter on success (matches daemon pattern)
             self._model_failures[current_model] = 0
             return result
@@ -335,9 +535,7 @@ class LiteLLMProvider(LLMProvider):
         fallback_model = self._get_current_model(requested)
         try:
             logger.info(f"LLM fallback retry with {fallback_model}")
-            result = await self._attempt_chat(
-                fallback_model, messages, tools, max_tokens, temperature,
-            )
+            result = await attempt(fallback_model)
             self._model_failures[fallback_model] = 0
             return result
 
@@ -384,11 +582,7 @@ class LiteLLMProvider(LLMProvider):
 
         usage = {}
         if hasattr(response, "usage") and response.usage:
-            usage = {
-                "prompt_tokens": response.usage.prompt_tokens,
-                "completion_tokens": response.usage.completion_tokens,
-                "total_tokens": response.usage.total_tokens,
-            }
+            usage = _usage_dict(response.usage)
 
         reasoning_content = getattr(message, "reasoning_content", None)
 
@@ -0,0 +1,195 @@
+"""Compact index of the sessions directory.
+
+Listing sessions used to open every session file to read its metadata
+line — thousands of files for a long-running bot. SessionIndex keeps one
+summary record per session (timestamps, message count, token estimate,
+responded count) in a single append-only JSONL file next to the sessions:
+
+    {"key": "discord:123", "file": "discord_123.jsonl", "updated_at": ..., ...}
+
+SessionManager appends a record on every save; the latest record for a
+key wins. The file is compacted to one line per session once stale
+records dominate. Other processes writing the same directory (sharded
+gateway workers) append to the same file, and readers pick up their
+records by reading only what was appended since the last look. Appends
+and compactions hold an exclusive lock on a sidecar file, so a
+compaction never drops a record another process is appending.
+"""
+
+import json
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from loguru import logger
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+INDEX_FILENAME = "sessions.index"
+
+# Compact once the file holds this many times more lines than sessions
+COMPACT_FACTOR = 4
+# ...but never bother below this many lines
+COMPACT_MIN_LINES = 256
+
+
+class SessionIndex:
+    """Per-session summary records, persisted as append-only JSONL."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._pos = 0  # Bytes of the file already applied
+        self._file_id: str | None = None  # Header of that file (new on every compaction)
+        self._lines = 0  # Records in the file (stale ones included)
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def update(self, entry: dict[str, Any]) -> None:
+        """Record a session's latest summary (called after each session write)."""
+        with self._lock, self._file_lock():
+            self._refresh()  # Catch up on other writers first: nobody can append while we hold the lock
+            self._entries[entry["key"]] = entry
+            data = (json.dumps(entry) + "\n").encode("utf-8")
+            with open(self.path, "ab") as f:
+                f.write(data)
+            self._pos += len(data)
+            self._lines += 1
+            if self._lines > max(COMPACT_MIN_LINES, COMPACT_FACTOR * len(self._entries)):
+                self._compact()
+
+    def entries(self) -> list[dict[str, Any]]:
+        """Current summary of every indexed session (copies)."""
+        with self._lock:
+            self._refresh()
+            return [dict(e) for e in self._entries.values()]
+
+    def rebuild(self, entries: Iterable[dict[str, Any]]) -> None:
+        """Replace the index wholesale (first run, or a lost index file)."""
+        with self._lock, self._file_lock():
+            self._entries = {e["key"]: e for e in entries}
+            self._compact()
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Exclusive lock shared with other processes writing this index."""
+        with open(self.path.with_name(self.path.name + ".lock"), "a+b") as f:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            else:
+                f.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue  # LK_LOCK gives up after ~10s of retries
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _refresh(self) -> None:
+        """Apply records appended since the last read (by any process)."""
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            file_id = _file_id(f.readline())
+            size = os.fstat(f.fileno()).st_size
+            if file_id != self._file_id or size < self._pos:
+                # Compacted (replaced) by someone — start over. Compared by the
+                # header, not the inode: a freed inode is often reused at once.
+                self._entries.clear()
+                self._pos = 0
+                self._lines = 0
+                self._file_id = file_id
+            if size == self._pos:
+                return
+            f.seek(self._pos)
+            chunk = f.read()
+        # Only whole lines; a partial one is still being written
+        end = chunk.rfind(b"\n") + 1
+        for raw in chunk[:end].splitlines():
+            try:
+                entry = json.loads(raw)
+                self._entries[entry["key"]] = entry
+                self._lines += 1
+            except (json.JSONDecodeError, KeyError, TypeError):
+                continue
+        self._pos += end
+
+    def _compact(self) -> None:
+        # Caller holds _file_lock(); the pid keeps a crashed writer's leftover apart
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        file_id = uuid.uuid4().hex
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"_index": file_id}) + "\n")
+                for entry in self._entries.values():
+                    f.write(json.dumps(entry) + "\n")
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to compact session index: {e}")
+            return
+        self._file_id = file_id
+        self._pos = os.stat(self.path).st_size
+        self._lines = len(self._entries)
+
+
+def _file_id(first_line: bytes) -> str | None:
+    """Compaction ID from an index file's header line (None for a headerless file)."""
+    try:
+        return json.loads(first_line).get("_index")
+    except (json.JSONDecodeError, AttributeError):
+        return None
+
+
+def scan_sessions_dir(
+    sessions_dir: Path,
+    key_for: Callable[[Path], str],
+) -> list[dict[str, Any]]:
+    """Build index records by reading every session file (used to seed the index).
+
+    Message counts are exact; token and responded counts come from the
+    counters in the metadata line and may miss messages appended since the
+    file was last rewritten — the next save of that session corrects them.
+    """
+    entries = []
+    for path in sessions_dir.glob("*.jsonl"):
+        try:
+            meta: dict[str, Any] = {}
+            count = 0
+            with open(path, encoding="utf-8") as f:
+                for i, line in enumerate(f):
+                    if i == 0 and '"_type": "metadata"' in line:
+                        meta = json.loads(line)
+                    elif line.strip() and '"_type": "meta_delta"' not in line:
+                        count += 1
+            counters = meta.get("counters") or {}
+            entries.append({
+                "key": key_for(path),
+                "file": path.name,
+                "created_at": meta.get("created_at"),
+                "updated_at": meta.get("updated_at"),
+                "message_count": count,
+                "token_estimate": counters.get("tokens"),
+                "responded_count": (counters.get("roles") or {}).get("assistant"),
+            })
+        except Exception:
+            continue
+    return entries
@@ -0,0 +1,208 @@
+"""JSONL session store: one append-only file per session.
+
+Each file starts with a metadata line, followed by one line per message:
+
+    {"_type": "metadata", "created_at": ..., "metadata": {...}, "last_consolidated": 12, ...}
+    {"role": "user", "content": "...", "timestamp": "..."}
+    {"_type": "meta_delta", "last_consolidated": 20}
+
+A write appends only the new messages, plus a meta_delta record if metadata
+changed. The whole file is rewritten (temp file + atomic rename) only when
+the message list was not simply appended to, or once delta records pile up.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from nanobot.session.index import INDEX_FILENAME, SessionIndex, scan_sessions_dir
+from nanobot.session.store import SessionSnapshot, SessionStore, StoredSession
+from nanobot.utils.helpers import safe_filename
+
+# Rewrite (compact) a session file once it carries this many delta records
+COMPACT_AFTER_DELTAS = 64
+
+
+@dataclass
+class _DiskState:
+    """What a session's file already holds, so a write can append only the rest."""
+
+    message_count: int  # Messages written
+    tail: dict[str, Any] | None  # Last message written (identity-checked)
+    meta: dict[str, Any]  # Metadata fields as of the last write
+    deltas: int = 0  # meta_delta records since the last full rewrite
+    seq: int = 0  # Snapshot sequence written (older snapshots are skipped)
+
+
+class JsonlSessionStore(SessionStore):
+    """Sessions as JSONL files, listed through a SessionIndex."""
+
+    def __init__(self, sessions_dir: Path):
+        self.sessions_dir = sessions_dir
+        self._disk: dict[str, _DiskState] = {}
+        self._lock = threading.Lock()  # One writer at a time (loop or flush thread)
+        self._index = SessionIndex(sessions_dir / INDEX_FILENAME)
+        if not self._index.exists():
+            self._index.rebuild(scan_sessions_dir(sessions_dir, self.key_for_path))
+
+    def path_for(self, key: str) -> Path:
+        """File path for a session."""
+        safe_key = safe_filename(key.replace(":", "_"))
+        return self.sessions_dir / f"{safe_key}.jsonl"
+
+    @staticmethod
+    def key_for_path(path: Path) -> str:
+        """Best-effort key for a session file (only used to seed the index)."""
+        return path.stem.replace("_", ":")
+
+    def load(self, key: str) -> StoredSession | None:
+        path = self.path_for(key)
+        if not path.exists():
+            return None
+
+        try:
+            stored = StoredSession(messages=[], metadata={})
+            deltas = 0
+            damaged = False
+
+            with self._lock, open(path, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+
+                    try:
+                        data = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn append from a crash — skip it; the next write rewrites the file
+                        damaged = True
+                        continue
+
+                    record_type = data.get("_type")
+                    if record_type == "metadata":
+                        stored.metadata = data.get("metadata", {})
+                        stored.created_at = data.get("created_at")
+                        stored.last_consolidated = data.get("last_consolidated", 0)
+                        stored.counters = data.get("counters")
+                    elif record_type == "meta_delta":
+                        stored.metadata = data.get("metadata", stored.metadata)
+                        stored.last_consolidated = data.get("last_consolidated", stored.last_consolidated)
+                        deltas += 1
+                    else:
+                        stored.messages.append(data)
+
+                if damaged:
+                    logger.warning(f"Session {key}: skipped unreadable lines, file will be rewritten")
+                    stored.counters = None  # May cover lines that were skipped
+                else:
+                    # seq 0: what's on disk never outranks a snapshot still being written
+                    self._disk[key] = _DiskState(
+                        message_count=len(stored.messages),
+                        tail=stored.messages[-1] if stored.messages else None,
+                        # Copied: the session will edit its metadata dict in place
+                        meta=json.loads(json.dumps({
+                            "metadata": stored.metadata,
+                            "last_consolidated": stored.last_consolidated,
+                        })),
+                        deltas=deltas,
+                    )
+            return stored
+        except Exception as e:
+            logger.warning(f"Failed to load session {key}: {e}")
+            return None
+
+    def write(self, snap: SessionSnapshot) -> None:
+        """Persist a snapshot: append if possible, rewrite otherwise."""
+        path = self.path_for(snap.key)
+        with self._lock:
+            state = self._disk.get(snap.key)
+            if state is not None and snap.seq < state.seq:
+                return  # A newer snapshot already reached the disk
+            if (
+                snap.rewrite
+                or state is None
+                or not path.exists()
+                or not self._is_append_only(snap, state)
+                or state.deltas >= COMPACT_AFTER_DELTAS
+            ):
+                self._rewrite(snap, path)
+                deltas = 0
+            else:
+                deltas = self._append(snap, path, state)
+            self._disk[snap.key] = _DiskState(
+                message_count=len(snap.messages),
+                tail=snap.messages[-1] if snap.messages else None,
+                meta=snap.meta,
+                deltas=deltas,
+                seq=snap.seq,
+            )
+            try:
+                self._index.update(self._index_entry(snap, path))
+            except OSError as e:
+                logger.warning(f"Failed to index session {snap.key}: {e}")
+
+    def entries(self) -> list[dict[str, Any]]:
+        return [
+            {**e, "path": str(self.sessions_dir / e.get("file", ""))}
+            for e in self._index.entries()
+        ]
+
+    @staticmethod
+    def _index_entry(snap: SessionSnapshot, path: Path) -> dict[str, Any]:
+        return {
+            "key": snap.key,
+            "file": path.name,
+            "created_at": snap.created_at,
+            "updated_at": snap.updated_at,
+            "message_count": len(snap.messages),
+            "token_estimate": snap.counters["tokens"],
+            "responded_count": snap.counters["roles"].get("assistant", 0),
+        }
+
+    @staticmethod
+    def _is_append_only(snap: SessionSnapshot, state: _DiskState) -> bool:
+        """Whether everything on disk is still an unchanged prefix of the snapshot."""
+        count = state.message_count
+        if len(snap.messages) < count:
+            return False
+        if count == 0:
+            return True
+        return snap.messages[count - 1] is state.tail
+
+    @staticmethod
+    def _append(snap: SessionSnapshot, path: Path, state: _DiskState) -> int:
+        """Append new messages (and a metadata delta if needed). Returns the delta count."""
+        lines = [json.dumps(m) for m in snap.messages[state.message_count:]]
+        delta = {k: v for k, v in snap.meta.items() if state.meta.get(k) != v}
+        if delta:
+            lines.append(json.dumps({"_type": "meta_delta", **delta}))
+        if lines:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+        return state.deltas + (1 if delta else 0)
+
+    @staticmethod
+    def _rewrite(snap: SessionSnapshot, path: Path) -> None:
+        """Write the whole session to a temp file and atomically swap it in."""
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            metadata_line = {
+                "_type": "metadata",
+                "created_at": snap.created_at,
+                "updated_at": snap.updated_at,
+                "counters": snap.counters,
+                **snap.meta,
+            }
+            f.write(json.dumps(metadata_line) + "\n")
+            for msg in snap.messages:
+                f.write(json.dumps(msg) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
@@ -1,6 +1,9 @@
 """Session management for conversation history."""
 
+import asyncio
+import itertools
 import json
+from collections import OrderedDict
 from pathlib import Path
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -8,9 +11,44 @@ from typing import Any
 
 from loguru import logger
 
+from nanobot.session.jsonl_store import COMPACT_AFTER_DELTAS  # noqa: F401 — re-exported
+from nanobot.session.store import SessionSnapshot, SessionStore, StoreKind, open_store
+from nanobot.session.tokens import count_tokens, count_tokens_cached, message_tokens
 from nanobot.utils.helpers import ensure_dir, safe_filename
 
 
+@dataclass
+class SessionCounters:
+    """Running totals over a session's messages, kept in step by Session."""
+
+    count: int = 0  # Messages folded into the totals
+    chars: int = 0  # Total content characters
+    tokens: int = 0  # Total content tokens
+    roles: dict[str, int] = field(default_factory=dict)  # Messages per role
+
+    def fold(self, msg: dict[str, Any], model: str | None = None) -> None:
+        """Add one message to the totals."""
+        self.count += 1
+        self.chars += len(msg.get("content") or "")
+        self.tokens += message_tokens(msg, model)
+        role = msg.get("role", "")
+        self.roles[role] = self.roles.get(role, 0) + 1
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"count": self.count, "chars": self.chars, "tokens": self.tokens, "roles": dict(self.roles)}
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "SessionCounters | None":
+        """Rebuild persisted counters; None if the record is missing or malformed."""
+        try:
+            return cls(
+                int(data["count"]), int(data["chars"]), int(data["tokens"]),
+                {str(k): int(v) for k, v in data["roles"].items()},
+            )
+        except (TypeError, KeyError, ValueError, AttributeError):
+            return None
+
+
 @dataclass
 class Session:
     """
@@ -29,6 +67,10 @@ class Session:
     updated_at: datetime = field(default_factory=datetime.now)
     metadata: dict[str, Any] = field(default_factory=dict)
     last_consolidated: int = 0  # Number of messages already consolidated to files
+    token_model: str | None = field(default=None, repr=False, compare=False)  # Tokenizer to count with
+    # Running totals, so budget checks don't rescan every message
+    _counters: SessionCounters = field(default_factory=SessionCounters, init=False, repr=False, compare=False)
+    _counted_tail: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
     
     def add_message(self, role: str, content: str, **kwargs: Any) -> None:
         """Add a message to the session."""
@@ -38,21 +80,97 @@ class Session:
             "timestamp": datetime.now().isoformat(),
             **kwargs
         }
+        # Counted once here and stored with the message, so reloads don't re-tokenize
+        msg.setdefault("tokens", count_tokens(content, self.token_model))
+        self._sync_counters()
         self.messages.append(msg)
+        self._counters.fold(msg, self.token_model)
+        self._counted_tail = msg
         self.updated_at = datetime.now()
+
+    @property
+    def counters(self) -> SessionCounters:
+        """Up-to-date running totals over all messages."""
+        self._sync_counters()
+        return self._counters
+
+    def _sync_counters(self) -> None:
+        """Fold in messages appended directly to self.messages; recount if it was rewritten.
+
+        Callers (rotation, consolidation) sometimes edit self.messages
+        directly. Appends are picked up incrementally; anything else — the
+        last counted message gone or moved — triggers one full recount.
+        """
+        counted = self._counters.count
+        messages = self.messages
+        if len(messages) == counted and (not counted or messages[-1] is self._counted_tail):
+            return
+        if len(messages) < counted or (counted and messages[counted - 1] is not self._counted_tail):
+            self._counters = SessionCounters()
+            counted = 0
+        for msg in messages[counted:]:
+            self._counters.fold(msg, self.token_model)
+        self._counted_tail = messages[-1] if messages else None
+
+    def _seed_counters(self, counters: SessionCounters) -> None:
+        """Adopt persisted totals covering the first counters.count messages."""
+        if 0 < counters.count <= len(self.messages):
+            self._counters = counters
+            self._counted_tail = self.messages[counters.count - 1]
     
     def get_history(self, max_messages: int = 500) -> list[dict[str, Any]]:
         """Get recent messages in LLM format (role + content only)."""
         return [{"role": m["role"], "content": m["content"]} for m in self.messages[-max_messages:]]
 
+    def history_tokens(self, history: list[dict[str, Any]]) -> int:
+        """Token count of a get_history()/get_hybrid_history() result.
+
+        Verbatim entries share their content with the stored messages, so
+        they are counted from the cached per-message counts; only a leading
+        summary entry is tokenized.
+        """
+        self._sync_counters()  # Every stored message carries its "tokens"
+        n = 0
+        while (
+            n < len(history) and n < len(self.messages)
+            and history[-1 - n]["content"] is self.messages[-1 - n]["content"]
+        ):
+            n += 1
+        stored = self.messages[len(self.messages) - n:] if n else []
+        return sum(message_tokens(m, self.token_model) for m in stored) + sum(
+            count_tokens_cached(str(m["content"])) for m in history[:len(history) - n]
+        )
+
     def get_responded_count(self) -> int:
         """Count messages where Ene actually responded (assistant role)."""
-        return sum(1 for m in self.messages if m.get("role") == "assistant")
+        return self.role_count("assistant")
+
+    def role_count(self, role: str) -> int:
+        """Number of messages with the given role."""
+        return self.counters.roles.get(role, 0)
+
+    def recent_window_start(self, token_budget: int) -> int:
+        """Index of the oldest message in the newest run that fits token_budget.
+
+        The newest message is always included, even if it alone exceeds the
+        budget.
+        """
+        start = len(self.messages)
+        used = 0
+        while start > 0:
+            tokens = message_tokens(self.messages[start - 1], self.token_model)
+            if used + tokens > token_budget and start < len(self.messages):
+                break
+            used += tokens
+            start -= 1
+        return start
 
     def get_hybrid_history(
         self,
         recent_count: int = 20,
         summary: str | None = None,
+        token_budget: int | None = None,
+        summary_covers: int | None = None,
     ) -> list[dict[str, Any]]:
         """Get history with optional summary of older messages + verbatim recent.
 
@@ -64,6 +182,11 @@ class Session:
         Args:
             recent_count: Number of recent messages to include verbatim.
             summary: Optional summary of older messages to prepend.
+            token_budget: If set, include as many recent messages as fit in
+                this many tokens instead of a fixed recent_count.
+            summary_covers: How many leading messages the summary covers.
+                Messages after those are kept verbatim even beyond the recent
+                window, so none drop out while a summary update is pending.
 
         Returns:
             List of messages in LLM format.
@@ -80,50 +203,184 @@ class Session:
             })
 
         # Recent verbatim messages (placed last — high attention zone)
-        recent = self.messages[-recent_count:] if len(self.messages) > recent_count else self.messages
+        if token_budget is not None:
+            start = self.recent_window_start(token_budget)
+        else:
+            start = max(0, len(self.messages) - recent_count)
+        if summary and summary_covers is not None:
+            start = min(start, summary_covers)
+        recent = self.messages[start:]
         for m in recent:
             messages.append({"role": m["role"], "content": m["content"]})
 
         return messages
 
     def estimate_tokens(self) -> int:
-        """Estimate total token count of all messages.
+        """Total token count of all messages.
 
-        Uses the rough heuristic: 1 token ≈ 4 characters (English average).
-        This avoids importing tiktoken for every message check while being
-        accurate enough for budget decisions.
+        Each message's count is computed once (see nanobot.session.tokens)
+        and cached on the message as "tokens", so this is a running total,
+        not a rescan.
         """
-        total_chars = sum(len(m.get("content", "")) for m in self.messages)
-        return total_chars // 4
+        return self.counters.tokens
 
     def clear(self) -> None:
         """Clear all messages and reset session to initial state."""
         self.messages = []
+        self._counters = SessionCounters()
+        self._counted_tail = None
         self.last_consolidated = 0
         self.updated_at = datetime.now()
 
 
+# Metadata fields persisted per session alongside its messages
+_META_FIELDS = ("metadata", "last_consolidated")
+
+# Session cache bounds; the least recently used sessions beyond either are dropped
+DEFAULT_MAX_CACHED = 256
+DEFAULT_MAX_CACHED_BYTES = 64 * 1024 * 1024
+
+# Rough in-memory cost of a message beyond its content (dict, timestamp, keys)
+_MESSAGE_OVERHEAD_BYTES = 400
+
+
+def _estimate_bytes(session: Session) -> int:
+    """Approximate memory held by a session's messages (O(1), from its counters)."""
+    counters = session.counters
+    return counters.chars + counters.count * _MESSAGE_OVERHEAD_BYTES
+
+
 class SessionManager:
     """
     Manages conversation sessions.
 
-    Sessions are stored as JSONL files in the sessions directory.
+    Persistence is delegated to a SessionStore (see nanobot.session.store):
+    JSONL files by default, or a SQLite database. Either way save() writes
+    only the messages added since the last save; anything that isn't a pure
+    append (clear(), rotation, a reloaded session) replaces the stored
+    messages wholesale.
+
+    Editing an already-saved message in place is not detected; call
+    save(session, rewrite=True) after doing that.
+
+    With flush_interval > 0 (write-behind), save() only marks the session
+    dirty. Saves within the interval coalesce into one flush, written on a
+    worker thread so file I/O never blocks the event loop. Call flush_all()
+    before shutdown or anything that must see the files up to date.
+
+    Session bodies are loaded on first use and kept in an LRU cache bounded
+    by max_cached sessions and max_cached_bytes (estimated). A dirty session
+    is written before it is evicted. list_sessions() is served from the
+    store's per-session summaries, so listing never reads message bodies.
     """
 
-    def __init__(self, workspace: Path, sessions_dir: Path | None = None):
+    def __init__(
+        self,
+        workspace: Path,
+        sessions_dir: Path | None = None,
+        flush_interval: float = 0.0,
+        token_model: str | None = None,
+        max_cached: int = DEFAULT_MAX_CACHED,
+        max_cached_bytes: int = DEFAULT_MAX_CACHED_BYTES,
+        store: SessionStore | StoreKind = "auto",
+    ):
+        """
+        Args:
+            workspace: Agent workspace.
+            sessions_dir: Where session files live (default ~/.nanobot/sessions).
+            flush_interval: Write-behind delay in seconds (0 = write on every save).
+            token_model: Model whose tokenizer counts message tokens.
+            max_cached: Sessions kept in memory (least recently used evicted).
+            max_cached_bytes: Estimated bytes of cached messages before evicting.
+            store: A SessionStore, or which kind to open in sessions_dir
+                ("auto" = SQLite if a session database exists there, else JSONL).
+        """
         self.workspace = workspace
+        self.flush_interval = flush_interval
+        self.token_model = token_model
+        self.max_cached = max_cached
+        self.max_cached_bytes = max_cached_bytes
         # Lab harness passes custom sessions_dir for state isolation.
         # Default: ~/.nanobot/sessions (backwards compatible).
         self.sessions_dir = ensure_dir(
             sessions_dir if sessions_dir is not None
             else (Path.home() / ".nanobot" / "sessions")
         )
-        self._cache: dict[str, Session] = {}
+        self._cache: OrderedDict[str, Session] = OrderedDict()
+        self._cache_sizes: dict[str, int] = {}  # Estimated bytes per cached session
+        self._cache_bytes = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_evictions = 0
+        self.store = store if isinstance(store, SessionStore) else open_store(self.sessions_dir, store)
+        self._seq = itertools.count(1)
+        # Write-behind state (event loop thread only)
+        self._dirty: dict[str, Session] = {}
+        self._dirty_rewrite: set[str] = set()
+        self._flushing: dict[str, Session] = {}  # Handed to the flush thread, not yet written
+        self._flush_handle: asyncio.Handle | None = None
+        self._flush_task: asyncio.Task | None = None
     
     def _get_session_path(self, key: str) -> Path:
         """Get the file path for a session."""
         safe_key = safe_filename(key.replace(":", "_"))
         return self.sessions_dir / f"{safe_key}.jsonl"
+
+    def _remember(self, session: Session) -> None:
+        """Cache a session as most recently used, evicting the least recently used."""
+        key = session.key
+        self._cache[key] = session
+        self._cache.move_to_end(key)
+        # Re-measure: the session may have grown since it was last seen
+        size = _estimate_bytes(session)
+        self._cache_bytes += size - self._cache_sizes.get(key, 0)
+        self._cache_sizes[key] = size
+        # The session just touched is never evicted, even if it alone is over budget
+        while len(self._cache) > 1 and (
+            len(self._cache) > self.max_cached or self._cache_bytes > self.max_cached_bytes
+        ):
+            self._evict_lru()
+
+    def _evict_lru(self) -> None:
+        key, session = self._cache.popitem(last=False)
+        self._cache_bytes -= self._cache_sizes.pop(key, 0)
+        self.cache_evictions += 1
+        if key in self._dirty:
+            if self._has_running_loop():
+                # Lookups still find it in _dirty; the flush thread writes it
+                # soon, so the event loop never blocks on an eviction
+                self._flush_soon()
+                return
+            del self._dirty[key]
+            rewrite = key in self._dirty_rewrite
+            self._dirty_rewrite.discard(key)
+            self._write(self._snapshot(session, rewrite))
+
+    def _forget(self, key: str) -> None:
+        self._cache.pop(key, None)
+        self._cache_bytes -= self._cache_sizes.pop(key, 0)
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Session cache size and hit/miss/eviction counters (for the observatory)."""
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "entries": len(self._cache),
+            "max_entries": self.max_cached,
+            "bytes": self._cache_bytes,
+            "max_bytes": self.max_cached_bytes,
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": round(self.cache_hits / lookups, 3) if lookups else None,
+            "evictions": self.cache_evictions,
+            "dirty": len(self._dirty),
+        }
+
+    def clear_cache(self) -> None:
+        """Write pending saves, then drop every cached session (next access reloads)."""
+        self.flush_all()
+        self._cache.clear()
+        self._cache_sizes.clear()
+        self._cache_bytes = 0
     
     def get_or_create(self, key: str) -> Session:
         """
@@ -136,100 +393,191 @@ class SessionManager:
             The session.
         """
         if key in self._cache:
-            return self._cache[key]
-        
-        session = self._load(key)
+            self.cache_hits += 1
+            session = self._cache[key]
+            self._remember(session)
+            return session
+        self.cache_misses += 1
+        # Invalidated but not flushed yet — the file is behind, the object isn't
+        session = self._dirty.get(key) or self._flushing.get(key)
         if session is None:
-            session = Session(key=key)
+            session = self._load(key)
+        if session is None:
+            session = Session(key=key, token_model=self.token_model)
         
-        self._cache[key] = session
+        self._remember(session)
         return session
     
     def _load(self, key: str) -> Session | None:
-        """Load a session from disk."""
-        path = self._get_session_path(key)
-
-        if not path.exists():
+        """Load a session from the store."""
+        stored = self.store.load(key)
+        if stored is None:
             return None
-
         try:
-            messages = []
-            metadata = {}
+            created_at = datetime.fromisoformat(stored.created_at) if stored.created_at else None
+        except ValueError:
             created_at = None
-            last_consolidated = 0
-
-            with open(path, encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    data = json.loads(line)
-
-                    if data.get("_type") == "metadata":
-                        metadata = data.get("metadata", {})
-                        created_at = datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None
-                        last_consolidated = data.get("last_consolidated", 0)
-                    else:
-                        messages.append(data)
-
-            return Session(
-                key=key,
-                messages=messages,
-                created_at=created_at or datetime.now(),
-                metadata=metadata,
-                last_consolidated=last_consolidated
-            )
-        except Exception as e:
-            logger.warning(f"Failed to load session {key}: {e}")
-            return None
+        session = Session(
+            key=key,
+            messages=stored.messages,
+            created_at=created_at or datetime.now(),
+            metadata=stored.metadata,
+            last_consolidated=stored.last_consolidated,
+            token_model=self.token_model,
+        )
+        # Totals as of the last full write; later messages are folded in lazily
+        counters = SessionCounters.from_dict(stored.counters)
+        if counters:
+            session._seed_counters(counters)
+        return session
+
+    def read_messages(self, key: str, start: int = 0, end: int | None = None) -> list[dict[str, Any]]:
+        """Messages [start:end] of a session without loading it into the cache.
+
+        Uses the cached session if there is one (it may be ahead of the
+        store); otherwise asks the store for just that range.
+        """
+        session = self._cache.get(key) or self._dirty.get(key) or self._flushing.get(key)
+        if session is not None:
+            return session.messages[start:end]
+        return self.store.load_range(key, start, end)
     
-    def save(self, session: Session) -> None:
-        """Save a session to disk."""
-        path = self._get_session_path(session.key)
-
-        with open(path, "w", encoding="utf-8") as f:
-            metadata_line = {
-                "_type": "metadata",
-                "created_at": session.created_at.isoformat(),
-                "updated_at": session.updated_at.isoformat(),
-                "metadata": session.metadata,
-                "last_consolidated": session.last_consolidated
-            }
-            f.write(json.dumps(metadata_line) + "\n")
-            for msg in session.messages:
-                f.write(json.dumps(msg) + "\n")
-
-        self._cache[session.key] = session
+    def save(self, session: Session, rewrite: bool = False) -> None:
+        """Save a session to the store.
+
+        Appends only what changed since the last save; falls back to a full
+        rewrite when the message list was not simply appended to. In
+        write-behind mode the write is deferred and coalesced.
+
+        Args:
+            session: The session to persist.
+            rewrite: Force a full rewrite (e.g. after editing saved messages).
+        """
+        self._remember(session)
+        if self.flush_interval > 0 and self._has_running_loop():
+            self._dirty[session.key] = session
+            if rewrite:
+                self._dirty_rewrite.add(session.key)
+            self._schedule_flush()
+            return
+        self._write(self._snapshot(session, rewrite))
+
+    @property
+    def dirty_count(self) -> int:
+        """Sessions with changes not yet written to disk."""
+        return len(self._dirty)
+
+    def flush_all(self) -> None:
+        """Write every dirty session now (blocking). Call on shutdown and resets."""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        # Re-snapshot sessions the flush thread holds too: the newer snapshots
+        # win, and each write waits on the thread's lock, so nothing is left
+        # half-written when this returns
+        for key, session in self._flushing.items():
+            self._dirty.setdefault(key, session)
+        for snap in self._take_dirty():
+            self._write(snap)
+        self._flushing = {}
+
+    @staticmethod
+    def _has_running_loop() -> bool:
+        try:
+            asyncio.get_running_loop()
+            return True
+        except RuntimeError:
+            return False
+
+    def _schedule_flush(self) -> None:
+        # One flush in flight at a time; the done-callback reschedules if needed
+        if self._flush_handle or (self._flush_task and not self._flush_task.done()):
+            return
+        self._flush_handle = asyncio.get_running_loop().call_later(
+            self.flush_interval, self._start_flush,
+        )
+
+    def _flush_soon(self) -> None:
+        """Start a flush on the next loop iteration instead of after flush_interval."""
+        if self._flush_task and not self._flush_task.done():
+            return  # Its done-callback reschedules for what's left
+        if self._flush_handle:
+            self._flush_handle.cancel()
+        self._flush_handle = asyncio.get_running_loop().call_soon(self._start_flush)
+
+    def _start_flush(self) -> None:
+        self._flush_handle = None
+        self._flushing = dict(self._dirty)
+        snapshots = self._take_dirty()
+        if not snapshots:
+            return
+        self._flush_task = asyncio.ensure_future(asyncio.to_thread(self._write_many, snapshots))
+        self._flush_task.add_done_callback(self._flush_done)
+
+    def _flush_done(self, task: asyncio.Task) -> None:
+        self._flushing = {}
+        if not task.cancelled() and task.exception():
+            logger.error(f"Session flush failed: {task.exception()}")
+        if self._dirty:
+            self._schedule_flush()
+
+    def _take_dirty(self) -> list[SessionSnapshot]:
+        """Snapshot and clear the dirty set (event loop thread)."""
+        snapshots = [
+            self._snapshot(session, key in self._dirty_rewrite)
+            for key, session in self._dirty.items()
+        ]
+        self._dirty.clear()
+        self._dirty_rewrite.clear()
+        return snapshots
+
+    def _write_many(self, snapshots: list[SessionSnapshot]) -> None:
+        for snap in snapshots:
+            try:
+                self._write(snap)
+            except Exception as e:
+                logger.error(f"Failed to save session {snap.key}: {e}")
+
+    def _snapshot(self, session: Session, rewrite: bool = False) -> SessionSnapshot:
+        # Metadata round-trips through JSON so later in-place edits can't alias it
+        meta = json.loads(json.dumps({name: getattr(session, name) for name in _META_FIELDS}))
+        return SessionSnapshot(
+            key=session.key,
+            messages=list(session.messages),
+            meta=meta,
+            created_at=session.created_at.isoformat(),
+            updated_at=session.updated_at.isoformat(),
+            counters=session.counters.to_dict(),
+            seq=next(self._seq),
+            rewrite=rewrite,
+        )
+
+    def _write(self, snap: SessionSnapshot) -> None:
+        self.store.write(snap)
     
     def invalidate(self, key: str) -> None:
         """Remove a session from the in-memory cache."""
-        self._cache.pop(key, None)
+        self._forget(key)
     
-    def list_sessions(self) -> list[dict[str, Any]]:
+    def list_sessions(self, limit: int | None = None, offset: int = 0) -> list[dict[str, Any]]:
         """
-        List all sessions.
+        List sessions, most recently updated first.
         
-        Returns:
-            List of session info dicts.
-        """
-        sessions = []
+        Served from the store's per-session summaries — no messages are read.
         
-        for path in self.sessions_dir.glob("*.jsonl"):
-            try:
-                # Read just the metadata line
-                with open(path, encoding="utf-8") as f:
-                    first_line = f.readline().strip()
-                    if first_line:
-                        data = json.loads(first_line)
-                        if data.get("_type") == "metadata":
-                            sessions.append({
-                                "key": path.stem.replace("_", ":"),
-                                "created_at": data.get("created_at"),
-                                "updated_at": data.get("updated_at"),
-                                "path": str(path)
-                            })
-            except Exception:
-                continue
+        Args:
+            limit: Maximum number of sessions to return (None = all).
+            offset: Number of sessions to skip (for pagination).
         
-        return sorted(sessions, key=lambda x: x.get("updated_at", ""), reverse=True)
+        Returns:
+            List of session info dicts (key, path, created_at, updated_at,
+            message_count, token_estimate, responded_count).
+        """
+        entries = self.store.entries()
+        entries.sort(key=lambda e: e.get("updated_at") or "", reverse=True)
+        end = None if limit is None else offset + limit
+        return entries[offset:end]
+
+    def count_sessions(self) -> int:
+        """Number of stored sessions."""
+        return len(self.store.entries())
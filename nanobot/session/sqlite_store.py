@@ -0,0 +1,305 @@
+"""SQLite session store: every session in one WAL-mode database.
+
+Thousands of small JSONL files are slow to list, copy and snapshot. This
+store keeps all messages in one table keyed by (session_key, seq):
+
+    sessions  one row per session — metadata, counters, and the seq range
+              [first_seq, next_seq) holding its current messages
+    messages  (session_key, seq) → message JSON
+
+seq numbers are never reused. A write that only appends inserts the new
+rows in one batch. A write that rewrote history — rotation, /new, edited
+messages — inserts the new list as a fresh seq range and deletes the old
+range, so each write is a single transaction.
+
+Connections are per thread (WAL lets the flush thread write while the
+event loop reads), the same pattern as the observatory MetricsStore.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+from loguru import logger
+
+from nanobot.session.store import SessionSnapshot, SessionStore, StoredSession
+from nanobot.session.tokens import message_tokens
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS sessions (
+    key               TEXT PRIMARY KEY,
+    created_at        TEXT,
+    updated_at        TEXT,
+    metadata          TEXT NOT NULL DEFAULT '{}',
+    last_consolidated INTEGER NOT NULL DEFAULT 0,
+    counters          TEXT,
+    first_seq         INTEGER NOT NULL DEFAULT 0,
+    next_seq          INTEGER NOT NULL DEFAULT 0,
+    token_estimate    INTEGER,
+    responded_count   INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS messages (
+    session_key TEXT NOT NULL,
+    seq         INTEGER NOT NULL,
+    data        TEXT NOT NULL,
+    PRIMARY KEY (session_key, seq)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_sessions_updated ON sessions(updated_at);
+"""
+
+
+@dataclass
+class _Written:
+    """What the database holds for a session, so a write can insert only the rest."""
+
+    count: int  # Messages in the live range
+    tail: dict[str, Any] | None  # Last message written (identity-checked)
+    first_seq: int
+    next_seq: int
+    seq: int = 0  # Snapshot sequence written (older snapshots are skipped)
+
+
+class SqliteSessionStore(SessionStore):
+    """Sessions as rows in a single SQLite database."""
+
+    def __init__(self, db_path: Path, import_jsonl_from: Path | None = None):
+        """
+        Args:
+            db_path: Database file (created if missing).
+            import_jsonl_from: On first creation, import the JSONL sessions
+                found in this directory.
+        """
+        self.db_path = db_path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._written: dict[str, _Written] = {}
+        fresh = not db_path.exists()
+        with self._cursor() as cur:
+            cur.executescript(SCHEMA_SQL)
+        if fresh and import_jsonl_from is not None and any(import_jsonl_from.glob("*.jsonl")):
+            self._import_jsonl(import_jsonl_from)
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """Get a thread-local connection."""
+        if getattr(self._local, "conn", None) is None:
+            conn = sqlite3.connect(str(self.db_path))
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+        return self._local.conn
+
+    @contextmanager
+    def _cursor(self) -> Iterator[sqlite3.Cursor]:
+        """Cursor in a transaction that commits on success."""
+        conn = self._get_conn()
+        cursor = conn.cursor()
+        try:
+            yield cursor
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def close(self) -> None:
+        if getattr(self._local, "conn", None) is not None:
+            self._local.conn.close()
+            self._local.conn = None
+
+    # ── Read ────────────────────────────────────────────────
+
+    def load(self, key: str) -> StoredSession | None:
+        try:
+            with self._lock, self._cursor() as cur:
+                row = cur.execute(
+                    "SELECT created_at, metadata, last_consolidated, counters, first_seq, next_seq "
+                    "FROM sessions WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return None
+                created_at, metadata, last_consolidated, counters, first_seq, next_seq = row
+                messages = [
+                    json.loads(data) for (data,) in cur.execute(
+                        "SELECT data FROM messages WHERE session_key = ? AND seq >= ? AND seq < ? "
+                        "ORDER BY seq",
+                        (key, first_seq, next_seq),
+                    )
+                ]
+                # seq 0: what's stored never outranks a snapshot still being written
+                self._written[key] = _Written(
+                    count=len(messages),
+                    tail=messages[-1] if messages else None,
+                    first_seq=first_seq,
+                    next_seq=next_seq,
+                )
+            return StoredSession(
+                messages=messages,
+                metadata=json.loads(metadata),
+                last_consolidated=last_consolidated,
+                created_at=created_at,
+                counters=json.loads(counters) if counters else None,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load session {key}: {e}")
+            return None
+
+    def load_range(self, key: str, start: int, end: int | None = None) -> list[dict[str, Any]]:
+        """Messages [start:end] of a session, fetched by seq range."""
+        with self._cursor() as cur:
+            row = cur.execute(
+                "SELECT first_seq, next_seq FROM sessions WHERE key = ?", (key,),
+            ).fetchone()
+            if row is None:
+                return []
+            first_seq, next_seq = row
+            lo, hi, _ = slice(start, end).indices(next_seq - first_seq)
+            if lo >= hi:
+                return []
+            return [
+                json.loads(data) for (data,) in cur.execute(
+                    "SELECT data FROM messages WHERE session_key = ? AND seq >= ? AND seq < ? "
+                    "ORDER BY seq",
+                    (key, first_seq + lo, first_seq + hi),
+                )
+            ]
+
+    def entries(self) -> list[dict[str, Any]]:
+        with self._cursor() as cur:
+            rows = cur.execute(
+                "SELECT key, created_at, updated_at, next_seq - first_seq, token_estimate, responded_count "
+                "FROM sessions"
+            ).fetchall()
+        return [
+            {
+                "key": key,
+                "created_at": created_at,
+                "updated_at": updated_at,
+                "message_count": count,
+                "token_estimate": tokens,
+                "responded_count": responded,
+                "path": str(self.db_path),
+            }
+            for key, created_at, updated_at, count, tokens, responded in rows
+        ]
+
+    # ── Write ───────────────────────────────────────────────
+
+    def write(self, snap: SessionSnapshot) -> None:
+        with self._lock:
+            state = self._written.get(snap.key)
+            if state is not None and snap.seq < state.seq:
+                return  # A newer snapshot already reached the database
+            with self._cursor() as cur:
+                if state is None:
+                    # Never loaded here: whatever is stored gets replaced
+                    row = cur.execute(
+                        "SELECT next_seq FROM sessions WHERE key = ?", (snap.key,),
+                    ).fetchone()
+                    start = row[0] if row else 0
+                    first_seq = self._replace_range(cur, snap, start)
+                elif not snap.rewrite and self._is_append_only(snap, state):
+                    first_seq = state.first_seq
+                    self._insert(cur, snap.key, snap.messages[state.count:], state.next_seq)
+                else:
+                    first_seq = self._replace_range(cur, snap, state.next_seq)
+                next_seq = first_seq + len(snap.messages)
+                self._upsert_session(cur, snap, first_seq, next_seq)
+            self._written[snap.key] = _Written(
+                count=len(snap.messages),
+                tail=snap.messages[-1] if snap.messages else None,
+                first_seq=first_seq,
+                next_seq=next_seq,
+                seq=snap.seq,
+            )
+
+    @staticmethod
+    def _is_append_only(snap: SessionSnapshot, state: _Written) -> bool:
+        """Whether every stored message is still an unchanged prefix of the snapshot."""
+        if len(snap.messages) < state.count:
+            return False
+        return state.count == 0 or snap.messages[state.count - 1] is state.tail
+
+    def _replace_range(self, cur: sqlite3.Cursor, snap: SessionSnapshot, start: int) -> int:
+        """Write the whole message list at seq `start` onward and drop older rows."""
+        cur.execute("DELETE FROM messages WHERE session_key = ? AND seq < ?", (snap.key, start))
+        self._insert(cur, snap.key, snap.messages, start)
+        return start
+
+    @staticmethod
+    def _insert(cur: sqlite3.Cursor, key: str, messages: list[dict[str, Any]], start: int) -> None:
+        cur.executemany(
+            "INSERT OR REPLACE INTO messages (session_key, seq, data) VALUES (?, ?, ?)",
+            [(key, start + i, json.dumps(m)) for i, m in enumerate(messages)],
+        )
+
+    @staticmethod
+    def _upsert_session(cur: sqlite3.Cursor, snap: SessionSnapshot, first_seq: int, next_seq: int) -> None:
+        cur.execute(
+            """INSERT INTO sessions
+                 (key, created_at, updated_at, metadata, last_consolidated, counters,
+                  first_seq, next_seq, token_estimate, responded_count)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(key) DO UPDATE SET
+                 updated_at = excluded.updated_at,
+                 metadata = excluded.metadata,
+                 last_consolidated = excluded.last_consolidated,
+                 counters = excluded.counters,
+                 first_seq = excluded.first_seq,
+                 next_seq = excluded.next_seq,
+                 token_estimate = excluded.token_estimate,
+                 responded_count = excluded.responded_count""",
+            (
+                snap.key,
+                snap.created_at,
+                snap.updated_at,
+                json.dumps(snap.meta.get("metadata", {})),
+                snap.meta.get("last_consolidated", 0),
+                json.dumps(snap.counters),
+                first_seq,
+                next_seq,
+                snap.counters.get("tokens"),
+                snap.counters.get("roles", {}).get("assistant", 0),
+            ),
+        )
+
+    # ── Migration ───────────────────────────────────────────
+
+    def _import_jsonl(self, sessions_dir: Path) -> None:
+        """Copy JSONL sessions into a new database (the files are left in place)."""
+        from nanobot.session.jsonl_store import JsonlSessionStore
+
+        source = JsonlSessionStore(sessions_dir)
+        imported = 0
+        for entry in source.entries():
+            stored = source.load(entry["key"])
+            if stored is None:
+                continue
+            roles: dict[str, int] = {}
+            for m in stored.messages:
+                roles[m.get("role", "")] = roles.get(m.get("role", ""), 0) + 1
+            self.write(SessionSnapshot(
+                key=entry["key"],
+                messages=stored.messages,
+                meta={"metadata": stored.metadata, "last_consolidated": stored.last_consolidated},
+                created_at=stored.created_at or entry.get("created_at") or "",
+                updated_at=entry.get("updated_at") or stored.created_at or "",
+                counters={
+                    "count": len(stored.messages),
+                    "chars": sum(len(m.get("content") or "") for m in stored.messages),
+                    "tokens": sum(message_tokens(m) for m in stored.messages),
+                    "roles": roles,
+                },
+                seq=0,
+            ))
+            imported += 1
+        self._written.clear()  # Sessions are re-read before their next write
+        logger.info(f"Imported {imported} JSONL sessions into {self.db_path}")
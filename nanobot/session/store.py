@@ -0,0 +1,99 @@
+"""Pluggable persistence backends for SessionManager.
+
+SessionManager owns the in-memory side — the LRU cache, dirty tracking and
+write-behind flushing — and hands each write to a SessionStore as an
+immutable SessionSnapshot. Two stores ship:
+
+    jsonl   one append-only JSONL file per session plus a session index
+            (nanobot.session.jsonl_store — the original layout)
+    sqlite  one WAL-mode database with a messages table keyed by
+            (session_key, seq) (nanobot.session.sqlite_store)
+
+Stores are written from the flush thread and read from the event loop,
+so implementations must be thread-safe. A store must skip a snapshot
+older (by seq) than one it has already written.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+StoreKind = Literal["auto", "jsonl", "sqlite"]
+
+
+@dataclass
+class SessionSnapshot:
+    """A session's persistable state, captured on the event loop for a write."""
+
+    key: str
+    messages: list[dict[str, Any]]  # Shallow copy — message dicts are never edited
+    meta: dict[str, Any]  # metadata + last_consolidated (JSON round-tripped)
+    created_at: str
+    updated_at: str
+    counters: dict[str, Any]  # SessionCounters.to_dict()
+    seq: int  # Capture order; older snapshots are never written over newer ones
+    rewrite: bool = False  # Saved messages were edited in place — write everything
+
+
+@dataclass
+class StoredSession:
+    """A session as read back from a store."""
+
+    messages: list[dict[str, Any]]
+    metadata: dict[str, Any]
+    last_consolidated: int = 0
+    created_at: str | None = None
+    counters: dict[str, Any] | None = None  # Totals over the first counters["count"] messages
+
+
+class SessionStore(ABC):
+    """Where session messages and metadata live."""
+
+    @abstractmethod
+    def load(self, key: str) -> StoredSession | None:
+        """Read a whole session (None if it doesn't exist or can't be read)."""
+
+    @abstractmethod
+    def write(self, snap: SessionSnapshot) -> None:
+        """Persist a snapshot, writing only what changed where possible."""
+
+    @abstractmethod
+    def entries(self) -> list[dict[str, Any]]:
+        """One summary record per session: key, created_at, updated_at,
+        message_count, token_estimate, responded_count, path."""
+
+    def load_range(self, key: str, start: int, end: int | None = None) -> list[dict[str, Any]]:
+        """Messages [start:end] of a session (negative indexes count from the end).
+
+        The default reads the whole session; stores with indexed storage
+        override it to fetch just the range.
+        """
+        stored = self.load(key)
+        return stored.messages[start:end] if stored else []
+
+    def close(self) -> None:
+        """Release resources (connections, handles)."""
+
+
+SQLITE_FILENAME = "sessions.db"
+
+
+def open_store(sessions_dir: Path, kind: StoreKind = "auto") -> SessionStore:
+    """Create the store for a sessions directory.
+
+    "auto" picks SQLite if the directory already holds a session database,
+    JSONL files otherwise — so lab snapshots and runs keep whichever layout
+    they were created with.
+    """
+    if kind == "auto":
+        kind = "sqlite" if (sessions_dir / SQLITE_FILENAME).exists() else "jsonl"
+    if kind == "sqlite":
+        from nanobot.session.sqlite_store import SqliteSessionStore
+        return SqliteSessionStore(sessions_dir / SQLITE_FILENAME, import_jsonl_from=sessions_dir)
+    if kind == "jsonl":
+        from nanobot.session.jsonl_store import JsonlSessionStore
+        return JsonlSessionStore(sessions_dir)
+    raise ValueError(f"Unknown session store: {kind!r}")
@@ -0,0 +1,71 @@
+"""Running summaries of older conversation, persisted per session.
+
+The hybrid context window shows messages older than the verbatim window
+as one running summary. The summary is stored in the session's metadata
+together with how many messages it covers, so it survives restarts and
+each update only folds in the messages added since:
+
+    session.metadata["running_summary"] = {
+        "text": "...",
+        "covered": 120,  # session.messages[:120] are folded in
+        "anchor": "...",  # fingerprint of message 119, to catch rewrites
+    }
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from nanobot.session.manager import Session
+
+SUMMARY_KEY = "running_summary"
+
+
+def _fingerprint(msg: dict[str, Any]) -> str:
+    """Identify a message across reloads (dict identity doesn't survive them)."""
+    return f"{msg.get('role')}|{msg.get('timestamp')}|{len(msg.get('content') or '')}"
+
+
+@dataclass
+class RunningSummary:
+    """A session's running summary and the message prefix it covers."""
+
+    text: str
+    covered: int
+    anchor: str = ""
+
+    @classmethod
+    def capture(cls, session: Session, covered: int, text: str = "") -> RunningSummary:
+        """A summary of session.messages[:covered] (text filled in once generated)."""
+        anchor = _fingerprint(session.messages[covered - 1]) if covered else ""
+        return cls(text=text, covered=covered, anchor=anchor)
+
+    @classmethod
+    def load(cls, session: Session) -> RunningSummary | None:
+        """The session's summary, or None if missing or no longer lining up.
+
+        A summary stops lining up when the messages it covers were cleared,
+        rotated away or rewritten since it was stored.
+        """
+        data = session.metadata.get(SUMMARY_KEY)
+        if not isinstance(data, dict) or not data.get("text"):
+            return None
+        summary = cls(text=data["text"], covered=data.get("covered", 0), anchor=data.get("anchor", ""))
+        if not summary.is_current(session):
+            return None
+        return summary
+
+    def is_current(self, session: Session) -> bool:
+        if self.covered > len(session.messages):
+            return False
+        return self.covered == 0 or _fingerprint(session.messages[self.covered - 1]) == self.anchor
+
+    def store(self, session: Session) -> None:
+        """Record the summary in the session's metadata (persisted on save)."""
+        session.metadata[SUMMARY_KEY] = {"text": self.text, "covered": self.covered, "anchor": self.anchor}
+
+    @staticmethod
+    def clear(session: Session) -> None:
+        session.metadata.pop(SUMMARY_KEY, None)
@@ -0,0 +1,89 @@
+"""Token counting for session history budgets.
+
+Counts use the tiktoken encoding registered for the configured model
+(o200k_base for GPT-4o-era models, and so on) and cl100k_base for every
+other model — a far closer fit than chars/4 for emoji and non-Latin
+text. litellm's Hugging Face tokenizers are deliberately not used: they
+are fetched over the network on first use, which would stall the event
+loop inside Session.add_message().
+
+tiktoken downloads its encoding files on first use; litellm ships copies
+of them, so those are used when no cache directory is configured. If
+tiktoken or its encodings are unavailable, counts fall back to chars/4.
+"""
+
+import importlib.util
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable
+
+from loguru import logger
+
+# Encoding for models tiktoken doesn't know (DeepSeek, Claude, Llama, ...)
+DEFAULT_ENCODING = "cl100k_base"
+
+
+def _use_bundled_encodings() -> None:
+    """Point tiktoken at litellm's bundled encoding files (without importing litellm)."""
+    if "TIKTOKEN_CACHE_DIR" in os.environ:
+        return
+    spec = importlib.util.find_spec("litellm")
+    if spec and spec.origin:
+        bundled = Path(spec.origin).parent / "litellm_core_utils" / "tokenizers"
+        if bundled.is_dir():
+            os.environ["TIKTOKEN_CACHE_DIR"] = str(bundled)
+
+
+def _heuristic(text: str) -> int:
+    return len(text) // 4
+
+
+@lru_cache(maxsize=16)
+def _encoder_for(model: str | None) -> Callable[[str], int]:
+    try:
+        import tiktoken
+    except ImportError:
+        logger.warning("tiktoken not installed; estimating tokens as chars/4")
+        return _heuristic
+
+    _use_bundled_encodings()
+    try:
+        encoding = None
+        if model:
+            try:
+                # "openrouter/openai/gpt-4o" → "gpt-4o"
+                encoding = tiktoken.encoding_for_model(model.rsplit("/", 1)[-1])
+            except KeyError:
+                pass
+        encoding = encoding or tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception as e:
+        logger.warning(f"tiktoken encoding unavailable ({e}); estimating tokens as chars/4")
+        return _heuristic
+    # Chat text can contain literal special-token strings; count them as text
+    return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+
+def count_tokens(text: str, model: str | None = None) -> int:
+    """Count tokens in text with the tokenizer matching model."""
+    if not text:
+        return 0
+    return _encoder_for(model)(text)
+
+
+@lru_cache(maxsize=512)
+def count_tokens_cached(text: str) -> int:
+    """count_tokens() with the default encoding, memoized.
+
+    For prompt parts that repeat call after call (cached context blocks).
+    """
+    return count_tokens(text)
+
+
+def message_tokens(msg: dict[str, Any], model: str | None = None) -> int:
+    """Token count of a stored message — its cached "tokens" field if present."""
+    cached = msg.get("tokens")
+    if isinstance(cached, int):
+        return cached
+    content = msg.get("content") or ""
+    return count_tokens(content if isinstance(content, str) else str(content), model)
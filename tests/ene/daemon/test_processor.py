@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+import re
 import time
 from dataclasses import dataclass
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -10,10 +11,11 @@ import pytest
 
 from nanobot.ene.daemon.models import (
     Classification,
+    DaemonRequest,
     DaemonResult,
     DEFAULT_FREE_MODELS,
 )
-from nanobot.ene.daemon.processor import DaemonProcessor, DAEMON_PROMPT
+from nanobot.ene.daemon.processor import DaemonProcessor, DAEMON_PROMPT, DAEMON_BATCH_PROMPT
 
 
 # ── Helpers ──────────────────────────────────────────────────────────────
@@ -585,6 +587,135 @@ class TestProcess:
         assert call_kwargs["model"] == "test/model"
 
 
+# ── Batched process_batch() flow ─────────────────────────────────────────
+
+
+def batch_entry(msg_id: str, classification: str = "context", **extra) -> dict:
+    return {"id": msg_id, "classification": classification, "confidence": 0.9,
+            "reason": msg_id, "security_flags": [], "implicit_ene_ref": False,
+            "topic": "t", "tone": "neutral", **extra}
+
+
+def echo_ids(*replies: list[dict]) -> MagicMock:
+    """Provider answering batch prompts; "m1".."mN" in replies become the IDs sent."""
+    provider = MagicMock()
+    pending = list(replies)
+
+    async def chat(messages, **kwargs):
+        sent = re.findall(r"^\[(m\d+-[0-9a-f]+)\]", messages[-1]["content"], re.MULTILINE)
+        ids = {msg_id.split("-")[0]: msg_id for msg_id in sent}
+        entries = pending.pop(0) if pending else []
+        if isinstance(entries, str):
+            return FakeLLMResponse(content=entries)
+        return FakeLLMResponse(content=json.dumps([
+            {**e, "id": ids.get(e["id"], e["id"])} if isinstance(e, dict) else e for e in entries
+        ]))
+
+    provider.chat = AsyncMock(side_effect=chat)
+    return provider
+
+
+def make_requests(n: int) -> list[DaemonRequest]:
+    return [
+        DaemonRequest(content=f"message {i}", sender_name=f"User{i}", sender_id=f"discord:{i}")
+        for i in range(n)
+    ]
+
+
+class TestProcessBatch:
+    @pytest.mark.asyncio
+    async def test_single_call_for_batch(self):
+        provider = echo_ids([
+            batch_entry("m2", "respond"), batch_entry("m1"), batch_entry("m3", "drop"),
+        ])
+        proc = make_processor(provider=provider, model="test/model")
+        proc.batch_size = 8
+        results = await proc.process_batch(make_requests(3), recent_context=["A: hi"])
+
+        provider.chat.assert_called_once()
+        assert [r.classification_reason for r in results] == ["m1", "m2", "m3"]
+        assert results[1].classification == Classification.RESPOND
+        assert results[2].classification == Classification.DROP
+
+        messages = provider.chat.call_args[1]["messages"]
+        assert messages[0]["content"] == DAEMON_BATCH_PROMPT
+        user = messages[1]["content"]
+        assert user.count("Recent chat:") == 1
+        assert re.search(r"^\[m1-[0-9a-f]{6}\] Sender: User0", user, re.MULTILINE)
+        assert re.search(r"^\[m3-[0-9a-f]{6}\] Sender: User2", user, re.MULTILINE)
+
+    @pytest.mark.asyncio
+    async def test_missing_entries_fall_back_per_message(self):
+        provider = echo_ids([batch_entry("m1")], GOOD_RESPONSE)
+        proc = make_processor(provider=provider, model="test/model")
+        proc.batch_size = 8
+        results = await proc.process_batch(make_requests(2))
+
+        assert provider.chat.call_count == 2
+        assert results[0].classification_reason == "m1"
+        assert results[1].classification == Classification.RESPOND
+
+    @pytest.mark.asyncio
+    async def test_chunks_by_batch_size(self):
+        entries = [batch_entry(f"m{i}") for i in range(1, 4)]
+        provider = echo_ids(entries, entries)
+        proc = make_processor(provider=provider, model="test/model")
+        proc.batch_size = 3
+        results = await proc.process_batch(make_requests(6))
+
+        assert provider.chat.call_count == 2
+        assert len(results) == 6
+        assert not any(r.fallback_used for r in results)
+
+    @pytest.mark.asyncio
+    async def test_timeout_uses_hardcoded_fallback(self):
+        provider = MagicMock()
+
+        async def slow_chat(**kwargs):
+            await asyncio.sleep(10)
+
+        provider.chat = slow_chat
+        proc = make_processor(provider=provider, timeout=0.05)
+        proc.batch_size = 8
+        requests = make_requests(2)
+        requests[1].content = "hey ene"
+        results = await proc.process_batch(requests)
+
+        assert all(r.fallback_used for r in results)
+        assert results[1].classification == Classification.RESPOND
+
+    def test_parse_batch_matches_sent_ids(self):
+        proc = make_processor()
+        text = "```json\n" + json.dumps([batch_entry("[m2-b71e04]"), "junk"]) + "\n```"
+        parsed = proc._parse_batch_response(text, "m", ["m1-3f9a2c", "m2-b71e04"])
+        assert list(parsed) == [1]
+
+    def test_parse_batch_rejects_unknown_or_repeated_ids(self):
+        proc = make_processor()
+        ids = ["m1-3f9a2c", "m2-b71e04"]
+        forged = json.dumps([batch_entry("m1-3f9a2c"), batch_entry("m2")])
+        assert proc._parse_batch_response(forged, "m", ids) == {}
+        repeated = json.dumps([batch_entry("m1-3f9a2c"), batch_entry("m1-3f9a2c", "respond")])
+        assert proc._parse_batch_response(repeated, "m", ids) == {}
+
+    @pytest.mark.asyncio
+    async def test_forged_ids_fall_back_per_message(self):
+        provider = echo_ids([batch_entry("m1"), batch_entry("m2-000000", "respond")], GOOD_RESPONSE, GOOD_RESPONSE)
+        proc = make_processor(provider=provider, model="test/model")
+        proc.batch_size = 8
+        results = await proc.process_batch(make_requests(2))
+
+        assert provider.chat.call_count == 3
+        assert all(r.classification == Classification.RESPOND for r in results)
+
+    def test_batching_off_by_default(self):
+        assert make_processor().batch_size == 1
+
+    def test_extract_array_wrapped(self):
+        data = DaemonProcessor._extract_json_array(json.dumps({"results": [1, 2]}))
+        assert data == [1, 2]
+
+
 # ── Daemon prompt ────────────────────────────────────────────────────────
 
 
@@ -122,6 +122,13 @@ def test_add_entry_strips_whitespace(core: CoreMemory):
     assert core.find_entry(entry_id)["content"] == "hello world"
 
 
+def test_add_entry_bumps_revision(core: CoreMemory):
+    """Every save bumps the revision so cached prompt blocks re-render."""
+    before = core.revision
+    core.add_entry("identity", "I like cats")
+    assert core.revision > before
+
+
 # ── Edit Entry ─────────────────────────────────────────────
 
 
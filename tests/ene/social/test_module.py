@@ -4,7 +4,7 @@ import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, AsyncMock
 
-from nanobot.ene import EneContext, ModuleRegistry
+from nanobot.ene import EneContext, ModuleRegistry, SenderContext
 from nanobot.ene.social import SocialModule
 from nanobot.ene.social.person import DAD_IDS
 from nanobot.ene.social.trust import TrustCalculator
@@ -110,8 +110,7 @@ class TestModuleLifecycle:
 class TestPersonCard:
     @pytest.mark.asyncio
     async def test_unknown_person_card(self, module):
-        module.set_sender_context("discord:unknown123", {})
-        card = module.get_context_block_for_message("hello")
+        card = module.get_context_block_for_message("hello", SenderContext("discord:unknown123"))
         assert card is not None
         assert "Unknown" in card
         assert "stranger" in card
@@ -124,16 +123,14 @@ class TestPersonCard:
         await module.on_message(msg, responded=True)
 
         # Now get their card
-        module.set_sender_context("discord:111222", msg.metadata)
-        card = module.get_context_block_for_message("hello")
+        card = module.get_context_block_for_message("hello", SenderContext("discord:111222", msg.metadata))
         assert card is not None
         assert "Alice" in card
 
     @pytest.mark.asyncio
     async def test_dad_person_card(self, module):
         dad_pid = list(DAD_IDS)[0]
-        module.set_sender_context(dad_pid, {})
-        card = module.get_context_block_for_message("hello")
+        card = module.get_context_block_for_message("hello", SenderContext(dad_pid))
         assert card is not None
         assert "Dad" in card
         assert "inner_circle" in card
@@ -189,7 +186,7 @@ class TestModuleRegistryIntegration:
         registry.set_current_sender("12345", "discord", {"author_name": "Test"})
         assert registry.get_current_platform_id() == "discord:12345"
 
-        # Dynamic context should trigger set_sender_context on modules
+        # Dynamic context passes the sender to modules
         dynamic = registry.get_all_dynamic_context("hello")
         # Should include the person card (unknown person)
         assert "Unknown" in dynamic or "stranger" in dynamic
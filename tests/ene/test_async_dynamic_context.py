@@ -0,0 +1,115 @@
+"""Tests for concurrent gathering of per-message module context."""
+
+import asyncio
+import time
+from pathlib import Path
+
+from nanobot.agent.batch_context import BatchContext
+from nanobot.agent.context import ContextBuilder
+from nanobot.bus.events import InboundMessage
+from nanobot.ene import EneContext, EneModule, ModuleRegistry
+
+
+class SlowModule(EneModule):
+    """Module whose per-message context blocks for `delay` seconds."""
+
+    context_blocking = True
+
+    def __init__(self, name: str, delay: float = 0.0, block: str | None = None):
+        self._name = name
+        self.delay = delay
+        self.block = block or f"[{name}]"
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    async def initialize(self, ctx: EneContext) -> None:
+        pass
+
+    def get_tools(self) -> list:
+        return []
+
+    def get_context_block_for_message(self, message: str, sender=None) -> str | None:
+        time.sleep(self.delay)
+        return self.block
+
+
+class SpeakerModule(SlowModule):
+    """Echoes the sender it was handed, after the delay."""
+
+    def get_context_block_for_message(self, message: str, sender=None) -> str | None:
+        time.sleep(self.delay)
+        return f"[speaker {sender.platform_id}]"
+
+
+class FakeSocial(SlowModule):
+    def get_scene_context(self, primary_id: str, participant_ids: list[str]) -> str:
+        return f"## Scene {primary_id} {len(participant_ids)}"
+
+
+def make_registry(*modules: EneModule) -> ModuleRegistry:
+    registry = ModuleRegistry()
+    for module in modules:
+        registry.register(module)
+    return registry
+
+
+class TestGatherDynamicContext:
+    async def test_blocking_modules_run_concurrently(self):
+        registry = make_registry(SlowModule("memory", 0.2), SlowModule("social", 0.2))
+
+        start = time.perf_counter()
+        result = await registry.gather_dynamic_context("hello")
+
+        assert time.perf_counter() - start < 0.35
+        assert result == "[memory]\n\n[social]"  # Registration order kept
+
+    async def test_slow_module_is_skipped_after_timeout(self):
+        registry = make_registry(SlowModule("memory", 0.5), SlowModule("daemon"))
+        registry.dynamic_context_timeout = 0.05
+
+        start = time.perf_counter()
+        result = await registry.gather_dynamic_context("hello")
+
+        assert time.perf_counter() - start < 0.3
+        assert result == "[daemon]"
+
+    async def test_scene_replaces_speaker_card(self):
+        registry = make_registry(FakeSocial("social", block="## Current Speaker"))
+        batch = BatchContext(scene_participant_ids=["discord:1", "discord:2"])
+        batch.bind_message(InboundMessage(channel="discord", sender_id="1", chat_id="room", content="hi"))
+
+        result = await registry.gather_dynamic_context("hello", batch=batch)
+
+        assert result == "## Scene discord:1 2"
+
+    async def test_concurrent_batches_overlap_with_own_sender(self):
+        registry = make_registry(SpeakerModule("social", 0.2))
+        batches = []
+        for sender_id in ("1", "2"):
+            batch = BatchContext()
+            batch.bind_message(InboundMessage(channel="discord", sender_id=sender_id, chat_id="room", content="hi"))
+            batches.append(batch)
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(registry.gather_dynamic_context("hi", batch=b) for b in batches))
+
+        assert time.perf_counter() - start < 0.35  # Not serialized
+        assert results == ["[speaker discord:1]", "[speaker discord:2]"]
+
+    async def test_matches_sync_path(self):
+        registry = make_registry(SlowModule("memory"), SlowModule("conversation"))
+        assert await registry.gather_dynamic_context("hello") == registry.get_all_dynamic_context("hello")
+
+
+async def test_context_builder_async_matches_sync(tmp_path: Path):
+    registry = make_registry(SlowModule("memory", 0.01))
+    builder = ContextBuilder(tmp_path, module_registry=registry, stable_prefix=True)
+    builder._current_time = lambda: ("2026-01-01 10:00 (Thursday)", "UTC")
+
+    sync = builder.build_messages([], "hello", channel="discord", chat_id="room")
+    gathered = await builder.build_messages_async([], "hello", channel="discord", chat_id="room")
+
+    assert gathered == sync
+    assert "[memory]" in gathered[-1]["content"]
@@ -0,0 +1,113 @@
+"""Tests for token-budgeted packing of module context."""
+
+from nanobot.ene import ContextFragment, EneContext, EneModule, ModuleRegistry
+from nanobot.ene.context_packer import TRUNCATION_MARKER, pack_fragments
+
+
+def fragment(name: str, words: int, priority: int, truncatable: bool = False) -> ContextFragment:
+    text = "\n".join(f"{name} line {i} " + "word " * 8 for i in range(words // 10))
+    return ContextFragment(text, priority=priority, truncatable=truncatable, source=name)
+
+
+class BlockModule(EneModule):
+    def __init__(self, name: str, static: ContextFragment | None = None, dynamic: ContextFragment | None = None):
+        self._name = name
+        self._static = static
+        self._dynamic = dynamic
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    async def initialize(self, ctx: EneContext) -> None:
+        pass
+
+    def get_tools(self) -> list:
+        return []
+
+    def get_context_fragments(self) -> list[ContextFragment]:
+        return [self._static] if self._static else []
+
+    def get_context_fragments_for_message(self, message: str, sender=None) -> list[ContextFragment]:
+        return [self._dynamic] if self._dynamic else []
+
+
+class TestPackFragments:
+    def test_unbounded_keeps_everything(self):
+        fragments = [fragment("a", 100, 10), ContextFragment(""), fragment("b", 100, 90)]
+        assert [f.source for f in pack_fragments(fragments, None)] == ["a", "b"]
+
+    def test_fills_by_priority_and_keeps_prompt_order(self):
+        low, mid, high = fragment("low", 100, 10), fragment("mid", 100, 50), fragment("high", 100, 90)
+        budget = high.tokens + mid.tokens + low.tokens // 2
+
+        kept = pack_fragments([low, mid, high], budget)
+
+        assert [f.source for f in kept] == ["mid", "high"]
+        assert sum(f.tokens for f in kept) <= budget
+
+    def test_truncatable_fragment_is_trimmed(self):
+        core, diary = fragment("core", 100, 90), fragment("diary", 200, 30, truncatable=True)
+        budget = core.tokens + diary.tokens // 2
+
+        kept = pack_fragments([core, diary], budget)
+
+        assert [f.source for f in kept] == ["core", "diary"]
+        assert kept[1].text.startswith("diary line 0")
+        assert kept[1].text.endswith(TRUNCATION_MARKER)
+        assert sum(f.tokens for f in kept) <= budget
+        assert diary.text.count("\n") > kept[1].text.count("\n")  # Original untouched
+
+    def test_keep_tail_trims_oldest_lines(self):
+        diary = fragment("diary", 200, 30, truncatable=True)
+        diary.text = "## Recent Diary\n" + diary.text
+        diary.keep = "tail"
+
+        kept = pack_fragments([diary], diary.tokens // 2)
+
+        lines = kept[0].text.split("\n")
+        assert lines[:2] == ["## Recent Diary", TRUNCATION_MARKER]
+        assert lines[-1] == diary.text.split("\n")[-1]  # Newest entry survives
+        assert "diary line 0 " not in kept[0].text
+        assert kept[0].tokens <= diary.tokens // 2
+
+
+class TestRegistryBudget:
+    def test_dynamic_context_gets_what_static_leaves(self):
+        static = fragment("memory", 100, 90)
+        retrieval = fragment("retrieval", 200, 50, truncatable=True)
+        card = fragment("card", 50, 70)
+        registry = ModuleRegistry()
+        registry.register(BlockModule("memory", static=static, dynamic=retrieval))
+        registry.register(BlockModule("social", dynamic=card))
+        registry.context_token_budget = static.tokens + card.tokens + 40
+
+        assert registry.get_all_context_blocks() == static.text
+        dynamic = registry.get_all_dynamic_context("hi")
+
+        assert dynamic.startswith("retrieval line 0")  # Trimmed, prompt order kept
+        assert dynamic.endswith(card.text)
+
+    def test_static_blocks_leave_dynamic_share(self):
+        diary = fragment("diary", 400, 30, truncatable=True)
+        focus = fragment("focus", 60, 95)
+        registry = ModuleRegistry()
+        registry.register(BlockModule("memory", static=diary))
+        registry.register(BlockModule("conversation", dynamic=focus))
+        registry.context_token_budget = diary.tokens
+
+        static = registry.get_all_context_blocks()
+        assert static.endswith(TRUNCATION_MARKER)  # Trimmed to leave the share
+        assert registry.get_all_dynamic_context("hi") == focus.text
+
+    def test_default_fragments_wrap_blocks(self):
+        class Plain(BlockModule):
+            context_priority = 77
+
+            get_context_fragments = EneModule.get_context_fragments
+
+            def get_context_block(self) -> str | None:
+                return "plain block"
+
+        fragments = Plain("plain").get_context_fragments()
+        assert [(f.text, f.priority) for f in fragments] == [("plain block", 77)]
@@ -32,7 +32,7 @@ class StubModule(EneModule):
     def get_context_block(self) -> str | None:
         return f"[{self._name} context]"
 
-    def get_context_block_for_message(self, message: str) -> str | None:
+    def get_context_block_for_message(self, message: str, sender=None) -> str | None:
         if "trigger" in message:
             return f"[{self._name} dynamic for: {message}]"
         return None
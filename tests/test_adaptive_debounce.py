@@ -0,0 +1,90 @@
+"""Tests for the adaptive debounce window."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from nanobot.agent.debounce import AdaptiveDebouncer
+from nanobot.agent.live_trace import LiveTracer
+from nanobot.agent.loop import AgentLoop
+from nanobot.bus.events import InboundMessage
+from nanobot.bus.queue import MessageBus
+
+
+def _arrivals(debouncer: AdaptiveDebouncer, key: str, interval: float, count: int, start: float = 1000.0) -> float:
+    now = start
+    for i in range(count):
+        now = start + i * interval
+        debouncer.record_arrival(key, f"u{i % 3}", now=now)
+    return now
+
+
+class TestAdaptiveDebouncer:
+    def test_lone_dm_gets_shortest_window(self):
+        debouncer = AdaptiveDebouncer()
+        now = _arrivals(debouncer, "discord:dm", interval=0, count=1)
+        decision = debouncer.decide("discord:dm", is_direct=True, now=now)
+        assert decision.tier == "dm"
+        assert decision.window == debouncer.dm_window
+
+    def test_quiet_group_shortened(self):
+        debouncer = AdaptiveDebouncer()
+        now = _arrivals(debouncer, "discord:g", interval=90, count=4)  # < 1 msg/min
+        decision = debouncer.decide("discord:g", now=now)
+        assert decision.tier == "quiet"
+        assert decision.window < debouncer.base_window
+
+    def test_active_group_keeps_base_window(self):
+        debouncer = AdaptiveDebouncer()
+        now = _arrivals(debouncer, "discord:g", interval=10, count=10)  # ~6 msgs/min
+        decision = debouncer.decide("discord:g", now=now)
+        assert decision.tier == "active"
+        assert decision.window == debouncer.base_window
+        assert decision.batch_limit == debouncer.base_batch_limit
+
+    def test_burst_widens_window_and_batch(self):
+        debouncer = AdaptiveDebouncer()
+        now = _arrivals(debouncer, "discord:g", interval=0.5, count=20)  # ~120 msgs/min
+        decision = debouncer.decide("discord:g", now=now)
+        assert decision.tier == "burst"
+        assert decision.window > debouncer.base_window
+        assert decision.batch_limit > debouncer.base_batch_limit
+
+    def test_dm_burst_batches_at_base_window(self):
+        debouncer = AdaptiveDebouncer()
+        now = _arrivals(debouncer, "discord:dm", interval=0.5, count=6)
+        decision = debouncer.decide("discord:dm", is_direct=True, now=now)
+        assert decision.window == debouncer.base_window
+
+    def test_tracer_sees_tier_changes_only(self):
+        tracer = LiveTracer()
+        debouncer = AdaptiveDebouncer(tracer=tracer)
+        for _ in range(3):
+            debouncer.decide("discord:g", now=1000.0)
+        now = _arrivals(debouncer, "discord:g", interval=0.5, count=20)
+        debouncer.decide("discord:g", now=now)
+
+        events = [e for e in tracer.get_recent() if e["type"] == "debounce_window"]
+        assert [e["tier"] for e in events] == ["quiet", "burst"]
+
+
+async def test_loop_flushes_lone_dm_on_short_window(tmp_path: Path):
+    provider = MagicMock()
+    provider.get_default_model.return_value = "test-model"
+    bus = MessageBus()
+    loop = AgentLoop(bus=bus, provider=provider, workspace=tmp_path)
+    loop._debouncer.dm_window = 0.05
+    flushed: list[str] = []
+
+    with patch.object(loop, "_initialize_ene_modules"), \
+            patch.object(loop, "_idle_watcher"), patch.object(loop, "_daily_trigger"), \
+            patch.object(loop, "_enqueue_batch", side_effect=lambda key, trigger="timer": flushed.append(trigger)):
+        task = asyncio.create_task(loop.run())
+        await bus.publish_inbound(InboundMessage(
+            channel="discord", sender_id="1", chat_id="dm", content="hey", metadata={},
+        ))
+        await asyncio.sleep(0.3)  # Far below the 3.5s fixed window
+        loop.stop()
+        await asyncio.wait_for(task, 1.0)
+
+    assert flushed == ["timer"]
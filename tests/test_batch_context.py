@@ -0,0 +1,119 @@
+"""Tests for per-batch execution context isolation."""
+
+import asyncio
+
+import pytest
+
+from nanobot.agent.batch_context import BatchContext, bind_batch, current_batch
+from nanobot.agent.tools.message import MessageTool
+from nanobot.bus.events import InboundMessage, OutboundMessage
+from nanobot.ene import EneContext, EneModule, ModuleRegistry
+
+
+class StubModule(EneModule):
+    """Minimal module with a configurable name."""
+
+    def __init__(self, module_name: str):
+        self._name = module_name
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    async def initialize(self, ctx: EneContext) -> None:
+        pass
+
+    def get_tools(self) -> list:
+        return []
+
+
+def _msg(sender: str = "42", channel: str = "discord", chat_id: str = "room") -> InboundMessage:
+    return InboundMessage(
+        channel=channel, sender_id=sender, chat_id=chat_id,
+        content="hi", metadata={"author_name": f"user{sender}"},
+    )
+
+
+class TestBatchContext:
+    def test_bind_message_sets_sender(self):
+        batch = BatchContext(channel_key="discord:room")
+        batch.last_message_content = "stale"
+        batch.bind_message(_msg("42"))
+
+        assert batch.caller_id == "discord:42"
+        assert batch.platform_id == "discord:42"
+        assert batch.sender_metadata["author_name"] == "user42"
+        assert batch.last_message_content is None
+
+    def test_empty_platform_id(self):
+        assert BatchContext().platform_id == ""
+
+    @pytest.mark.asyncio
+    async def test_binding_is_task_scoped(self):
+        seen: dict[str, str | None] = {}
+
+        async def worker(key: str) -> None:
+            bind_batch(BatchContext(channel_key=key))
+            await asyncio.sleep(0)
+            seen[key] = current_batch().channel_key
+
+        await asyncio.gather(worker("a"), worker("b"))
+        assert seen == {"a": "a", "b": "b"}
+        assert current_batch() is None
+
+
+class TestMessageToolIsolation:
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_keep_own_target(self):
+        sent: list[OutboundMessage] = []
+
+        async def capture(msg: OutboundMessage) -> None:
+            sent.append(msg)
+
+        tool = MessageTool(send_callback=capture)
+
+        async def worker(chat_id: str) -> None:
+            tool.set_context("discord", chat_id)
+            await asyncio.sleep(0)  # Let the other task overwrite if state were shared
+            await tool.execute(content=f"to {chat_id}")
+
+        await asyncio.gather(worker("one"), worker("two"))
+        assert {(m.chat_id, m.content) for m in sent} == {
+            ("one", "to one"), ("two", "to two"),
+        }
+
+
+class TestRegistryBatchContext:
+    def test_batch_overrides_shared_sender(self):
+        registry = ModuleRegistry()
+        received: list[str] = []
+
+        class Recorder(StubModule):
+            def get_context_block_for_message(self, message: str, sender=None) -> str | None:
+                received.append(sender.platform_id)
+                return None
+
+        registry.register(Recorder("rec"))
+        registry.set_current_sender("1", "discord", {})
+
+        batch = BatchContext()
+        batch.bind_message(_msg("99"))
+        registry.get_all_dynamic_context("hello", batch=batch)
+
+        assert received == ["discord:99"]
+
+    def test_batch_scene_participants(self):
+        registry = ModuleRegistry()
+
+        class FakeSocial(StubModule):
+            def get_scene_context(self, primary_id: str, participant_ids: list[str]) -> str:
+                return f"## Scene {primary_id} {len(participant_ids)}"
+
+        registry.register(FakeSocial("social"))
+        batch = BatchContext(scene_participant_ids=["discord:1", "discord:2"])
+        batch.bind_message(_msg("1"))
+
+        result = registry.get_all_dynamic_context("hello", batch=batch)
+        assert "## Scene discord:1 2" in result
+        # Shared registry state untouched
+        assert "## Scene" not in registry.get_all_dynamic_context("hello")
@@ -0,0 +1,131 @@
+"""Tests for per-component context-build profiling."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from nanobot.agent.context import ContextBuilder
+from nanobot.agent.context_profile import ContextProfile
+from nanobot.ene import EneContext, EneModule, ModuleRegistry
+from nanobot.ene.context_packer import ContextFragment
+from nanobot.ene.observatory.module_metrics import ModuleMetrics
+from nanobot.ene.observatory.store import MetricsStore
+from nanobot.session.manager import Session
+from nanobot.session.tokens import count_tokens_cached
+
+
+class MemoryStub(EneModule):
+    @property
+    def name(self) -> str:
+        return "memory"
+
+    async def initialize(self, ctx: EneContext) -> None:
+        pass
+
+    def get_tools(self) -> list:
+        return []
+
+    def get_context_block(self) -> str | None:
+        return "core memory " * 50
+
+    def get_context_block_for_message(self, message: str, sender=None) -> str | None:
+        return "retrieved memory " * 10
+
+
+class SplitMemoryStub(MemoryStub):
+    """Emits fragments with their own sources, like the real memory module."""
+
+    def get_context_fragments(self) -> list[ContextFragment]:
+        return [
+            ContextFragment("core memory " * 50, priority=90, source="memory:core"),
+            ContextFragment("diary " * 20, priority=30, source="memory:diary"),
+        ]
+
+    def get_context_fragments_for_message(self, message: str, sender=None) -> list[ContextFragment]:
+        return [ContextFragment("retrieved memory " * 10, source="memory:recall")]
+
+
+def make_builder(tmp_path: Path) -> tuple[ContextBuilder, MetricsStore]:
+    store = MetricsStore(tmp_path / "metrics.db")
+    registry = ModuleRegistry()
+    registry.register(MemoryStub())
+    builder = ContextBuilder(tmp_path, module_registry=registry, stable_prefix=True)
+    builder.set_metrics(ModuleMetrics("context", store))
+    return builder, store
+
+
+class TestContextProfile:
+    def test_measure_attributes_time_and_tokens(self):
+        profile = ContextProfile()
+        assert profile.measure("identity", lambda: "word " * 40) == "word " * 40
+        profile.add_messages("history", [{"role": "user", "content": "hi", "tokens": 7}])
+
+        event = profile.as_event()
+        assert event["components"]["history"]["tokens"] == 7
+        assert event["components"]["identity"]["tokens"] > 0
+        assert event["total_tokens"] == 7 + event["components"]["identity"]["tokens"]
+
+    def test_build_records_components(self, tmp_path):
+        builder, store = make_builder(tmp_path)
+        history = [{"role": "user", "content": "earlier message"}]
+        builder.build_messages(history, "hello", channel="discord", chat_id="room")
+
+        events = store.get_module_events("context")
+        assert len(events) == 1
+        components = events[0]["data"]["components"]
+        assert {"identity", "skills", "memory", "memory:message", "history", "message"} <= components.keys()
+        assert events[0]["channel_key"] == "discord:room"
+
+    def test_history_attributed_from_stored_counts(self, tmp_path):
+        builder, store = make_builder(tmp_path)
+        session = Session(key="discord:room")
+        for i in range(6):
+            session.add_message("user", f"message {i} " + "word " * 20)
+        history = session.get_hybrid_history(summary="earlier talk", token_budget=80)
+        stored = [m["tokens"] for m in session.messages]
+
+        summary_tokens = count_tokens_cached(history[0]["content"])
+        with patch("nanobot.session.manager.count_tokens", side_effect=AssertionError):
+            tokens = session.history_tokens(history)
+        assert tokens == summary_tokens + sum(stored[-(len(history) - 1):])
+
+        with patch("nanobot.agent.context_profile.message_tokens", side_effect=AssertionError):
+            builder.build_messages(history, "hello", channel="discord", chat_id="room", history_tokens=tokens)
+        components = store.get_module_events("context")[0]["data"]["components"]
+        assert components["history"]["tokens"] == tokens
+
+    async def test_time_and_tokens_share_component_keys(self):
+        registry = ModuleRegistry()
+        registry.register(SplitMemoryStub())
+        profile = ContextProfile()
+        registry.get_all_context_blocks(profile)
+        registry.get_all_dynamic_context("hello", profile=profile)
+        await registry.gather_dynamic_context("hello", profile=profile)
+
+        components = profile.as_event()["components"]
+        assert set(components) == {"memory", "memory:message"}
+        assert components["memory"]["tokens"] == (
+            count_tokens_cached("core memory " * 50) + count_tokens_cached("diary " * 20)
+        )
+        assert components["memory:message"]["tokens"] == 2 * count_tokens_cached("retrieved memory " * 10)
+
+    def test_no_profiling_without_metrics(self, tmp_path):
+        builder = ContextBuilder(tmp_path)
+        builder.build_messages([], "hello")  # NullContextProfile path
+
+
+class TestContextBuildStats:
+    def test_breakdown_and_top_consumers(self, tmp_path):
+        builder, store = make_builder(tmp_path)
+        for _ in range(3):
+            builder.build_messages([], "hello", channel="discord", chat_id="room")
+
+        stats = store.get_context_build_stats(24)
+        assert stats["builds"] == 3
+        by_name = {c["component"]: c for c in stats["components"]}
+        assert by_name["memory"]["builds"] == 3
+        assert by_name["memory"]["avg_tokens"] > by_name["message"]["avg_tokens"]
+        assert abs(sum(c["token_share"] for c in stats["components"]) - 1) < 0.01
+
+        top = store.get_top_context_consumers(24, limit=2)
+        assert len(top) == 2
+        assert top[0]["total_tokens"] >= top[1]["total_tokens"]
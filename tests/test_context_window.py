@@ -12,6 +12,7 @@ import pytest
 import re
 
 from nanobot.session.manager import Session
+from nanobot.session.tokens import count_tokens
 
 
 # ============================================================
@@ -255,6 +256,30 @@ class TestHybridHistory:
         assert history[-1]["content"] == "Assistant response 49"
         assert history[0]["content"] == "User message 45"
 
+    def test_token_budget_selects_newest_that_fit(self):
+        session = self._make_session(50)
+        per_message = session.messages[-1]["tokens"]
+        history = session.get_hybrid_history(token_budget=per_message * 4 + 1)
+        assert history[-1]["content"] == "Assistant response 49"
+        assert sum(session.messages[-len(history) + i]["tokens"] for i in range(len(history))) \
+            <= per_message * 4 + 1
+        assert 2 <= len(history) <= 5
+
+    def test_token_budget_keeps_oversized_newest_message(self):
+        session = Session(key="test:hybrid")
+        session.add_message("user", "short")
+        session.add_message("user", "long " * 500)
+        history = session.get_hybrid_history(token_budget=10)
+        assert len(history) == 1
+        assert history[0]["content"].startswith("long")
+
+    def test_unsummarized_messages_kept_verbatim(self):
+        """Messages the summary doesn't cover yet stay in history verbatim."""
+        session = self._make_session(50)
+        history = session.get_hybrid_history(recent_count=10, summary="Old.", summary_covers=80)
+        assert len(history) == 1 + 20
+        assert history[1]["content"] == "User message 40"
+
     def test_empty_session(self):
         """Empty session should return empty list."""
         session = Session(key="test:empty")
@@ -283,24 +308,37 @@ class TestTokenEstimation:
 
     def test_short_messages(self):
         session = Session(key="test:tokens")
-        session.add_message("user", "Hello")  # 5 chars = ~1 token
-        session.add_message("assistant", "Hi there")  # 8 chars = ~2 tokens
-        tokens = session.estimate_tokens()
-        # 13 chars // 4 = 3
-        assert tokens == 3
+        session.add_message("user", "Hello")  # 1 token
+        session.add_message("assistant", "Hi there")  # 2 tokens
+        assert session.estimate_tokens() == 3
 
     def test_longer_messages(self):
         session = Session(key="test:tokens")
-        # 400 chars = ~100 tokens
         session.add_message("user", "a" * 400)
-        assert session.estimate_tokens() == 100
+        assert session.estimate_tokens() == count_tokens("a" * 400)
 
     def test_multiple_messages(self):
         session = Session(key="test:tokens")
         for _ in range(10):
-            session.add_message("user", "a" * 40)  # 40 chars each
-        # 400 total chars // 4 = 100 tokens
-        assert session.estimate_tokens() == 100
+            session.add_message("user", "a" * 40)
+        assert session.estimate_tokens() == 10 * count_tokens("a" * 40)
+
+    def test_count_is_cached_on_message(self):
+        session = Session(key="test:tokens")
+        session.add_message("user", "héllo 😀 こんにちは")
+        assert session.messages[0]["tokens"] == count_tokens("héllo 😀 こんにちは")
+
+    def test_non_latin_text_counts_more_than_chars_heuristic(self):
+        session = Session(key="test:tokens")
+        text = "こんにちは世界" * 20
+        session.add_message("user", text)
+        assert session.estimate_tokens() > len(text) // 4
+
+    def test_direct_append_without_cached_count(self):
+        """Messages appended directly (rotation summaries) are tokenized on fold."""
+        session = Session(key="test:tokens")
+        session.messages.append({"role": "user", "content": "Hello"})
+        assert session.estimate_tokens() == 1
 
     def test_empty_content(self):
         session = Session(key="test:tokens")
@@ -344,6 +382,35 @@ class TestRespondedCount:
         assert session.get_responded_count() == 10
 
 
+class TestSessionCounters:
+    """Running counters must survive direct edits to session.messages."""
+
+    def test_direct_append_is_counted(self):
+        session = Session(key="test:counters")
+        session.add_message("user", "a" * 8)
+        session.messages.append({"role": "assistant", "content": "b" * 8})
+        assert session.get_responded_count() == 1
+        assert session.counters.chars == 16
+
+    def test_clear_and_refill_recounts(self):
+        """Auto-rotation clears the list in place and appends a summary."""
+        session = Session(key="test:counters")
+        for i in range(4):
+            session.add_message("assistant", "x" * 40)
+        assert session.counters.chars == 160
+        session.messages.clear()
+        session.messages.append({"role": "user", "content": "y" * 8})
+        assert session.get_responded_count() == 0
+        assert session.counters.chars == 8
+
+    def test_replaced_list_recounts(self):
+        session = Session(key="test:counters")
+        session.add_message("assistant", "x")
+        session.messages = [{"role": "user", "content": "abcd"}]
+        assert session.role_count("user") == 1
+        assert session.get_responded_count() == 0
+
+
 # ============================================================
 # Re-anchoring Trigger Tests
 # ============================================================
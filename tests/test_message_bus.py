@@ -0,0 +1,247 @@
+"""Tests for the message bus: priority lanes, fairness, bounds, outbound fan-out."""
+
+import asyncio
+
+import pytest
+
+from nanobot.bus.events import InboundMessage, OutboundMessage
+from nanobot.bus.fair_queue import FairQueue, Lane, QueueClosedError
+from nanobot.bus.queue import ChannelFanout, MessageBus, inbound_lane
+
+
+def _msg(chat: str, text: str, sender: str = "u1", channel: str = "discord",
+         guild: str | None = "g") -> InboundMessage:
+    meta = {"guild_id": guild} if guild else {}
+    return InboundMessage(channel=channel, sender_id=sender, chat_id=chat, content=text, metadata=meta)
+
+
+async def _drain(queue: FairQueue) -> list:
+    return [await queue.get() for _ in range(queue.qsize())]
+
+
+class TestFairQueue:
+    async def test_default_is_fifo(self):
+        q: FairQueue[int] = FairQueue()
+        for i in range(5):
+            await q.put(i)
+        assert await _drain(q) == [0, 1, 2, 3, 4]
+
+    async def test_round_robin_across_keys(self):
+        q: FairQueue[str] = FairQueue(key_of=lambda s: s[0])
+        for item in ["a1", "a2", "a3", "b1", "c1", "b2"]:
+            await q.put(item)
+        assert await _drain(q) == ["a1", "b1", "c1", "a2", "b2", "a3"]
+
+    async def test_lanes_served_most_urgent_first(self):
+        q: FairQueue[tuple[int, str]] = FairQueue(lane_of=lambda x: x[0])
+        for item in [(Lane.GROUP, "g"), (Lane.DIRECT, "d"), (Lane.SYSTEM, "s")]:
+            await q.put(item)
+        assert [x[1] for x in await _drain(q)] == ["s", "d", "g"]
+
+    async def test_drop_oldest_evicts_noisiest_low_priority_key(self):
+        q: FairQueue[str] = FairQueue(
+            maxsize=4, overflow="drop_oldest",
+            lane_of=lambda s: Lane.DIRECT if s.startswith("dm") else Lane.GROUP,
+            key_of=lambda s: s.split("-")[0],
+        )
+        for item in ["raid-1", "raid-2", "raid-3", "dm-1", "quiet-1"]:
+            assert await q.put(item)
+
+        items = await _drain(q)
+        assert "raid-1" not in items
+        assert set(items) == {"raid-2", "raid-3", "dm-1", "quiet-1"}
+        assert q.dropped == 1
+
+    async def test_drop_oldest_never_evicts_more_urgent_lanes(self):
+        q: FairQueue[tuple[int, str]] = FairQueue(maxsize=2, overflow="drop_oldest", lane_of=lambda x: x[0])
+        assert await q.put((Lane.SYSTEM, "cron"))
+        assert await q.put((Lane.PRIORITY, "dad"))
+        assert not await q.put((Lane.GROUP, "raid"))  # Rejected, nothing evicted
+        assert await q.put((Lane.SYSTEM, "cron-2"))  # Evicts the less urgent "dad"
+
+        assert [x[1] for x in await _drain(q)] == ["cron", "cron-2"]
+        assert q.dropped == 2
+
+    async def test_drop_newest_rejects(self):
+        q: FairQueue[int] = FairQueue(maxsize=1, overflow="drop_newest")
+        assert await q.put(1)
+        assert not await q.put(2)
+        assert await _drain(q) == [1]
+
+    async def test_block_waits_for_space(self):
+        q: FairQueue[int] = FairQueue(maxsize=1)
+        await q.put(1)
+        pending = asyncio.create_task(q.put(2))
+        await asyncio.sleep(0.01)
+        assert not pending.done()
+
+        assert await q.get() == 1
+        await asyncio.wait_for(pending, 1.0)
+        assert await q.get() == 2
+
+    async def test_close_wakes_idle_consumer(self):
+        q: FairQueue[int] = FairQueue()
+        seen: list[int] = []
+
+        async def consume() -> None:
+            async for item in q:
+                seen.append(item)
+
+        task = asyncio.create_task(consume())
+        await q.put(1)
+        await asyncio.sleep(0)
+        q.close()
+        await asyncio.wait_for(task, 0.1)  # No polling interval to wait out
+        assert seen == [1]
+
+    async def test_close_drains_then_stops(self):
+        q: FairQueue[int] = FairQueue()
+        await q.put(1)
+        await q.put(2)
+        q.close()
+        assert not await q.put(3)
+        assert [item async for item in q] == [1, 2]
+        with pytest.raises(QueueClosedError):
+            await q.get()
+
+    async def test_close_releases_blocked_producer(self):
+        q: FairQueue[int] = FairQueue(maxsize=1)
+        await q.put(1)
+        pending = asyncio.create_task(q.put(2))
+        await asyncio.sleep(0)
+        q.close()
+        assert await asyncio.wait_for(pending, 0.1) is False
+
+    async def test_cancelled_getter_passes_wakeup_on(self):
+        q: FairQueue[int] = FairQueue()
+        first = asyncio.create_task(q.get())
+        second = asyncio.create_task(q.get())
+        await asyncio.sleep(0)
+        await q.put(1)
+        first.cancel()
+        assert await asyncio.wait_for(second, 0.1) == 1
+
+    def test_unknown_policy_rejected(self):
+        with pytest.raises(ValueError):
+            FairQueue(overflow="explode")  # type: ignore[arg-type]
+
+
+class TestMessageBusLanes:
+    def test_lane_classification(self):
+        dad = {"discord:dad"}
+        assert inbound_lane(_msg("c", "x", channel="system"), dad) == Lane.SYSTEM
+        assert inbound_lane(_msg("c", "x", sender="dad"), dad) == Lane.PRIORITY
+        assert inbound_lane(_msg("c", "x", guild=None), dad) == Lane.DIRECT
+        assert inbound_lane(_msg("c", "x"), dad) == Lane.GROUP
+        tg_private = InboundMessage(
+            channel="telegram", sender_id="1", chat_id="1", content="x",
+            metadata={"is_group": False},
+        )
+        assert inbound_lane(tg_private, dad) == Lane.DIRECT
+
+    async def test_fair_bus_interleaves_chats(self):
+        bus = MessageBus(fair=True, priority_senders={"discord:dad"})
+        for i in range(3):
+            await bus.publish_inbound(_msg("noisy", f"n{i}"))
+        await bus.publish_inbound(_msg("calm", "c0"))
+        await bus.publish_inbound(_msg("calm", "from dad", sender="dad"))
+
+        order = [(await bus.consume_inbound()).content for _ in range(5)]
+        assert order == ["from dad", "n0", "c0", "n1", "n2"]
+
+
+class TestBusClose:
+    async def test_dispatcher_returns_on_close_after_delivering(self):
+        bus = MessageBus()
+        sent: list[str] = []
+
+        async def on_send(msg: OutboundMessage) -> None:
+            sent.append(msg.content)
+
+        bus.subscribe_outbound("discord", on_send)
+        task = asyncio.create_task(bus.dispatch_outbound())
+        await bus.publish_outbound(OutboundMessage(channel="discord", chat_id="c", content="bye"))
+        bus.close()
+
+        await asyncio.wait_for(task, 0.5)
+        assert sent == ["bye"]
+
+    async def test_agent_loop_run_exits_on_stop(self, tmp_path):
+        from unittest.mock import MagicMock, patch
+
+        from nanobot.agent.loop import AgentLoop
+
+        provider = MagicMock()
+        provider.get_default_model.return_value = "test-model"
+        loop = AgentLoop(bus=MessageBus(), provider=provider, workspace=tmp_path)
+        with patch.object(loop, "_initialize_ene_modules"), \
+                patch.object(loop, "_idle_watcher"), patch.object(loop, "_daily_trigger"):
+            task = asyncio.create_task(loop.run())
+            await asyncio.sleep(0.01)
+            loop.stop()
+            await asyncio.wait_for(task, 0.5)
+
+    async def test_publish_after_close_is_dropped(self):
+        bus = MessageBus()
+        bus.close()
+        await bus.publish_inbound(_msg("c", "late"))
+        await bus.publish_outbound(OutboundMessage(channel="discord", chat_id="c", content="late"))
+        assert bus.closed
+        assert bus.inbound_size == 0 and bus.outbound_size == 0
+
+
+class TestChannelFanout:
+    async def test_slow_channel_does_not_block_others(self):
+        sent: list[str] = []
+        release = asyncio.Event()
+
+        async def send(msg: OutboundMessage) -> None:
+            if msg.channel == "discord":
+                await release.wait()  # Stuck in a rate-limit backoff
+            sent.append(f"{msg.channel}:{msg.content}")
+
+        fanout = ChannelFanout(send)
+        await fanout.submit(OutboundMessage(channel="discord", chat_id="c", content="1"))
+        await fanout.submit(OutboundMessage(channel="discord", chat_id="c", content="2"))
+        await fanout.submit(OutboundMessage(channel="telegram", chat_id="c", content="1"))
+        await asyncio.sleep(0.01)
+        assert sent == ["telegram:1"]
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert sent == ["telegram:1", "discord:1", "discord:2"]  # Per-channel order kept
+        await fanout.close()
+
+    async def test_full_channel_queue_blocks_submit(self):
+        release = asyncio.Event()
+
+        async def send(msg: OutboundMessage) -> None:
+            await release.wait()
+
+        fanout = ChannelFanout(send, maxsize=2)
+        for i in range(3):  # One in flight, two queued
+            await fanout.submit(OutboundMessage(channel="discord", chat_id="c", content=str(i)))
+            await asyncio.sleep(0)
+
+        blocked = asyncio.create_task(
+            fanout.submit(OutboundMessage(channel="discord", chat_id="c", content="3"))
+        )
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        release.set()
+        await asyncio.wait_for(blocked, 1.0)
+        await fanout.close(drain_timeout=1.0)
+
+    async def test_close_drains_pending_sends(self):
+        sent: list[str] = []
+
+        async def send(msg: OutboundMessage) -> None:
+            await asyncio.sleep(0.01)
+            sent.append(msg.content)
+
+        fanout = ChannelFanout(send)
+        for i in range(3):
+            await fanout.submit(OutboundMessage(channel="discord", chat_id="c", content=str(i)))
+        await fanout.close(drain_timeout=1.0)
+        assert sent == ["0", "1", "2"]
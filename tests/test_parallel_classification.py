@@ -0,0 +1,151 @@
+"""Tests for concurrent daemon classification in AgentLoop._process_batch."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from nanobot.agent.loop import AgentLoop
+from nanobot.bus.events import InboundMessage
+from nanobot.bus.queue import MessageBus
+from nanobot.ene.daemon.models import Classification, DaemonResult
+
+
+def make_loop(tmp_path: Path) -> AgentLoop:
+    provider = MagicMock()
+    provider.get_default_model.return_value = "test-model"
+    return AgentLoop(bus=MessageBus(), provider=provider, workspace=tmp_path)
+
+
+def make_msg(i: int, content: str | None = None) -> InboundMessage:
+    return InboundMessage(
+        channel="discord", sender_id=f"user{i}", chat_id="room",
+        content=content or f"message {i}",
+        metadata={"author_name": f"User{i}", "guild_id": "g"},
+    )
+
+
+class FakeDaemon:
+    """Daemon stand-in: later messages finish first, tracks concurrency."""
+
+    def __init__(self, results: dict[str, Classification], fail: set[str] | None = None):
+        self._results = results
+        self._fail = fail or set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def process_message(self, content, sender_name, sender_id, is_dad,
+                              metadata=None, channel_state=None, recent_context=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            idx = int(content.split()[-1]) if content.split()[-1].isdigit() else 0
+            await asyncio.sleep(0.01 * (10 - idx))
+            if content in self._fail:
+                raise RuntimeError("model down")
+            return DaemonResult(
+                classification=self._results.get(content, Classification.CONTEXT),
+                confidence=0.9,
+                classification_reason=content,
+            )
+        finally:
+            self.in_flight -= 1
+
+
+class TestClassifyWithDaemon:
+    async def test_results_in_input_order(self, tmp_path):
+        loop = make_loop(tmp_path)
+        msgs = [make_msg(i) for i in range(6)]
+        daemon = FakeDaemon({})
+
+        results = await loop._classify_with_daemon(msgs, "discord:room", daemon)
+
+        assert [r.classification_reason for r in results] == [m.content for m in msgs]
+
+    async def test_concurrency_is_bounded(self, tmp_path):
+        loop = make_loop(tmp_path)
+        loop._daemon_concurrency = 3
+        daemon = FakeDaemon({})
+
+        await loop._classify_with_daemon(
+            [make_msg(i) for i in range(8)], "discord:room", daemon,
+        )
+
+        assert daemon.max_in_flight == 3
+
+    async def test_failure_returns_none(self, tmp_path):
+        loop = make_loop(tmp_path)
+        daemon = FakeDaemon({}, fail={"message 1"})
+
+        results = await loop._classify_with_daemon(
+            [make_msg(0), make_msg(1)], "discord:room", daemon,
+        )
+
+        assert results[0] is not None
+        assert results[1] is None
+
+    async def test_no_daemon(self, tmp_path):
+        loop = make_loop(tmp_path)
+        results = await loop._classify_with_daemon([make_msg(0)], "discord:room", None)
+        assert results == [None]
+
+
+class TestProcessBatchRules:
+    async def test_hard_override_and_order_preserved(self, tmp_path):
+        loop = make_loop(tmp_path)
+        daemon = FakeDaemon({"message 2": Classification.RESPOND})
+        loop.module_registry._modules["daemon"] = daemon
+        loop.module_registry._modules.pop("conversation_tracker", None)
+
+        captured: list[InboundMessage] = []
+        injected: list[str] = []
+
+        async def fake_process_message(msg, session_key=None, batch=None):
+            captured.append(msg)
+            injected.append(batch.daemon_result.classification_reason)
+            return None
+
+        loop._process_message = fake_process_message
+        msgs = [make_msg(0), make_msg(1, "hey ene 1"), make_msg(2)]
+
+        await loop._process_batch("discord:room", msgs)
+
+        assert len(captured) == 1
+        merged = captured[0].content
+        # Ene mention forced to RESPOND despite CONTEXT from the daemon
+        assert merged.index("hey ene") < merged.index("message 2")
+        assert all(m.metadata.get("_daemon_result") for m in msgs)
+        assert injected == ["message 2"]  # Last message in batch order, kept on the batch
+
+
+class TestBatchedDaemonMode:
+    async def test_uses_process_batch_when_enabled(self, tmp_path):
+        loop = make_loop(tmp_path)
+        daemon = FakeDaemon({})
+        daemon.batch_enabled = True
+        calls: list[int] = []
+
+        async def process_batch(requests, channel_state=None, recent_context=None):
+            calls.append(len(requests))
+            return [DaemonResult(classification_reason=r.content) for r in requests]
+
+        daemon.process_batch = process_batch
+        msgs = [make_msg(i) for i in range(3)]
+        results = await loop._classify_with_daemon(msgs, "discord:room", daemon)
+
+        assert calls == [3]
+        assert daemon.max_in_flight == 0  # No per-message calls
+        assert [r.classification_reason for r in results] == [m.content for m in msgs]
+
+    async def test_batch_failure_falls_back_per_message(self, tmp_path):
+        loop = make_loop(tmp_path)
+        daemon = FakeDaemon({})
+        daemon.batch_enabled = True
+
+        async def process_batch(requests, channel_state=None, recent_context=None):
+            raise RuntimeError("boom")
+
+        daemon.process_batch = process_batch
+        results = await loop._classify_with_daemon(
+            [make_msg(0), make_msg(1)], "discord:room", daemon,
+        )
+        assert all(r is not None for r in results)
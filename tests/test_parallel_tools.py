@@ -0,0 +1,164 @@
+"""Tests for concurrent execution of independent tool calls in one LLM turn."""
+
+import asyncio
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from nanobot.agent.batch_context import BatchContext
+from nanobot.agent.loop import AgentLoop
+from nanobot.agent.tools.base import Tool
+from nanobot.agent.tools.registry import ToolRegistry
+from nanobot.bus.queue import MessageBus
+from nanobot.providers.base import LLMResponse, ToolCallRequest
+
+
+class RecordingTool(Tool):
+    """Tool that sleeps, then records when it ran and how many overlapped."""
+
+    active = 0
+    peak = 0
+
+    def __init__(self, name: str, log: list[str], read_only: bool, delay: float = 0.02):
+        self._name = name
+        self._log = log
+        self._delay = delay
+        self.read_only = read_only
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> str:
+        return self._name
+
+    @property
+    def parameters(self) -> dict[str, Any]:
+        return {"type": "object", "properties": {"tag": {"type": "string"}}}
+
+    async def execute(self, **kwargs: Any) -> str:
+        RecordingTool.active += 1
+        RecordingTool.peak = max(RecordingTool.peak, RecordingTool.active)
+        try:
+            await asyncio.sleep(self._delay)
+            self._log.append(f"{self._name}:{kwargs.get('tag', '')}")
+            return f"{self._name} {kwargs.get('tag', '')}".strip()
+        finally:
+            RecordingTool.active -= 1
+
+
+def _call(i: int, name: str, **args: Any) -> ToolCallRequest:
+    return ToolCallRequest(id=f"call{i}", name=name, arguments=args)
+
+
+def make_loop(tmp_path: Path, responses: list[LLMResponse]) -> AgentLoop:
+    provider = MagicMock()
+    provider.get_default_model.return_value = "test-model"
+    provider.chat = AsyncMock(side_effect=responses)
+    return AgentLoop(bus=MessageBus(), provider=provider, workspace=tmp_path)
+
+
+def _tool_results(messages: list[dict]) -> list[str]:
+    return [m["content"] for m in messages if m.get("role") == "tool"]
+
+
+class TestRegistryReadOnly:
+    def test_unknown_and_default_tools_are_order_sensitive(self):
+        registry = ToolRegistry()
+        registry.register(RecordingTool("writer", [], read_only=False))
+        registry.register(RecordingTool("reader", [], read_only=True))
+
+        assert registry.is_read_only("reader")
+        assert not registry.is_read_only("writer")
+        assert not registry.is_read_only("missing")
+
+
+class TestGroupToolCalls:
+    def test_read_only_runs_grouped_writes_isolated(self, tmp_path):
+        loop = make_loop(tmp_path, [])
+        for name, ro in [("a", True), ("b", True), ("w", False)]:
+            loop.tools.register(RecordingTool(name, [], read_only=ro))
+
+        calls = [_call(0, "a"), _call(1, "b"), _call(2, "w"), _call(3, "a"), _call(4, "w")]
+        groups = loop._group_tool_calls(calls)
+
+        assert [[c.id for c in g] for g in groups] == [
+            ["call0", "call1"], ["call2"], ["call3"], ["call4"],
+        ]
+
+
+class TestConcurrentToolExecution:
+    async def test_read_only_calls_overlap_and_keep_order(self, tmp_path):
+        log: list[str] = []
+        loop = make_loop(tmp_path, [
+            LLMResponse(content=None, tool_calls=[
+                _call(0, "slow", tag="0"), _call(1, "fast", tag="1"),
+            ]),
+            LLMResponse(content="done"),
+        ])
+        loop.tools.register(RecordingTool("slow", log, read_only=True, delay=0.05))
+        loop.tools.register(RecordingTool("fast", log, read_only=True, delay=0.0))
+        RecordingTool.peak = 0
+
+        batch = BatchContext(caller_id="discord:1")
+        messages = [{"role": "user", "content": "hi"}]
+        content, tools_used = await loop._run_agent_loop(messages, batch=batch)
+
+        assert content == "done"
+        assert tools_used == ["slow", "fast"]
+        assert RecordingTool.peak == 2
+        assert log == ["fast:1", "slow:0"]  # Finished out of order...
+        sent = loop.provider.chat.call_args_list[1].kwargs["messages"]
+        assert _tool_results(sent) == ["slow 0", "fast 1"]  # ...appended in order
+
+    async def test_order_sensitive_calls_run_sequentially(self, tmp_path):
+        log: list[str] = []
+        loop = make_loop(tmp_path, [
+            LLMResponse(content=None, tool_calls=[
+                _call(0, "w", tag="0"), _call(1, "w", tag="1"),
+            ]),
+            LLMResponse(content="done"),
+        ])
+        loop.tools.register(RecordingTool("w", log, read_only=False))
+        RecordingTool.peak = 0
+
+        await loop._run_agent_loop(
+            [{"role": "user", "content": "hi"}], batch=BatchContext(caller_id="discord:1"),
+        )
+
+        assert RecordingTool.peak == 1
+        assert log == ["w:0", "w:1"]
+
+    async def test_duplicate_message_guard_holds(self, tmp_path):
+        log: list[str] = []
+        loop = make_loop(tmp_path, [
+            LLMResponse(content=None, tool_calls=[
+                _call(0, "message", tag="a"), _call(1, "message", tag="b"),
+            ]),
+            LLMResponse(content="done"),
+        ])
+        loop.tools.register(RecordingTool("message", log, read_only=False))
+
+        await loop._run_agent_loop(
+            [{"role": "user", "content": "hi"}], batch=BatchContext(caller_id="discord:1"),
+        )
+
+        assert log == ["message:a"]
+
+    async def test_restricted_tool_denied_in_parallel_group(self, tmp_path):
+        log: list[str] = []
+        loop = make_loop(tmp_path, [
+            LLMResponse(content=None, tool_calls=[
+                _call(0, "read_file", path="x"), _call(1, "lookup", tag="1"),
+            ]),
+            LLMResponse(content="done"),
+        ])
+        loop.tools.register(RecordingTool("lookup", log, read_only=True))
+
+        await loop._run_agent_loop(
+            [{"role": "user", "content": "hi"}], batch=BatchContext(caller_id="discord:1"),
+        )
+
+        sent = loop.provider.chat.call_args_list[1].kwargs["messages"]
+        assert _tool_results(sent) == ["Access denied.", "lookup 1"]
@@ -0,0 +1,95 @@
+"""Tests for memoized system prompt assembly."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from nanobot.agent.context import ContextBuilder
+from nanobot.ene import EneContext, EneModule, ModuleRegistry
+
+
+class VersionedModule(EneModule):
+    """Module whose context block carries a version."""
+
+    def __init__(self):
+        self.version = 1
+        self.renders = 0
+
+    @property
+    def name(self) -> str:
+        return "versioned"
+
+    async def initialize(self, ctx: EneContext) -> None:
+        pass
+
+    def get_tools(self) -> list:
+        return []
+
+    def get_context_block(self) -> str | None:
+        self.renders += 1
+        return f"[block v{self.version}]"
+
+    def context_version(self):
+        return self.version
+
+
+class TestComponentCache:
+    def test_bootstrap_reread_only_when_file_changes(self, tmp_path: Path):
+        soul = tmp_path / "SOUL.md"
+        soul.write_text("first", encoding="utf-8")
+        builder = ContextBuilder(tmp_path)
+
+        with patch.object(ContextBuilder, "_read_bootstrap_files", wraps=builder._read_bootstrap_files) as read:
+            assert "first" in builder._load_bootstrap_files()
+            builder._load_bootstrap_files()
+            assert read.call_count == 1
+
+            soul.write_text("second, longer", encoding="utf-8")
+            assert "second, longer" in builder._load_bootstrap_files()
+            assert read.call_count == 2
+
+    def test_system_prompt_reused_between_calls(self, tmp_path: Path):
+        builder = ContextBuilder(tmp_path, stable_prefix=True)
+        first = builder.build_system_prompt()
+        assert builder.build_system_prompt() is first
+
+        (tmp_path / "AGENTS.md").write_text("new rules", encoding="utf-8")
+        assert "new rules" in builder.build_system_prompt()
+
+    def test_skills_rebuilt_when_skill_file_changes(self, tmp_path: Path):
+        skill = tmp_path / "skills" / "demo" / "SKILL.md"
+        skill.parent.mkdir(parents=True)
+        skill.write_text("---\ndescription: old description\n---\nbody", encoding="utf-8")
+        builder = ContextBuilder(tmp_path)
+        builder.skills.poll_interval = 0
+        assert "old description" in builder.build_system_prompt()
+
+        skill.write_text("---\ndescription: new description\n---\nbody", encoding="utf-8")
+        stat = skill.stat()
+        os.utime(skill, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert "new description" in builder.build_system_prompt()
+
+
+class TestModuleBlockCache:
+    def test_rendered_only_when_version_changes(self):
+        registry = ModuleRegistry()
+        module = VersionedModule()
+        registry.register(module)
+
+        assert registry.get_all_context_blocks() == "[block v1]"
+        registry.get_all_context_blocks()
+        assert module.renders == 1
+
+        module.version = 2
+        assert registry.get_all_context_blocks() == "[block v2]"
+        assert module.renders == 2
+
+    def test_unversioned_modules_render_every_time(self):
+        registry = ModuleRegistry()
+        module = VersionedModule()
+        module.context_version = lambda: None
+        registry.register(module)
+
+        registry.get_all_context_blocks()
+        registry.get_all_context_blocks()
+        assert module.renders == 2
@@ -0,0 +1,153 @@
+"""Tests for the cache-friendly prompt layout and prompt-cache accounting."""
+
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from nanobot.agent.context import ContextBuilder
+from nanobot.ene.observatory.store import LLMCallRecord, MetricsStore
+from nanobot.providers.litellm_provider import LiteLLMProvider, _usage_dict, apply_cache_control
+
+
+def _build(builder: ContextBuilder, text: str) -> list[dict]:
+    history = [{"role": "user", "content": "earlier"}, {"role": "assistant", "content": "reply"}]
+    return builder.build_messages(history, text, channel="discord", chat_id="room")
+
+
+class TestStablePrefixLayout:
+    def test_system_prompt_identical_across_calls(self, tmp_path: Path):
+        builder = ContextBuilder(tmp_path, stable_prefix=True)
+        with patch.object(ContextBuilder, "_current_time", return_value=("2026-01-01 10:00 (Thursday)", "UTC")):
+            first = _build(builder, "hello")
+        with patch.object(ContextBuilder, "_current_time", return_value=("2026-01-01 10:07 (Thursday)", "UTC")):
+            second = _build(builder, "hello again")
+
+        assert first[:-1] == second[:-1]
+        assert "10:00" not in first[0]["content"]
+        assert [m["role"] for m in first] == ["system", "user", "assistant", "user"]
+        assert first[-1]["content"].startswith("# Current Context")
+        assert "10:00" in first[-1]["content"] and "Chat ID: room" in first[-1]["content"]
+        assert first[-1]["content"].endswith("# Current Message\n\nhello")
+        assert "10:07" in second[-1]["content"]
+
+    def test_reanchor_joins_current_context(self, tmp_path: Path):
+        builder = ContextBuilder(tmp_path, stable_prefix=True)
+        history = [{"role": "user", "content": "earlier"}]
+        messages = builder.build_messages(history, "hello", reanchor="Stay Ene.")
+
+        assert [m["role"] for m in messages] == ["system", "user", "user"]
+        assert "Stay Ene." in messages[-1]["content"]
+
+    def test_late_context_joins_current_context(self, tmp_path: Path):
+        builder = ContextBuilder(tmp_path, stable_prefix=True)
+        messages = _build(builder, "hello")
+        builder.add_late_context(messages, "## Daemon notes")
+
+        assert [m["role"] for m in messages] == ["system", "user", "assistant", "user"]
+        section, message = messages[-1]["content"].split("# Current Message")
+        assert section.startswith("# Current Context") and "## Daemon notes" in section
+        assert message == "\n\nhello"
+
+        legacy = ContextBuilder(tmp_path)
+        messages = _build(legacy, "hello")
+        legacy.add_late_context(messages, "## Daemon notes")
+        assert messages[0]["content"].endswith("## Daemon notes")
+        assert messages[-1]["content"] == "hello"
+
+    def test_anthropic_system_field_stable(self, tmp_path: Path):
+        from litellm.llms.anthropic.chat.transformation import AnthropicConfig
+
+        builder = ContextBuilder(tmp_path, stable_prefix=True)
+        requests = []
+        for now, text in (("10:00", "hello"), ("10:07", "hello again")):
+            with patch.object(ContextBuilder, "_current_time", return_value=(f"2026-01-01 {now} (Thursday)", "UTC")):
+                messages = apply_cache_control(_build(builder, text))
+            requests.append(AnthropicConfig().transform_request(
+                "claude-sonnet-4-20250514", messages, {"max_tokens": 10}, {}, {},
+            ))
+
+        first, second = requests
+        assert first["system"] == second["system"]
+        assert first["messages"][:-1] == second["messages"][:-1]
+        assert "10:00" not in str(first["system"])
+        assert first["messages"][-1]["content"][0]["text"].startswith("# Current Context")  # Sent as user text
+
+    def test_legacy_layout_unchanged(self, tmp_path: Path):
+        messages = _build(ContextBuilder(tmp_path), "hello")
+        assert [m["role"] for m in messages] == ["system", "user", "assistant", "user"]
+        assert "Chat ID: room" in messages[0]["content"]
+
+
+class TestCacheControl:
+    def test_marks_system_prompt_and_history_tail(self):
+        messages = [
+            {"role": "system", "content": "stable"},
+            {"role": "user", "content": "earlier"},
+            {"role": "assistant", "content": "reply"},
+            {"role": "system", "content": "reanchor"},
+            {"role": "user", "content": "# Current Context"},
+        ]
+        marked = apply_cache_control(messages)
+
+        assert marked[0]["content"] == [
+            {"type": "text", "text": "stable", "cache_control": {"type": "ephemeral"}},
+        ]
+        assert marked[2]["content"][0]["cache_control"] == {"type": "ephemeral"}
+        assert all(isinstance(m["content"], str) for m in (marked[1], marked[3], marked[4]))
+        assert messages[0]["content"] == "stable"  # Input left untouched
+
+    def test_only_sent_to_models_that_need_it(self):
+        provider = LiteLLMProvider(api_key="k", default_model="anthropic/claude-sonnet-4")
+        messages = [{"role": "system", "content": "s"}, {"role": "user", "content": "u"}]
+        claude = provider._build_kwargs("anthropic/claude-sonnet-4", messages, None, 10, 0.5)
+        deepseek = provider._build_kwargs("deepseek/deepseek-chat", messages, None, 10, 0.5)
+
+        assert isinstance(claude["messages"][0]["content"], list)
+        assert deepseek["messages"] is messages
+
+
+class TestCachedTokenAccounting:
+    def test_usage_reads_cached_tokens(self):
+        usage = SimpleNamespace(
+            prompt_tokens=100, completion_tokens=5, total_tokens=105,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=80),
+        )
+        assert _usage_dict(usage)["cached_tokens"] == 80
+
+        bare = SimpleNamespace(prompt_tokens=100, completion_tokens=5, total_tokens=105)
+        assert "cached_tokens" not in _usage_dict(bare)
+
+    def test_hit_rate(self, tmp_path: Path):
+        store = MetricsStore(tmp_path / "metrics.db")
+        for cached in (0, 600, 900):
+            store.record_call(LLMCallRecord(
+                timestamp=datetime.now().isoformat(), call_type="response", model="m",
+                prompt_tokens=1000, completion_tokens=10, total_tokens=1010, cost_usd=0.0,
+                latency_ms=100, caller_id="system", cached_tokens=cached,
+            ))
+
+        stats = store.get_prompt_cache_stats(24)
+        assert stats["hits"] == 2
+        assert stats["hit_rate"] == 0.5
+        assert stats["by_model"]["m"]["cached_tokens"] == 1500
+        assert store.get_today_summary()["cache_hit_rate"] == 0.5
+
+    def test_migrates_existing_database(self, tmp_path: Path):
+        db = tmp_path / "metrics.db"
+        conn = sqlite3.connect(db)
+        conn.execute(
+            "CREATE TABLE llm_calls (id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL, "
+            "call_type TEXT NOT NULL, model TEXT NOT NULL, prompt_tokens INTEGER NOT NULL DEFAULT 0, "
+            "completion_tokens INTEGER NOT NULL DEFAULT 0, total_tokens INTEGER NOT NULL DEFAULT 0, "
+            "cost_usd REAL NOT NULL DEFAULT 0.0, latency_ms INTEGER NOT NULL DEFAULT 0, "
+            "caller_id TEXT NOT NULL DEFAULT 'system', session_key TEXT DEFAULT '', "
+            "tool_calls TEXT DEFAULT '[]', finish_reason TEXT DEFAULT 'stop', error TEXT, "
+            "experiment_id TEXT, variant_id TEXT)"
+        )
+        conn.commit()
+        conn.close()
+
+        store = MetricsStore(db)
+        assert store.get_prompt_cache_stats(24)["calls"] == 0
@@ -0,0 +1,124 @@
+"""Tests for persistent, incremental running summaries."""
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from nanobot.agent.loop import AgentLoop
+from nanobot.bus.queue import MessageBus
+from nanobot.session.manager import Session, SessionManager
+from nanobot.session.summary import SUMMARY_KEY, RunningSummary
+
+
+def make_loop(tmp_path: Path) -> AgentLoop:
+    provider = MagicMock()
+    provider.get_default_model.return_value = "test-model"
+    provider.chat = AsyncMock(side_effect=lambda **kw: SimpleNamespace(content=f"summary {provider.chat.await_count}"))
+    sessions = SessionManager(tmp_path, sessions_dir=tmp_path / "sessions")
+    loop = AgentLoop(bus=MessageBus(), provider=provider, workspace=tmp_path, session_manager=sessions)
+    loop._recent_history_tokens = 100
+    loop._summary_fold_tokens = 50
+    return loop
+
+
+def fill(session: Session, n: int, start: int = 0) -> None:
+    for i in range(start, start + n):
+        session.add_message("user", f"Alice (@alice): message {i} " + "word " * 10)
+
+
+def prompt_of(loop: AgentLoop) -> str:
+    return loop.provider.chat.await_args.kwargs["messages"][1]["content"]
+
+
+class TestRunningSummary:
+    def test_stale_after_rewrite(self):
+        session = Session(key="discord:room")
+        fill(session, 5)
+        RunningSummary.capture(session, 3, "text").store(session)
+        assert RunningSummary.load(session).covered == 3
+        session.clear()
+        fill(session, 5, start=10)
+        assert RunningSummary.load(session) is None
+
+    async def test_first_summary_inline_and_persisted(self, tmp_path):
+        loop = make_loop(tmp_path)
+        session = loop.sessions.get_or_create("discord:room")
+        fill(session, 20)
+
+        assert await loop._generate_running_summary(session, "discord:room") == "summary 1"
+        covered = session.metadata[SUMMARY_KEY]["covered"]
+        assert covered == session.recent_window_start(loop._recent_history_tokens)
+
+        # A restart reuses the stored summary instead of calling the LLM again
+        loop.sessions.flush_all()
+        restarted = make_loop(tmp_path)
+        reloaded = restarted.sessions.get_or_create("discord:room")
+        assert await restarted._generate_running_summary(reloaded, "discord:room") == "summary 1"
+        restarted.provider.chat.assert_not_awaited()
+
+    async def test_updates_fold_only_new_messages_in_background(self, tmp_path):
+        loop = make_loop(tmp_path)
+        session = loop.sessions.get_or_create("discord:room")
+        fill(session, 20)
+        await loop._generate_running_summary(session, "discord:room")
+        covered = RunningSummary.load(session).covered
+
+        fill(session, 1, start=20)  # Below the fold threshold: no call
+        assert await loop._generate_running_summary(session, "discord:room") == "summary 1"
+        assert not loop._summary_tasks
+
+        fill(session, 6, start=21)
+        # Stored summary returned at once, update runs in the background
+        assert await loop._generate_running_summary(session, "discord:room") == "summary 1"
+        await loop._summary_tasks["discord:room"]
+
+        assert RunningSummary.load(session).text == "summary 2"
+        prompt = prompt_of(loop)
+        assert "summary 1" in prompt
+        assert f"message {covered - 1} " not in prompt
+        assert f"message {covered} " in prompt
+
+    async def test_backlog_counts_messages_without_cached_tokens(self, tmp_path):
+        loop = make_loop(tmp_path)
+        session = loop.sessions.get_or_create("discord:room")
+        fill(session, 20)
+        await loop._generate_running_summary(session, "discord:room")
+
+        fill(session, 6, start=20)
+        for m in session.messages:  # As loaded from a file saved before per-message counts
+            m.pop("tokens", None)
+        await loop._generate_running_summary(session, "discord:room")
+
+        assert "discord:room" in loop._summary_tasks
+        await loop._summary_tasks["discord:room"]
+
+    async def test_force_waits_for_full_coverage(self, tmp_path):
+        loop = make_loop(tmp_path)
+        session = loop.sessions.get_or_create("discord:room")
+        fill(session, 20)
+        await loop._generate_running_summary(session, "discord:room")
+        fill(session, 10, start=20)
+
+        assert await loop._generate_running_summary(session, "discord:room", force=True) == "summary 2"
+        assert RunningSummary.load(session).covered == session.recent_window_start(100)
+
+    async def test_update_discarded_when_history_changes(self, tmp_path):
+        loop = make_loop(tmp_path)
+        release = asyncio.Event()
+
+        async def slow_chat(**kwargs):
+            await release.wait()
+            return SimpleNamespace(content="late summary")
+
+        loop.provider.chat = slow_chat
+        session = loop.sessions.get_or_create("discord:room")
+        fill(session, 20)
+        task = loop._schedule_summary(session, "discord:room")
+        await asyncio.sleep(0)
+        session.clear()
+        fill(session, 20, start=100)
+        release.set()
+        await task
+
+        assert RunningSummary.load(session) is None
@@ -0,0 +1,280 @@
+"""Tests for append-only session persistence."""
+
+import asyncio
+import multiprocessing as mp
+from pathlib import Path
+from unittest.mock import patch
+
+from nanobot.session import index as index_mod
+from nanobot.session.index import INDEX_FILENAME, SessionIndex
+from nanobot.session.manager import COMPACT_AFTER_DELTAS, SessionManager
+
+
+def _manager(tmp_path: Path) -> SessionManager:
+    return SessionManager(tmp_path, sessions_dir=tmp_path / "sessions")
+
+
+def _lines(manager: SessionManager, key: str) -> list[str]:
+    return manager._get_session_path(key).read_text(encoding="utf-8").splitlines()
+
+
+def _reload(manager: SessionManager, key: str):
+    manager.invalidate(key)
+    return manager.get_or_create(key)
+
+
+def _index_writer(path: Path, prefix: str, count: int) -> None:
+    """Worker process: record `count` sessions, compacting often."""
+    index_mod.COMPACT_MIN_LINES = 4
+    index_mod.COMPACT_FACTOR = 1
+    index = SessionIndex(path)
+    for i in range(count):
+        for _ in range(3):  # Stale records, so compactions keep happening
+            index.update({"key": f"{prefix}:{i}"})
+
+
+class TestAppendOnlySave:
+    def test_appends_only_new_messages(self, tmp_path):
+        manager = _manager(tmp_path)
+        session = manager.get_or_create("discord:1")
+        session.add_message("user", "one")
+        manager.save(session)
+        first = _lines(manager, "discord:1")
+
+        session.add_message("assistant", "two")
+        manager.save(session)
+        lines = _lines(manager, "discord:1")
+
+        assert lines[:len(first)] == first  # Existing records untouched
+        assert len(lines) == len(first) + 1
+        assert [m["content"] for m in _reload(manager, "discord:1").messages] == ["one", "two"]
+
+    def test_metadata_change_writes_delta_record(self, tmp_path):
+        manager = _manager(tmp_path)
+        session = manager.get_or_create("discord:1")
+        for i in range(3):
+            session.add_message("user", str(i))
+        manager.save(session)
+
+        session.last_consolidated = 2
+        session.metadata["topic"] = "cats"
+        manager.save(session)
+
+        assert '"_type": "meta_delta"' in _lines(manager, "discord:1")[-1]
+        loaded = _reload(manager, "discord:1")
+        assert loaded.last_consolidated == 2
+        assert loaded.metadata == {"topic": "cats"}
+
+    def test_clear_and_rotation_rewrite_file(self, tmp_path):
+        manager = _manager(tmp_path)
+        session = manager.get_or_create("discord:1")
+        for i in range(5):
+            session.add_message("user", str(i))
+        manager.save(session)
+
+        session.messages.clear()  # Rotation clears in place
+        session.messages.append({"role": "system", "content": "[summary]"})
+        manager.save(session)
+
+        assert len(_lines(manager, "discord:1")) == 2
+        assert [m["content"] for m in _reload(manager, "discord:1").messages] == ["[summary]"]
+        assert not list((tmp_path / "sessions").glob("*.tmp"))
+
+    def test_deltas_compacted(self, tmp_path):
+        manager = _manager(tmp_path)
+        session = manager.get_or_create("discord:1")
+        session.add_message("user", "hi")
+        manager.save(session)
+        for i in range(COMPACT_AFTER_DELTAS + 1):
+            session.metadata["n"] = i
+            manager.save(session)
+
+        assert len(_lines(manager, "discord:1")) < COMPACT_AFTER_DELTAS
+        assert _reload(manager, "discord:1").metadata == {"n": COMPACT_AFTER_DELTAS}
+
+    def test_torn_trailing_line_is_skipped_and_repaired(self, tmp_path):
+        manager = _manager(tmp_path)
+        session = manager.get_or_create("discord:1")
+        session.add_message("user", "kept")
+        manager.save(session)
+        with open(manager._get_session_path("discord:1"), "a", encoding="utf-8") as f:
+            f.write('{"role": "user", "cont')  # Crash mid-append
+
+        loaded = _reload(manager, "discord:1")
+        assert [m["content"] for m in loaded.messages] == ["kept"]
+
+        loaded.add_message("user", "next")
+        manager.save(loaded)
+        assert [m["content"] for m in _reload(manager, "discord:1").messages] == ["kept", "next"]
+
+
+class TestWriteBehind:
+    async def test_saves_coalesce_into_one_background_flush(self, tmp_path):
+        manager = SessionManager(tmp_path, sessions_dir=tmp_path / "sessions", flush_interval=0.05)
+        session = manager.get_or_create("discord:1")
+        for i in range(5):
+            session.add_message("user", f"m{i}")
+            manager.save(session)
+        path = manager._get_session_path("discord:1")
+        assert not path.exists() and manager.dirty_count == 1
+
+        await asyncio.sleep(0.2)
+        assert manager.dirty_count == 0
+        # One flush of a new session = one full write: metadata line + 5 messages
+        assert len(_lines(manager, "discord:1")) == 6
+
+    async def test_flush_all_writes_pending_sessions(self, tmp_path):
+        manager = SessionManager(tmp_path, sessions_dir=tmp_path / "sessions", flush_interval=60)
+        session = manager.get_or_create("discord:1")
+        session.add_message("user", "hi")
+        manager.save(session)
+        manager.flush_all()
+
+        fresh = SessionManager(tmp_path, sessions_dir=tmp_path / "sessions")
+        assert [m["content"] for m in fresh.get_or_create("discord:1").messages] == ["hi"]
+
+    async def test_invalidate_keeps_unflushed_session(self, tmp_path):
+        manager = SessionManager(tmp_path, sessions_dir=tmp_path / "sessions", flush_interval=60)
+        session = manager.get_or_create("discord:1")
+        session.add_message("user", "hi")
+        manager.save(session)
+        assert _reload(manager, "discord:1") is session
+        manager.flush_all()
+
+    def test_without_running_loop_saves_synchronously(self, tmp_path):
+        manager = SessionManager(tmp_path, sessions_dir=tmp_path / "sessions", flush_interval=60)
+        session = manager.get_or_create("discord:1")
+        session.add_message("user", "hi")
+        manager.save(session)
+        assert manager.dirty_count == 0
+        assert len(_lines(manager, "discord:1")) == 2
+
+
+class TestPersistedCounters:
+    def test_counters_survive_reload_and_fold_appends(self, tmp_path):
+        manager = _manager(tmp_path)
+        session = manager.get_or_create("discord:1")
+        session.add_message("user", "a" * 40)
+        session.add_message("assistant", "b" * 40)
+        manager.save(session)  # Full write: counters land in the metadata line
+        session.add_message("assistant", "c" * 40)
+        manager.save(session)  # Append: folded in on load
+
+        loaded = _reload(manager, "discord:1")
+        assert loaded is not session
+        assert loaded.get_responded_count() == 2
+        assert loaded.counters.chars == 120
+        assert loaded.estimate_tokens() == session.estimate_tokens()
+
+
+class TestSessionIndex:
+    def _save(self, manager: SessionManager, key: str, *contents: str) -> None:
+        session = manager.get_or_create(key)
+        for content in contents:
+            session.add_message("assistant", content)
+        manager.save(session)
+
+    def test_list_served_from_index_and_paginated(self, tmp_path):
+        manager = _manager(tmp_path)
+        for i in range(5):
+            self._save(manager, f"discord:{i}", "hi" * (i + 1))
+
+        listed = manager.list_sessions()
+        assert [s["key"] for s in listed] == [f"discord:{i}" for i in reversed(range(5))]
+        assert listed[0]["message_count"] == 1 and listed[0]["responded_count"] == 1
+        assert listed[0]["token_estimate"] == manager.get_or_create("discord:4").estimate_tokens()
+        assert [s["key"] for s in manager.list_sessions(limit=2, offset=1)] == ["discord:3", "discord:2"]
+        assert manager.count_sessions() == 5
+
+        # Listing doesn't touch session files
+        for path in (tmp_path / "sessions").glob("*.jsonl"):
+            path.unlink()
+        assert len(manager.list_sessions()) == 5
+
+    def test_index_seeded_from_existing_files(self, tmp_path):
+        manager = _manager(tmp_path)
+        self._save(manager, "discord:1", "a", "b")
+        (tmp_path / "sessions" / INDEX_FILENAME).unlink()
+
+        listed = _manager(tmp_path).list_sessions()
+        assert [(s["key"], s["message_count"]) for s in listed] == [("discord:1", 2)]
+
+    def test_sees_sessions_saved_by_another_manager(self, tmp_path):
+        """Sharded gateway workers share the sessions directory."""
+        front = _manager(tmp_path)
+        worker = _manager(tmp_path)
+        assert front.list_sessions() == []
+        self._save(worker, "discord:1", "from worker")
+        assert [s["key"] for s in front.list_sessions()] == ["discord:1"]
+
+    def test_concurrent_writers_keep_every_record(self, tmp_path):
+        """Compaction in one process must not drop another process's appends."""
+        path = tmp_path / INDEX_FILENAME
+        ctx = mp.get_context("spawn")
+        workers = [ctx.Process(target=_index_writer, args=(path, f"w{n}", 150)) for n in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(60)
+            assert worker.exitcode == 0
+
+        keys = {e["key"] for e in SessionIndex(path).entries()}
+        assert keys == {f"w{n}:{i}" for n in range(3) for i in range(150)}
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_cache_is_lru_bounded(self, tmp_path):
+        manager = SessionManager(tmp_path, sessions_dir=tmp_path / "sessions", max_cached=2)
+        for key in ("a:1", "b:1", "c:1"):
+            self._save(manager, key, "x")
+        manager.get_or_create("b:1")  # Touch: "c:1" becomes least recently used
+        manager.get_or_create("a:1")
+        assert list(manager._cache) == ["b:1", "a:1"]
+
+
+class TestSessionCache:
+    async def test_byte_bound_evicts_least_recently_used(self, tmp_path):
+        manager = SessionManager(
+            tmp_path, sessions_dir=tmp_path / "sessions", max_cached_bytes=10_000,
+        )
+        for key in ("a:1", "b:1", "c:1"):
+            session = manager.get_or_create(key)
+            session.add_message("user", "x" * 4_000)
+            manager.save(session)
+        assert list(manager._cache) == ["b:1", "c:1"]
+        stats = manager.cache_stats()
+        assert stats["evictions"] == 1 and stats["bytes"] <= 10_000
+
+    async def test_dirty_session_flushed_after_eviction(self, tmp_path):
+        manager = SessionManager(
+            tmp_path, sessions_dir=tmp_path / "sessions", flush_interval=60, max_cached=1,
+        )
+        session = manager.get_or_create("a:1")
+        session.add_message("user", "unsaved")
+        manager.save(session)
+        assert manager.dirty_count == 1
+
+        with patch.object(manager, "_write", wraps=manager._write) as write:
+            manager.get_or_create("b:1")  # Evicts "a:1"
+            assert write.call_count == 0  # Not written on the event loop
+            assert manager.read_messages("a:1") == session.messages
+
+            await asyncio.sleep(0)  # Flush starts without waiting flush_interval
+            await manager._flush_task
+        assert manager.dirty_count == 0
+        fresh = SessionManager(tmp_path, sessions_dir=tmp_path / "sessions")
+        assert [m["content"] for m in fresh.get_or_create("a:1").messages] == ["unsaved"]
+
+    def test_hit_and_miss_counters(self, tmp_path):
+        manager = _manager(tmp_path)
+        manager.get_or_create("a:1")
+        manager.get_or_create("a:1")
+        manager.get_or_create("b:1")
+        stats = manager.cache_stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 2)
+
+    def test_clear_cache_resets_accounting(self, tmp_path):
+        manager = _manager(tmp_path)
+        manager.get_or_create("a:1").add_message("user", "hi")
+        manager.clear_cache()
+        assert manager.cache_stats()["entries"] == 0
+        assert manager.cache_stats()["bytes"] == 0
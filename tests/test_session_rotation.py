@@ -0,0 +1,125 @@
+"""Tests for predictive (background) session rotation."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+from nanobot.agent.loop import AgentLoop
+from nanobot.agent.rotation import PreparedRotation
+from nanobot.bus.queue import MessageBus
+from nanobot.session.manager import Session, SessionManager
+from nanobot.session.summary import RunningSummary
+
+
+def make_loop(tmp_path: Path) -> AgentLoop:
+    provider = MagicMock()
+    provider.get_default_model.return_value = "test-model"
+    sessions = SessionManager(tmp_path, sessions_dir=tmp_path / "sessions")
+    loop = AgentLoop(bus=MessageBus(), provider=provider, workspace=tmp_path, session_manager=sessions)
+    loop._consolidate_memory = AsyncMock()
+    loop._recent_history_tokens = 50
+    return loop
+
+
+def fill(session: Session, n: int, start: int = 0) -> None:
+    for i in range(start, start + n):
+        session.add_message("user", f"message number {i} " + "word " * 20)
+
+
+class SlowSummary:
+    """_generate_running_summary stand-in that blocks until released."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.calls = 0
+
+    async def __call__(self, session, key, force=False):
+        self.calls += 1
+        await self.release.wait()
+        return "the summary"
+
+
+class TestPreparedRotation:
+    def test_apply_carries_uncovered_messages(self):
+        session = Session(key="discord:room")
+        fill(session, 6)
+        prepared = PreparedRotation.capture(session, "sum", 4)
+        fill(session, 2, start=6)
+
+        archived = prepared.apply(session)
+
+        assert len(archived) == 4
+        assert session.messages[0]["content"] == "[Previous session summary: sum]"
+        assert [m["content"].split()[2] for m in session.messages[1:]] == ["4", "5", "6", "7"]
+        assert session.last_consolidated == 0
+
+    def test_stale_after_history_changes(self):
+        session = Session(key="discord:room")
+        fill(session, 6)
+        prepared = PreparedRotation.capture(session, "sum", 4)
+        assert prepared.is_current(session)
+        session.clear()
+        fill(session, 6)
+        assert not prepared.is_current(session)
+
+
+class TestBackgroundRotation:
+    async def test_summary_prepared_off_the_critical_path(self, tmp_path):
+        loop = make_loop(tmp_path)
+        summary = SlowSummary()
+        loop._generate_running_summary = summary
+        session = loop.sessions.get_or_create("discord:room")
+        fill(session, 20)
+        loop._history_token_budget = int(session.estimate_tokens() / 0.7)
+
+        loop._prepare_rotation(session, "discord:room")
+        await asyncio.sleep(0)
+        fill(session, 4, start=20)  # Crosses 80% while the summary is in flight
+        tokens = session.estimate_tokens()
+        assert tokens > loop._history_token_budget * loop._rotation_at
+
+        await loop._rotate_session(session, "discord:room", tokens)
+        assert len(session.messages) == 24  # Deferred, nothing blocked
+
+        summary.release.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert "discord:room" in loop._rotation_ready
+
+        await loop._rotate_session(session, "discord:room", tokens)
+        assert summary.calls == 1
+        assert session.messages[0]["content"] == "[Previous session summary: the summary]"
+        # Everything after the summarized prefix survives verbatim
+        assert session.messages[-1]["content"].startswith("message number 23 ")
+        assert not loop._rotation_ready and not loop._rotation_tasks
+
+    async def test_over_budget_rotates_without_waiting(self, tmp_path):
+        loop = make_loop(tmp_path)
+        summary = SlowSummary()
+        loop._generate_running_summary = summary
+        session = loop.sessions.get_or_create("discord:room")
+        fill(session, 20)
+        RunningSummary.capture(session, 10, "older summary").store(session)
+        tokens = session.estimate_tokens()
+        loop._history_token_budget = tokens - 1
+
+        await loop._rotate_session(session, "discord:room", tokens)
+
+        assert summary.calls == 0
+        assert [m["content"] for m in session.messages] == ["[Previous session summary: older summary]"]
+
+    async def test_over_budget_without_summary_generates_inline(self, tmp_path):
+        loop = make_loop(tmp_path)
+        summary = SlowSummary()
+        summary.release.set()
+        loop._generate_running_summary = summary
+        session = loop.sessions.get_or_create("discord:room")
+        fill(session, 20)
+        tokens = session.estimate_tokens()
+        loop._history_token_budget = tokens - 1
+
+        await loop._rotate_session(session, "discord:room", tokens)
+
+        assert summary.calls == 1
+        assert session.messages[0]["content"] == "[Previous session summary: the summary]"
+        assert session.messages[-1]["content"].startswith("message number 19 ")
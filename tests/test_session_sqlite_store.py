@@ -0,0 +1,107 @@
+"""Tests for the SQLite session store."""
+
+import asyncio
+import sqlite3
+from pathlib import Path
+
+from nanobot.session.manager import SessionManager
+from nanobot.session.sqlite_store import SqliteSessionStore
+from nanobot.session.store import SQLITE_FILENAME
+
+
+def _manager(tmp_path: Path, **kwargs) -> SessionManager:
+    return SessionManager(tmp_path, sessions_dir=tmp_path / "sessions", store="sqlite", **kwargs)
+
+
+def _rows(tmp_path: Path, key: str) -> list[int]:
+    conn = sqlite3.connect(tmp_path / "sessions" / SQLITE_FILENAME)
+    try:
+        return [seq for (seq,) in conn.execute(
+            "SELECT seq FROM messages WHERE session_key = ? ORDER BY seq", (key,),
+        )]
+    finally:
+        conn.close()
+
+
+def _reload(manager: SessionManager, key: str):
+    manager.invalidate(key)
+    return manager.get_or_create(key)
+
+
+class TestSqliteStore:
+    def test_round_trip_and_append_inserts_only_new_rows(self, tmp_path):
+        manager = _manager(tmp_path)
+        session = manager.get_or_create("discord:1")
+        session.add_message("user", "one")
+        session.metadata["topic"] = "cats"
+        manager.save(session)
+        session.add_message("assistant", "two")
+        session.last_consolidated = 1
+        manager.save(session)
+
+        assert _rows(tmp_path, "discord:1") == [0, 1]
+        loaded = _reload(manager, "discord:1")
+        assert [m["content"] for m in loaded.messages] == ["one", "two"]
+        assert loaded.metadata == {"topic": "cats"}
+        assert loaded.last_consolidated == 1
+        assert loaded.get_responded_count() == 1
+
+    def test_rotation_moves_to_fresh_seq_range(self, tmp_path):
+        manager = _manager(tmp_path)
+        session = manager.get_or_create("discord:1")
+        for i in range(3):
+            session.add_message("user", f"m{i}")
+        manager.save(session)
+
+        session.messages.clear()
+        session.messages.append({"role": "user", "content": "summary"})
+        manager.save(session)
+
+        assert _rows(tmp_path, "discord:1") == [3]  # Old range dropped, seqs not reused
+        assert [m["content"] for m in _reload(manager, "discord:1").messages] == ["summary"]
+
+    def test_read_messages_is_a_range_query(self, tmp_path):
+        manager = _manager(tmp_path)
+        session = manager.get_or_create("discord:1")
+        for i in range(10):
+            session.add_message("user", f"m{i}")
+        manager.save(session)
+        manager.invalidate("discord:1")
+
+        assert [m["content"] for m in manager.read_messages("discord:1", -3)] == ["m7", "m8", "m9"]
+        assert [m["content"] for m in manager.read_messages("discord:1", 2, 4)] == ["m2", "m3"]
+        assert "discord:1" not in manager._cache
+
+    def test_list_sessions(self, tmp_path):
+        manager = _manager(tmp_path)
+        for key in ("a:1", "b:1"):
+            session = manager.get_or_create(key)
+            session.add_message("assistant", "hi")
+            manager.save(session)
+        listed = manager.list_sessions()
+        assert [s["key"] for s in listed] == ["b:1", "a:1"]
+        assert listed[0]["message_count"] == 1 and listed[0]["responded_count"] == 1
+
+    async def test_write_behind_flushes_through_sqlite(self, tmp_path):
+        manager = _manager(tmp_path, flush_interval=0.05)
+        session = manager.get_or_create("discord:1")
+        session.add_message("user", "hi")
+        manager.save(session)
+        await asyncio.sleep(0.2)
+        assert _rows(tmp_path, "discord:1") == [0]
+
+
+class TestStoreSelection:
+    def test_auto_uses_existing_database(self, tmp_path):
+        _manager(tmp_path)
+        manager = SessionManager(tmp_path, sessions_dir=tmp_path / "sessions")
+        assert isinstance(manager.store, SqliteSessionStore)
+
+    def test_new_database_imports_jsonl_sessions(self, tmp_path):
+        jsonl = SessionManager(tmp_path, sessions_dir=tmp_path / "sessions", store="jsonl")
+        session = jsonl.get_or_create("discord:1")
+        session.add_message("user", "old")
+        jsonl.save(session)
+
+        manager = _manager(tmp_path)
+        assert [m["content"] for m in manager.get_or_create("discord:1").messages] == ["old"]
@@ -0,0 +1,150 @@
+"""Tests for the sharded gateway transport."""
+
+import asyncio
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from nanobot.agent.loop import AgentLoop
+from nanobot.bus.events import InboundMessage, OutboundMessage
+from nanobot.bus.queue import MessageBus
+from nanobot.bus.shards import ShardRouter, shard_for
+from nanobot.cli.commands import _run_gateway_shard
+from nanobot.config.schema import Config
+
+
+async def _echo_worker(shard_id: int, bus: MessageBus) -> None:
+    """Stand-in agent: reply with the shard and pid that handled each message."""
+    async for msg in bus.inbound_messages():
+        await bus.publish_outbound(OutboundMessage(
+            channel=msg.channel, chat_id=msg.chat_id,
+            content=f"{shard_id}:{os.getpid()}:{msg.content}",
+        ))
+
+
+def test_shard_for_is_stable_and_spread():
+    keys = [f"discord:{i}" for i in range(200)]
+    assert [shard_for(k, 4) for k in keys] == [shard_for(k, 4) for k in keys]
+    assert {shard_for(k, 4) for k in keys} == {0, 1, 2, 3}
+    assert shard_for("discord:1", 1) == 0
+
+
+def test_router_needs_a_worker():
+    with pytest.raises(ValueError):
+        ShardRouter(MessageBus(), 0, _echo_worker)
+
+
+async def test_router_round_trip_through_worker_processes():
+    bus = MessageBus()
+    router = ShardRouter(bus, 2, _echo_worker)
+    task = asyncio.create_task(router.run())
+    try:
+        chats = ["a", "b", "c", "d"]
+        for chat in chats:
+            for n in range(2):
+                await bus.publish_inbound(InboundMessage(
+                    channel="discord", sender_id="u", chat_id=chat, content=f"{chat}{n}",
+                ))
+
+        replies = [await asyncio.wait_for(bus.consume_outbound(), 30) for _ in range(8)]
+    finally:
+        bus.close_inbound()
+        await task
+        await router.stop(timeout=10)
+
+    by_chat: dict[str, set[str]] = {}
+    for reply in replies:
+        shard, pid, _ = reply.content.split(":")
+        assert int(pid) != os.getpid()  # Handled out of process
+        assert int(shard) == shard_for(f"discord:{reply.chat_id}", 2)
+        by_chat.setdefault(reply.chat_id, set()).add(pid)
+    assert sorted(by_chat) == chats
+    assert all(len(pids) == 1 for pids in by_chat.values())  # One worker per chat
+    assert sum(router.routed) == 8
+
+
+async def test_only_first_shard_runs_dashboard_and_daily_tasks(tmp_path):
+    started: list[tuple[bool, bool]] = []
+
+    def load_config() -> Config:
+        config = Config()
+        config.agents.defaults.workspace = str(tmp_path)
+        return config
+
+    async def record_init(self):
+        dashboard = self._config.agents.defaults.observatory.dashboard_enabled
+        started.append((dashboard, self._background_tasks))
+
+    provider = MagicMock()
+    provider.get_default_model.return_value = "test-model"
+    with patch("nanobot.config.loader.load_config", load_config), \
+            patch("nanobot.config.loader.get_data_dir", return_value=tmp_path), \
+            patch("nanobot.cli.commands._make_provider", return_value=provider), \
+            patch.object(AgentLoop, "_initialize_ene_modules", record_init), \
+            patch.object(AgentLoop, "_daily_trigger") as daily, \
+            patch.object(AgentLoop, "_idle_watcher") as idle:
+        for shard in range(3):
+            bus = MessageBus()
+            bus.close_inbound()  # Run returns once startup is done
+            await _run_gateway_shard(shard, bus)
+
+    assert started == [(True, True), (False, False), (False, False)]  # Shards 0, 1, 2
+    assert daily.call_count == idle.call_count == 1
+
+
+def test_front_agent_runs_cron_jobs_with_modules(tmp_path):
+    from nanobot.bus.events import OutboundMessage as Reply
+    from nanobot.cli.commands import gateway
+    from nanobot.cron.service import CronService
+    from nanobot.cron.types import CronJob, CronPayload
+
+    events: list[str] = []
+    crons: list[CronService] = []
+    replies: list[str | None] = []
+
+    class RecordingCron(CronService):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            crons.append(self)
+
+    class CronFiringRouter:
+        """ShardRouter stand-in: fires a cron job on the front agent, then returns."""
+
+        def __init__(self, bus, workers, worker):
+            self.workers = workers
+
+        async def run(self):
+            job = CronJob(id="j1", name="ping", payload=CronPayload(message="ping"))
+            replies.append(await crons[0].on_job(job))
+
+        async def stop(self):
+            pass
+
+    def load_config() -> Config:
+        config = Config()
+        config.agents.defaults.workspace = str(tmp_path)
+        config.gateway.workers = 2
+        return config
+
+    async def record_init(self):
+        dashboard = self._config.agents.defaults.observatory.dashboard_enabled
+        events.append(f"init dashboard={dashboard}")
+
+    async def record_message(self, msg, session_key=None, batch=None):
+        events.append(f"message {session_key}")
+        return Reply(channel=msg.channel, chat_id=msg.chat_id, content="pong")
+
+    provider = MagicMock()
+    provider.get_default_model.return_value = "test-model"
+    with patch("nanobot.config.loader.load_config", load_config), \
+            patch("nanobot.config.loader.get_data_dir", return_value=tmp_path), \
+            patch("nanobot.cli.commands._make_provider", return_value=provider), \
+            patch("nanobot.cron.service.CronService", RecordingCron), \
+            patch("nanobot.bus.shards.ShardRouter", CronFiringRouter), \
+            patch.object(AgentLoop, "_initialize_ene_modules", record_init), \
+            patch.object(AgentLoop, "_process_message", record_message):
+        gateway(port=18790, verbose=False)
+
+    assert events == ["init dashboard=False", "message cron:j1"]  # Modules ready first; shard 0 owns the dashboard
+    assert replies == ["pong"]
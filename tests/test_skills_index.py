@@ -0,0 +1,80 @@
+"""Tests for the indexed SkillsLoader."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from nanobot.agent.skills import SkillsLoader
+
+
+def write_skill(skills_dir: Path, name: str, body: str) -> Path:
+    path = skills_dir / name / "SKILL.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(body, encoding="utf-8")
+    return path
+
+
+def touch_later(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def make_loader(tmp_path: Path, **kwargs) -> SkillsLoader:
+    return SkillsLoader(tmp_path, builtin_skills_dir=tmp_path / "builtin", **kwargs)
+
+
+class TestSkillsIndex:
+    def test_prompt_build_reads_each_file_once(self, tmp_path):
+        write_skill(tmp_path / "skills", "alpha", '---\ndescription: Alpha\nmetadata: {"nanobot": {"always": true}}\n---\nbody')
+        write_skill(tmp_path / "skills", "beta", "---\ndescription: Beta\n---\nbody")
+        loader = make_loader(tmp_path)
+
+        with patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as read:
+            assert loader.get_always_skills() == ["alpha"]
+            assert "<description>Beta</description>" in loader.build_skills_summary()
+            assert "### Skill: alpha" in loader.load_skills_for_context(["alpha"])
+            assert loader.get_skill_metadata("beta") == {"description": "Beta"}
+        assert read.call_count == 2
+
+    def test_poll_picks_up_edits_and_bumps_version(self, tmp_path):
+        path = write_skill(tmp_path / "skills", "alpha", "---\ndescription: Old\n---\nbody")
+        loader = make_loader(tmp_path, poll_interval=0)
+        version = loader.version
+        assert loader.version == version  # Nothing changed, no bump
+
+        path.write_text("---\ndescription: New\n---\nbody", encoding="utf-8")
+        touch_later(path)
+        assert loader.version > version
+        assert "New" in loader.build_skills_summary()
+
+        write_skill(tmp_path / "skills", "beta", "body")
+        assert [s["name"] for s in loader.list_skills()] == ["alpha", "beta"]
+
+    def test_no_rescan_until_poll_interval_or_reload(self, tmp_path):
+        loader = make_loader(tmp_path, poll_interval=3600)
+        assert loader.list_skills() == []
+        write_skill(tmp_path / "skills", "alpha", "body")
+        assert loader.list_skills() == []
+
+        loader.reload()
+        assert [s["name"] for s in loader.list_skills()] == ["alpha"]
+
+    def test_workspace_shadows_builtin(self, tmp_path):
+        write_skill(tmp_path / "skills", "alpha", "workspace copy")
+        write_skill(tmp_path / "builtin", "alpha", "builtin copy")
+        loader = make_loader(tmp_path)
+
+        assert loader.load_skill("alpha") == "workspace copy"
+        assert loader.list_skills()[0]["source"] == "workspace"
+
+    def test_requirement_changes_bump_version(self, tmp_path, monkeypatch):
+        write_skill(tmp_path / "skills", "alpha", '---\nmetadata: {"nanobot": {"requires": {"env": ["SKILL_TEST_KEY"]}}}\n---\nbody')
+        monkeypatch.delenv("SKILL_TEST_KEY", raising=False)
+        loader = make_loader(tmp_path, requirements_ttl=0)
+        version = loader.version
+        assert loader.list_skills() == []
+        assert "ENV: SKILL_TEST_KEY" in loader.build_skills_summary()
+
+        monkeypatch.setenv("SKILL_TEST_KEY", "1")
+        assert loader.version > version
+        assert [s["name"] for s in loader.list_skills()] == ["alpha"]
@@ -0,0 +1,341 @@
+"""Tests for streamed LLM responses: provider assembly, reply previews, channel edits."""
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from nanobot.agent.batch_context import BatchContext
+from nanobot.agent.loop import AgentLoop
+from nanobot.agent.reply_stream import ReplyStreamer
+from nanobot.bus.events import InboundMessage, OutboundMessage
+from nanobot.bus.queue import MessageBus
+from nanobot.channels.base import BaseChannel
+from nanobot.ene.observatory.store import LLMCallRecord, MetricsStore
+from nanobot.providers.base import LLMProvider, LLMResponse, ToolCallBuffer, ToolCallRequest
+from nanobot.providers.litellm_provider import LiteLLMProvider
+
+# ── Helpers ──────────────────────────────────────────────
+
+
+def _chunk(content=None, tool_calls=None, finish_reason=None, usage=None):
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls, reasoning_content=None)
+    choices = [SimpleNamespace(delta=delta, finish_reason=finish_reason)]
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+def _tc(index, id=None, name=None, arguments=None):
+    return SimpleNamespace(
+        index=index, id=id, function=SimpleNamespace(name=name, arguments=arguments),
+    )
+
+
+async def _fake_stream(chunks):
+    for c in chunks:
+        yield c
+
+
+class FakeEditChannel(BaseChannel):
+    """Edit-capable channel that records platform operations."""
+
+    name = "fake"
+    supports_edits = True
+
+    def __init__(self, bus: MessageBus):
+        super().__init__(SimpleNamespace(allow_from=[]), bus)
+        self.ops: list[tuple[str, str]] = []
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def send(self, msg: OutboundMessage) -> None:
+        self.ops.append(("send", msg.content))
+
+    async def send_tracked(self, msg: OutboundMessage) -> str | None:
+        self.ops.append(("send", msg.content))
+        return "m1"
+
+    async def edit_message(self, chat_id: str, message_id: str, content: str) -> None:
+        self.ops.append(("edit", content))
+
+    async def delete_message(self, chat_id: str, message_id: str) -> None:
+        self.ops.append(("delete", message_id))
+
+
+class FakePlainChannel(FakeEditChannel):
+    supports_edits = False
+
+
+class FakeUntrackedChannel(BaseChannel):
+    """Claims edit support but relies on the base-class hooks."""
+
+    name = "fake"
+    supports_edits = True
+
+    def __init__(self, bus: MessageBus):
+        super().__init__(SimpleNamespace(allow_from=[]), bus)
+        self.sent: list[str] = []
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def send(self, msg: OutboundMessage) -> None:
+        self.sent.append(msg.content)
+
+
+def _inbound() -> InboundMessage:
+    return InboundMessage(
+        channel="discord", sender_id="1", chat_id="room", content="hey ene",
+        metadata={"message_id": "orig", "msg_id_map": {"#msg2": "real2"}},
+    )
+
+
+async def _drain(bus: MessageBus) -> list[OutboundMessage]:
+    out = []
+    while bus.outbound_size:
+        out.append(await bus.consume_outbound())
+    return out
+
+
+# ── Provider ─────────────────────────────────────────────
+
+
+class TestLiteLLMStreamAssembly:
+    async def test_assembles_content_tool_calls_and_usage(self):
+        provider = LiteLLMProvider(default_model="openai/gpt-4o")
+        chunks = [
+            _chunk(content="hel"),
+            _chunk(content="lo"),
+            _chunk(tool_calls=[_tc(0, id="call_1", name="message", arguments='{"cont')]),
+            _chunk(tool_calls=[_tc(0, arguments='ent": "hi"}')]),
+            _chunk(finish_reason="tool_calls"),
+            SimpleNamespace(choices=[], usage=SimpleNamespace(
+                prompt_tokens=10, completion_tokens=5, total_tokens=15,
+            )),
+        ]
+        snapshots: list[tuple[str, list[str]]] = []
+
+        async def on_delta(content: str, tool_calls: list[ToolCallBuffer]) -> None:
+            snapshots.append((content, [tc.arguments for tc in tool_calls]))
+
+        async def fake_acompletion(**kwargs: Any):
+            assert kwargs["stream"] is True
+            return _fake_stream(chunks)
+
+        with patch("nanobot.providers.litellm_provider.acompletion", fake_acompletion):
+            response = await provider.chat_stream(
+                [{"role": "user", "content": "x"}], on_delta=on_delta,
+            )
+
+        assert response.content == "hello"
+        assert response.tool_calls == [
+            ToolCallRequest(id="call_1", name="message", arguments={"content": "hi"}),
+        ]
+        assert response.finish_reason == "tool_calls"
+        assert response.usage["total_tokens"] == 15
+        assert response.ttft_ms is not None
+        assert snapshots[0] == ("hel", [])
+        assert snapshots[-1] == ("hello", ['{"content": "hi"}'])
+
+    async def test_stream_closed_when_on_delta_fails(self):
+        provider = LiteLLMProvider(default_model="openai/gpt-4o")
+        closed = []
+
+        async def stream():
+            try:
+                for c in [_chunk(content="a"), _chunk(content="b")]:
+                    yield c
+            finally:
+                closed.append(True)
+
+        async def fake_acompletion(**kwargs: Any):
+            return stream()
+
+        async def on_delta(content, tool_calls):
+            raise RuntimeError("channel gone")
+
+        with patch("nanobot.providers.litellm_provider.acompletion", fake_acompletion):
+            with pytest.raises(RuntimeError):
+                await provider._attempt_chat_stream(
+                    "openai/gpt-4o", [{"role": "user", "content": "x"}], None, 100, 0.7, on_delta,
+                )
+        assert closed == [True]
+
+    async def test_default_chat_stream_reports_once(self):
+        class Plain(LLMProvider):
+            async def chat(self, messages, tools=None, model=None, max_tokens=4096, temperature=0.7):
+                return LLMResponse(content="full reply")
+
+            def get_default_model(self) -> str:
+                return "plain"
+
+        seen: list[str] = []
+
+        async def on_delta(content, tool_calls):
+            seen.append(content)
+
+        response = await Plain().chat_stream([], on_delta=on_delta)
+        assert response.content == "full reply"
+        assert seen == ["full reply"]
+
+
+# ── Channel delivery ─────────────────────────────────────
+
+
+class TestChannelDeliver:
+    async def test_edit_capable_channel_sends_then_edits(self):
+        channel = FakeEditChannel(MessageBus())
+        for content, final in [("partial", False), ("partial more", False), ("done", True)]:
+            await channel.deliver(OutboundMessage(
+                channel="fake", chat_id="c", content=content,
+                stream_id="s1", stream_final=final,
+            ))
+
+        assert channel.ops == [("send", "partial"), ("edit", "partial more"), ("edit", "done")]
+        assert channel._stream_messages == {}
+
+    async def test_empty_final_retracts_preview(self):
+        channel = FakeEditChannel(MessageBus())
+        await channel.deliver(OutboundMessage(channel="fake", chat_id="c", content="x", stream_id="s"))
+        await channel.deliver(OutboundMessage(
+            channel="fake", chat_id="c", content="", stream_id="s", stream_final=True,
+        ))
+        assert channel.ops == [("send", "x"), ("delete", "m1")]
+
+    async def test_plain_channel_only_sends_final(self):
+        channel = FakePlainChannel(MessageBus())
+        await channel.deliver(OutboundMessage(channel="fake", chat_id="c", content="x", stream_id="s"))
+        await channel.deliver(OutboundMessage(
+            channel="fake", chat_id="c", content="final", stream_id="s", stream_final=True,
+        ))
+        assert channel.ops == [("send", "final")]
+
+    async def test_default_hooks_fall_back_to_send(self):
+        channel = FakeUntrackedChannel(MessageBus())
+        for content, final in [("partial", False), ("partial more", False), ("done", True)]:
+            await channel.deliver(OutboundMessage(
+                channel="fake", chat_id="c", content=content,
+                stream_id="s1", stream_final=final,
+            ))
+
+        assert channel.sent == ["partial", "done"]
+        assert channel._stream_messages == {}
+
+
+# ── ReplyStreamer ────────────────────────────────────────
+
+
+class TestReplyStreamer:
+    def _streamer(self, bus: MessageBus, msg: InboundMessage) -> ReplyStreamer:
+        return ReplyStreamer(bus, msg, clean=lambda t: t.strip() or None, update_interval=0)
+
+    async def test_content_preview_then_finalize(self):
+        bus, msg = MessageBus(), _inbound()
+        streamer = self._streamer(bus, msg)
+
+        await streamer.on_delta("short", [])  # Below STREAM_MIN_CHARS
+        await streamer.on_delta("a reply that is long enough to show", [])
+        final = await streamer.finalize(OutboundMessage(
+            channel="discord", chat_id="room", content="the final reply", reply_to="orig",
+        ))
+
+        previews = await _drain(bus)
+        assert [p.content for p in previews] == ["a reply that is long enough to show"]
+        assert previews[0].stream_id == streamer.stream_id
+        assert not previews[0].stream_final
+        assert final.stream_id == streamer.stream_id and final.stream_final
+
+    async def test_message_tool_arguments_previewed(self):
+        bus, msg = MessageBus(), _inbound()
+        streamer = self._streamer(bus, msg)
+
+        await streamer.on_delta("", [ToolCallBuffer(
+            id="c1", name="message",
+            arguments='{"reply_to": "#msg2", "content": "streaming out of the message tool',
+        )])
+
+        (preview,) = await _drain(bus)
+        assert preview.content == "streaming out of the message tool"
+        assert preview.reply_to == "real2"
+
+    async def test_tool_only_turn_not_previewed(self):
+        bus, msg = MessageBus(), _inbound()
+        streamer = self._streamer(bus, msg)
+        await streamer.on_delta("", [ToolCallBuffer(name="search_memory", arguments='{"query": "x"}')])
+        assert bus.outbound_size == 0
+
+    async def test_retarget_retracts_preview(self):
+        bus, msg = MessageBus(), _inbound()
+        streamer = self._streamer(bus, msg)
+        await streamer.on_delta("a reply that is long enough to show", [])
+
+        final = await streamer.finalize(OutboundMessage(
+            channel="discord", chat_id="room", content="reply", reply_to="someone-else",
+        ))
+
+        preview, retract = await _drain(bus)
+        assert retract.stream_final and retract.content == ""
+        assert final.stream_id is None
+
+    async def test_close_retracts_unfinalized_preview(self):
+        bus, msg = MessageBus(), _inbound()
+        streamer = self._streamer(bus, msg)
+        await streamer.on_delta("a reply that is long enough to show", [])
+        await streamer.close()
+
+        preview, retract = await _drain(bus)
+        assert retract.stream_id == streamer.stream_id and retract.content == ""
+
+
+# ── Agent loop ───────────────────────────────────────────
+
+
+class TestAgentLoopStreaming:
+    async def test_streamer_routes_through_chat_stream(self, tmp_path: Path):
+        provider = MagicMock()
+        provider.get_default_model.return_value = "test-model"
+
+        async def chat_stream(on_delta=None, **kwargs):
+            await on_delta("a streamed reply long enough to preview", [])
+            return LLMResponse(content="a streamed reply long enough to preview", ttft_ms=12)
+
+        provider.chat_stream = AsyncMock(side_effect=chat_stream)
+        bus = MessageBus()
+        loop = AgentLoop(bus=bus, provider=provider, workspace=tmp_path, stream_responses=True)
+        batch = BatchContext(caller_id="discord:1")
+        batch.streamer = ReplyStreamer(bus, _inbound(), clean=lambda t: t, update_interval=0)
+
+        content, _ = await loop._run_agent_loop([{"role": "user", "content": "hi"}], batch=batch)
+
+        assert content == "a streamed reply long enough to preview"
+        provider.chat.assert_not_called()
+        assert batch.streamer.has_preview
+
+
+# ── Observatory ──────────────────────────────────────────
+
+
+class TestTTFTMetrics:
+    def test_ttft_percentiles(self, tmp_path: Path):
+        from datetime import datetime
+
+        store = MetricsStore(tmp_path / "metrics.db")
+        for ttft in (300, None, 100, 200):
+            store.record_call(LLMCallRecord(
+                timestamp=datetime.now().isoformat(), call_type="response", model="m",
+                prompt_tokens=1, completion_tokens=1, total_tokens=2, cost_usd=0.0,
+                latency_ms=1000, caller_id="system", ttft_ms=ttft,
+            ))
+
+        data = store.get_ttft_percentiles(24)
+        assert data["count"] == 3
+        assert data["p50"] == 200
+        assert data["max"] == 300